@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Parallel calculator audit engine
+
+Subsumes the checks of audit_calculator_formulas.sh and comprehensive_audit.sh,
+which cat every formulas.ts into a shell variable and pipe it through several
+grep processes per calculator. This script:
+1. Finds every calculator directory by the generated-file conventions
+   (formulas.ts, validation.ts, register.ts, types.ts, *Calculator.ts)
+2. Reads each of those files once and runs every detector over the text:
+   missing files, generic amount * rate * time templates, placeholder logic,
+   too-short formulas, no math, missing calculateResult, empty validation
+3. Classifies formulas as real / generic / unknown / missing, as the shell audit did
+4. Fans the work out over a process pool
+5. Writes machine-readable JSON and the familiar markdown summary
+
+Usage:
+    python audit_calculators.py [--json audit.json] [--markdown audit.md] [--detailed]
+"""
+
+import os
+import re
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from git_scope import add_scope_arguments, scope_from_args, scoped_dirs
+
+CALCULATORS_DIR = 'src/calculators'
+CONVENTION_FILES = ('formulas.ts', 'validation.ts', 'register.ts', 'types.ts', 'quickValidation.ts')
+MIN_FORMULA_LINES = 10
+
+# Detectors, compiled once per worker
+GENERIC_PATTERNS = [
+    re.compile(r'inputs\.amount.*inputs\.rate.*inputs\.time'),
+    re.compile(r'Basic calculation - customize based on calculator type'),
+    re.compile(r'inputs\.value \* inputs\.rate'),
+    re.compile(r'inputs\.amount \* inputs\.quantity'),
+]
+PLACEHOLDER_PATTERNS = [
+    re.compile(r'return.*0.*//.*placeholder'),
+    re.compile(r'//\s*Add calculation logic here'),
+]
+MATH_OPERATOR = re.compile(r'[+*/=<>%]')
+CALCULATE_RESULT = re.compile(r'export function calculateResult')
+REAL_FORMULA_PATTERNS = [
+    # Named domain formulas
+    re.compile(r'calculateMonthlyPayment|calculateLTC|calculateAdvanceRate|calculateBMI|calculateAverageGlucose'
+               r'|factorial|calculatePermutations|calculateCombinations'),
+    # Math operations
+    re.compile(r'Math\.|sqrt\(|pow\(|log\(|exp\(|sin\(|cos\(|tan\('),
+    # Business logic
+    re.compile(r'if.*riskLevel|recommendation.*=|category.*=|analysis.*=|metrics.*'),
+    # Domain-specific keywords
+    re.compile(r'borrowingBase|advanceRate|amortization|hemoglobin|glucose|permutations|combinations'),
+]
+VALIDATION_LOGIC = re.compile(r'validate|error|invalid')
+
+def find_calculator_dirs(base_dir: str = CALCULATORS_DIR) -> List[str]:
+    """Directories that contain any of the generated calculator files"""
+    calc_dirs = []
+    for root, dirs, files in os.walk(base_dir):
+        if root == base_dir:
+            continue
+        if any(f in files for f in CONVENTION_FILES) or any(f.endswith('Calculator.ts') for f in files):
+            calc_dirs.append(root)
+    return sorted(calc_dirs)
+
+def _read(path: str) -> Optional[str]:
+    """Read a file once; None if it does not exist"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def audit_formulas(content: Optional[str]) -> Dict:
+    """Classify formulas.ts and list its problems"""
+    if content is None:
+        return {'status': 'missing', 'issues': ['MISSING: formulas.ts file not found']}
+
+    issues = []
+    if any(p.search(content) for p in GENERIC_PATTERNS):
+        return {'status': 'generic', 'issues': ['GENERIC: still has generic template']}
+    if any(p.search(content) for p in PLACEHOLDER_PATTERNS):
+        issues.append('PLACEHOLDER: has placeholder return')
+
+    line_count = content.count('\n')
+    if line_count < MIN_FORMULA_LINES:
+        issues.append(f'TOO SHORT: only {line_count} lines, likely incomplete')
+    if not MATH_OPERATOR.search(content):
+        issues.append('NO MATH: no mathematical operations found')
+    if not CALCULATE_RESULT.search(content):
+        issues.append('NO RESULT: missing calculateResult function')
+
+    has_real_formulas = any(p.search(content) for p in REAL_FORMULA_PATTERNS)
+    return {'status': 'real' if has_real_formulas else 'unknown', 'issues': issues}
+
+def audit_calculator(calc_dir: str) -> Dict:
+    """Run every detector over one calculator directory"""
+    formulas = _read(os.path.join(calc_dir, 'formulas.ts'))
+    validation = _read(os.path.join(calc_dir, 'validation.ts'))
+    has_register = os.path.exists(os.path.join(calc_dir, 'register.ts'))
+
+    result = audit_formulas(formulas)
+    issues = list(result['issues'])
+
+    if validation is None:
+        issues.append('MISSING: validation.ts file not found')
+    elif not VALIDATION_LOGIC.search(validation):
+        issues.append('EMPTY VALIDATION: validation.ts has no validation logic')
+    if not has_register:
+        issues.append('MISSING: register.ts file not found')
+
+    return {
+        'name': os.path.relpath(calc_dir, CALCULATORS_DIR).replace(os.sep, ' -> '),
+        'path': calc_dir,
+        'status': result['status'],
+        'issues': issues,
+    }
+
+def run_audit(calc_dirs: List[str], jobs: int) -> List[Dict]:
+    """Audit all calculators across a worker pool"""
+    if jobs <= 1:
+        return [audit_calculator(d) for d in calc_dirs]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(audit_calculator, calc_dirs, chunksize=64))
+
+def summarize(results: List[Dict]) -> Dict:
+    """Counts per status, as reported by the shell audits"""
+    summary = {'total': len(results), 'real': 0, 'generic': 0, 'unknown': 0, 'missing': 0, 'withIssues': 0}
+    for result in results:
+        summary[result['status']] += 1
+        if result['issues']:
+            summary['withIssues'] += 1
+    return summary
+
+def render_markdown(results: List[Dict], summary: Dict, detailed: bool) -> str:
+    """Render the same summary the shell audit printed, as markdown"""
+    total = summary['total']
+    lines = [
+        '# 📊 Calculator Audit Results',
+        '',
+        '## Summary',
+        f"- Total calculators audited: {total}",
+        f"- ✅ Real domain-specific formulas: {summary['real']}",
+        f"- ❌ Still generic templates: {summary['generic']}",
+        f"- ❓ Unknown/cannot determine: {summary['unknown'] + summary['missing']}",
+        f"- ⚠️  Calculators with issues: {summary['withIssues']}",
+        '',
+    ]
+
+    if total:
+        lines.append(f"- 📈 Success Rate: {summary['real'] * 100 // total}% have real formulas")
+        lines.append(f"- 📉 Generic Rate: {summary['generic'] * 100 // total}% still have templates")
+        lines.append(f"- 🤔 Unknown Rate: {(summary['unknown'] + summary['missing']) * 100 // total}% undetermined")
+        lines.append('')
+
+    if detailed:
+        lines.append('## 📋 Detailed Results')
+        for status, heading in (('real', '✅ Calculators with real formulas'),
+                                ('generic', '❌ Calculators with generic templates'),
+                                ('unknown', '❓ Calculators with unknown status'),
+                                ('missing', '❓ Calculators missing formulas.ts')):
+            names = [r['name'] for r in results if r['status'] == status]
+            if names:
+                lines.append(f'### {heading} ({len(names)})')
+                lines.extend(f'- {name}' for name in names)
+                lines.append('')
+
+        flagged = [r for r in results if r['issues']]
+        if flagged:
+            lines.append(f'### ⚠️ Issues ({len(flagged)})')
+            for result in flagged:
+                lines.append(f"- {result['name']}")
+                lines.extend(f'  - {issue}' for issue in result['issues'])
+            lines.append('')
+
+    lines.append('## 🎯 Conclusion')
+    if summary['generic'] == 0:
+        lines.append('🎉 SUCCESS: All calculators have real domain-specific formulas!')
+    elif summary['real'] > summary['generic']:
+        lines.append(f"👍 GOOD: Majority have real formulas, but {summary['generic']} still need implementation")
+    else:
+        lines.append(f"⚠️  INCOMPLETE: Most calculators still have generic templates "
+                     f"({summary['generic']} generic vs {summary['real']} real)")
+
+    return '\n'.join(lines) + '\n'
+
+def main():
+    parser = argparse.ArgumentParser(description='Audit all calculator implementations')
+    parser.add_argument('--json', help='write machine-readable results to this file')
+    parser.add_argument('--markdown', help='write the markdown summary to this file (default: stdout)')
+    parser.add_argument('--detailed', action='store_true', help='list every calculator by status')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='worker processes')
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+
+    calc_dirs = scoped_dirs(find_calculator_dirs(), scope_from_args(args))
+    results = run_audit(calc_dirs, args.jobs)
+    summary = summarize(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'calculators': results}, f, indent=2)
+            f.write('\n')
+
+    markdown = render_markdown(results, summary, args.detailed)
+    if args.markdown:
+        with open(args.markdown, 'w', encoding='utf-8') as f:
+            f.write(markdown)
+        print(f"Report saved to {args.markdown}")
+    else:
+        print(markdown)
+
+    # Same contract as comprehensive_audit.sh: non-zero while problems remain
+    return 0 if summary['generic'] == 0 and summary['withIssues'] == 0 else 1
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Batch calculator scaffold generator
+
+Replaces the serial batch_generate*.sh scripts, which fork one
+./generate_calculator.sh process per calculator. This script:
+1. Reads a declarative manifest of calculators (category, slug, title, description)
+   from JSON, or from the legacy batch_generate*.sh files directly
+2. Renders the scaffolds in-process from the templates/calculator skeletons,
+   using the same placeholders as templates/generate-calculator.js
+3. Writes calculators with a bounded worker pool
+4. Reports which calculators were created, already existed, or were skipped
+
+Manifest format (JSON):
+    [
+      {"category": "finance", "slug": "planned-giving-calculator",
+       "title": "Planned Giving Calculator",
+       "description": "Calculate tax benefits and impact of planned giving strategies",
+       "subcategory": "Estate Planning"}
+    ]
+
+Usage:
+    python batch_generate_calculators.py manifest.json
+    python batch_generate_calculators.py batch_generate*.sh --dry-run
+"""
+
+import re
+import json
+import shlex
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from fix_invalid_identifiers import convert_invalid_identifier
+
+TEMPLATES_DIR = Path('templates/calculator')
+CALCULATORS_DIR = Path('src/calculators')
+DEFAULT_JOBS = 8
+
+# Files produced per calculator, as in templates/generate-calculator.js
+TEMPLATE_FILES = [
+    'CalculatorNameCalculator.ts',
+    'types.ts',
+    'formulas.ts',
+    'validation.ts',
+    'quickValidation.ts',
+    'CalculatorNameCalculator.test.ts',
+    'index.ts',
+    'register.ts',
+]
+
+SLUG_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+LEGACY_COMMAND = re.compile(r'^\s*\./generate_calculator(?:_enhanced)?\.sh\s+(.*)$')
+
+def load_templates() -> Dict[str, str]:
+    """Read every skeleton once; workers only do string substitution"""
+    templates = {}
+    for name in TEMPLATE_FILES:
+        with open(TEMPLATES_DIR / f'{name}.template', 'r', encoding='utf-8') as f:
+            templates[name] = f.read()
+    return templates
+
+def parse_legacy_script(path: str) -> List[Dict[str, str]]:
+    """Turn ./generate_calculator.sh lines of a batch_generate*.sh into manifest entries"""
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = LEGACY_COMMAND.match(line)
+            if not match:
+                continue
+            args = shlex.split(match.group(1))
+            entry = dict(zip(('category', 'slug', 'title', 'description'), args))
+            entry['source'] = path
+            entries.append(entry)
+    return entries
+
+def load_manifest(paths: List[str]) -> List[Dict[str, str]]:
+    """Load manifest entries from JSON manifests and/or legacy shell scripts"""
+    entries = []
+    for path in paths:
+        if path.endswith('.sh'):
+            entries.extend(parse_legacy_script(path))
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                for entry in json.load(f):
+                    entries.append({**entry, 'source': path})
+    return entries
+
+def to_pascal_case(slug: str) -> str:
+    """planned-giving -> PlannedGiving (leading digits spelled out, e.g. 401k -> FourZeroOneK)"""
+    return convert_invalid_identifier(''.join(part[:1].upper() + part[1:] for part in slug.split('-')))
+
+def base_slug(slug: str) -> str:
+    """planned-giving-calculator -> planned-giving"""
+    return slug[:-len('-calculator')] if slug.endswith('-calculator') else slug
+
+def escape_ts_string(text: str) -> str:
+    """Text safe inside a single-quoted TypeScript string literal"""
+    return json.dumps(text, ensure_ascii=False)[1:-1].replace('\\"', '"').replace("'", "\\'")
+
+def build_replacements(entry: Dict[str, str]) -> List[Tuple[str, str]]:
+    """Placeholder substitutions, applied in order
+
+    Free text lands inside single-quoted TypeScript strings, so it is escaped
+    here ("Workers' Compensation" must not end the literal early).
+    """
+    slug = entry['slug']
+    title = entry['title']
+    name = title[:-len(' Calculator')] if title.endswith(' Calculator') else title
+    pascal = to_pascal_case(base_slug(slug))
+    camel = pascal[:1].lower() + pascal[1:]
+    description = escape_ts_string(entry.get('description') or f'Calculate {name.lower()} values and analysis.')
+    title, name = escape_ts_string(title), escape_ts_string(name)
+
+    return [
+        # Whole tokens first so slugs/titles that already end in "calculator" are not doubled
+        ("'calculator-name-calculator'", f"'{slug}'"),
+        ("'Calculator Name Calculator'", f"'{title}'"),
+        ("'category'", f"'{entry['category']}'"),
+        ('CalculatorName', pascal),
+        ('calculator-name', base_slug(slug)),
+        ('Calculator Name', name),
+        ('Subcategory Name', escape_ts_string(entry.get('subcategory') or 'General')),
+        ('Brief description of what this calculator does and its purpose.', description),
+        ('primaryInput', f'{camel}Value'),
+        ('Primary Input Label', f'{name} Value'),
+        ('Description of what this input represents', f'The primary value for {name.lower()} calculation'),
+        ('secondaryInput', f'{camel}Rate'),
+        ('Secondary Input Label', f'{name} Rate'),
+        ('Description of the secondary input', f'The rate or percentage for {name.lower()}'),
+        ('selectInput', f'{camel}Type'),
+        ('Select Input Label', f'{name} Type'),
+        ('Choose from available options', f'Select the type of {name.lower()}'),
+        ('primaryResult', f'{camel}Result'),
+        ('Primary Result', f'{name} Result'),
+        ('Explanation of what this result represents', f'The calculated {name.lower()} result'),
+        ('secondaryResult', f'{camel}Percentage'),
+        ('Secondary Result', f'{name} Percentage'),
+        ('Explanation of the secondary result', f'The percentage result for {name.lower()}'),
+    ]
+
+def render_calculator(entry: Dict[str, str], templates: Dict[str, str]) -> Dict[str, str]:
+    """Render all scaffold files for one calculator, keyed by file name"""
+    replacements = build_replacements(entry)
+    pascal = to_pascal_case(base_slug(entry['slug']))
+
+    files = {}
+    for name, content in templates.items():
+        for placeholder, value in replacements:
+            content = content.replace(placeholder, value)
+        files[name.replace('CalculatorName', pascal)] = content
+    return files
+
+def validate_entry(entry: Dict[str, str]) -> Optional[str]:
+    """Return why an entry cannot be generated, or None if it is fine"""
+    for field in ('category', 'slug', 'title'):
+        if not entry.get(field):
+            return f'missing {field}'
+    if not SLUG_PATTERN.match(entry['slug']):
+        return f"invalid slug '{entry['slug']}' (expected kebab-case)"
+    if not SLUG_PATTERN.match(entry['category']):
+        return f"invalid category '{entry['category']}'"
+    return None
+
+def generate_one(entry: Dict[str, str], templates: Dict[str, str], force: bool, dry_run: bool) -> Tuple[str, str]:
+    """Create one calculator directory; returns (status, detail)"""
+    calc_dir = CALCULATORS_DIR / entry['category'] / entry['slug']
+    if calc_dir.exists() and not force:
+        return 'existing', str(calc_dir)
+
+    files = render_calculator(entry, templates)
+    if dry_run:
+        return 'created', f'{calc_dir} (dry run, {len(files)} files)'
+
+    calc_dir.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        with open(calc_dir / name, 'w', encoding='utf-8') as f:
+            f.write(content)
+    return 'created', str(calc_dir)
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate calculator scaffolds from a manifest')
+    parser.add_argument('manifests', nargs='+', help='JSON manifests or legacy batch_generate*.sh scripts')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS, help=f'concurrent writers (default: {DEFAULT_JOBS})')
+    parser.add_argument('--force', action='store_true', help='overwrite calculators that already exist')
+    parser.add_argument('--dry-run', action='store_true', help='render but do not write anything')
+    parser.add_argument('--write-manifest', help='also save the combined manifest as JSON (e.g. to retire .sh batches)')
+    args = parser.parse_args()
+
+    entries = load_manifest(args.manifests)
+    templates = load_templates()
+
+    report = {'created': [], 'existing': [], 'skipped': []}
+    seen = set()
+    to_generate = []
+    for entry in entries:
+        problem = validate_entry(entry)
+        key = (entry.get('category'), entry.get('slug'))
+        if problem is None and key in seen:
+            problem = 'duplicate manifest entry'
+        if problem:
+            report['skipped'].append(f"{entry.get('category')}/{entry.get('slug')}: {problem} ({entry['source']})")
+            continue
+        seen.add(key)
+        to_generate.append(entry)
+
+    if args.write_manifest:
+        with open(args.write_manifest, 'w', encoding='utf-8') as f:
+            json.dump([{k: v for k, v in entry.items() if k != 'source'} for entry in to_generate], f, indent=2)
+            f.write('\n')
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = pool.map(lambda entry: generate_one(entry, templates, args.force, args.dry_run), to_generate)
+        for status, detail in results:
+            report[status].append(detail)
+
+    print(f"✅ Created: {len(report['created'])}")
+    for detail in report['created']:
+        print(f"  {detail}")
+    print(f"📁 Already existing: {len(report['existing'])}")
+    for detail in report['existing']:
+        print(f"  {detail}")
+    print(f"⚠️  Skipped: {len(report['skipped'])}")
+    for detail in report['skipped']:
+        print(f"  {detail}")
+
+    if report['created'] and not args.dry_run:
+        print("Remember to register all calculators in src/calculators/index.ts")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
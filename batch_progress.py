@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Resumable, checkpointed batch processing backed by calculator_implementation_progress.json
+
+Long batch runs (implementing or generating hundreds of calculators) record their
+progress in a named section of the shared progress file, next to the
+'lastProcessed' / 'completed' keys that automate_calculator_implementation.cjs
+maintains. A killed or timed-out run picks up where it stopped:
+
+1. Items already in the section's 'completed' list are skipped, unless the
+   caller forgets them first (e.g. because they changed since)
+2. Progress is written atomically (temp file + rename) every N items and on
+   interrupt, so a crash never leaves a truncated progress file
+3. Per-item durations and failures are recorded for later inspection
+"""
+
+import os
+import json
+import time
+import signal
+import tempfile
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+PROGRESS_FILE = 'calculator_implementation_progress.json'
+DEFAULT_CHECKPOINT_EVERY = 25
+
+class BatchProgress:
+    def __init__(self, section: str, path: str = PROGRESS_FILE,
+                 checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY):
+        self.section = section
+        self.path = path
+        self.checkpoint_every = max(1, checkpoint_every)
+        self._pending = 0
+        self._data = self._load()
+        self.state = self._data.setdefault(section, {})
+        self.state.setdefault('lastProcessed', None)
+        self.state.setdefault('completed', [])
+        self.state.setdefault('failed', {})
+        self.state.setdefault('durations', {})
+        self._completed = set(self.state['completed'])
+
+    def _load(self) -> Dict:
+        """Load the whole progress file, keeping other sections intact"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Could not read {self.path} ({e}), starting fresh")
+            return {}
+
+    def reset(self) -> None:
+        """Forget this section's progress (other sections are untouched)"""
+        self.state.update({'lastProcessed': None, 'completed': [], 'failed': {}, 'durations': {}})
+        self._completed.clear()
+        self.checkpoint(force=True)
+
+    def forget(self, items: Iterable[str]) -> int:
+        """Mark items as not completed (e.g. they changed since); returns how many were"""
+        stale = self._completed.intersection(items)
+        if stale:
+            self._completed -= stale
+            self.state['completed'] = [item for item in self.state['completed'] if item not in stale]
+            self.checkpoint(force=True)
+        return len(stale)
+
+    def is_completed(self, item: str) -> bool:
+        return item in self._completed
+
+    def record(self, item: str, duration: float, error: Optional[str] = None) -> None:
+        """Record the outcome of one item and checkpoint every N items"""
+        self.state['lastProcessed'] = item
+        self.state['durations'][item] = round(duration, 4)
+        if error is None:
+            if item not in self._completed:
+                self._completed.add(item)
+                self.state['completed'].append(item)
+            self.state['failed'].pop(item, None)
+        else:
+            self.state['failed'][item] = error
+
+        self._pending += 1
+        self.checkpoint()
+
+    def checkpoint(self, force: bool = False) -> None:
+        """Atomically write the progress file if enough items are pending"""
+        if not force and self._pending < self.checkpoint_every:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.progress-', suffix='.json', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._pending = 0
+
+    def run(self, items: Iterable[str], process_item: Callable[[str], None],
+            on_skip: Optional[Callable[[str], None]] = None) -> Dict[str, List[str]]:
+        """Process items in order, skipping completed ones and checkpointing as we go.
+
+        Exceptions from process_item are recorded as failures and the batch
+        continues; KeyboardInterrupt and SIGTERM checkpoint before stopping.
+        """
+        summary = {'processed': [], 'skipped': [], 'failed': []}
+
+        def handle_sigterm(signum, frame):
+            raise KeyboardInterrupt
+
+        # Signal handlers can only be installed from the main thread
+        in_main_thread = threading.current_thread() is threading.main_thread()
+        previous_handler = signal.signal(signal.SIGTERM, handle_sigterm) if in_main_thread else None
+        try:
+            for item in items:
+                if self.is_completed(item):
+                    summary['skipped'].append(item)
+                    if on_skip:
+                        on_skip(item)
+                    continue
+
+                start = time.perf_counter()
+                try:
+                    process_item(item)
+                except Exception as e:
+                    self.record(item, time.perf_counter() - start, error=str(e))
+                    summary['failed'].append(item)
+                    print(f"❌ Error processing {item}: {e}")
+                    continue
+
+                self.record(item, time.perf_counter() - start)
+                summary['processed'].append(item)
+        except KeyboardInterrupt:
+            print(f"\n🛑 Interrupted. Saving progress to {self.path} (section '{self.section}')...")
+            raise
+        finally:
+            self.checkpoint(force=True)
+            if in_main_thread:
+                signal.signal(signal.SIGTERM, previous_handler)
+
+        return summary
@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+"""
+Benchmark the maintenance scripts on synthetic calculator trees
+
+Nobody knows how the tooling behaves at 5x or 20x today's ~1,150 calculators.
+This script:
+1. Generates a deterministic synthetic src/calculators tree per size (number of
+   calculator directories) with today's mix of naming styles (category/kebab-case,
+   top-level PascalCase, snake_case), duplicate directories across categories,
+   broken '../../../' imports, and an index.ts with stale and doubled-suffix
+   imports, plus calculator-list-CORRECTED.md and the progress file
+2. Runs each script's main path in a fresh copy of that tree (the copy is not
+   timed): ImportFixer, fix_relative_imports, consolidate_duplicates, update_list,
+   the manifest / search index codegen and implement_domain_specific_calculators
+3. Reports wall and CPU time, throughput per file, peak RSS and read/write
+   syscalls per file (from /proc/<pid>/io, Linux only) as JSON
+4. Optionally records the run under the current commit in a local history file
+   and compares it with a recorded baseline: the median of --repeat runs must not
+   exceed the baseline by more than --tolerance percent (and, for time, by more
+   than the noise floor: --min-delta or the spread of the baseline's runs).
+   Regressions are printed as a table and make the script exit 1.
+
+With --workdir the generated trees are kept and reused while the generator
+version, size and seed match, so repeated and compared runs share one corpus.
+
+Usage:
+    python benchmark_tooling.py                             # 1k directories
+    python benchmark_tooling.py --sizes 1000 10000 50000 --repeat 3
+    python benchmark_tooling.py --only import_fixer update_list --output results.json
+    python benchmark_tooling.py --repeat 5 --workdir /tmp/bench --record
+    python benchmark_tooling.py --repeat 5 --workdir /tmp/bench --compare [REF]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from calculator_categories import HUB_CATEGORIES, to_human
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = [1000]
+DEFAULT_OUTPUT = 'benchmark_results.json'
+HISTORY_FILE = '.benchmark-history.json'
+DEFAULT_TOLERANCE = 10.0    # percent
+DEFAULT_MIN_DELTA = 0.05    # seconds; slower runs by less than this are noise
+GENERATOR_VERSION = 1
+RESULTS_VERSION = 1
+
+# name -> command line, run from the root of a fresh copy of the tree
+BENCHMARKS = {
+    'import_fixer': ['fix_import_paths_comprehensive.py'],
+    'fix_relative_imports': ['fix_relative_imports.py'],
+    'consolidate_duplicates': ['consolidate_duplicates.py'],
+    'update_list': ['update_list.py'],
+    'manifest_codegen': ['generate_calculator_manifest.py'],
+    'search_index_codegen': ['build_search_index.py'],
+    # Rewrites every *-calculator directory (the kebab-case share of the tree)
+    'implement': ['implement_domain_specific_calculators.py'],
+}
+
+# Metrics compared against the baseline: (key, unit, noise-aware)
+METRICS = (('seconds', 's', True), ('peak_rss_mb', 'MB', False), ('syscalls_per_file', '/file', False))
+
+# Runs a script as __main__ and dumps the child's /proc/self/io when it exits
+RUNNER = '''
+import atexit, os, runpy, sys
+
+def _record_io(path=os.environ.pop('BENCHMARK_IO_FILE')):
+    try:
+        with open('/proc/self/io') as f, open(path, 'w') as out:
+            out.write(f.read())
+    except OSError:
+        pass
+
+atexit.register(_record_io)
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name='__main__')
+'''
+
+# Share of calculator directories per naming style, like today's tree
+NAMING_STYLES = (('kebab', 0.75), ('pascal', 0.15), ('snake', 0.10))
+DUPLICATE_SHARE = 0.05      # kebab directories repeated under a second category
+BROKEN_IMPORT_SHARE = 0.10  # formulas.ts importing '../../../utils' from two levels deep
+REGISTERED_SHARE = 0.25     # calculators imported and registered by index.ts
+LISTED_SHARE = 0.60         # calculators already in calculator-list-CORRECTED.md
+
+CATEGORIES = ('finance', 'business', 'legal', 'health', 'construction', 'math', 'lifestyle', 'automotive')
+WORDS = (
+    'mortgage', 'loan', 'interest', 'retirement', 'savings', 'annuity', 'bond', 'stock',
+    'dividend', 'crypto', 'tax', 'income', 'payroll', 'budget', 'rent', 'lease', 'insurance',
+    'premium', 'settlement', 'injury', 'claim', 'liability', 'marketing', 'roi', 'margin',
+    'profit', 'revenue', 'cost', 'break-even', 'inventory', 'calorie', 'bmi', 'protein',
+    'heart-rate', 'pace', 'concrete', 'roofing', 'lumber', 'paint', 'tile', 'fraction',
+    'percentage', 'ratio', 'area', 'volume', 'fuel', 'mileage', 'tire', 'travel', 'tip',
+    'wedding', 'pet', 'garden', 'solar', 'energy', 'water', 'commission', 'equity', 'refinance',
+    'amortization',
+)
+QUALIFIERS = ('advanced', 'simple', 'monthly', 'annual', 'home', 'business', 'personal', 'net', 'total', 'smart')
+
+def pascal(words: List[str]) -> str:
+    return ''.join(part.capitalize() for word in words for part in word.split('-'))
+
+class CalculatorSpec:
+    """One synthetic calculator directory"""
+    __slots__ = ('words', 'category', 'style', 'broken', 'registered', 'listed', 'completed')
+
+    def __init__(self, words: List[str], category: Optional[str], style: str):
+        self.words = words
+        self.category = category
+        self.style = style
+        self.broken = self.registered = self.listed = self.completed = False
+
+    @property
+    def export_name(self) -> str:
+        return pascal(self.words) + 'Calculator'
+
+    @property
+    def dir_name(self) -> str:
+        if self.style == 'pascal':
+            return self.export_name
+        if self.style == 'snake':
+            return '_'.join(self.words).replace('-', '_') + '_calculator'
+        return '-'.join(self.words) + '-calculator'
+
+    @property
+    def rel_dir(self) -> str:
+        """Directory relative to src/calculators"""
+        return f'{self.category}/{self.dir_name}' if self.category else self.dir_name
+
+    @property
+    def title(self) -> str:
+        return ' '.join(word.replace('-', ' ').title() for word in self.words) + ' Calculator'
+
+def plan_tree(size: int, seed: int) -> List[CalculatorSpec]:
+    """Deterministic specs for `size` calculator directories"""
+    rng = random.Random(seed)
+    seen = set()
+    specs = []
+    styles, weights = zip(*NAMING_STYLES)
+    while len(specs) < size:
+        words = rng.sample(WORDS, rng.choice((1, 2, 2, 3)))
+        if rng.random() < 0.3:
+            words.insert(0, rng.choice(QUALIFIERS))
+        key = tuple(words)
+        if key in seen:
+            continue
+        seen.add(key)
+        style = rng.choices(styles, weights)[0]
+        # PascalCase directories sit directly under src/calculators, the rest in a category
+        category = None if style == 'pascal' else rng.choice(CATEGORIES)
+        spec = CalculatorSpec(words, category, style)
+        spec.broken = spec.category is not None and rng.random() < BROKEN_IMPORT_SHARE
+        spec.registered = rng.random() < REGISTERED_SHARE
+        spec.listed = rng.random() < LISTED_SHARE
+        spec.completed = spec.listed and rng.random() < 0.5
+        specs.append(spec)
+        if style == 'kebab' and len(specs) < size and rng.random() < DUPLICATE_SHARE:
+            other = rng.choice([c for c in CATEGORIES if c != category])
+            specs.append(CalculatorSpec(words, other, style))
+    return specs
+
+def calculator_source(spec: CalculatorSpec, ups: str) -> str:
+    inputs = ',\n'.join(f"""    {{
+      id: '{word.replace('-', '_')}',
+      label: '{word.replace('-', ' ').title()}',
+      type: 'number',
+      required: true,
+      min: 0,
+      tooltip: 'Enter the {word.replace('-', ' ')} value'
+    }}""" for word in spec.words + ['amount', 'rate'])
+    return f"""import {{ Calculator }} from '{ups}types/calculator';
+import {{ calculateResult }} from './formulas';
+import {{ validateInputs }} from './validation';
+
+export const {spec.export_name}: Calculator = {{
+  id: '{'-'.join(spec.words)}-calculator',
+  title: '{spec.title}',
+  category: '{spec.category or 'lifestyle'}',
+  subcategory: '{spec.words[-1].replace('-', ' ').title()}',
+  description: 'Estimate {' and '.join(w.replace('-', ' ') for w in spec.words)} with a detailed breakdown.',
+  usageInstructions: [
+    'Enter your {spec.words[0].replace('-', ' ')} details',
+    'Review the calculated results and breakdown'
+  ],
+  inputs: [
+{inputs}
+  ],
+  outputs: [
+    {{ id: 'result', label: 'Result', type: 'currency' }},
+    {{ id: 'breakdown', label: 'Breakdown', type: 'text' }}
+  ],
+  calculate: (inputs: Record<string, any>) => {{
+    const errors = validateInputs(inputs);
+    if (errors.length > 0) {{
+      return {{ result: 0, breakdown: errors.join(', ') }};
+    }}
+    return calculateResult(inputs);
+  }}
+}};
+"""
+
+def formulas_source(spec: CalculatorSpec, ups: str) -> str:
+    # A broken import climbs one level too far, like fix_relative_imports.py repairs
+    math_import = "'../../../utils/math'" if spec.broken else f"'{ups}utils/math'"
+    return f"""import {{ {pascal(spec.words)}Inputs, {pascal(spec.words)}Results }} from './types';
+import {{ roundTo }} from {math_import};
+
+export function calculateResult(inputs: Record<string, any>): {pascal(spec.words)}Results {{
+  const amount = Number(inputs.amount) || 0;
+  const rate = (Number(inputs.rate) || 0) / 100;
+  const result = roundTo(amount * (1 + rate), 2);
+  return {{ result, breakdown: `Base ${{amount}} at ${{rate * 100}}%` }};
+}}
+"""
+
+def write_calculator(root: str, spec: CalculatorSpec) -> None:
+    directory = os.path.join(root, 'src/calculators', spec.rel_dir)
+    os.makedirs(directory, exist_ok=True)
+    ups = '../' * spec.rel_dir.count('/') + '../'
+    base = pascal(spec.words)
+    files = {
+        f'{spec.export_name}.ts': calculator_source(spec, ups),
+        'formulas.ts': formulas_source(spec, ups),
+        'types.ts': (f"export interface {base}Inputs {{\n  amount: number;\n  rate: number;\n}}\n\n"
+                     f"export interface {base}Results {{\n  result: number;\n  breakdown: string;\n}}\n"),
+        'validation.ts': ("export function validateInputs(inputs: Record<string, any>): string[] {\n"
+                          "  const errors: string[] = [];\n"
+                          "  if (inputs.amount === undefined || inputs.amount < 0) errors.push('Amount must be positive');\n"
+                          "  return errors;\n}\n"),
+        'register.ts': (f"import {{ calculatorRegistry }} from '{ups}data/calculatorRegistry';\n"
+                        f"import {{ {spec.export_name} }} from './{spec.export_name}';\n\n"
+                        f"export function register{spec.export_name}(): void {{\n"
+                        f"  calculatorRegistry.register({spec.export_name});\n}}\n"),
+        'index.ts': (f"export {{ {spec.export_name} }} from './{spec.export_name}';\n"
+                     f"export * from './types';\nexport * from './formulas';\n"),
+    }
+    for name, content in files.items():
+        with open(os.path.join(directory, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+def index_source(specs: List[CalculatorSpec], rng: random.Random) -> str:
+    imports, registrations = [], []
+    for spec in specs:
+        if not spec.registered:
+            continue
+        name = spec.export_name
+        roll = rng.random()
+        if roll < 0.8:
+            path = f'./{spec.rel_dir}/{name}'
+        elif roll < 0.9:
+            # Doubled suffix, as generators used to emit
+            path = f'./{spec.dir_name}Calculator/{name}Calculator'
+        else:
+            path = f'./{spec.dir_name}-legacy/{name}'
+        imports.append(f"import {{ {name} as {name} }} from '{path}';")
+        registrations.append(f'    calculatorRegistry.register({name});')
+    return ("import { calculatorRegistry } from '../data/calculatorRegistry';\n"
+            + '\n'.join(imports)
+            + "\n\n/**\n * Register all calculators with the system\n */\n"
+            "export function registerAllCalculators(): void {\n"
+            + '\n'.join(registrations)
+            + "\n}\n\nPromise.resolve().then(() => {\n  registerAllCalculators();\n});\n")
+
+def list_source(specs: List[CalculatorSpec], rng: random.Random) -> str:
+    sections = {hub: [] for hub in HUB_CATEGORIES}
+    hubs = list(HUB_CATEGORIES)
+    for spec in specs:
+        if spec.listed:
+            sections[rng.choice(hubs)].append(spec)
+    lines = ['# Calculator List', '', '**Total: ~1000 Industry-Leading Calculators**', '']
+    for hub, items in sections.items():
+        lines.append(f'### {hub} ({len(items)} calculators)')
+        lines.extend(f"- [{'x' if spec.completed else ' '}] {to_human(spec.dir_name)}" for spec in items)
+        lines.append('')
+    lines += ['---', '', '## Summary', '']
+    lines += [f'- {group}: 0' for group in ('Finance & Investment', 'Legal, Insurance & Settlements',
+                                             'Business, Marketing & Operations', 'Health, Fitness & Diet',
+                                             'Construction & Industrial', 'Math & Science', 'Lifestyle & Automotive')]
+    lines += ['', '**VERIFIED WORKING CALCULATORS: 0**', '**TOTAL IMPLEMENTED: 0**', '**REMAINING TO BUILD: 0**', '']
+    return '\n'.join(lines)
+
+def generate_tree(root: str, size: int, seed: int = 0) -> Dict:
+    """Write a synthetic tree under root and return its shape"""
+    specs = plan_tree(size, seed)
+    rng = random.Random(seed + 1)
+    for spec in specs:
+        write_calculator(root, spec)
+
+    os.makedirs(os.path.join(root, 'src/types'), exist_ok=True)
+    os.makedirs(os.path.join(root, 'src/data'), exist_ok=True)
+    with open(os.path.join(root, 'src/types/calculator.ts'), 'w', encoding='utf-8') as f:
+        f.write("export interface Calculator {\n  id: string;\n  title: string;\n  category: string;\n}\n")
+    with open(os.path.join(root, 'src/calculators/index.ts'), 'w', encoding='utf-8') as f:
+        f.write(index_source(specs, rng))
+    with open(os.path.join(root, 'calculator-list-CORRECTED.md'), 'w', encoding='utf-8') as f:
+        f.write(list_source(specs, rng))
+    with open(os.path.join(root, 'calculator_implementation_progress.json'), 'w', encoding='utf-8') as f:
+        json.dump({'lastProcessed': specs[-1].title if specs else None,
+                   'completed': [spec.title for spec in specs if spec.completed]}, f, indent=2)
+
+    files = total_bytes = 0
+    for dirpath, _, filenames in os.walk(os.path.join(root, 'src/calculators')):
+        for name in filenames:
+            if name.endswith('.ts'):
+                files += 1
+                total_bytes += os.path.getsize(os.path.join(dirpath, name))
+    return {
+        'directories': len(specs),
+        'duplicates': len(specs) - len({spec.rel_dir.rsplit('/', 1)[-1] for spec in specs}),
+        'broken_imports': sum(spec.broken for spec in specs),
+        'registered': sum(spec.registered for spec in specs),
+        'files': files,
+        'bytes': total_bytes,
+    }
+
+def read_syscalls(io_file: str) -> Optional[int]:
+    """read + write syscalls from a /proc/<pid>/io dump, or None if there is none"""
+    try:
+        with open(io_file, 'r') as f:
+            stats = dict(line.split(': ', 1) for line in f.read().splitlines() if ': ' in line)
+        return int(stats['syscr']) + int(stats['syscw'])
+    except (OSError, KeyError, ValueError):
+        return None
+    finally:
+        if os.path.exists(io_file):
+            os.remove(io_file)
+
+def run_script(command: List[str], cwd: str) -> Dict:
+    """Run a script in cwd; wall time, CPU time, peak RSS and syscalls of the child"""
+    io_file = cwd.rstrip('/') + '.io'
+    env = dict(os.environ, PYTHONPATH=REPO_DIR, PYTHONDONTWRITEBYTECODE='1', BENCHMARK_IO_FILE=io_file)
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', RUNNER, os.path.join(REPO_DIR, command[0]), *command[1:]],
+                               cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    # stderr is small (tracebacks); drain it before reaping so rusage belongs to this child alone
+    stderr = process.stderr.read()
+    process.stderr.close()
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss_bytes = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return {
+        'seconds': elapsed,
+        'cpu_seconds': usage.ru_utime + usage.ru_stime,
+        'peak_rss_mb': rss_bytes / (1024 * 1024),
+        'syscalls': read_syscalls(io_file),
+        'exit_code': process.returncode,
+        'stderr': stderr.decode('utf-8', 'replace')[-2000:],
+    }
+
+def benchmark(pristine: str, workdir: str, name: str, files: int, repeat: int) -> Dict:
+    """Median of `repeat` runs, each in a fresh copy of the pristine tree"""
+    runs = []
+    for _ in range(repeat):
+        shutil.rmtree(workdir, ignore_errors=True)
+        shutil.copytree(pristine, workdir, symlinks=True)
+        runs.append(run_script(BENCHMARKS[name], workdir))
+    seconds = statistics.median(run['seconds'] for run in runs)
+    syscalls = [run['syscalls'] for run in runs if run['syscalls'] is not None]
+    result = {
+        'seconds': seconds,
+        'runs': [run['seconds'] for run in runs],
+        'cpu_seconds': statistics.median(run['cpu_seconds'] for run in runs),
+        'files_per_second': files / seconds if seconds else 0.0,
+        'us_per_file': seconds / files * 1e6 if files else 0.0,
+        'peak_rss_mb': max(run['peak_rss_mb'] for run in runs),
+        'syscalls_per_file': statistics.median(syscalls) / files if syscalls and files else None,
+        'exit_code': next((run['exit_code'] for run in runs if run['exit_code']), 0),
+    }
+    if result['exit_code']:
+        result['stderr'] = next(run['stderr'] for run in runs if run['exit_code'])
+    return result
+
+def corpus_tree(workdir: str, size: int, seed: int) -> Tuple[str, Dict]:
+    """Pristine tree for a size, reusing one generated earlier with the same generator and seed"""
+    pristine = os.path.join(workdir, f'tree-{size}')
+    marker = pristine + '.json'
+    if os.path.isdir(pristine) and os.path.exists(marker):
+        with open(marker, 'r', encoding='utf-8') as f:
+            shape = json.load(f)
+        if shape.get('generator_version') == GENERATOR_VERSION and shape.get('seed') == seed:
+            print(f"♻️  Reusing {size} calculator directories in {pristine}")
+            return pristine, shape
+
+    shutil.rmtree(pristine, ignore_errors=True)
+    print(f"🏗️  Generating {size} calculator directories...")
+    started = time.perf_counter()
+    shape = generate_tree(pristine, size, seed)
+    shape['generate_seconds'] = time.perf_counter() - started
+    print(f"   {shape['files']} files, {shape['bytes'] / 1e6:.1f} MB in {shape['generate_seconds']:.1f}s")
+    with open(marker, 'w', encoding='utf-8') as f:
+        json.dump({**shape, 'generator_version': GENERATOR_VERSION, 'seed': seed}, f, indent=2)
+    return pristine, shape
+
+def run_suite(sizes: List[int], names: List[str], repeat: int, seed: int, workdir: str) -> Dict:
+    results = {
+        'version': RESULTS_VERSION,
+        'generator_version': GENERATOR_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'repeat': repeat,
+        'sizes': {},
+    }
+    for size in sizes:
+        pristine, shape = corpus_tree(workdir, size, seed)
+
+        scripts = {}
+        for name in names:
+            result = benchmark(pristine, os.path.join(workdir, 'run'), name, shape['files'], repeat)
+            scripts[name] = result
+            status = '✅' if not result['exit_code'] else f"❌ exit {result['exit_code']}"
+            print(f"   {status} {name:<24} {result['seconds']:8.2f}s {result['us_per_file']:9.1f} µs/file "
+                  f"{result['peak_rss_mb']:8.1f} MB")
+        shape = {key: value for key, value in shape.items() if key not in ('generator_version', 'seed')}
+        results['sizes'][str(size)] = {**shape, 'scripts': scripts}
+        shutil.rmtree(os.path.join(workdir, 'run'), ignore_errors=True)
+    return results
+
+# History and comparison
+
+def current_commit() -> Tuple[str, bool]:
+    """HEAD commit and whether the working tree has changes ('worktree' outside git)"""
+    try:
+        head = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return 'worktree', True
+    return head, bool(status.strip())
+
+def resolve_ref(ref: str) -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--verify', f'{ref}^{{commit}}'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ref
+
+def load_history(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {'version': RESULTS_VERSION, 'runs': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def record_run(history: Dict, results: Dict, commit: str, dirty: bool) -> None:
+    """Store results under a commit, replacing an earlier run of the same commit and state"""
+    history['runs'] = [run for run in history['runs'] if (run['commit'], run['dirty']) != (commit, dirty)]
+    history['runs'].append({**results, 'commit': commit, 'dirty': dirty})
+
+def find_baseline(history: Dict, ref: Optional[str], commit: str) -> Optional[Dict]:
+    """Latest run recorded for ref, or by default the latest run of another commit
+    (falling back to an earlier run of this one)"""
+    runs = history['runs']
+    if ref:
+        full = resolve_ref(ref)
+        matches = [run for run in runs if run['commit'].startswith(full) or run['commit'].startswith(ref)]
+        return matches[-1] if matches else None
+    others = [run for run in runs if run['commit'] != commit]
+    return (others or runs or [None])[-1]
+
+def compare_runs(baseline: Dict, results: Dict, tolerance: float, min_delta: float) -> List[Dict]:
+    """One row per size, script and metric; status is ok, regression, improved, new or skipped"""
+    rows = []
+    for size, data in results['sizes'].items():
+        base_size = baseline['sizes'].get(size)
+        same_corpus = (base_size is not None and baseline.get('seed') == results['seed']
+                       and baseline.get('generator_version') == results['generator_version'])
+        for name, result in data['scripts'].items():
+            base = base_size['scripts'].get(name) if same_corpus else None
+            for metric, unit, noisy in METRICS:
+                row = {'size': size, 'script': name, 'metric': metric, 'unit': unit,
+                       'baseline': base.get(metric) if base else None, 'current': result.get(metric),
+                       'change': None, 'status': 'new' if same_corpus else 'skipped'}
+                rows.append(row)
+                if row['baseline'] is None or row['current'] is None:
+                    continue
+                delta = row['current'] - row['baseline']
+                row['change'] = delta / row['baseline'] * 100 if row['baseline'] else 0.0
+                floor = max(min_delta, max(base['runs']) - min(base['runs'])) if noisy else 0.0
+                if row['change'] > tolerance and delta > floor:
+                    row['status'] = 'regression'
+                elif row['change'] < -tolerance and -delta > floor:
+                    row['status'] = 'improved'
+                else:
+                    row['status'] = 'ok'
+    return rows
+
+def print_comparison(rows: List[Dict], baseline: Dict) -> None:
+    icons = {'ok': '✅', 'regression': '❌', 'improved': '🚀', 'new': '🆕', 'skipped': '⏭️ '}
+    label = baseline['commit'][:12] + (' (dirty)' if baseline.get('dirty') else '')
+    print(f"\n📈 Compared with {label}, recorded {baseline.get('created', '?')}")
+    print(f"   {'size':>7}  {'script':<24} {'metric':<18} {'baseline':>12} {'current':>12} {'change':>8}")
+    for row in rows:
+        fmt = lambda value: '-' if value is None else f"{value:.3f}{row['unit']}"
+        change = '-' if row['change'] is None else f"{row['change']:+.1f}%"
+        print(f"{icons[row['status']]} {row['size']:>7}  {row['script']:<24} {row['metric']:<18} "
+              f"{fmt(row['baseline']):>12} {fmt(row['current']):>12} {change:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the maintenance scripts on synthetic calculator trees')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='calculator directories per synthetic tree (e.g. 1000 10000 50000)')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per benchmark; the median is reported')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the synthetic trees')
+    parser.add_argument('--workdir', help='where to generate and reuse trees (default: a temporary directory)')
+    parser.add_argument('--keep', action='store_true', help='keep the temporary directory')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='JSON results file')
+    parser.add_argument('--history', default=HISTORY_FILE, help='local history of recorded runs')
+    parser.add_argument('--record', action='store_true', help='store this run under the current commit')
+    parser.add_argument('--compare', nargs='?', const='', metavar='REF',
+                        help='compare with the run recorded for REF (default: the latest other commit)')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed slowdown / growth in percent before a metric counts as a regression')
+    parser.add_argument('--min-delta', type=float, default=DEFAULT_MIN_DELTA,
+                        help='ignore time differences smaller than this many seconds')
+    args = parser.parse_args()
+
+    history = load_history(args.history)
+    commit, dirty = current_commit()
+    baseline = None
+    if args.compare is not None:
+        baseline = find_baseline(history, args.compare or None, commit)
+        if baseline is None:
+            print(f"❌ No recorded run for {args.compare or 'a baseline'} in {args.history}; run with --record first")
+            return 2
+        if args.repeat < 3:
+            print("⚠️  Comparing with fewer than 3 repeats; expect noisy timings")
+
+    names = args.only or list(BENCHMARKS)
+    workdir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix='calculator-bench-')
+    os.makedirs(workdir, exist_ok=True)
+    try:
+        results = run_suite(args.sizes, names, max(1, args.repeat), args.seed, workdir)
+    finally:
+        if args.keep:
+            print(f"📁 Trees kept in {workdir}")
+        elif not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"📊 Results written to {args.output}")
+
+    if args.record:
+        record_run(history, results, commit, dirty)
+        with open(args.history, 'w', encoding='utf-8') as f:
+            json.dump(history, f, indent=2)
+        print(f"💾 Recorded under {commit[:12]}{' (dirty)' if dirty else ''} in {args.history}")
+
+    failed = [f"{size}/{name}" for size, data in results['sizes'].items()
+              for name, result in data['scripts'].items() if result['exit_code']]
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}")
+        return 1
+
+    if baseline is not None:
+        rows = compare_runs(baseline, results, args.tolerance, args.min_delta)
+        print_comparison(rows, baseline)
+        regressions = [row for row in rows if row['status'] == 'regression']
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions beyond {args.tolerance:g}%")
+            return 1
+        print(f"\n✅ No regressions beyond {args.tolerance:g}%")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
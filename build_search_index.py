@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Prebuilt calculator search index
+
+CalculatorRegistry search lowercases and substring-scans title, description,
+category and subcategory of every calculator on each keystroke. This script
+precomputes what the runtime needs into src/data/calculatorSearchIndex.generated.ts:
+1. One document per calculator in the lazy manifest (see generate_calculator_manifest.py)
+2. Trigram postings over the same lowercased fields the registry searches, so a
+   query of 3+ characters only has to verify the intersection of its trigrams' postings
+3. Ranked prefix tables over the calculator names (the title plus the human name
+   update_list.py derives from the directory), to put name matches first. Every
+   result is still a substring match, as on the unindexed path; 1-2 character
+   queries have no trigram, so they check every calculator in ranked order
+
+Usage:
+    python build_search_index.py [--check]
+"""
+
+import os
+import re
+import json
+import argparse
+from collections import defaultdict
+from typing import Dict, List
+
+from calculator_categories import to_human
+from find_unreachable_calculators import registered_modules
+from generate_calculator_manifest import build_manifest
+from git_scope import add_scope_arguments, scope_from_args, touches
+
+INDEX_FILE = 'src/data/calculatorSearchIndex.generated.ts'
+INDEX_VERSION = 1
+SEARCH_FIELDS = ('title', 'description', 'category', 'subcategory')
+MAX_PREFIX_LENGTH = 4
+TOKEN = re.compile(r'[a-z0-9]+')
+
+def trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def document_names(entry: Dict) -> List[str]:
+    """Names a calculator is known by: its title and the human name of its directory"""
+    names = [entry['title']]
+    human = to_human(os.path.basename(os.path.dirname(entry['path'])))
+    if human.lower() != entry['title'].lower():
+        names.append(human)
+    return names
+
+def build_index(entries: List[Dict]) -> Dict:
+    """Compact index: document ids, trigram postings and ranked prefix tables"""
+    ids = [entry['id'] for entry in entries]
+    postings = defaultdict(list)
+    prefix_scores = defaultdict(dict)
+
+    for doc, entry in enumerate(entries):
+        grams = set()
+        for field in SEARCH_FIELDS:
+            if entry.get(field):
+                grams |= trigrams(entry[field].lower())
+        for gram in grams:
+            postings[gram].append(doc)
+
+        # Rank: names first (title before alias), earlier tokens first, shorter titles first
+        for name_rank, name in enumerate(document_names(entry)):
+            for position, token in enumerate(TOKEN.findall(name.lower())):
+                for length in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1):
+                    score = (name_rank, position, len(entry['title']), doc)
+                    table = prefix_scores[token[:length]]
+                    if doc not in table or score < table[doc]:
+                        table[doc] = score
+
+    prefixes = {
+        prefix: [doc for doc, _ in sorted(scores.items(), key=lambda item: item[1])]
+        for prefix, scores in prefix_scores.items()
+    }
+    return {
+        'version': INDEX_VERSION,
+        'ids': ids,
+        'maxPrefixLength': MAX_PREFIX_LENGTH,
+        'trigrams': dict(sorted(postings.items())),
+        'prefixes': dict(sorted(prefixes.items())),
+    }
+
+def render_index(index: Dict) -> str:
+    """TypeScript module for the index (no JSON module support needed in tsconfig)"""
+    return (
+        '// Generated by build_search_index.py from the calculator manifest - do not edit\n'
+        "import { CalculatorSearchIndexData } from './calculatorSearchIndex';\n"
+        '\n'
+        'export const calculatorSearchIndexData: CalculatorSearchIndexData = '
+        + json.dumps(index, separators=(',', ':'))
+        + ';\n'
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the prebuilt calculator search index')
+    parser.add_argument('--check', action='store_true', help='exit 1 if the index is out of date instead of writing it')
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+
+    if not touches(scope_from_args(args)):
+        print("⏩ No calculator changes; search index left as is")
+        return 0
+
+    entries, _ = build_manifest(registered_modules())
+    index = build_index(entries)
+    source = render_index(index)
+
+    print(f"🔎 Indexed {len(index['ids'])} calculators: {len(index['trigrams'])} trigrams, "
+          f"{len(index['prefixes'])} prefixes, {len(source) / 1024:.1f} KB")
+
+    current = None
+    if os.path.exists(INDEX_FILE):
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            current = f.read()
+
+    if args.check:
+        if current != source:
+            print(f"❌ {INDEX_FILE} is out of date, run build_search_index.py")
+            return 1
+        print(f"✅ {INDEX_FILE} is up to date")
+        return 0
+
+    if current != source:
+        with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+            f.write(source)
+        print(f"✅ Wrote {INDEX_FILE}")
+    else:
+        print(f"✅ {INDEX_FILE} already up to date")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+SQLite calculator catalog
+
+Replaces the loose inventories (all_dirs.txt, existing_dirs.txt, existing_names.txt,
+imports.txt, unimplemented_calculators.txt, ...) that each script re-reads and
+re-parses with ad-hoc string splitting. One local database, calculator_catalog.db,
+holds indexed tables for:
+1. directories: every directory under src/calculators, with its human name
+2. identifiers: names exported by each calculator source file
+3. listed_names: calculators in calculator-list-CORRECTED.md, with hub and checkbox
+4. registrations: imports and register calls in src/calculators/index.ts
+5. implementation: completion recorded in calculator_implementation_progress.json
+
+refresh() is incremental: source files are only re-read when their mtime or size
+changed, and the list, index and progress files only when they changed.
+
+Usage:
+    python calculator_catalog.py refresh
+    python calculator_catalog.py query "SELECT name FROM directories WHERE depth = 1"
+    python calculator_catalog.py export all_dirs existing_names
+"""
+
+import os
+import re
+import json
+import sqlite3
+import argparse
+from typing import Dict, List, Optional, Set
+
+from calculator_categories import path_category, to_human
+from find_unreachable_calculators import INDEX_FILE, REGISTER_CALL
+from ts_scanner import imported_bindings, scan
+
+CATALOG_FILE = 'calculator_catalog.db'
+CALCULATORS_DIR = 'src/calculators'
+CALCULATOR_LIST = 'calculator-list-CORRECTED.md'
+PROGRESS_FILE = 'calculator_implementation_progress.json'
+SCHEMA_VERSION = 1
+
+EXPORT_PATTERN = re.compile(r'^export\s+(?:default\s+)?(?:async\s+)?(const|let|var|function|class|interface|type|enum)\s+(\w+)', re.M)
+LIST_ITEM = re.compile(r'^- \[([ x])\] (.+?)(?:\s*✅.*)?$')
+HUB_HEADER = re.compile(r'^### (.+? Hub) \(\d+ calculators\)')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY, directory TEXT NOT NULL, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS files_directory ON files (directory);
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY, name TEXT NOT NULL, parent TEXT, depth INTEGER NOT NULL,
+    category TEXT, human_name TEXT NOT NULL, normalized TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS directories_name ON directories (name);
+CREATE INDEX IF NOT EXISTS directories_normalized ON directories (normalized);
+CREATE INDEX IF NOT EXISTS directories_category ON directories (category);
+CREATE TABLE IF NOT EXISTS identifiers (
+    file TEXT NOT NULL, name TEXT NOT NULL, kind TEXT NOT NULL, directory TEXT NOT NULL,
+    PRIMARY KEY (file, name));
+CREATE INDEX IF NOT EXISTS identifiers_name ON identifiers (name);
+CREATE INDEX IF NOT EXISTS identifiers_directory ON identifiers (directory);
+CREATE TABLE IF NOT EXISTS listed_names (
+    name TEXT PRIMARY KEY, normalized TEXT NOT NULL, hub TEXT, checked INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS listed_names_normalized ON listed_names (normalized);
+CREATE TABLE IF NOT EXISTS registrations (
+    identifier TEXT PRIMARY KEY, specifier TEXT NOT NULL, registered INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS registrations_specifier ON registrations (specifier);
+CREATE TABLE IF NOT EXISTS implementation (
+    item TEXT NOT NULL, source TEXT NOT NULL, status TEXT NOT NULL, PRIMARY KEY (item, source));
+CREATE INDEX IF NOT EXISTS implementation_status ON implementation (status);
+"""
+
+def normalize_name(name: str) -> str:
+    """Match key shared by list names and directory names, as in parse_calculators.cjs"""
+    name = re.sub(r'[^a-z0-9\s]', '', name.lower())
+    name = re.sub(r'\s+', '', name)
+    return re.sub(r'calculator$', '', name)
+
+class CalculatorCatalog:
+    def __init__(self, path: str = CATALOG_FILE):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        if self._meta('schema') != str(SCHEMA_VERSION):
+            with self.db:
+                for table in ('files', 'directories', 'identifiers', 'listed_names', 'registrations', 'implementation'):
+                    self.db.execute(f'DELETE FROM {table}')
+                # Stale stamps would make the next refresh skip index.ts and the lists it just emptied
+                self.db.execute("DELETE FROM meta WHERE key LIKE 'stamp:%'")
+                self._set_meta('schema', str(SCHEMA_VERSION))
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.db.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.db.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def _source_changed(self, path: str) -> bool:
+        """Whether a whole-file input changed since the last refresh (and remember its stamp)"""
+        stamp = 'missing'
+        if os.path.exists(path):
+            st = os.stat(path)
+            stamp = f'{st.st_mtime_ns}:{st.st_size}'
+        if self._meta(f'stamp:{path}') == stamp:
+            return False
+        self._set_meta(f'stamp:{path}', stamp)
+        return True
+
+    # Population
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the catalog up to date with the tree, re-reading only what changed"""
+        stats = {'directories': 0, 'files': 0, 'parsed': 0, 'removed': 0}
+        with self.db:
+            self._refresh_tree(stats)
+            if self._source_changed(CALCULATOR_LIST):
+                self._refresh_listed_names()
+            if self._source_changed(INDEX_FILE):
+                self._refresh_registrations()
+            if self._source_changed(PROGRESS_FILE):
+                self._refresh_implementation()
+        return stats
+
+    def _refresh_tree(self, stats: Dict[str, int]) -> None:
+        known = dict((path, (mtime, size)) for path, mtime, size in
+                     self.db.execute('SELECT path, mtime_ns, size FROM files'))
+        seen_files, directories = set(), []
+
+        for root, dirs, files in os.walk(CALCULATORS_DIR):
+            root = root.replace(os.sep, '/')
+            if root != CALCULATORS_DIR:
+                name = os.path.basename(root)
+                rel = os.path.relpath(root, CALCULATORS_DIR).replace(os.sep, '/')
+                parent = os.path.dirname(root) if os.path.dirname(root) != CALCULATORS_DIR else None
+                base = name[:-len('Calculator')] if name.endswith('Calculator') else name
+                directories.append((root, name, parent, rel.count('/') + 1, path_category(root + '/'),
+                                    to_human(name), normalize_name(base)))
+
+            for filename in files:
+                if not filename.endswith(('.ts', '.tsx')):
+                    continue
+                path = f'{root}/{filename}'
+                st = os.stat(path)
+                seen_files.add(path)
+                if known.get(path) == (st.st_mtime_ns, st.st_size):
+                    continue
+                self._index_file(path, root, st)
+                stats['parsed'] += 1
+
+        self.db.execute('DELETE FROM directories')
+        self.db.executemany('INSERT INTO directories VALUES (?, ?, ?, ?, ?, ?, ?)', directories)
+
+        removed = set(known) - seen_files
+        for path in removed:
+            self.db.execute('DELETE FROM files WHERE path = ?', (path,))
+            self.db.execute('DELETE FROM identifiers WHERE file = ?', (path,))
+        stats.update(directories=len(directories), files=len(seen_files), removed=len(removed))
+
+    def _index_file(self, path: str, directory: str, st: os.stat_result) -> None:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        self.db.execute('DELETE FROM identifiers WHERE file = ?', (path,))
+        self.db.executemany(
+            'INSERT OR IGNORE INTO identifiers (file, name, kind, directory) VALUES (?, ?, ?, ?)',
+            [(path, name, kind, directory) for kind, name in EXPORT_PATTERN.findall(content)])
+        self.db.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)',
+                        (path, directory, st.st_mtime_ns, st.st_size))
+
+    def _refresh_listed_names(self) -> None:
+        self.db.execute('DELETE FROM listed_names')
+        if not os.path.exists(CALCULATOR_LIST):
+            return
+        hub = None
+        rows = {}
+        with open(CALCULATOR_LIST, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                header = HUB_HEADER.match(line)
+                if header:
+                    hub = header.group(1)
+                    continue
+                item = LIST_ITEM.match(line)
+                if item:
+                    name = item.group(2).replace('**', '').strip()
+                    rows.setdefault(name, (name, normalize_name(name), hub, int(item.group(1) == 'x')))
+        self.db.executemany('INSERT INTO listed_names VALUES (?, ?, ?, ?)', rows.values())
+
+    def _refresh_registrations(self) -> None:
+        self.db.execute('DELETE FROM registrations')
+        if not os.path.exists(INDEX_FILE):
+            return
+        with open(INDEX_FILE, 'rb') as f:
+            source = f.read()
+        imported = imported_bindings(scan(source))
+        content = source.decode('utf-8')
+        registered = set()
+        for line in content.split('\n'):
+            match = REGISTER_CALL.search(line)
+            if match and not line.strip().startswith('//'):
+                registered.add(match.group(1).strip())
+
+        self.db.executemany('INSERT INTO registrations VALUES (?, ?, ?)',
+                            [(name, specifier, int(name in registered)) for name, specifier in imported.items()])
+
+    def _refresh_implementation(self) -> None:
+        self.db.execute('DELETE FROM implementation')
+        if not os.path.exists(PROGRESS_FILE):
+            return
+        with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
+            progress = json.load(f)
+
+        rows = {}
+        # Top-level keys belong to automate_calculator_implementation.cjs; dict values are batch_progress.py sections
+        for item in progress.get('completed', []):
+            rows[(item, 'automation')] = 'completed'
+        for section, state in progress.items():
+            if not isinstance(state, dict):
+                continue
+            for item in state.get('completed', []):
+                rows[(item, section)] = 'completed'
+            for item in state.get('failed', {}):
+                rows[(item, section)] = 'failed'
+        self.db.executemany('INSERT INTO implementation VALUES (?, ?, ?)',
+                            [(item, source, status) for (item, source), status in rows.items()])
+
+    # Queries
+
+    def top_level_directories(self) -> List[str]:
+        """Directory names directly under src/calculators (all_dirs.txt / existing_dirs.txt)"""
+        return [row[0] for row in self.db.execute('SELECT name FROM directories WHERE depth = 1 ORDER BY name')]
+
+    def listed_names(self) -> Set[str]:
+        """Calculator names in the calculator list (existing_names.txt)"""
+        return {row[0] for row in self.db.execute('SELECT name FROM listed_names')}
+
+    def unimplemented_names(self) -> List[str]:
+        """Listed calculators with no matching top-level directory, as parse_calculators.cjs reports"""
+        return [row[0] for row in self.db.execute(
+            'SELECT l.name FROM listed_names l WHERE NOT EXISTS '
+            '(SELECT 1 FROM directories d WHERE d.depth = 1 AND d.normalized = l.normalized) ORDER BY l.name')]
+
+    def registered_identifiers(self) -> List[str]:
+        """Identifiers imported by index.ts (imports.txt)"""
+        return [row[0] for row in self.db.execute('SELECT identifier FROM registrations ORDER BY identifier')]
+
+    def query(self, sql: str, params=()) -> List[tuple]:
+        return self.db.execute(sql, params).fetchall()
+
+# Legacy inventories the shell scripts can still be pointed at
+EXPORTS = {
+    'all_dirs': ('all_dirs.txt', lambda c: [f'{CALCULATORS_DIR}/{name}' for name in c.top_level_directories()]),
+    'existing_dirs': ('existing_dirs.txt', lambda c: c.top_level_directories()),
+    'existing_names': ('existing_names.txt', lambda c: [f'- [ ] {name}' for name in sorted(c.listed_names())]),
+    'imports': ('imports.txt', lambda c: c.registered_identifiers()),
+    'unimplemented': ('unimplemented_calculators.txt', lambda c: c.unimplemented_names()),
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='Maintain and query the SQLite calculator catalog')
+    parser.add_argument('--db', default=CATALOG_FILE, help=f'catalog database (default: {CATALOG_FILE})')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('refresh', help='update the catalog from the tree')
+    query = sub.add_parser('query', help='run a read-only SQL query')
+    query.add_argument('sql')
+    export = sub.add_parser('export', help='regenerate legacy .txt inventories from the catalog')
+    export.add_argument('names', nargs='*', choices=sorted(EXPORTS), help='inventories to write (default: all)')
+    args = parser.parse_args()
+
+    catalog = CalculatorCatalog(args.db)
+    try:
+        stats = catalog.refresh()
+        if args.command == 'refresh':
+            print(f"📚 {stats['directories']} directories, {stats['files']} files "
+                  f"({stats['parsed']} re-read, {stats['removed']} removed)")
+        elif args.command == 'query':
+            for row in catalog.query(args.sql):
+                print('\t'.join('' if value is None else str(value) for value in row))
+        else:
+            for name in args.names or sorted(EXPORTS):
+                filename, rows = EXPORTS[name]
+                lines = rows(catalog)
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(lines) + '\n')
+                print(f"✅ Wrote {filename} ({len(lines)} lines)")
+    finally:
+        catalog.close()
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
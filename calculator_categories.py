@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Shared calculator category knowledge
+
+Used by consolidate_duplicates.py, update_list.py and generate_calculator_manifest.py:
+1. CATEGORY_PRIORITY: the registry categories, most to least preferred when a
+   calculator (or a module shared between calculators) belongs to several
+2. HUB_CATEGORIES: the calculator-list hubs and the registry category each rolls up to
+3. HUB_RULES / categorize(): the keyword rules that place a calculator name in a hub,
+   compiled into one keyword automaton
+4. to_human(): the human calculator name derived from a directory name
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Priority order for keeping calculators (most to least preferred)
+CATEGORY_PRIORITY = [
+    'finance',      # Finance calculators first
+    'business',     # Business calculators second
+    'legal',        # Legal calculators third
+    'health',       # Health calculators fourth
+    'construction', # Construction calculators fifth
+    'math',         # Math calculators sixth
+    'lifestyle'     # Lifestyle calculators last
+]
+
+# Hub -> registry category, in calculator-list order
+HUB_CATEGORIES = {
+    'Mortgage & Real Estate Hub': 'finance',
+    'Retirement & Savings Hub': 'finance',
+    'Investment & Portfolio Hub': 'finance',
+    'Loans & Debt Hub': 'finance',
+    'Cryptocurrency Hub': 'finance',
+    'Legal Settlement Hub': 'legal',
+    'Insurance Hub': 'legal',
+    'Business Operations & Finance Hub': 'business',
+    'Marketing & Creator Hub': 'business',
+    'Health & Fitness Hub': 'health',
+    'Construction Hub': 'construction',
+    'Math Hub': 'math',
+    'Lifestyle & Automotive Hub': 'lifestyle',
+}
+
+def category_priority(category: Optional[str]) -> int:
+    """Priority score for a category (lower is better; unknown categories last)"""
+    if category in CATEGORY_PRIORITY:
+        return CATEGORY_PRIORITY.index(category)
+    return len(CATEGORY_PRIORITY)
+
+def path_category(path: str) -> Optional[str]:
+    """Highest-priority category directory a calculator path sits under"""
+    for category in CATEGORY_PRIORITY:
+        if f'/{category}/' in path:
+            return category
+    return None
+
+def hubs_for(category: str) -> List[str]:
+    """Hubs that roll up to a registry category"""
+    return [hub for hub, hub_category in HUB_CATEGORIES.items() if hub_category == category]
+
+def to_human(name):
+    if name.endswith('Calculator'):
+        name = name[:-10]
+    name = name.replace('_', ' ').title()
+    return name + ' Calculator'
+
+# Hub keyword rules, highest priority first: a name goes to the first hub with a
+# keyword occurring anywhere in it (lowercased), otherwise to DEFAULT_HUB
+HUB_RULES = [
+    ('Mortgage & Real Estate Hub', ('mortgage', 'real estate', 'property', 'home', 'rental')),
+    ('Retirement & Savings Hub', ('retirement', '401k', 'ira', 'annuity', 'social security', 'life insurance',
+                                  'savings', 'pension', 'college', 'student loan')),
+    ('Investment & Portfolio Hub', ('investment', 'portfolio', 'stock', 'bond', 'dividend', 'equity', 'forex',
+                                    'futures', 'options', 'reit')),
+    ('Loans & Debt Hub', ('loan', 'debt', 'credit')),
+    ('Cryptocurrency Hub', ('crypto', 'bitcoin', 'blockchain', 'nft', 'ethereum')),
+    ('Legal Settlement Hub', ('legal', 'settlement', 'lawsuit', 'malpractice', 'injury', 'accident', 'divorce',
+                              'patent')),
+    ('Insurance Hub', ('insurance',)),
+    ('Business Operations & Finance Hub', ('business', 'marketing', 'roi', 'valuation', 'payback', 'break even',
+                                           'churn', 'saas', 'customer')),
+    ('Health & Fitness Hub', ('health', 'fitness', 'calorie', 'diet', 'bmi', 'body', 'blood', 'cholesterol')),
+    ('Construction Hub', ('construction', 'concrete', 'drywall', 'flooring', 'roofing')),
+    ('Math Hub', ('math', 'algebra', 'calculus', 'geometry', 'trigonometry', 'probability')),
+]
+DEFAULT_HUB = 'Lifestyle & Automotive Hub'
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over prioritized keyword rules
+
+    Every keyword is matched in one left-to-right pass over the text, so
+    classifying a name costs its length rather than one scan per keyword.
+    classify() returns the lowest rule index with a keyword in the text.
+    """
+
+    def __init__(self, rules: List[Tuple[str, Iterable[str]]], default: str):
+        self.labels = [label for label, _ in rules]
+        self.default = default
+        self.none = len(self.labels)
+        # State 0 is the root; goto[state] maps a character to the next state
+        self.goto: List[Dict[str, int]] = [{}]
+        # Best (lowest) rule index of any keyword ending at each state, via fail links
+        self.output: List[int] = [self.none]
+        self.fail: List[int] = [0]
+
+        for priority, (_, keywords) in enumerate(rules):
+            for keyword in keywords:
+                state = 0
+                for char in keyword:
+                    next_state = self.goto[state].get(char)
+                    if next_state is None:
+                        next_state = len(self.goto)
+                        self.goto[state][char] = next_state
+                        self.goto.append({})
+                        self.output.append(self.none)
+                        self.fail.append(0)
+                    state = next_state
+                self.output[state] = min(self.output[state], priority)
+
+        # Breadth-first fail links; each state inherits the best output of its suffixes
+        # and its fail state's transitions, giving a DFA with one lookup per character
+        self.delta: List[Dict[str, int]] = [dict(self.goto[0])] + [{} for _ in self.goto[1:]]
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            self.delta[state] = {**self.delta[self.fail[state]], **self.goto[state]}
+            for char, next_state in self.goto[state].items():
+                self.fail[next_state] = self.delta[self.fail[state]].get(char, 0) if state else 0
+                self.output[next_state] = min(self.output[next_state], self.output[self.fail[next_state]])
+                queue.append(next_state)
+
+    def match(self, text: str) -> int:
+        """Lowest rule index with a keyword in text (len(rules) if none)"""
+        delta, output = self.delta, self.output
+        best = self.none
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if output[state] < best:
+                best = output[state]
+                if best == 0:
+                    break
+        return best
+
+    def classify(self, text: str) -> str:
+        best = self.match(text)
+        return self.labels[best] if best < self.none else self.default
+
+    def classify_all(self, texts: Iterable[str]) -> List[str]:
+        """Classify many texts, matching each distinct text once"""
+        seen: Dict[str, str] = {}
+        results = []
+        for text in texts:
+            label = seen.get(text)
+            if label is None:
+                label = seen[text] = self.classify(text)
+            results.append(label)
+        return results
+
+HUB_AUTOMATON = KeywordAutomaton(HUB_RULES, DEFAULT_HUB)
+
+def categorize(name):
+    return HUB_AUTOMATON.classify(name.lower())
+
+def categorize_all(names: Iterable[str]) -> List[str]:
+    """Hub for each name, in order"""
+    return HUB_AUTOMATON.classify_all(name.lower() for name in names)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Registration integrity checker
+
+register.ts files come in several generations (registration objects with a
+path-derived id from fix_imports_comprehensive.generate_register_file,
+register<Name>() functions, plain and default re-exports, objects defined in
+register.ts itself), and flat and nested directories
+can both register the same calculator. CalculatorRegistry.register keys its Map
+by calculator.id and silently overwrites, so nothing notices collisions or
+registrations of calculators that do not exist. This script:
+1. Inspects every register.ts over a process pool: its exports, the calculators
+   it registers or re-exports, the module and export each one comes from, and
+   the id/category of the calculator object (read statically, as the manifest does)
+2. Builds global id tables in one pass (dict lookups, so collisions are O(1)):
+   - duplicate calculator ids from different modules (one silently wins at runtime)
+   - duplicate registration-object ids
+3. Cross-references the registrations in src/calculators/index.ts: identifiers
+   imported from missing modules or not exported by them, and ids registered twice
+4. Flags registrations of identifiers that are not imported, `new` on calculator
+   objects, category mismatches and register.ts files that register nothing
+
+Usage:
+    python check_registrations.py [--jobs N] [--json report.json] [--verbose] [--strict]
+"""
+
+import os
+import re
+import json
+import time
+import argparse
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from find_unreachable_calculators import INDEX_FILE, registered_modules
+from generate_calculator_manifest import extract_metadata, find_definition, resolve_module
+from ts_scanner import scan
+
+CALCULATORS_DIR = 'src/calculators'
+REGISTER_FILE = 'register.ts'
+ID_FIELDS = ('id', 'category')
+MAX_LISTED = 20
+
+# code -> (severity, description)
+PROBLEMS = {
+    'duplicate_id': ('error', 'calculator id registered from different modules'),
+    'duplicate_registration_id': ('error', 'registration-object id used by more than one register.ts'),
+    'missing_import': ('error', 'registers an identifier that is not imported'),
+    'missing_module': ('error', 'imports a calculator from a module that does not exist'),
+    'missing_export': ('error', 'imports a calculator the module does not export'),
+    'new_on_object': ('error', 'uses `new` on a calculator object'),
+    'index_missing_module': ('error', 'index.ts registers a calculator from a module that does not exist'),
+    'index_missing_export': ('error', 'index.ts registers a calculator its module does not export'),
+    'index_duplicate_id': ('error', 'index.ts registers two calculators with the same id'),
+    'category_mismatch': ('warning', "registration category differs from the calculator's"),
+    'duplicate_registration': ('warning', 'calculator module registered by more than one register.ts'),
+    'no_calculator': ('warning', 'register.ts registers or re-exports no calculator'),
+    'no_static_id': ('info', 'calculator id cannot be read statically (class or computed object)'),
+    'not_in_index': ('info', 'calculator registered by register.ts but not by index.ts'),
+}
+
+REGISTER_CALL = re.compile(r'calculatorRegistry\.register\(\s*(new\s+)?([A-Za-z_$][\w$]*)\s*(?:\(\s*\))?\s*\)')
+REGISTRATION_OBJECT = re.compile(r'export\s+const\s+([A-Za-z_$][\w$]*)\s*(?::\s*[\w.<>]+\s*)?=\s*\{')
+CALCULATOR_FIELD = re.compile(r'\bcalculator\s*:\s*([A-Za-z_$][\w$]*)')
+EXPORTED_CLASS = r'export\s+(?:default\s+)?(?:abstract\s+)?class\s+{name}\b'
+LOCAL_OBJECT = r'(?<![\w$.])const\s+{name}\s*(?::\s*[\w.<>]+\s*)?=\s*\{{'
+
+def _imports(records) -> Dict[str, Tuple[str, str]]:
+    """local name -> (exported name, specifier) for value imports"""
+    imports = {}
+    for record in records:
+        if record.kind == 'import' and not record.type_only:
+            for binding in record.names:
+                if not binding.type_only:
+                    imports[binding.alias] = (binding.name, record.source)
+    return imports
+
+@lru_cache(maxsize=None)
+def _module_exports(path: str) -> Tuple[Set[str], bool]:
+    """Names a module exports, and whether it also has `export *` (so anything may be exported)"""
+    with open(path, 'rb') as f:
+        records = scan(f.read())
+    names, star = set(), False
+    for record in records:
+        if record.kind != 'export':
+            continue
+        for binding in record.names:
+            if binding.name == '*' and binding.alias == '*':
+                star = True
+            else:
+                names.add(binding.alias)
+    return names, star
+
+@lru_cache(maxsize=None)
+def _is_class(path: str, name: str) -> bool:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return re.search(EXPORTED_CLASS.format(name=re.escape(name)), f.read()) is not None
+
+def resolve_calculator(local: str, imports: Dict[str, Tuple[str, str]], importer: str,
+                       prefix: str = '') -> Tuple[Optional[Dict], List[Tuple[str, str]]]:
+    """Module, id and category of an imported calculator, plus problems (codes prefixed for index.ts)"""
+    if local not in imports:
+        return None, [('missing_import', f"{local} is not imported")]
+    exported, specifier = imports[local]
+    module = resolve_module(specifier, importer)
+    if module is None:
+        return None, [(prefix + 'missing_module', f"{local}: cannot resolve '{specifier}'")]
+    entry = {'name': local, 'module': module, 'id': None, 'category': None, 'class': False}
+    names, star = _module_exports(module)
+    if exported not in names and exported != 'default' and not star:
+        return None, [(prefix + 'missing_export', f"{local}: {module} does not export {exported}")]
+
+    found = find_definition(module, exported, fields=ID_FIELDS)
+    if found is not None:
+        definition, metadata = found
+        entry.update(module=definition, id=metadata.get('id'), category=metadata.get('category'))
+        if entry['id'] is None:
+            return entry, [('no_static_id', f"{local}: no id in {definition}")]
+        return entry, []
+    entry['class'] = _is_class(module, exported)
+    return entry, [('no_static_id', f"{local}: no static calculator object in {module}")]
+
+def inspect_register(path: str) -> Dict:
+    """Everything the global checks need from one register.ts"""
+    with open(path, 'rb') as f:
+        source = f.read()
+    records = scan(source)
+    content = source.decode('utf-8', errors='replace')
+    code = '\n'.join(line for line in content.split('\n') if not line.lstrip().startswith('//'))
+    imports = _imports(records)
+    exports = [binding.alias for record in records if record.kind == 'export' for binding in record.names]
+
+    result = {'path': path, 'style': 'other', 'exports': exports, 'registration_id': None,
+              'calculators': [], 'problems': []}
+    referenced: Dict[str, bool] = {}   # local name -> instantiated with `new`
+    registration_category = None
+
+    for match in REGISTER_CALL.finditer(code):
+        result['style'] = 'function'
+        referenced.setdefault(match.group(2), bool(match.group(1)))
+    for match in REGISTRATION_OBJECT.finditer(code):
+        field = CALCULATOR_FIELD.search(code, match.end())
+        metadata = extract_metadata(code, match.group(1), ID_FIELDS)
+        if field is None or not metadata:
+            continue
+        result['style'] = 'object'
+        result['registration_id'] = metadata.get('id')
+        registration_category = metadata.get('category')
+        referenced.setdefault(field.group(1), False)
+    if not referenced:
+        for record in records:
+            if record.kind != 'export':
+                continue
+            for binding in record.names:
+                if record.source is not None and binding.name != '*':
+                    # export { default } / { X as Y } from './X': resolve it like an import
+                    imports.setdefault(binding.alias, (binding.name, record.source))
+                    local = binding.alias
+                else:
+                    # export default X; / export { X as Y }: X is the imported local name
+                    local = binding.name
+                if local in imports:
+                    result['style'] = 'reexport'
+                    referenced.setdefault(local, False)
+                    continue
+                # export default roiCalculator; where register.ts defines the object itself
+                definition = re.search(LOCAL_OBJECT.format(name=re.escape(local)), code)
+                if definition and result['style'] == 'other':
+                    exported_code = code[:definition.start()] + 'export ' + code[definition.start():]
+                    result['style'] = 'definition'
+                    result['registration_id'] = (extract_metadata(exported_code, local, ID_FIELDS) or {}).get('id')
+
+    if not referenced and result['style'] == 'other':
+        result['problems'].append(('no_calculator', 'nothing registered or re-exported'))
+    for local, instantiated in referenced.items():
+        entry, problems = resolve_calculator(local, imports, path)
+        result['problems'].extend(problems)
+        if entry is None:
+            continue
+        if instantiated and entry['id'] is not None:
+            result['problems'].append(('new_on_object', f"new {local}() but {local} is an object"))
+        if registration_category and entry['category'] and registration_category != entry['category']:
+            result['problems'].append(('category_mismatch',
+                                       f"registered as '{registration_category}', calculator says '{entry['category']}'"))
+        result['calculators'].append(entry)
+    return result
+
+def inspect_index_entry(item: Tuple[str, Tuple[str, str]]) -> Dict:
+    local, (exported, specifier) = item
+    entry, problems = resolve_calculator(local, {local: (exported, specifier)}, INDEX_FILE, prefix='index_')
+    return {'path': INDEX_FILE, 'calculators': [entry] if entry else [], 'problems': problems}
+
+def find_register_files(base_dir: str = CALCULATORS_DIR) -> List[str]:
+    files = []
+    for root, dirs, names in os.walk(base_dir):
+        dirs.sort()
+        if REGISTER_FILE in names:
+            files.append(os.path.join(root, REGISTER_FILE).replace(os.sep, '/'))
+    return files
+
+def index_registrations() -> Dict[str, Tuple[str, str]]:
+    """Identifiers registered in index.ts -> (exported name, specifier)"""
+    if not os.path.exists(INDEX_FILE):
+        return {}
+    with open(INDEX_FILE, 'rb') as f:
+        imports = _imports(scan(f.read()))
+    return {name: imports[name] for name in registered_modules(INDEX_FILE) if name in imports}
+
+def check(jobs: int) -> Dict:
+    register_files = find_register_files()
+    index_items = list(index_registrations().items())
+    if jobs <= 1:
+        registers = [inspect_register(path) for path in register_files]
+        index_results = [inspect_index_entry(item) for item in index_items]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            registers = list(pool.map(inspect_register, register_files, chunksize=32))
+            index_results = list(pool.map(inspect_index_entry, index_items, chunksize=32))
+
+    problems: Dict[str, List[Dict]] = defaultdict(list)
+
+    def report(code: str, path: str, message: str) -> None:
+        problems[code].append({'path': path, 'message': message})
+
+    for result in registers + index_results:
+        for code, message in result['problems']:
+            report(code, result['path'], message)
+
+    # Global tables: first owner of each id wins, later ones collide
+    ids: Dict[str, Tuple[str, str]] = {}
+    registration_ids: Dict[str, str] = {}
+    module_owner: Dict[str, str] = {}
+    for result in registers:
+        rid = result['registration_id']
+        if rid is not None:
+            owner = registration_ids.setdefault(rid, result['path'])
+            if owner != result['path']:
+                report('duplicate_registration_id', result['path'], f"'{rid}' is also used by {owner}")
+        for entry in result['calculators']:
+            owner = module_owner.setdefault(entry['module'], result['path'])
+            if owner != result['path']:
+                report('duplicate_registration', result['path'], f"{entry['module']} is also registered by {owner}")
+            if entry['id'] is None:
+                continue
+            module, first = ids.setdefault(entry['id'], (entry['module'], result['path']))
+            if module != entry['module']:
+                report('duplicate_id', result['path'], f"'{entry['id']}' from {entry['module']} "
+                                                       f"collides with {module} (registered by {first})")
+
+    index_ids: Dict[str, Tuple[str, str]] = {}
+    index_modules = set()
+    for result in index_results:
+        for entry in result['calculators']:
+            index_modules.add(entry['module'])
+            if entry['id'] is None:
+                continue
+            module, first = index_ids.setdefault(entry['id'], (entry['module'], entry['name']))
+            if module != entry['module']:
+                report('index_duplicate_id', INDEX_FILE, f"'{entry['id']}': {entry['name']} ({entry['module']}) "
+                                                         f"overwrites {first} ({module})")
+    for module, owner in module_owner.items():
+        if module not in index_modules:
+            report('not_in_index', owner, f"{module} is not registered by {INDEX_FILE}")
+
+    return {
+        'register_files': len(register_files),
+        'index_registrations': len(index_items),
+        'calculator_ids': len(ids),
+        'styles': dict(Counter(result['style'] for result in registers)),
+        'problems': {code: problems[code] for code in PROBLEMS if problems[code]},
+    }
+
+def print_report(report: Dict, verbose: bool) -> None:
+    icons = {'error': '❌', 'warning': '⚠️ ', 'info': 'ℹ️ '}
+    styles = ', '.join(f"{count} {style}" for style, count in sorted(report['styles'].items()))
+    print(f"📋 {report['register_files']} register.ts files ({styles}), "
+          f"{report['index_registrations']} index.ts registrations, {report['calculator_ids']} distinct ids")
+    for code, items in report['problems'].items():
+        severity, description = PROBLEMS[code]
+        print(f"\n{icons[severity]} {code}: {len(items)} ({description})")
+        if severity == 'info' and not verbose:
+            continue
+        shown = items if verbose else items[:MAX_LISTED]
+        for item in shown:
+            print(f"  {item['path']}: {item['message']}")
+        if len(shown) < len(items):
+            print(f"  ... {len(items) - len(shown)} more (--verbose)")
+
+def main():
+    parser = argparse.ArgumentParser(description='Check register.ts files and index.ts registrations for collisions')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='worker processes')
+    parser.add_argument('--json', help='write the full report as JSON')
+    parser.add_argument('--verbose', action='store_true', help='list every problem, including informational ones')
+    parser.add_argument('--strict', action='store_true', help='exit 1 on warnings too')
+    args = parser.parse_args()
+
+    if not os.path.isdir(CALCULATORS_DIR):
+        print(f"Error: {CALCULATORS_DIR} not found")
+        return 1
+
+    started = time.time()
+    report = check(args.jobs)
+    print_report(report, args.verbose)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    counts = Counter(PROBLEMS[code][0] for code, items in report['problems'].items() for _ in items)
+    print(f"\n{'❌' if counts['error'] else '✅'} {counts['error']} errors, {counts['warning']} warnings "
+          f"in {time.time() - started:.2f}s")
+    failing = counts['error'] + (counts['warning'] if args.strict else 0)
+    return 1 if failing else 0
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Static cost classifier for calculator formulas
+
+PerformanceOptimizationService treats every calculator the same, while a few
+formulas.ts files run long simulations and nested loops on the main thread.
+This script estimates each calculator's cost without running it:
+1. Strips comments and string contents from formulas.ts and finds every loop:
+   for / for-of / while / do-while and array iterations (.map, .reduce, ...)
+2. Estimates each loop's iteration count from its condition: numeric constants,
+   local constants and expressions (months = years * 12), literal / new Array(N)
+   array sizes, and name-based defaults for inputs (years, months, simulations)
+3. Multiplies along loop nesting, and through calls to local functions made
+   inside loops, to get an operation estimate per calculation
+4. Classifies the calculator:
+   cheap    under MEMOIZE_COST operations
+   memoize  deterministic and under WORKER_COST: cache results by input
+   worker   WORKER_COST or more (or randomised and RANDOM_WORKER_COST or more):
+            run it off the main thread
+   Randomised formulas (Math.random in a loop) are never memoized.
+5. Writes src/data/calculatorCostClasses.generated.ts with the non-cheap
+   calculators by id, read by PerformanceOptimizationService.getCalculatorCostClass
+
+Usage:
+    python classify_calculator_cost.py [--check] [--json cost_report.json] [--verbose]
+"""
+
+import os
+import re
+import json
+import argparse
+import warnings
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from generate_calculator_manifest import OBJECT_START, extract_metadata
+from git_scope import add_scope_arguments, scope_from_args, touches
+
+CALCULATORS_DIR = 'src/calculators'
+OUTPUT_FILE = 'src/data/calculatorCostClasses.generated.ts'
+FORMULAS_FILE = 'formulas.ts'
+
+MEMOIZE_COST = 10_000
+WORKER_COST = 1_000_000
+RANDOM_WORKER_COST = 100_000
+COST_CLASSES = ('cheap', 'memoize', 'worker')
+
+# Iteration estimates when a bound is not a constant: (name fragments, estimate), first match wins
+NAME_BOUNDS = (
+    (('simulation', 'trial', 'sample', 'scenario', 'path'), 10_000),
+    (('iteration', 'iter'), 1_000),
+    (('frequency', 'peryear', 'compounding'), 12),
+    (('month', 'payment', 'periods', 'installment'), 360),
+    (('week',), 520),
+    (('day',), 365),
+    # holdingPeriod, analysisPeriod, loanTerm: durations in years
+    (('year', 'period', 'duration', 'horizon', 'term', 'age', 'life'), 40),
+)
+DEFAULT_BOUND = 50          # any other identifier
+DEFAULT_ARRAY_SIZE = 50     # arrays of unknown size
+DEFAULT_WHILE_BOUND = 100   # while loops without a recognisable bound
+RECURSION_COST = 1_000
+MAX_ESTIMATE = 1e12
+
+SKIPPED = re.compile(r"//[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\\n])*'|\"(?:\\.|[^\"\\\n])*\"|`(?:\\.|[^`\\])*`", re.S)
+LOOP = re.compile(r'\b(for|while)\s*\(|\bdo\s*\{|\.(forEach|map|reduce|reduceRight|filter|some|every|find|'
+                  r'findIndex|flatMap)\s*\(')
+ASSIGNMENT = re.compile(r'\b(?:const|let|var|readonly)\s+([A-Za-z_$][\w$]*)\s*(?::\s*[^=;\n]+?)?\s*=\s*(?!>)')
+FUNCTION = re.compile(r'\bfunction\s*\*?\s*([A-Za-z_$][\w$]*)\s*[(<]|'
+                      r'\b(?:const|let)\s+([A-Za-z_$][\w$]*)\s*(?::[^=;\n]+)?=\s*(?:async\s*)?'
+                      r'(?:\([^()]*\)|[A-Za-z_$][\w$]*)\s*(?::\s*[^=;{]+?)?=>')
+CALL = re.compile(r'(?<![\w$.])([A-Za-z_$][\w$]*)\s*\(')
+COMPARISON = re.compile(r'^\s*(.+?)\s*(<=|>=|<|>|!==|!=)\s*(.+?)\s*$')
+TOKEN = re.compile(r'\s*(\d+(?:_\d+)*(?:\.\d+)?(?:e[+-]?\d+)?|[A-Za-z_$][\w$]*(?:\s*\.\s*[A-Za-z_$][\w$]*)*|[()+\-*/,%])')
+ITERATOR_RECEIVER = re.compile(r'([A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*)\s*(?:\)\s*)?$')
+ARRAY_SIZE = re.compile(r'^(?:new\s+Array|Array)\s*\((.+)\)|^Array\.from\s*\(\s*\{\s*length\s*:\s*(.+?)\s*\}')
+OPENERS, CLOSERS = '([{', ')]}'
+
+def strip_code(source: str) -> str:
+    """Blank out comments and string contents (keeping offsets and newlines)"""
+    return SKIPPED.sub(lambda m: re.sub(r'[^\n]', ' ', m.group()), source)
+
+def matching(code: str, pos: int) -> int:
+    """Index of the bracket closing the one at pos (len(code) if unbalanced)"""
+    depth = 0
+    for i in range(pos, len(code)):
+        char = code[i]
+        if char in OPENERS:
+            depth += 1
+        elif char in CLOSERS:
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(code)
+
+def split_top_level(text: str, separator: str) -> List[str]:
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        if char in OPENERS:
+            depth += 1
+        elif char in CLOSERS:
+            depth -= 1
+        elif depth == 0 and text.startswith(separator, i):
+            parts.append(text[start:i])
+            start = i + len(separator)
+    parts.append(text[start:])
+    return parts
+
+def statement_end(code: str, pos: int) -> int:
+    """End of the block or single statement starting at pos"""
+    while pos < len(code) and code[pos].isspace():
+        pos += 1
+    if pos < len(code) and code[pos] == '{':
+        return matching(code, pos)
+    depth = 0
+    for i in range(pos, len(code)):
+        char = code[i]
+        if char in OPENERS:
+            depth += 1
+        elif char in CLOSERS:
+            if depth == 0:
+                return i
+            depth -= 1
+        elif char == ';' and depth == 0:
+            return i
+    return len(code)
+
+def name_bound(name: str) -> int:
+    lowered = name.lower()
+    for fragments, bound in NAME_BOUNDS:
+        if any(fragment in lowered for fragment in fragments):
+            return bound
+    return DEFAULT_BOUND
+
+class Loop:
+    __slots__ = ('kind', 'start', 'end', 'bound', 'label', 'children', 'random')
+
+    def __init__(self, kind: str, start: int, end: int, bound: float, label: str):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.bound = bound
+        self.label = label
+        self.children: List['Loop'] = []
+        self.random = False
+
+class FormulaAnalyzer:
+    """Loop-nesting cost estimate for one formulas.ts"""
+
+    def __init__(self, source: str):
+        self.code = strip_code(source)
+        self.assignments: Dict[str, str] = {}
+        self.arrays: Dict[str, int] = {}
+        self._collect_assignments()
+
+    # Constants and array sizes
+
+    def _collect_assignments(self) -> None:
+        code = self.code
+        for match in ASSIGNMENT.finditer(code):
+            name, pos = match.group(1), match.end()
+            if name in self.assignments or name in self.arrays:
+                continue
+            if code.startswith('[', pos):
+                inner = code[pos + 1:matching(code, pos)]
+                # An empty literal is filled later, so its size is unknown
+                size = len([p for p in split_top_level(inner, ',') if p.strip()])
+                if size:
+                    self.arrays[name] = size
+                continue
+            end = statement_end(code, pos)
+            self.assignments[name] = code[pos:end].strip()
+
+    def array_size(self, expr: str, depth: int = 0) -> float:
+        expr = expr.strip()
+        if expr.startswith('[') and matching(expr, 0) == len(expr) - 1:
+            return len([p for p in split_top_level(expr[1:-1], ',') if p.strip()]) or 1
+        size = ARRAY_SIZE.match(expr)
+        if size:
+            return self.value(size.group(1) or size.group(2), depth + 1) or DEFAULT_ARRAY_SIZE
+        name = expr.split('.')[-1] if expr else ''
+        if name in self.arrays:
+            return self.arrays[name]
+        if depth < 4 and name in self.assignments:
+            assigned = self.assignments[name]
+            if ARRAY_SIZE.match(assigned):
+                return self.array_size(assigned, depth + 1)
+        bound = name_bound(name)
+        return bound if bound != DEFAULT_BOUND else DEFAULT_ARRAY_SIZE
+
+    def value(self, expr: str, depth: int = 0) -> Optional[float]:
+        """Estimate of a numeric expression, or None if it cannot be read"""
+        pieces, pos = [], 0
+        expr = expr.strip()
+        while pos < len(expr):
+            match = TOKEN.match(expr, pos)
+            if not match:
+                return None
+            pos = match.end()
+            token = re.sub(r'\s+', '', match.group(1))
+            if token[0].isdigit():
+                pieces.append(token.replace('_', ''))
+            elif token in '()+-*/,%':
+                pieces.append(token)
+            elif token in ('Math.min', 'Math.max'):
+                pieces.append(token[5:])
+            elif token.startswith('Math.'):
+                pieces.append('_')
+            elif token.endswith('.length'):
+                pieces.append(repr(float(self.array_size(token[:-7], depth))))
+            else:
+                name = token.split('.')[-1]
+                known = None
+                if depth < 4 and token == name and name in self.assignments:
+                    known = self.value(self.assignments[name], depth + 1)
+                pieces.append(repr(float(known if known is not None else name_bound(name))))
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', SyntaxWarning)
+                result = eval(''.join(pieces), {'__builtins__': {}}, {'min': min, 'max': max, '_': lambda x, *rest: x})
+        except Exception:
+            return None
+        if not isinstance(result, (int, float)):
+            return None
+        return min(max(float(result), 1.0), MAX_ESTIMATE)
+
+    # Loops
+
+    def condition_bound(self, condition: str, init: str = '', default: float = DEFAULT_BOUND) -> float:
+        bounds = []
+        for term in split_top_level(condition, '&&'):
+            if '||' in term:
+                continue
+            comparison = COMPARISON.match(term.strip('() '))
+            if not comparison:
+                continue
+            left, op, right = comparison.groups()
+            if op in ('<', '<=', '!==', '!='):
+                estimate = self.value(right)
+            else:
+                # Counting down: `i >= 0` starts from the initializer
+                start = init.split('=', 1)[1] if '=' in init else left
+                estimate = self.value(start)
+            if estimate is not None:
+                bounds.append(estimate)
+        return min(bounds) if bounds else default
+
+    def find_loops(self) -> List[Loop]:
+        code = self.code
+        loops, skip = [], set()
+        for match in LOOP.finditer(code):
+            start = match.start()
+            if start in skip:
+                continue
+            keyword, method = match.group(1), match.group(2)
+            if method:
+                open_paren = match.end() - 1
+                close = matching(code, open_paren)
+                receiver = ITERATOR_RECEIVER.search(code[:start])
+                target = receiver.group(1) if receiver else ''
+                loops.append(Loop(method, open_paren, close, self.array_size(target), f'{target or "array"}.{method}'))
+            elif keyword is None:
+                # do { ... } while (cond);
+                body_end = matching(code, match.end() - 1)
+                tail = re.match(r'\s*while\s*\(', code[body_end + 1:])
+                condition = ''
+                if tail:
+                    skip.add(body_end + 1 + tail.start() + tail.group().index('while'))
+                    paren = body_end + tail.end()
+                    condition = code[paren + 1:matching(code, paren)]
+                bound = self.condition_bound(condition, default=DEFAULT_WHILE_BOUND)
+                loops.append(Loop('do', start, body_end, bound, f'do-while {condition.strip()[:40]}'))
+            else:
+                open_paren = match.end() - 1
+                close = matching(code, open_paren)
+                header = code[open_paren + 1:close]
+                end = statement_end(code, close + 1)
+                if keyword == 'for':
+                    of = re.match(r'\s*(?:const|let|var)?\s*(?:\[[^\]]*\]|\{[^}]*\}|[\w$]+)\s+(?:of|in)\s+(.+)$', header, re.S)
+                    if of:
+                        bound = self.array_size(re.sub(r'\.(entries|keys|values)\(\s*\)$', '', of.group(1).strip()))
+                    else:
+                        parts = split_top_level(header, ';')
+                        init, condition = (parts + ['', ''])[:2]
+                        bound = self.condition_bound(condition, init)
+                else:
+                    bound = self.condition_bound(header, default=DEFAULT_WHILE_BOUND)
+                loops.append(Loop(keyword, start, end, bound, f'{keyword} ({" ".join(header.split())[:40]})'))
+
+        for loop in loops:
+            loop.random = 'Math.random' in code[loop.start:loop.end]
+        return loops
+
+    # Cost
+
+    def functions(self) -> Dict[str, Tuple[int, int]]:
+        spans = {}
+        code = self.code
+        self.definitions = set()
+        for match in FUNCTION.finditer(code):
+            name = match.group(1) or match.group(2)
+            self.definitions.add(match.start(1) if match.group(1) else match.start(2))
+            if match.group(1):
+                paren = code.find('(', match.end() - 1)
+                body = code.find('{', matching(code, paren))
+                end = matching(code, body) if body != -1 else len(code)
+                spans.setdefault(name, (match.start(), end))
+            else:
+                spans.setdefault(name, (match.start(), statement_end(code, match.end())))
+        return spans
+
+    def analyze(self) -> Dict:
+        loops = sorted(self.find_loops(), key=lambda loop: (loop.start, -loop.end))
+        roots: List[Loop] = []
+        stack: List[Loop] = []
+        for loop in loops:
+            while stack and loop.start >= stack[-1].end:
+                stack.pop()
+            (stack[-1].children if stack else roots).append(loop)
+            stack.append(loop)
+
+        spans = self.functions()
+        function_costs: Dict[str, float] = {}
+        in_progress = set()
+        recursive = set()
+
+        def calls_cost(start: int, end: int, exclude: List[Loop]) -> float:
+            total = 0.0
+            for match in CALL.finditer(self.code, start, end):
+                if match.start() in self.definitions:
+                    continue
+                if any(child.start <= match.start() < child.end for child in exclude):
+                    continue
+                name = match.group(1)
+                span = spans.get(name)
+                if span and not (span[0] <= start < span[1]):
+                    total += function_cost(name)
+                elif span:
+                    recursive.add(name)
+                    total += RECURSION_COST
+            return total
+
+        def loop_cost(loop: Loop) -> float:
+            inner = sum(loop_cost(child) for child in loop.children)
+            inner += calls_cost(loop.start, loop.end, loop.children)
+            return min(loop.bound * (1 + inner), MAX_ESTIMATE)
+
+        def function_cost(name: str) -> float:
+            if name in function_costs:
+                return function_costs[name]
+            if name in in_progress:
+                recursive.add(name)
+                return RECURSION_COST
+            in_progress.add(name)
+            start, end = spans[name]
+            top = [loop for loop in roots if start <= loop.start < end]
+            # Straight-line code is noise next to loops; only iterations add up
+            cost = sum(loop_cost(loop) for loop in top) + calls_cost(start, end, top)
+            in_progress.discard(name)
+            function_costs[name] = min(cost, MAX_ESTIMATE)
+            return function_costs[name]
+
+        called = {m.group(1) for m in CALL.finditer(self.code)
+                  if m.group(1) in spans and m.start() not in self.definitions and not (spans[m.group(1)][0] <= m.start() < spans[m.group(1)][1])}
+        entry_points = [name for name in spans if name not in called] or list(spans)
+        cost = sum(function_cost(name) for name in entry_points)
+        cost += sum(loop_cost(loop) for loop in roots
+                    if not any(start <= loop.start < end for start, end in spans.values()))
+
+        def chains(loop: Loop, prefix: str) -> List[Tuple[float, str]]:
+            label = f"{prefix}{loop.label} ×{loop.bound:,.0f}"
+            found = [(loop_cost(loop), label)]
+            for child in loop.children:
+                found.extend(chains(child, label + ' › '))
+            return found
+
+        heaviest = sorted((item for root in roots for item in chains(root, '')), reverse=True)[:3]
+        return {
+            'cost': min(cost, MAX_ESTIMATE),
+            'loops': len(loops),
+            'max_depth': max((depth_of(root) for root in roots), default=0),
+            'random': any(loop.random for loop in loops),
+            'recursive': sorted(recursive),
+            'heaviest': [label for _, label in heaviest],
+        }
+
+def depth_of(loop: Loop) -> int:
+    return 1 + max((depth_of(child) for child in loop.children), default=0)
+
+def classify(cost: float, random: bool) -> str:
+    if cost >= WORKER_COST or (random and cost >= RANDOM_WORKER_COST):
+        return 'worker'
+    if cost >= MEMOIZE_COST and not random:
+        return 'memoize'
+    return 'cheap'
+
+def calculator_ids(directory: str) -> List[str]:
+    """ids of the calculator objects defined next to formulas.ts"""
+    ids = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('Calculator.ts') or name.endswith('.test.ts'):
+            continue
+        with open(os.path.join(directory, name), 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        for match in OBJECT_START.finditer(content):
+            metadata = extract_metadata(content, match.group(1), ('id',))
+            if metadata and metadata.get('id'):
+                ids.append(metadata['id'])
+    return ids
+
+def analyze_tree(base_dir: str = CALCULATORS_DIR) -> List[Dict]:
+    results = []
+    for root, dirs, files in os.walk(base_dir):
+        dirs.sort()
+        if FORMULAS_FILE not in files:
+            continue
+        path = os.path.join(root, FORMULAS_FILE).replace(os.sep, '/')
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            source = f.read()
+        result = FormulaAnalyzer(source).analyze()
+        result.update(path=path, bytes=len(source.encode('utf-8')), ids=calculator_ids(root),
+                      cost_class=classify(result['cost'], result['random']))
+        results.append(result)
+    return results
+
+def cost_classes(results: List[Dict]) -> Dict[str, str]:
+    """Non-cheap classes by calculator id; an id defined in several places gets the heaviest"""
+    classes = {}
+    for result in results:
+        for calculator_id in result['ids']:
+            current = classes.get(calculator_id, 'cheap')
+            if COST_CLASSES.index(result['cost_class']) > COST_CLASSES.index(current):
+                classes[calculator_id] = result['cost_class']
+    return dict(sorted(classes.items()))
+
+def render_classes(classes: Dict[str, str]) -> str:
+    lines = [
+        '// Generated by classify_calculator_cost.py from formulas.ts loop analysis - do not edit',
+        "export type CalculatorCostClass = 'cheap' | 'memoize' | 'worker';",
+        '',
+        "// Calculators whose formulas are not cheap, by calculator id; every other calculator is 'cheap'",
+        'export const calculatorCostClasses: Record<string, CalculatorCostClass> = {',
+    ]
+    lines.extend(f'  {json.dumps(calculator_id)}: {json.dumps(cost_class)},' for calculator_id, cost_class in classes.items())
+    lines.append('};')
+    return '\n'.join(lines) + '\n'
+
+def main():
+    parser = argparse.ArgumentParser(description='Classify calculators as cheap, memoize or worker from their formulas')
+    parser.add_argument('--check', action='store_true', help=f'exit 1 if {OUTPUT_FILE} is out of date instead of writing it')
+    parser.add_argument('--json', help='write the per-formulas.ts analysis as JSON')
+    parser.add_argument('--verbose', action='store_true', help='list every non-cheap calculator with its heaviest loops')
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+
+    if not touches(scope_from_args(args)):
+        print("⏩ No calculator changes; cost classes left as is")
+        return 0
+
+    results = analyze_tree()
+    counts = Counter(result['cost_class'] for result in results)
+    print(f"🧮 Analyzed {len(results)} formulas.ts: {counts['cheap']} cheap, "
+          f"{counts['memoize']} memoize, {counts['worker']} worker")
+    heavy = sorted((r for r in results if r['cost_class'] != 'cheap'), key=lambda r: -r['cost'])
+    for result in heavy if args.verbose else heavy[:10]:
+        print(f"  {'🧵' if result['cost_class'] == 'worker' else '💾'} {result['path']}: "
+              f"~{result['cost']:,.0f} ops{' (random)' if result['random'] else ''}")
+        for label in result['heaviest'][:1 if not args.verbose else 3]:
+            print(f"      {label}")
+    unkeyed = [r['path'] for r in heavy if not r['ids']]
+    if unkeyed:
+        print(f"⚠️  {len(unkeyed)} non-cheap formulas have no calculator id next to them and are left out")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    source = render_classes(cost_classes(results))
+    current = None
+    if os.path.exists(OUTPUT_FILE):
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            current = f.read()
+
+    if args.check:
+        if current != source:
+            print(f"❌ {OUTPUT_FILE} is out of date, run classify_calculator_cost.py")
+            return 1
+        print(f"✅ {OUTPUT_FILE} is up to date")
+        return 0
+
+    if current != source:
+        os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            f.write(source)
+        print(f"✅ Wrote {OUTPUT_FILE}")
+    else:
+        print(f"✅ {OUTPUT_FILE} already up to date")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
@@ -2,10 +2,15 @@
 
 import os
 import shutil
+import argparse
 from collections import defaultdict
 
-def consolidate_duplicates():
+from calculator_categories import category_priority, path_category
+from event_log import EventLog, add_event_arguments, events_from_args
+
+def consolidate_duplicates(events: EventLog = None):
     """Consolidate duplicate calculator directories by keeping the most appropriate version"""
+    events = events or EventLog(None, 'consolidate_duplicates')
 
     # Find all calculator directories
     calculator_dirs = []
@@ -26,23 +31,9 @@ def consolidate_duplicates():
     print(f"Found {len(duplicate_groups)} calculator names with duplicates")
     print(f"Total duplicate directories: {sum(len(paths) for paths in duplicate_groups.values())}")
 
-    # Priority order for keeping calculators (most to least preferred)
-    priority_order = [
-        'finance',      # Finance calculators first
-        'business',     # Business calculators second
-        'legal',        # Legal calculators third
-        'health',       # Health calculators fourth
-        'construction', # Construction calculators fifth
-        'math',         # Math calculators sixth
-        'lifestyle'     # Lifestyle calculators last
-    ]
-
     def get_priority(path):
         """Get priority score for a calculator path (lower is better)"""
-        for i, category in enumerate(priority_order):
-            if f'/{category}/' in path:
-                return i
-        return len(priority_order)  # Lowest priority for unknown categories
+        return category_priority(path_category(path))
 
     consolidated = 0
     kept = 0
@@ -57,13 +48,16 @@ def consolidate_duplicates():
 
         print(f"\n🔄 Consolidating {calc_name}:")
         print(f"  ✅ KEEP: {keep_path}")
+        events.emit('kept', name=calc_name, path=keep_path, duplicates=remove_paths)
         for remove_path in remove_paths:
             print(f"  🗑️  REMOVE: {remove_path}")
             try:
                 shutil.rmtree(remove_path)
                 consolidated += 1
+                events.emit('removed', name=calc_name, path=remove_path)
             except Exception as e:
                 print(f"    ❌ Error removing {remove_path}: {e}")
+                events.emit('error', name=calc_name, path=remove_path, error=str(e))
 
         kept += 1
 
@@ -71,6 +65,10 @@ def consolidate_duplicates():
     print(f"  ✅ Kept {kept} unique calculators")
     print(f"  🗑️  Removed {consolidated} duplicate directories")
     print(f"  📁 Total directories remaining: {len(calculator_dirs) - consolidated}")
+    events.emit('summary', kept=kept, removed=consolidated, remaining=len(calculator_dirs) - consolidated)
 
 if __name__ == "__main__":
-    consolidate_duplicates()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Remove lower-priority duplicates of calculator directories')
+    add_event_arguments(parser)
+    with events_from_args(parser.parse_args(), 'consolidate_duplicates') as events:
+        consolidate_duplicates(events)
\ No newline at end of file
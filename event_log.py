@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Streaming NDJSON event log shared by the maintenance scripts
+
+Scripts used to collect every result in memory and write one report at the
+end (or only print emoji lines). With --events PATH they also write one JSON
+object per line as things happen:
+    {"seq": 3, "ts": 1760900000.123, "script": "consolidate_duplicates", "event": "removed", "path": "..."}
+Every line is flushed as it is written, so memory stays flat on huge runs, a
+crashed run leaves everything up to the crash (and no "end" event), and a log
+pipeline can parse the stream line by line. With --events - the records take
+over stdout and the script's own progress output goes to stderr. Markdown is rendered afterwards,
+streaming the file again instead of holding it in memory.
+
+Usage:
+    python consolidate_duplicates.py --events consolidate.ndjson
+    python event_log.py render consolidate.ndjson [-o report.md]
+    python event_log.py summary consolidate.ndjson
+"""
+
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from typing import Dict, Iterator, Optional, TextIO
+
+# Bookkeeping events written by EventLog itself
+START, END = 'start', 'end'
+
+class EventLog:
+    """Writes events to an NDJSON file (or stdout for '-'); with no path it only counts them"""
+
+    def __init__(self, path: Optional[str], script: str):
+        self.path = path
+        self.script = script
+        self.counts: Counter = Counter()
+        self.seq = 0
+        self._file: Optional[TextIO] = None
+        if path == '-':
+            # Keep stdout pure NDJSON: print() goes to stderr for the rest of the run
+            self._file = sys.stdout
+            sys.stdout = sys.stderr
+        elif path:
+            self._file = open(path, 'w', encoding='utf-8')
+        self._write(START, {'argv': sys.argv[1:]})
+
+    def __enter__(self) -> 'EventLog':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    @property
+    def replayable(self) -> bool:
+        """Whether events can be read back (they went to a file, not stdout)"""
+        return bool(self.path) and self.path != '-'
+
+    def _write(self, event: str, fields: Dict) -> None:
+        if self._file is None:
+            return
+        self.seq += 1
+        record = {'seq': self.seq, 'ts': round(time.time(), 3), 'script': self.script, 'event': event, **fields}
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+
+    def emit(self, event: str, **fields) -> None:
+        self.counts[event] += 1
+        self._write(event, fields)
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._write(END, {'counts': dict(self.counts)})
+        if self.path != '-':
+            self._file.close()
+        self._file = None
+
+def read_events(path: str, event: Optional[str] = None) -> Iterator[Dict]:
+    """Events from an NDJSON file, optionally only one kind; a torn last line is skipped"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if event is None or record.get('event') == event:
+                yield record
+
+def summarize(path: str) -> Dict:
+    """Counts per event, in order of first appearance, and whether the run finished"""
+    counts: Counter = Counter()
+    script, finished = None, False
+    for record in read_events(path):
+        event = record.get('event')
+        if event == START:
+            script = record.get('script')
+        elif event == END:
+            finished = True
+        else:
+            counts[event] += 1
+    return {'script': script, 'finished': finished, 'counts': counts}
+
+def _format_value(value) -> str:
+    if isinstance(value, list):
+        return ', '.join(f'`{item}`' for item in value)
+    return f'`{value}`'
+
+def render_markdown(path: str, out: TextIO, title: Optional[str] = None) -> None:
+    """One section per event kind; each section streams the file again"""
+    summary = summarize(path)
+    out.write(f"# {title or (summary['script'] or 'Event') + ' report'}\n\n")
+    if not summary['finished']:
+        out.write("⚠️ The run did not finish; events up to the interruption follow.\n\n")
+    out.write("## Summary\n")
+    for event, count in summary['counts'].items():
+        out.write(f"- {event}: {count}\n")
+    for event in summary['counts']:
+        out.write(f"\n## {event}\n")
+        for record in read_events(path, event):
+            fields = [f"{key}: {_format_value(value)}" for key, value in record.items()
+                      if key not in ('seq', 'ts', 'script', 'event')]
+            out.write(f"- {'; '.join(fields)}\n")
+
+def add_event_arguments(parser) -> None:
+    parser.add_argument('--events', metavar='PATH',
+                        help="stream results as NDJSON to PATH as they happen ('-' for stdout; "
+                             "progress output then goes to stderr)")
+
+def events_from_args(args, script: str) -> EventLog:
+    return EventLog(getattr(args, 'events', None), script)
+
+def main():
+    parser = argparse.ArgumentParser(description='Render or summarize an NDJSON event log')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    render = subparsers.add_parser('render', help='render the log as markdown')
+    render.add_argument('path')
+    render.add_argument('-o', '--output', help='markdown file (default: stdout)')
+    render.add_argument('--title')
+    summary = subparsers.add_parser('summary', help='print counts per event')
+    summary.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'render':
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                render_markdown(args.path, f, args.title)
+            print(f"✅ Wrote {args.output}")
+        else:
+            render_markdown(args.path, sys.stdout, args.title)
+        return 0
+
+    result = summarize(args.path)
+    print(f"📊 {result['script'] or args.path}: {sum(result['counts'].values())} events"
+          + ('' if result['finished'] else ' (run did not finish)'))
+    for event, count in result['counts'].items():
+        print(f"  {event}: {count}")
+    return 0 if result['finished'] else 1
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Lookup table extraction for table-driven calculators
+
+Life expectancy, RMD divisor, Social Security and bracket tables are numeric
+literals in calculator sources, parsed on every page load that imports them.
+This script:
+1. Finds numeric lookup tables in calculator modules (tests excluded):
+   const TABLE = { 72: 27.4, 73: 26.5, ... } or const TABLE = [0.1, 0.12, ...]
+2. Reports, per module, how many source bytes each table takes and how small it
+   is as a typed array (Int32 when every value is an integer, else Float64)
+3. With --write, for tables of at least --min-bytes:
+   - writes the values (then the keys, unless they are a contiguous range) to
+     public/tables/<name>.bin
+   - replaces the literal with lookupRecord('<name>') / lookupArray('<name>')
+     from src/lib/lookupTables.ts, which fetches the asset lazily
+   - records the asset in public/tables/manifest.json and regenerates
+     src/data/lookupTables.generated.ts
+   Tables declared inside functions, or read while the module loads, are
+   reported and left in place: the lazy loader can only fill them afterwards.
+
+Usage:
+    python extract_lookup_tables.py [--min-bytes 4096] [--write] [--json tables_report.json]
+"""
+
+import os
+import re
+import json
+import struct
+import argparse
+from typing import Dict, List, Optional
+
+from classify_calculator_cost import matching, strip_code
+from git_scope import add_scope_arguments, in_scope, scope_from_args
+
+CALCULATORS_DIR = 'src/calculators'
+TABLES_DIR = 'public/tables'
+TABLES_URL = '/tables'
+MANIFEST_FILE = os.path.join(TABLES_DIR, 'manifest.json')
+OUTPUT_FILE = 'src/data/lookupTables.generated.ts'
+LOADER_IMPORT = '@/lib/lookupTables'
+DEFAULT_MIN_BYTES = 4096
+MIN_ENTRIES = 8
+
+NUMBER = r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+DECLARATION = re.compile(r'\b(?:export\s+)?const\s+([A-Za-z_$][\w$]*)\s*(:\s*[^=;]+?)?\s*=\s*(?=[\[{])')
+ENTRY = re.compile(rf"^\s*(?:(\d+)|'(\d+)'|\"(\d+)\")\s*:\s*({NUMBER})\s*$")
+VALUE = re.compile(rf'^\s*({NUMBER})\s*$')
+NUMERIC_ITEM = re.compile(rf'{NUMBER}\s*,')
+IMPORT = re.compile(r'^import\b[^;]*;?[ \t]*\n', re.M)
+
+def is_test_file(name: str) -> bool:
+    return '.test.' in name or name == 'test.ts' or name.endswith('.spec.ts')
+
+def parse_table(literal: str) -> Optional[Dict]:
+    """Keys and values of a numeric object or array literal (comments already blanked), or None"""
+    inner = literal[1:-1].strip().rstrip(',')
+    if not inner:
+        return None
+    parts = inner.split(',')
+    keys, values = [], []
+    for part in parts:
+        if literal[0] == '[':
+            match = VALUE.match(part)
+            if not match:
+                return None
+            values.append(match.group(1))
+        else:
+            match = ENTRY.match(part)
+            if not match:
+                return None
+            keys.append(int(next(group for group in match.groups()[:3] if group)))
+            values.append(match.group(4))
+    if len(values) < MIN_ENTRIES:
+        return None
+
+    integers = all(re.fullmatch(r'-?\d+', value) and -2**31 <= int(value) < 2**31 for value in values)
+    numbers = [int(value) if integers else float(value) for value in values]
+    if keys and len(set(keys)) != len(keys):
+        return None
+    contiguous = bool(keys) and keys == list(range(keys[0], keys[0] + len(keys)))
+    return {
+        'kind': 'array' if literal[0] == '[' else 'record',
+        'keys': keys,
+        'values': numbers,
+        'type': 'int32' if integers else 'float64',
+        'first_key': keys[0] if contiguous else None,
+    }
+
+def encode_table(table: Dict) -> bytes:
+    values = struct.pack(f"<{len(table['values'])}{'i' if table['type'] == 'int32' else 'd'}", *table['values'])
+    if table['kind'] == 'array' or table['first_key'] is not None:
+        return values
+    return values + struct.pack(f"<{len(table['keys'])}i", *table['keys'])
+
+def table_name(path: str, name: str) -> str:
+    directory = os.path.basename(os.path.dirname(path))
+    return re.sub(r'[^a-z0-9]+', '-', f'{directory}-{name}'.lower()).strip('-')
+
+def find_tables(path: str, source: str) -> List[Dict]:
+    code = strip_code(source)
+    tables = []
+    for match in DECLARATION.finditer(code):
+        start = match.end()
+        end = matching(code, start)
+        table = parse_table(code[start:end + 1])
+        if table is None:
+            continue
+        name = match.group(1)
+        depth = code[:match.start()].count('{') - code[:match.start()].count('}')
+        statement_end = end + 1 + len(re.match(r'\s*;?', code[end + 1:]).group())
+        # A top-level read (outside any function) happens before the asset can arrive
+        rest = code[:match.start()] + code[statement_end:]
+        module_reads = [m for m in re.finditer(rf'(?<![\w$.]){re.escape(name)}\b', rest)
+                        if rest[:m.start()].count('{') == rest[:m.start()].count('}')
+                        and not re.search(r'export\s*\{[^}]*$', rest[:m.start()])]
+        skip = None
+        if depth:
+            skip = 'declared inside a function'
+        elif module_reads:
+            skip = 'read while the module loads'
+        binary = len(encode_table(table))
+        tables.append({
+            'path': path,
+            'name': name,
+            'asset': table_name(path, name),
+            'kind': table['kind'],
+            'type': table['type'],
+            'entries': len(table['values']),
+            'source_bytes': len(source[start:end + 1].encode('utf-8')),
+            'binary_bytes': binary,
+            'skip': skip,
+            'span': (start, end + 1),
+            'table': table,
+        })
+    return tables
+
+def scan(base_dir: str, scope) -> List[Dict]:
+    found = []
+    for root, dirs, files in os.walk(base_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith('.ts') or name.endswith('.d.ts') or is_test_file(name):
+                continue
+            path = os.path.join(root, name).replace(os.sep, '/')
+            if not in_scope(path, scope):
+                continue
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                source = f.read()
+            # Cheap pre-check before blanking comments and strings
+            if len(NUMERIC_ITEM.findall(source)) < MIN_ENTRIES - 1:
+                continue
+            found.extend(find_tables(path, source))
+    return found
+
+def add_loader_import(source: str, functions: List[str]) -> str:
+    line = f"import {{ {', '.join(sorted(functions))} }} from '{LOADER_IMPORT}';\n"
+    imports = list(IMPORT.finditer(source))
+    position = imports[-1].end() if imports else 0
+    return source[:position] + line + ('' if imports else '\n') + source[position:]
+
+def extract_module(path: str, tables: List[Dict]) -> int:
+    """Replace the tables' literals in path with loader calls; returns bytes removed"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    before = len(source.encode('utf-8'))
+    functions = set()
+    for table in sorted(tables, key=lambda t: -t['span'][0]):
+        start, end = table['span']
+        function = 'lookupArray' if table['kind'] == 'array' else 'lookupRecord'
+        functions.add(function)
+        source = source[:start] + f"{function}('{table['asset']}')" + source[end:]
+    source = add_loader_import(source, list(functions))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    return before - len(source.encode('utf-8'))
+
+def load_manifest() -> Dict[str, Dict]:
+    if not os.path.exists(MANIFEST_FILE):
+        return {}
+    with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def render_assets(manifest: Dict[str, Dict]) -> str:
+    lines = [
+        '// Generated by extract_lookup_tables.py from public/tables/manifest.json - do not edit',
+        'export interface LookupTableAsset {',
+        '  url: string;',
+        "  type: 'int32' | 'float64';",
+        '  length: number;',
+        "  module: string; // calculator directory under src/calculators that uses the table",
+        '  firstKey?: number; // record keys are firstKey, firstKey + 1, ...; otherwise stored after the values',
+        '}',
+        '',
+        'export const lookupTableAssets: Record<string, LookupTableAsset> = {',
+    ]
+    for name, asset in sorted(manifest.items()):
+        lines.append(f'  {json.dumps(name)}: {json.dumps(asset, separators=(", ", ": "))},')
+    lines.append('};')
+    return '\n'.join(lines) + '\n'
+
+def main():
+    parser = argparse.ArgumentParser(description='Move large constant lookup tables into lazily fetched binary assets')
+    parser.add_argument('--min-bytes', type=int, default=DEFAULT_MIN_BYTES,
+                        help=f'extract tables whose literal takes at least this many bytes (default: {DEFAULT_MIN_BYTES})')
+    parser.add_argument('--write', action='store_true', help='extract qualifying tables instead of only reporting them')
+    parser.add_argument('--json', help='write every table found as JSON')
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+
+    print("🔍 Scanning calculator modules for numeric lookup tables...")
+    tables = scan(CALCULATORS_DIR, scope_from_args(args))
+    eligible = [t for t in tables if t['source_bytes'] >= args.min_bytes and not t['skip']]
+    print(f"📊 Found {len(tables)} tables ({sum(t['source_bytes'] for t in tables):,} source bytes); "
+          f"{len(eligible)} of at least {args.min_bytes:,} bytes can be extracted")
+
+    for table in sorted(tables, key=lambda t: -t['source_bytes'])[:15]:
+        marker = '📦' if table in eligible else '  '
+        note = f" - {table['skip']}" if table['skip'] else ''
+        print(f"  {marker} {table['path']}: {table['name']} ({table['entries']} {table['type']}) "
+              f"{table['source_bytes']:,} B source -> {table['binary_bytes']:,} B binary{note}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([{k: v for k, v in t.items() if k not in ('table', 'span')} for t in tables], f, indent=2)
+
+    if not args.write:
+        if eligible:
+            print("💡 Run with --write to extract them")
+        return 0
+    if not eligible:
+        print("✅ Nothing to extract")
+        return 0
+
+    os.makedirs(TABLES_DIR, exist_ok=True)
+    manifest = load_manifest()
+    by_module: Dict[str, List[Dict]] = {}
+    for table in eligible:
+        with open(os.path.join(TABLES_DIR, f"{table['asset']}.bin"), 'wb') as f:
+            f.write(encode_table(table['table']))
+        asset = {'url': f"{TABLES_URL}/{table['asset']}.bin", 'type': table['type'], 'length': table['entries'],
+                 'module': os.path.relpath(os.path.dirname(table['path']), CALCULATORS_DIR).replace(os.sep, '/')}
+        if table['table']['first_key'] is not None:
+            asset['firstKey'] = table['table']['first_key']
+        manifest[table['asset']] = asset
+        by_module.setdefault(table['path'], []).append(table)
+
+    removed_total = 0
+    for path, module_tables in sorted(by_module.items()):
+        removed = extract_module(path, module_tables)
+        removed_total += removed
+        print(f"✅ {path}: -{removed:,} bytes ({', '.join(t['name'] for t in module_tables)})")
+
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+        f.write('\n')
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        f.write(render_assets(manifest))
+
+    print(f"🎉 Extracted {len(eligible)} tables from {len(by_module)} modules, {removed_total:,} bytes removed")
+    print(f"💡 calculatorRegistry.loadCalculator and PerformanceOptimizationService.loadCalculatorModule "
+          f"await the tables; other callers need lookupTablesReady(<calculator path>) from {LOADER_IMPORT}")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Unreachable calculator detector
+
+src/calculators holds ~3,200 directories, but registerAllCalculators in
+src/calculators/index.ts registers only a few hundred calculators. The rest
+(duplicate snake_case / kebab-case / PascalCase copies, abandoned drafts) are
+still walked and type-checked by tsc and vitest. This script:
+1. Reads the calculators registered in registerAllCalculators and resolves them
+   to their modules through index.ts's imports
+2. Walks the import graph (see import_graph.py) from those modules, from
+   everything index.ts imports and from the application code outside
+   src/calculators
+3. Lists and sizes every calculator directory none of whose files is reachable
+4. With --quarantine, moves those directories to quarantine/ (outside the
+   tsconfig "src" include and excluded from vitest and eslint) in one step,
+   recording them in quarantine/manifest.json so --restore can undo it
+
+Usage:
+    python find_unreachable_calculators.py [--json unreachable.json]
+    python find_unreachable_calculators.py --quarantine
+    python find_unreachable_calculators.py --restore
+"""
+
+import os
+import re
+import json
+import shutil
+import argparse
+from typing import Dict, List, Set
+
+from import_graph import ImportGraph
+from ts_scanner import imported_bindings, scan
+
+CALCULATORS_DIR = 'src/calculators'
+INDEX_FILE = 'src/calculators/index.ts'
+QUARANTINE_DIR = 'quarantine'
+QUARANTINE_MANIFEST = os.path.join(QUARANTINE_DIR, 'manifest.json')
+
+REGISTER_CALL = re.compile(r'calculatorRegistry\.register\(([^)]+)\);')
+
+def registered_modules(index_file: str = INDEX_FILE) -> Dict[str, str]:
+    """Map each identifier registered in registerAllCalculators to its import specifier"""
+    with open(index_file, 'rb') as f:
+        source = f.read()
+    imported = imported_bindings(scan(source))
+    content = source.decode('utf-8')
+
+    # Same boundaries fix_registry.py uses: the function header to the first closing brace
+    lines = content.split('\n')
+    start = next((i for i, line in enumerate(lines) if 'export function registerAllCalculators' in line), None)
+    if start is None:
+        return {}
+
+    registered = {}
+    for line in lines[start + 1:]:
+        if line.strip() == '}':
+            break
+        if line.strip().startswith('//'):
+            continue
+        match = REGISTER_CALL.search(line)
+        if match and match.group(1).strip() in imported:
+            name = match.group(1).strip()
+            registered[name] = imported[name]
+    return registered
+
+def calculator_units(base_dir: str = CALCULATORS_DIR) -> Dict[str, List[str]]:
+    """Every directory under src/calculators that directly contains source files"""
+    units = {}
+    for root, dirs, files in os.walk(base_dir):
+        if root == base_dir:
+            continue
+        sources = [os.path.join(root, f).replace(os.sep, '/') for f in files if f.endswith(('.ts', '.tsx'))]
+        if sources:
+            units[root.replace(os.sep, '/')] = sources
+    return units
+
+def find_reachable(graph: ImportGraph, registered: Dict[str, str]) -> Set[str]:
+    """Files reachable from registered calculators, index.ts and app code outside src/calculators"""
+    known = set(graph.edges)
+    roots = set()
+    for specifier in registered.values():
+        resolved = graph.resolve(INDEX_FILE, specifier, known)
+        if resolved:
+            roots.add(resolved)
+
+    calculators_prefix = CALCULATORS_DIR + '/'
+    roots.update(path for path in known if not path.startswith(calculators_prefix))
+    # Every static import in index.ts, registered or not, must still resolve after a quarantine
+    if INDEX_FILE in known:
+        roots.add(INDEX_FILE)
+    return ImportGraph._walk(roots, graph.edges)
+
+def find_unreachable(units: Dict[str, List[str]], reachable: Set[str]) -> List[Dict]:
+    """Calculator directories with no reachable file, largest first"""
+    unreachable = []
+    for unit, sources in units.items():
+        if unit == CALCULATORS_DIR or any(source in reachable for source in sources):
+            continue
+        unreachable.append({
+            'directory': unit,
+            'files': len(sources),
+            'bytes': sum(os.path.getsize(source) for source in sources),
+        })
+    unreachable.sort(key=lambda item: (-item['bytes'], item['directory']))
+    return unreachable
+
+def quarantine(unreachable: List[Dict], reachable_units: Set[str]) -> List[str]:
+    """Move unreachable directories under quarantine/, preserving their paths"""
+    moved = []
+    manifest = []
+    if os.path.exists(QUARANTINE_MANIFEST):
+        with open(QUARANTINE_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    for item in sorted(unreachable, key=lambda item: item['directory']):
+        directory = item['directory']
+        # A parent moves its whole subtree: skip it if anything below is still used,
+        # and skip children of a directory that has already been moved
+        if any(unit.startswith(directory + '/') for unit in reachable_units):
+            print(f"  ⏭️  Keeping {directory} (contains reachable subdirectories)")
+            continue
+        if any(directory.startswith(parent + '/') for parent in moved):
+            continue
+
+        target = os.path.join(QUARANTINE_DIR, directory)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(directory, target)
+        moved.append(directory)
+        manifest.append(directory)
+
+    os.makedirs(QUARANTINE_DIR, exist_ok=True)
+    with open(QUARANTINE_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(sorted(set(manifest)), f, indent=2)
+        f.write('\n')
+    return moved
+
+def restore() -> int:
+    """Move every quarantined directory back to its original location"""
+    if not os.path.exists(QUARANTINE_MANIFEST):
+        print("Nothing to restore")
+        return 0
+    with open(QUARANTINE_MANIFEST, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    restored = 0
+    for directory in manifest:
+        source = os.path.join(QUARANTINE_DIR, directory)
+        if not os.path.exists(source):
+            continue
+        if os.path.exists(directory):
+            print(f"  ❌ {directory} exists again, leaving quarantined copy in place")
+            continue
+        os.makedirs(os.path.dirname(directory), exist_ok=True)
+        shutil.move(source, directory)
+        restored += 1
+
+    os.remove(QUARANTINE_MANIFEST)
+    print(f"Restored {restored} directories")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Find calculator directories unreachable from registerAllCalculators')
+    parser.add_argument('--json', help='write the unreachable list to this file')
+    parser.add_argument('--quarantine', action='store_true', help=f'move unreachable directories to {QUARANTINE_DIR}/')
+    parser.add_argument('--restore', action='store_true', help='move quarantined directories back')
+    parser.add_argument('--top', type=int, default=20, help='largest directories to list (default: 20)')
+    args = parser.parse_args()
+
+    if args.restore:
+        return restore()
+
+    print("Building import graph...")
+    graph = ImportGraph().build()
+    registered = registered_modules()
+    reachable = find_reachable(graph, registered)
+    units = calculator_units()
+    unreachable = find_unreachable(units, reachable)
+
+    total_bytes = sum(item['bytes'] for item in unreachable)
+    total_files = sum(item['files'] for item in unreachable)
+    print(f"Registered calculators: {len(registered)}")
+    print(f"Calculator directories: {len(units)}")
+    print(f"Unreachable directories: {len(unreachable)} ({total_files} files, {total_bytes / 1024 / 1024:.1f} MB)")
+    for item in unreachable[:args.top]:
+        print(f"  {item['bytes'] / 1024:8.1f} KB  {item['files']:3d} files  {item['directory']}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'registered': len(registered), 'directories': len(units),
+                       'unreachable': unreachable}, f, indent=2)
+            f.write('\n')
+        print(f"Report saved to {args.json}")
+
+    if args.quarantine:
+        unreachable_dirs = {item['directory'] for item in unreachable}
+        reachable_units = set(units) - unreachable_dirs
+        moved = quarantine(unreachable, reachable_units)
+        print(f"Quarantined {len(moved)} directories under {QUARANTINE_DIR}/ (undo with --restore)")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
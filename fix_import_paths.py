@@ -1,21 +1,17 @@
 import re
 import os
 
+from ts_scanner import replace_source, rewrite, scan
+
 def to_pascal_case(snake_str):
     # Convert snake_case to PascalCase, handling existing camelCase
     return re.sub(r'(?:^|_)([a-z])', lambda m: m.group(1).upper(), snake_str)
 
 def fix_import_paths(file_path):
-    with open(file_path, 'r') as f:
-        content = f.read()
-
-    # Pattern for import lines
-    pattern = r"import\s*\{\s*(\w+)\s*\}\s*from\s*'\./([^']+)';"
-
-    def replace_match(match):
-        var_name = match.group(1)
-        old_path = match.group(2)
+    with open(file_path, 'rb') as f:
+        source = f.read()
 
+    def fixed_path(var_name):
         base = var_name[:-10]  # remove 'Calculator'
 
         candidates = [
@@ -30,16 +26,25 @@ def fix_import_paths(file_path):
                 file_name = cand + 'Calculator'
                 file_path = f'{dir_path}/{file_name}.ts'
                 if os.path.isfile(file_path):
-                    new_path = f'./{cand}/{file_name}'
-                    return f"import {{ {var_name} }} from '{new_path}';"
+                    return f'./{cand}/{file_name}'
 
         # If none found, keep old
-        return match.group(0)
-
-    new_content = re.sub(pattern, replace_match, content)
-
-    with open(file_path, 'w') as f:
-        f.write(new_content)
+        return None
+
+    # Imports of a single un-aliased name from a sibling module
+    edits = []
+    for record in scan(source):
+        if record.kind != 'import' or not record.source.startswith('./') or len(record.names) != 1:
+            continue
+        binding = record.names[0]
+        if binding.name != binding.alias or binding.name in ('default', '*'):
+            continue
+        new_path = fixed_path(binding.name)
+        if new_path and new_path != record.source:
+            edits.append(replace_source(record, new_path))
+
+    with open(file_path, 'wb') as f:
+        f.write(rewrite(source, edits))
 
 if __name__ == "__main__":
     fix_import_paths('src/calculators/index.ts')
\ No newline at end of file
@@ -15,27 +15,68 @@ This script:
 """
 
 import os
-import re
 import difflib
+import argparse
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
+
+from event_log import EventLog, add_event_arguments, events_from_args, read_events
+from git_scope import add_scope_arguments, scope_from_args, skip_unless_registration_changed
+from prefetch_io import LocalIO, add_io_arguments, io_from_args
+from tree_records import ImportRecord
+from ts_scanner import remove_statement, replace_source, rewrite, scan, statement_text
 
 class ImportFixer:
-    def __init__(self, base_dir: str = 'src/calculators'):
+    def __init__(self, base_dir: str = 'src/calculators', backend: Optional[LocalIO] = None,
+                 events: Optional[EventLog] = None):
         self.base_dir = Path(base_dir)
+        self.backend = backend or LocalIO()
         self.existing_dirs = self._get_existing_dirs()
-        self.report = {
+        # With a replayable event log, records are streamed there instead of kept in memory
+        self.events = events
+        self.counts: Counter = Counter()
+        # Compact ImportRecords holding each statement's text; unchanged imports are only counted
+        self.report: Dict[str, List] = {
             'fixed': [],
             'removed': [],
-            'unchanged': [],
             'errors': []
         }
 
+    def refresh(self) -> None:
+        """Re-list calculator directories and clear the report (for long-running callers)"""
+        self.backend.invalidate()
+        self.existing_dirs = self._get_existing_dirs()
+        self.counts.clear()
+        for items in self.report.values():
+            items.clear()
+
+    @property
+    def streaming(self) -> bool:
+        return self.events is not None and self.events.replayable
+
+    def _add(self, status: str, record: ImportRecord) -> None:
+        self.counts[status] += 1
+        if self.events is not None:
+            self.events.emit(status, file=record.file, line_no=record.line_no, specifier=record.specifier,
+                             target=record.target, line=record.line)
+        if not self.streaming:
+            self.report[status].append(record)
+
+    def items(self, status: str) -> Iterator[ImportRecord]:
+        """Records with a status, from memory or read back from the event log"""
+        if not self.streaming:
+            yield from self.report[status]
+            return
+        for event in read_events(self.events.path, status):
+            yield ImportRecord(event['file'], event['line_no'], event['specifier'], event.get('target'),
+                               status, event.get('line'))
+
     def _get_existing_dirs(self) -> List[str]:
         """Get list of all existing calculator directories"""
         if not self.base_dir.exists():
             return []
-        return [d.name for d in self.base_dir.iterdir() if d.is_dir()]
+        return self.backend.subdirs(self.base_dir)
 
     def _normalize_path(self, path: str) -> str:
         """Normalize a path by removing extra 'Calculator' suffixes"""
@@ -87,21 +128,37 @@ class ImportFixer:
 
     def _path_exists(self, path: str) -> bool:
         """Check if a path exists (with .ts extension or as index.ts)"""
-        full_path = self.base_dir / path.lstrip('./')
+        full_path = Path(os.path.normpath(self.base_dir / path))
 
         # Check for .ts file
-        if full_path.with_suffix('.ts').exists():
+        if self.backend.exists(full_path.with_suffix('.ts')):
             return True
 
         # Check for index.ts in directory
-        if full_path.is_dir() and (full_path / 'index.ts').exists():
+        if self.backend.is_dir(full_path) and self.backend.exists(full_path / 'index.ts'):
             return True
 
         return False
 
+    def _candidate_paths(self, paths: List[str]) -> Iterator[Path]:
+        """Everything _path_exists stats for the paths (and their normalized forms)"""
+        for path in paths:
+            for candidate in (path, self._normalize_path(path)):
+                full_path = Path(os.path.normpath(self.base_dir / candidate))
+                try:
+                    yield full_path.with_suffix('.ts')
+                except ValueError:
+                    pass
+                yield full_path
+                yield full_path / 'index.ts'
+
     def _fix_import_path(self, original_path: str) -> Optional[str]:
         """Try to fix an import path"""
-        # First, try normalizing
+        # Paths that already resolve (including '../' and single-segment ones) are left alone
+        if self._path_exists(original_path):
+            return original_path
+
+        # Then try normalizing
         normalized = self._normalize_path(original_path)
         if self._path_exists(normalized):
             return normalized
@@ -137,103 +194,109 @@ class ImportFixer:
 
     def fix_imports(self, file_path: str) -> str:
         """Fix all imports in the file and return the updated content"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        lines = content.split('\n')
-        fixed_lines = []
-        import_pattern = re.compile(r'^(\s*)import\s+(.+?)\s+from\s+([\'"])(.+?)\3\s*;?\s*$')
-
-        for line in lines:
-            match = import_pattern.match(line)
-            if match:
-                indent, imports, quote, path = match.groups()
-                fixed_path = self._fix_import_path(path)
-
-                if fixed_path and fixed_path != path:
-                    # Fixed
-                    new_line = f"{indent}import {imports} from {quote}{fixed_path}{quote};"
-                    fixed_lines.append(new_line)
-                    self.report['fixed'].append({
-                        'original': path,
-                        'fixed': fixed_path,
-                        'line': line.strip()
-                    })
-                elif fixed_path:
-                    # Unchanged (already correct)
-                    fixed_lines.append(line)
-                    self.report['unchanged'].append(path)
-                else:
-                    # Could not fix - remove
-                    self.report['removed'].append({
-                        'path': path,
-                        'line': line.strip()
-                    })
-                    # Skip this line
-                    continue
+        with open(file_path, 'rb') as f:
+            source = f.read()
+
+        # Imports that bind something (side-effect imports are left alone)
+        records = [record for record in scan(source) if record.kind == 'import' and record.names]
+        self.backend.prefetch_stats(self._candidate_paths([record.source for record in records]))
+
+        edits = []
+        for record in records:
+            path = record.source
+            fixed_path = self._fix_import_path(path)
+
+            if fixed_path and fixed_path != path:
+                # Fixed: only the specifier changes
+                edits.append(replace_source(record, fixed_path))
+                self._add('fixed', ImportRecord(file_path, record.line, path, fixed_path, 'fixed',
+                                                statement_text(source, record)))
+            elif fixed_path:
+                # Unchanged (already correct)
+                self.counts['unchanged'] += 1
             else:
-                fixed_lines.append(line)
+                # Could not fix - remove the statement
+                edits.append(remove_statement(source, record))
+                self._add('removed', ImportRecord(file_path, record.line, path, None, 'removed',
+                                                  statement_text(source, record)))
+
+        return rewrite(source, edits).decode('utf-8')
+
+    def iter_report(self) -> Iterator[str]:
+        """Yield the report of changes line by line"""
+        yield "# Import Path Fix Report"
+        yield ""
+
+        yield f"## Summary"
+        yield f"- Fixed imports: {self.counts['fixed']}"
+        yield f"- Removed imports: {self.counts['removed']}"
+        yield f"- Unchanged imports: {self.counts['unchanged']}"
+        yield f"- Errors: {self.counts['errors']}"
+        yield ""
+
+        if self.counts['fixed']:
+            yield "## Fixed Imports"
+            for item in self.items('fixed'):
+                yield f"- `{item.specifier}` → `{item.target}`"
+                yield f"  Original: {item.line.strip()}"
+            yield ""
+
+        if self.counts['removed']:
+            yield "## Removed Imports"
+            for item in self.items('removed'):
+                yield f"- `{item.specifier}` (could not find correct path)"
+                yield f"  Line: {item.line.strip()}"
+            yield ""
+
+        if self.counts['errors']:
+            yield "## Errors"
+            for error in self.report['errors']:
+                yield f"- {error}"
+            yield ""
 
-        return '\n'.join(fixed_lines)
+    def write_report(self, f) -> None:
+        """Stream the report to an open file"""
+        for i, line in enumerate(self.iter_report()):
+            f.write(f"\n{line}" if i else line)
 
     def generate_report(self) -> str:
         """Generate a detailed report of changes"""
-        report_lines = []
-        report_lines.append("# Import Path Fix Report")
-        report_lines.append("")
-
-        report_lines.append(f"## Summary")
-        report_lines.append(f"- Fixed imports: {len(self.report['fixed'])}")
-        report_lines.append(f"- Removed imports: {len(self.report['removed'])}")
-        report_lines.append(f"- Unchanged imports: {len(self.report['unchanged'])}")
-        report_lines.append(f"- Errors: {len(self.report['errors'])}")
-        report_lines.append("")
-
-        if self.report['fixed']:
-            report_lines.append("## Fixed Imports")
-            for item in self.report['fixed']:
-                report_lines.append(f"- `{item['original']}` → `{item['fixed']}`")
-                report_lines.append(f"  Original: {item['line']}")
-            report_lines.append("")
-
-        if self.report['removed']:
-            report_lines.append("## Removed Imports")
-            for item in self.report['removed']:
-                report_lines.append(f"- `{item['path']}` (could not find correct path)")
-                report_lines.append(f"  Line: {item['line']}")
-            report_lines.append("")
-
-        if self.report['errors']:
-            report_lines.append("## Errors")
-            for error in self.report['errors']:
-                report_lines.append(f"- {error}")
-            report_lines.append("")
-
-        return '\n'.join(report_lines)
+        return '\n'.join(self.iter_report())
 
 def main():
-    fixer = ImportFixer()
-
-    file_path = 'src/calculators/index.ts'
-    if not os.path.exists(file_path):
-        print(f"Error: {file_path} not found")
-        return
-
-    print("Analyzing imports...")
-    fixed_content = fixer.fix_imports(file_path)
-
-    print("Writing fixed file...")
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(fixed_content)
-
-    print("Generating report...")
-    report = fixer.generate_report()
-    with open('import_fix_report.md', 'w', encoding='utf-8') as f:
-        f.write(report)
+    parser = argparse.ArgumentParser(description='Fix import paths in src/calculators/index.ts')
+    add_scope_arguments(parser)
+    add_io_arguments(parser)
+    add_event_arguments(parser)
+    args = parser.parse_args()
+
+    # The event log first, so that with --events - every notice below goes to stderr
+    with events_from_args(args, 'fix_import_paths_comprehensive') as events:
+        if skip_unless_registration_changed(scope_from_args(args)):
+            return
+
+        file_path = 'src/calculators/index.ts'
+        if not os.path.exists(file_path):
+            print(f"Error: {file_path} not found")
+            return
+
+        with io_from_args(args) as backend:
+            fixer = ImportFixer(backend=backend, events=events)
+            print("Analyzing imports...")
+            fixed_content = fixer.fix_imports(file_path)
+
+            print("Writing fixed file...")
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(fixed_content)
+
+            # With --events PATH the report is rendered back from the stream
+            print("Generating report...")
+            with open('import_fix_report.md', 'w', encoding='utf-8') as f:
+                fixer.write_report(f)
 
     print("Done!")
     print(f"Report saved to import_fix_report.md")
-    print(f"Fixed: {len(fixer.report['fixed'])}, Removed: {len(fixer.report['removed'])}, Unchanged: {len(fixer.report['unchanged'])}")
+    print(f"Fixed: {fixer.counts['fixed']}, Removed: {fixer.counts['removed']}, Unchanged: {fixer.counts['unchanged']}")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,24 +1,18 @@
-import re
 import sys
 
-file_path = sys.argv[1] if len(sys.argv) > 1 else 'src/calculators/index.ts'
+from ts_scanner import replace_source, rewrite, scan
 
-with open(file_path, 'r') as f:
-    content = f.read()
+file_path = sys.argv[1] if len(sys.argv) > 1 else 'src/calculators/index.ts'
 
-lines = content.split('\n')
-new_lines = []
+with open(file_path, 'rb') as f:
+    source = f.read()
 
-for line in lines:
-    if 'from \'./' in line:
-        match = re.search(r"import \{ (.+) as (.+) \} from '(.+)';", line)
-        if match:
-            variable = match.group(2)
-            path = match.group(3)
-            if variable.endswith('CalculatorCalculator'):
-                correct_path = './' + variable[:-10]
-                line = line.replace(f"from '{path}'", f"from '{correct_path}'")
-    new_lines.append(line)
+edits = []
+for record in scan(source):
+    if record.kind == 'import' and record.source.startswith('./') and len(record.names) == 1:
+        variable = record.names[0].alias
+        if variable.endswith('CalculatorCalculator'):
+            edits.append(replace_source(record, './' + variable[:-10]))
 
-with open(file_path, 'w') as f:
-    f.write('\n'.join(new_lines))
\ No newline at end of file
+with open(file_path, 'wb') as f:
+    f.write(rewrite(source, edits))
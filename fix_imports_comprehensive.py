@@ -1,7 +1,10 @@
 import os
-import re
+import argparse
 from pathlib import Path
 
+from git_scope import add_scope_arguments, in_scope, scope_from_args, skip_unless_registration_changed
+from ts_scanner import remove_statement, replace_source, rewrite, scan
+
 def transform_path(path):
     """Transform import path to match actual directory name."""
     # Remove leading './'
@@ -22,10 +25,12 @@ def get_existing_dirs():
             dirs.add(item)
     return dirs
 
-def find_calculators_without_register():
-    """Find directories with *Calculator.ts but no register.ts."""
+def find_calculators_without_register(scope=None):
+    """Find directories with *Calculator.ts but no register.ts (within scope, if given)."""
     missing_register = []
     for root, dirs, files in os.walk('src/calculators'):
+        if not in_scope(root, scope):
+            continue
         has_calculator = any(f.endswith('Calculator.ts') for f in files)
         has_register = 'register.ts' in files
         if has_calculator and not has_register:
@@ -76,45 +81,44 @@ def fix_imports():
     """Fix imports in index.ts."""
     existing_dirs = get_existing_dirs()
 
-    with open('src/calculators/index.ts', 'r') as f:
-        content = f.read()
+    with open('src/calculators/index.ts', 'rb') as f:
+        source = f.read()
 
-    lines = content.split('\n')
-    new_lines = []
+    edits = []
     fixed_count = 0
     removed_count = 0
 
-    for line in lines:
-        if line.startswith('import'):
-            # Extract the path
-            match = re.search(r"from '\./([^']+)'", line)
-            if match:
-                original_path = match.group(1)
-                transformed = transform_path(original_path)
-                if transformed in existing_dirs:
-                    # Replace the import
-                    new_line = line.replace(f"'./{original_path}'", f"'./{transformed}'")
-                    new_lines.append(new_line)
-                    if new_line != line:
-                        fixed_count += 1
-                else:
-                    # Remove invalid import
-                    removed_count += 1
-                    continue
-            else:
-                new_lines.append(line)
+    for record in scan(source):
+        # Top-level imports of sibling modules
+        if record.kind != 'import' or not record.source.startswith('./') or \
+                (record.start > 0 and source[record.start - 1:record.start] != b'\n'):
+            continue
+        original_path = record.source[2:]
+        transformed = transform_path(original_path)
+        if transformed in existing_dirs:
+            # Replace the import
+            if transformed != original_path:
+                edits.append(replace_source(record, f'./{transformed}'))
+                fixed_count += 1
         else:
-            new_lines.append(line)
+            # Remove invalid import
+            edits.append(remove_statement(source, record))
+            removed_count += 1
 
-    new_content = '\n'.join(new_lines)
-    with open('src/calculators/index.ts', 'w') as f:
-        f.write(new_content)
+    with open('src/calculators/index.ts', 'wb') as f:
+        f.write(rewrite(source, edits))
 
     return fixed_count, removed_count
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate missing register.ts files and fix index.ts imports')
+    add_scope_arguments(parser)
+    scope = scope_from_args(parser.parse_args())
+    if skip_unless_registration_changed(scope):
+        return
+
     print("Generating missing register.ts files...")
-    missing = find_calculators_without_register()
+    missing = find_calculators_without_register(scope)
     generated = 0
     for dir_name in missing:
         if generate_register_file(dir_name):
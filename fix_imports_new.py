@@ -1,6 +1,8 @@
 import os
 import re
 
+from ts_scanner import replace_source, rewrite, scan
+
 def camel_to_snake(name):
     s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
@@ -23,35 +25,34 @@ for root, dirs, files in os.walk('src/calculators'):
                 mapping[snake] = path
 
 # Read the index.ts
-with open('src/calculators/index.ts', 'r') as f:
-    content = f.read()
-
-# Pattern for imports
-import_pattern = re.compile(r"from '\./([^']+)Calculator'")
+with open('src/calculators/index.ts', 'rb') as f:
+    source = f.read()
 
 fixed_count = 0
 unresolved_count = 0
-
-def replace_import(match):
-    global fixed_count, unresolved_count
-    path_part = match.group(1)
+edits = []
+
+# Imports and re-exports of './<name>Calculator'
+for record in scan(source):
+    if record.kind not in ('import', 'export') or record.source is None:
+        continue
+    if not (record.source.startswith('./') and record.source.endswith('Calculator')) or record.source == './Calculator':
+        continue
+    path_part = record.source[2:-len('Calculator')]
     original_path = path_part
     if path_part.startswith('register_'):
         path_part = path_part[8:]
     snake = path_part
     if snake in mapping:
         new_path = f"./{mapping[snake]}"
-        if f"'{new_path}'" != f"'./{original_path}Calculator'":
+        if new_path != f"./{original_path}Calculator":
             fixed_count += 1
-        return f"from '{new_path}'"
+            edits.append(replace_source(record, new_path))
     else:
         unresolved_count += 1
-        return match.group(0)
-
-new_content = import_pattern.sub(replace_import, content)
 
 # Write back
-with open('src/calculators/index.ts', 'w') as f:
-    f.write(new_content)
+with open('src/calculators/index.ts', 'wb') as f:
+    f.write(rewrite(source, edits))
 
 print(f"Fixed {fixed_count} imports, {unresolved_count} unresolved")
\ No newline at end of file
@@ -11,6 +11,10 @@ This script:
 
 import re
 import os
+import argparse
+
+from git_scope import add_scope_arguments, scope_from_args, skip_unless_registration_changed
+from ts_scanner import rewrite, scan, statement_text
 
 def number_to_word(num_str):
     """Convert a digit string to word representation"""
@@ -54,47 +58,35 @@ def process_file(file_path):
     """Process the TypeScript file to fix invalid identifiers"""
     print(f"Processing {file_path}...")
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with open(file_path, 'rb') as f:
+        source = f.read()
 
-    lines = content.split('\n')
-    modified_lines = []
     changes_made = []
 
     # Track identifier mappings
     identifier_map = {}
 
-    for i, line in enumerate(lines):
-        original_line = line
-
-        # Check for import statements with destructured imports
-        import_match = re.search(r'import\s*\{\s*([^}]+)\s*\}\s*from', line)
-        if import_match:
-            destructured = import_match.group(1)
-            # Split by comma and clean up
-            identifiers = [id.strip() for id in destructured.split(',')]
-
-            new_identifiers = []
-            for identifier in identifiers:
-                # Remove any aliases (part after 'as')
-                base_identifier = identifier.split(' as ')[0].strip()
-
-                if base_identifier and base_identifier[0].isdigit():
-                    new_identifier = convert_invalid_identifier(base_identifier)
-                    identifier_map[base_identifier] = new_identifier
-                    changes_made.append(f"Import: {base_identifier} -> {new_identifier}")
-
-                    # Replace in the line
-                    if ' as ' in identifier:
-                        alias = identifier.split(' as ')[1].strip()
-                        line = line.replace(f'{base_identifier} as {alias}', f'{new_identifier} as {alias}')
-                    else:
-                        line = line.replace(base_identifier, new_identifier)
-
-                    new_identifiers.append(new_identifier if ' as ' not in identifier else f'{new_identifier} as {alias}')
-                else:
-                    new_identifiers.append(identifier)
+    # Rename digit-leading names in named imports (multi-line imports included)
+    edits = []
+    for record in scan(source):
+        if record.kind != 'import':
+            continue
+        statement = statement_text(source, record)
+        renamed = statement
+        for binding in record.names:
+            base_identifier = binding.name
+            if base_identifier and base_identifier[0].isdigit():
+                new_identifier = convert_invalid_identifier(base_identifier)
+                identifier_map[base_identifier] = new_identifier
+                changes_made.append(f"Import: {base_identifier} -> {new_identifier}")
+                renamed = re.sub(rf'(?<![\w$-]){re.escape(base_identifier)}(?![\w$-])', new_identifier, renamed)
+        if renamed != statement:
+            edits.append((record.start, record.end, renamed.encode('utf-8')))
+
+    lines = rewrite(source, edits).decode('utf-8').split('\n')
+    modified_lines = []
 
+    for line in lines:
         # Check for registerAllCalculators function references
         if 'calculatorRegistry.register(' in line:
             for old_id, new_id in identifier_map.items():
@@ -116,6 +108,11 @@ def process_file(file_path):
     return len(changes_made) > 0
 
 def main():
+    parser = argparse.ArgumentParser(description='Fix identifiers starting with digits in index.ts')
+    add_scope_arguments(parser)
+    if skip_unless_registration_changed(scope_from_args(parser.parse_args())):
+        return 0
+
     file_path = 'src/calculators/index.ts'
 
     if not os.path.exists(file_path):
@@ -1,22 +1,24 @@
 import re
+import argparse
+from typing import List, Optional
 
-def main():
-    file_path = 'src/calculators/index.ts'
+from git_scope import add_scope_arguments, scope_from_args, skip_unless_registration_changed
+from ts_scanner import imported_bindings, scan
+
+def fix_registry(file_path: str = 'src/calculators/index.ts', verbose: bool = True) -> Optional[List[str]]:
+    """Drop registrations of identifiers index.ts does not import.
 
+    Returns the removed lines (the file is only rewritten when there are any),
+    or None if registerAllCalculators was not found.
+    """
     with open(file_path, 'r') as f:
         lines = f.readlines()
 
-    # Parse imports
-    imported_vars = set()
-    for line in lines:
-        if line.strip().startswith('import {'):
-            match = re.search(r'import \{ ([^}]+) \} from', line)
-            if match:
-                vars_str = match.group(1)
-                vars_list = [v.strip() for v in vars_str.split(',')]
-                imported_vars.update(vars_list)
+    # Parse imports (local names, so 'X as Y' binds Y)
+    imported_vars = set(imported_bindings(scan(''.join(lines).encode('utf-8'))))
 
-    print(f"Imported vars: {len(imported_vars)}")
+    if verbose:
+        print(f"Imported vars: {len(imported_vars)}")
 
     # Find the registerAllCalculators function
     start_idx = None
@@ -29,31 +31,46 @@ def main():
             break
 
     if start_idx is None or end_idx is None:
-        print("Function not found")
-        return
+        if verbose:
+            print("Function not found")
+        return None
 
-    print(f"Function from line {start_idx} to {end_idx}")
+    if verbose:
+        print(f"Function from line {start_idx} to {end_idx}")
 
     # Process the function lines
+    removed = []
     new_lines = lines[:start_idx + 1]  # include the function start
     for i in range(start_idx + 1, end_idx):
         line = lines[i]
         # Check if it's calculatorRegistry.register(variable);
-        match = re.search(r'calculatorRegistry\.register\(([^)]+)\);', line)
+        # Commented-out registrations are already inert, leave them alone
+        match = re.match(r'\s*calculatorRegistry\.register\(([^)]+)\);', line)
         if match:
             var = match.group(1).strip()
             if var not in imported_vars:
-                print(f"Removing: {line.strip()}")
+                if verbose:
+                    print(f"Removing: {line.strip()}")
+                removed.append(line)
                 continue  # skip this line
         new_lines.append(line)
 
     new_lines.extend(lines[end_idx:])  # add the rest
 
     # Write back
-    with open(file_path, 'w') as f:
-        f.writelines(new_lines)
+    if removed:
+        with open(file_path, 'w') as f:
+            f.writelines(new_lines)
+    return removed
+
+def main():
+    parser = argparse.ArgumentParser(description='Drop registrations of identifiers index.ts does not import')
+    add_scope_arguments(parser)
+    if skip_unless_registration_changed(scope_from_args(parser.parse_args())):
+        return
 
-    print("Fixed the file")
+    if fix_registry() is not None:
+        print("Fixed the file")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,6 +1,10 @@
 import os
 import re
-from pathlib import Path
+import mmap
+import argparse
+
+from git_scope import add_scope_arguments, scope_from_args
+from prefetch_io import LocalIO, add_io_arguments, io_from_args
 
 def calculate_depth(file_path):
     """Calculate the directory depth from src/calculators/."""
@@ -17,61 +21,69 @@ def get_correct_import(target_dir, module, depth):
     ups = '../' * depth
     return f"{ups}{target_dir}/{module}"
 
+# Broken imports: '../../../engines/...', '../../../types/...', etc.
+BROKEN_PREFIX = b"'../../../"
+BROKEN_IMPORT = re.compile(rb"'\.\./\.\./\.\./(engines|types|utils|lib|hooks)/([^'\n]+)'")
+
+def scan_file(file_path):
+    """Return the file's bytes if it has a broken import, else None.
+
+    The file is memory-mapped and checked with a bytes-level find() and regex,
+    so the vast majority of files (no broken imports) are never copied or decoded.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(BROKEN_PREFIX) == -1 or not BROKEN_IMPORT.search(mm):
+                return None
+            return mm[:]
+
 def fix_imports_in_file(file_path):
     """Fix broken relative imports in a single file."""
-    depth = calculate_depth(file_path)
-    with open(file_path, 'r') as f:
-        content = f.read()
+    return fix_scanned_file(file_path, scan_file(file_path))
 
-    lines = content.split('\n')
-    new_lines = []
-    fixed = False
+def fix_scanned_file(file_path, content):
+    """Rewrite a file given what scan_file returned for it."""
+    if content is None:
+        return False
 
-    # Patterns for broken imports: ../../../engines/, ../../../types/, etc.
-    patterns = [
-        (r"('../../../engines/([^']+)')", 'engines'),
-        (r"('../../../types/([^']+)')", 'types'),
-        (r"('../../../utils/([^']+)')", 'utils'),
-        (r"('../../../lib/([^']+)')", 'lib'),
-        (r"('../../../hooks/([^']+)')", 'hooks'),
-    ]
+    depth = calculate_depth(file_path)
 
-    for line in lines:
-        original_line = line
-        for pattern, target_dir in patterns:
-            match = re.search(pattern, line)
-            if match:
-                full_match = match.group(1)
-                module = match.group(2)
-                correct_path = get_correct_import(target_dir, module, depth)
-                line = line.replace(full_match, f"'{correct_path}'")
-                fixed = True
-        new_lines.append(line)
+    def replace(match):
+        target_dir = match.group(1).decode('ascii')
+        module = match.group(2).decode('utf-8')
+        return f"'{get_correct_import(target_dir, module, depth)}'".encode('utf-8')
 
-    if fixed:
-        new_content = '\n'.join(new_lines)
-        with open(file_path, 'w') as f:
-            f.write(new_content)
-        return True
-    return False
+    new_content = BROKEN_IMPORT.sub(replace, content)
+    if new_content == content:
+        return False
+    with open(file_path, 'wb') as f:
+        f.write(new_content)
+    return True
 
-def find_calculator_files():
-    """Find all .ts files in src/calculators/ recursively."""
-    files = []
-    for root, dirs, files_in_dir in os.walk('src/calculators'):
-        for file in files_in_dir:
-            if file.endswith('.ts'):
-                files.append(os.path.join(root, file))
-    return files
+def find_calculator_files(scope=None, backend=None):
+    """Find all .ts files in src/calculators/ recursively (only changed ones, if scoped)."""
+    if scope is not None:
+        return sorted(f for f in scope if f.startswith('src/calculators/') and f.endswith('.ts') and os.path.isfile(f))
+    return (backend or LocalIO()).walk_files('src/calculators', '.ts')
 
 def main():
+    parser = argparse.ArgumentParser(description='Fix broken relative imports in calculator files')
+    add_scope_arguments(parser)
+    add_io_arguments(parser)
+    args = parser.parse_args()
+    scope = scope_from_args(args)
+
     print("Scanning calculator files for broken relative imports...")
-    files = find_calculator_files()
     fixed_count = 0
-    for file_path in files:
-        if fix_imports_in_file(file_path):
-            fixed_count += 1
-            print(f"Fixed imports in {file_path}")
+    with io_from_args(args) as backend:
+        files = find_calculator_files(scope, backend)
+        # Files are scanned ahead by the backend; rewrites happen here, in order
+        for file_path, content in backend.map_files(scan_file, files):
+            if fix_scanned_file(file_path, content):
+                fixed_count += 1
+                print(f"Fixed imports in {file_path}")
     print(f"Fixed imports in {fixed_count} files.")
 
 if __name__ == '__main__':
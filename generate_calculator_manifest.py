@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Lazy calculator manifest generator
+
+src/calculators/index.ts statically imports every registered calculator, so all
+of their modules sit on the app's critical path. This script emits
+src/calculators/manifest.ts instead:
+1. Reads the calculators registered in registerAllCalculators and the modules
+   they are imported from
+2. Pulls the listing metadata (id, title, category, subcategory, description,
+   usageInstructions) out of each calculator object without running any code
+3. Writes one entry per calculator with a dynamic-import thunk, which
+   calculatorRegistry.registerLazy can list and search before loading the module,
+   as one entry module per category (src/calculators/categories/<category>.ts)
+4. Plans Rollup chunks (src/calculators/chunks.json, read by vite.config.ts) so
+   each category - and each hub within finance, legal and business - ships its
+   calculators in its own chunk; a visitor to one hub downloads only that hub.
+   Chunks follow the hub a calculator's title files it under (as in
+   update_list.py), since registered calculators mostly declare 'finance'; the
+   category modules follow the declared category, which the registry groups by
+
+Registrations whose metadata cannot be read statically (e.g. register functions
+passed to calculatorRegistry.register, or objects without a literal category)
+are reported and stay eager: manifest.ts imports and registers them as index.ts did.
+
+Usage:
+    python generate_calculator_manifest.py [--check]
+"""
+
+import os
+import re
+import json
+import argparse
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from calculator_categories import (CATEGORY_PRIORITY, DEFAULT_HUB, HUB_CATEGORIES, categorize, category_priority,
+                                   hubs_for)
+from find_unreachable_calculators import INDEX_FILE, registered_modules
+from git_scope import add_scope_arguments, scope_from_args, touches
+from import_graph import RESOLVE_SUFFIXES, ImportGraph
+from ts_scanner import scan
+
+MANIFEST_FILE = 'src/calculators/manifest.ts'
+CATEGORIES_DIR = 'src/calculators/categories'
+CHUNKS_FILE = 'src/calculators/chunks.json'
+GENERATED_HEADER = '// Generated by generate_calculator_manifest.py from registerAllCalculators - do not edit'
+STRING_FIELDS = ('id', 'title', 'category', 'subcategory', 'description')
+LIST_FIELDS = ('usageInstructions',)
+REQUIRED_FIELDS = ('id', 'title', 'category', 'description')
+
+# One pattern for every `export const X = {`, so no regex is compiled per calculator name
+OBJECT_START = re.compile(r'export\s+const\s+([A-Za-z_$][\w$]*)\s*(?::\s*[\w.<>]+\s*)?=\s*\{')
+REEXPORT = re.compile(r'export\s*(?:\*|\{([^}]*)\})\s*from\s*[\'"](\.[^\'"]+)[\'"]')
+PROPERTY = re.compile(r'["\']?(\w+)["\']?\s*:\s*')
+STRING_LITERAL = re.compile(r'\'((?:[^\'\\\n]|\\.)*)\'|"((?:[^"\\\n]|\\.)*)"|`((?:[^`\\$]|\\.)*)`')
+
+def _unescape(value: str) -> str:
+    return re.sub(r'\\(.)', r'\1', value)
+
+def _parse_string(text: str, pos: int) -> Tuple[Optional[str], int]:
+    match = STRING_LITERAL.match(text, pos)
+    if not match:
+        return None, pos
+    raw = next(group for group in match.groups() if group is not None)
+    return _unescape(raw), match.end()
+
+def _parse_string_list(text: str, pos: int) -> Tuple[Optional[List[str]], int]:
+    if not text.startswith('[', pos):
+        return None, pos
+    values = []
+    pos += 1
+    while True:
+        while pos < len(text) and text[pos] in ' \t\r\n,':
+            pos += 1
+        if text.startswith(']', pos):
+            return values, pos + 1
+        value, end = _parse_string(text, pos)
+        if value is None:
+            return None, pos
+        values.append(value)
+        pos = end
+
+def _skip_string(text: str, pos: int) -> int:
+    quote = text[pos]
+    pos += 1
+    while pos < len(text) and text[pos] != quote:
+        pos += 2 if text[pos] == '\\' else 1
+    return pos + 1
+
+def extract_metadata(content: str, name: str, fields: Optional[Tuple[str, ...]] = None) -> Optional[Dict]:
+    """Top-level listing fields of `export const <name> = { ... }`, or None if there is no such object.
+
+    With fields, parsing stops as soon as all of them have been read.
+    """
+    match = next((m for m in OBJECT_START.finditer(content) if m.group(1) == name), None)
+    if not match:
+        return None
+
+    metadata = {}
+    depth, pos = 1, match.end()
+    while pos < len(content) and depth > 0:
+        char = content[pos]
+        if char in '\'"`':
+            pos = _skip_string(content, pos)
+            continue
+        if content.startswith('//', pos):
+            newline = content.find('\n', pos)
+            pos = len(content) if newline == -1 else newline
+            continue
+        if char in '{[(':
+            depth += 1
+        elif char in '}])':
+            depth -= 1
+        elif depth == 1:
+            prop = PROPERTY.match(content, pos)
+            if prop and (pos == 0 or not (content[pos - 1].isalnum() or content[pos - 1] == '_')):
+                key, value_pos = prop.group(1), prop.end()
+                if key in STRING_FIELDS and key not in metadata:
+                    value, end = _parse_string(content, value_pos)
+                    if value is not None:
+                        metadata[key] = value
+                        if fields and all(field in metadata for field in fields):
+                            return metadata
+                        pos = end
+                        continue
+                elif key in LIST_FIELDS and key not in metadata:
+                    value, end = _parse_string_list(content, value_pos)
+                    if value is not None:
+                        metadata[key] = value
+                        pos = end
+                        continue
+                pos = value_pos
+                continue
+        pos += 1
+
+    return metadata
+
+def resolve_module(specifier: str, importer: str = INDEX_FILE) -> Optional[str]:
+    """File a relative import specifier points at"""
+    base = os.path.normpath(os.path.join(os.path.dirname(importer), specifier)).replace(os.sep, '/')
+    for suffix in RESOLVE_SUFFIXES:
+        if os.path.isfile(base + suffix):
+            return base + suffix
+    return None
+
+def find_definition(path: str, name: str, depth: int = 0,
+                    fields: Optional[Tuple[str, ...]] = None) -> Optional[Tuple[str, Dict]]:
+    """Follow barrel re-exports to the file that defines the calculator object"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    metadata = extract_metadata(content, name, fields)
+    if metadata is not None:
+        return path, metadata
+    if depth >= 3:
+        return None
+
+    for match in REEXPORT.finditer(content):
+        names = match.group(1)
+        if names is not None and name not in [n.strip().split(' as ')[-1].strip() for n in names.split(',')]:
+            continue
+        target = resolve_module(match.group(2), importer=path)
+        if target and target != path:
+            found = find_definition(target, name, depth + 1, fields)
+            if found:
+                return found
+    return None
+
+def build_manifest(registered: Dict[str, str]) -> Tuple[List[Dict], List[Dict]]:
+    """Manifest entries for every registered calculator, plus the ones left for eager registration"""
+    entries, skipped, seen_ids = [], [], set()
+
+    def skip(name: str, specifier: str, reason: str) -> None:
+        skipped.append({'export': name, 'specifier': specifier, 'reason': reason})
+
+    for name, specifier in registered.items():
+        path = resolve_module(specifier)
+        if path is None:
+            skip(name, specifier, f"cannot resolve '{specifier}'")
+            continue
+        found = find_definition(path, name)
+        if found is None:
+            skip(name, specifier, f"no static calculator object in {path}")
+            continue
+        path, metadata = found
+        missing = [field for field in REQUIRED_FIELDS if field not in metadata]
+        if missing:
+            skip(name, specifier, f"no {', '.join(missing)} in {path}")
+            continue
+        if metadata['category'] not in CATEGORY_PRIORITY:
+            skip(name, specifier, f"unknown category '{metadata['category']}'")
+            continue
+        if metadata['id'] in seen_ids:
+            # index.ts registered both and the later one won; keep that by registering it eagerly
+            skip(name, specifier, f"duplicate id '{metadata['id']}'")
+            continue
+        seen_ids.add(metadata['id'])
+        # Import the defining file directly so the chunk does not pull in the barrel's siblings
+        module = os.path.splitext(os.path.relpath(path, os.path.dirname(INDEX_FILE)))[0].replace(os.sep, '/')
+        entries.append({**metadata, 'export': name, 'module': module, 'path': path})
+    entries.sort(key=lambda entry: (category_priority(entry['category']), entry['id']))
+    return entries, skipped
+
+def _ts_literal(value) -> str:
+    """Single-quoted TypeScript literal for a string or list of strings"""
+    if isinstance(value, list):
+        return '[' + ', '.join(_ts_literal(item) for item in value) + ']'
+    escaped = json.dumps(value, ensure_ascii=False)[1:-1].replace('\\"', '"').replace("'", "\\'")
+    return f"'{escaped}'"
+
+def render_category_module(category: str, entries: List[Dict]) -> str:
+    """TypeScript source for src/calculators/categories/<category>.ts"""
+    lines = [
+        GENERATED_HEADER,
+        "import { CalculatorManifestEntry } from '../../types/calculator';",
+        '',
+        f'export const {category}Calculators: CalculatorManifestEntry[] = [',
+    ]
+    for entry in entries:
+        lines.append('  {')
+        for field in STRING_FIELDS + LIST_FIELDS:
+            if field in entry:
+                lines.append(f'    {field}: {_ts_literal(entry[field])},')
+        lines.append(f"    modulePath: {_ts_literal(os.path.dirname(entry['module']))},")
+        lines.append(f"    load: () => import({_ts_literal('../' + entry['module'])}).then((m) => m.{entry['export']}),")
+        lines.append('  },')
+    lines.extend(['];', ''])
+    return '\n'.join(lines)
+
+def imported_names(index_file: str = INDEX_FILE) -> Dict[str, str]:
+    """Local name -> exported name for every value index.ts imports"""
+    with open(index_file, 'rb') as f:
+        records = scan(f.read())
+    return {binding.alias: binding.name for record in records if record.kind == 'import' and not record.type_only
+            for binding in record.names if not binding.type_only}
+
+def _import_line(local: str, exported: str, specifier: str) -> str:
+    if exported == 'default':
+        return f"import {local} from {_ts_literal(specifier)};"
+    if exported == '*':
+        return f"import * as {local} from {_ts_literal(specifier)};"
+    binding = local if exported == local else f'{exported} as {local}'
+    return f"import {{ {binding} }} from {_ts_literal(specifier)};"
+
+def render_manifest(categories: List[str], eager: List[Dict]) -> str:
+    """TypeScript source for src/calculators/manifest.ts"""
+    lines = [
+        GENERATED_HEADER,
+        "import { calculatorRegistry } from '../data/calculatorRegistry';",
+        "import { CalculatorManifestEntry } from '../types/calculator';",
+    ]
+    lines.extend(f"import {{ {category}Calculators }} from './categories/{category}';" for category in categories)
+    if eager:
+        # index.ts lives next to manifest.ts, so its specifiers apply unchanged
+        names = imported_names()
+        lines.append('// Registered eagerly: their metadata cannot be read without loading the module')
+        lines.extend(_import_line(entry['export'], names.get(entry['export'], entry['export']), entry['specifier'])
+                     for entry in eager)
+    lines.extend([
+        '',
+        'export const calculatorManifest: CalculatorManifestEntry[] = [',
+    ])
+    lines.extend(f'  ...{category}Calculators,' for category in categories)
+    lines.extend([
+        '];',
+        '',
+        '/**',
+        ' * Make every calculator listable and searchable without loading its module;',
+        ' * the ones the manifest cannot describe are registered eagerly',
+        ' */',
+        'export function registerCalculatorManifest(): void {',
+        '  calculatorManifest.forEach(entry => calculatorRegistry.registerLazy(entry));',
+    ])
+    lines.extend(f"  calculatorRegistry.register({entry['export']});" for entry in eager)
+    lines.extend([
+        '}',
+        '',
+        'registerCalculatorManifest();',
+        '',
+    ])
+    return '\n'.join(lines)
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower().replace(' hub', '')).strip('-')
+
+def chunk_category(entry: Dict) -> Tuple[str, Optional[str]]:
+    """Category (and hub) whose pages list a calculator, as update_list.py files it.
+
+    Registered calculators nearly all declare category 'finance' or 'business',
+    calorie and algebra calculators included, so the declared category alone
+    would never produce a health or math chunk. A title matching a hub keyword
+    goes to that hub's category; otherwise the declared category stands.
+    """
+    hub = categorize(entry['title'])
+    if hub != DEFAULT_HUB:
+        return HUB_CATEGORIES[hub], hub
+    return entry['category'], None
+
+def entry_chunk(entry: Dict) -> str:
+    """Chunk for a calculator: its hub's category, split by hub where a category spans several"""
+    category, hub = chunk_category(entry)
+    if hub and len(hubs_for(category)) > 1:
+        return f'calculators-{_slug(hub)}'
+    return f'calculators-{category}'
+
+def plan_chunks(entries: List[Dict], graph: ImportGraph) -> Dict[str, List[str]]:
+    """Chunk name -> calculator source files, for Rollup's manualChunks
+
+    Each calculator's module and everything it pulls in from src/calculators goes
+    to its chunk. Files shared within one category go to the category's chunk;
+    files shared across categories go to the highest-priority category.
+    """
+    prefix = os.path.dirname(INDEX_FILE) + '/'
+    generated = {INDEX_FILE, MANIFEST_FILE}
+    owners = defaultdict(set)
+    for entry in entries:
+        for path in graph.reachable([entry['path']]):
+            if path.startswith(prefix) and path not in generated and not path.startswith(CATEGORIES_DIR + '/'):
+                owners[path].add((chunk_category(entry)[0], entry_chunk(entry)))
+
+    chunks = defaultdict(list)
+    for path, owned_by in sorted(owners.items()):
+        if len(owned_by) == 1:
+            chunk = next(iter(owned_by))[1]
+        else:
+            category = min((category for category, _ in owned_by), key=category_priority)
+            chunk = f'calculators-{category}'
+        chunks[chunk].append(path)
+    return dict(sorted(chunks.items()))
+
+def render_outputs(entries: List[Dict], eager: List[Dict]) -> Dict[str, str]:
+    """Every generated file, keyed by path"""
+    by_category = defaultdict(list)
+    for entry in entries:
+        by_category[entry['category']].append(entry)
+    categories = sorted(by_category, key=category_priority)
+
+    outputs = {MANIFEST_FILE: render_manifest(categories, eager)}
+    for category in categories:
+        outputs[os.path.join(CATEGORIES_DIR, f'{category}.ts')] = render_category_module(category, by_category[category])
+
+    chunks = plan_chunks(entries, ImportGraph().build())
+    outputs[CHUNKS_FILE] = json.dumps(chunks, indent=2) + '\n'
+    return outputs
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the lazy calculator manifest, category modules and chunk plan')
+    parser.add_argument('--check', action='store_true', help='exit 1 if any generated file is out of date instead of writing')
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+
+    # Calculator metadata can live in any module, so any calculator change regenerates
+    if not touches(scope_from_args(args)):
+        print("⏩ No calculator changes; generated files left as is")
+        return 0
+
+    entries, skipped = build_manifest(registered_modules())
+    outputs = render_outputs(entries, skipped)
+
+    print(f"📋 Manifest entries: {len(entries)}")
+    if skipped:
+        print(f"⚠️  Registered eagerly: {len(skipped)}")
+        for entry in skipped:
+            print(f"  {entry['export']}: {entry['reason']}")
+    chunks = json.loads(outputs[CHUNKS_FILE])
+    print(f"📦 Chunks: {len(chunks)}")
+    for chunk, files in chunks.items():
+        print(f"  {chunk}: {len(files)} files")
+
+    stale = []
+    for path, source in outputs.items():
+        current = None
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                current = f.read()
+        if current != source:
+            stale.append(path)
+
+    if args.check:
+        if stale:
+            for path in stale:
+                print(f"❌ {path} is out of date, run generate_calculator_manifest.py")
+            return 1
+        print("✅ Generated files are up to date")
+        return 0
+
+    for path in stale:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(outputs[path])
+        print(f"✅ Wrote {path}")
+    if not stale:
+        print("✅ Generated files already up to date")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
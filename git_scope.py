@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Git-aware work scoping for the maintenance scripts
+
+Every script walks the whole tree even when a branch only touches three
+calculators. Scripts that call add_scope_arguments() accept:
+    --changed-only   files modified, staged or untracked relative to HEAD
+    --since <ref>    files changed on this branch since it forked from <ref>
+                     (<ref>...HEAD), plus uncommitted and untracked changes
+and restrict their work to those paths. Outside a git checkout the scope is
+None and scripts fall back to processing everything; inside one, an unknown
+<ref> or a failing git command stops the script with an error instead.
+
+Usage from a script:
+    add_scope_arguments(parser)
+    scope = scope_from_args(args)          # None means full mode
+    files = [f for f in files if in_scope(f, scope)]
+"""
+
+import os
+import subprocess
+from typing import Iterable, List, Optional, Set
+
+CALCULATORS_DIR = 'src/calculators'
+INDEX_FILE = 'src/calculators/index.ts'
+# Files whose changes can affect what index.ts imports or registers
+REGISTRATION_FILES = ('index.ts', 'register.ts')
+
+class GitScopeError(Exception):
+    """git could not list the changed files inside a checkout"""
+
+def _git(*args: str) -> Optional[List[str]]:
+    try:
+        result = subprocess.run(['git', *args], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [line for line in result.stdout.splitlines() if line]
+
+def changed_files(since: Optional[str] = None) -> Optional[Set[str]]:
+    """Paths (relative to the current directory) changed since a ref, or None outside git.
+
+    Raises GitScopeError for an unknown ref or a git command that fails in a checkout.
+    """
+    if _git('rev-parse', '--is-inside-work-tree') is None:
+        return None
+    if since and _git('rev-parse', '--verify', '--quiet', f'{since}^{{commit}}') is None:
+        raise GitScopeError(f"unknown git ref '{since}'")
+    diff = _git('diff', '--name-only', '--relative', 'HEAD')
+    modified = _git('ls-files', '--modified', '--others', '--exclude-standard')
+    # Diff from the merge-base, so commits that only landed on <since> stay out of scope
+    branch = _git('diff', '--name-only', '--relative', f'{since}...HEAD') if since else []
+    if diff is None or modified is None or branch is None:
+        raise GitScopeError('git diff failed' + (f" against '{since}' (no merge-base with HEAD?)" if since else ''))
+    return {path.replace(os.sep, '/') for path in diff + modified + branch}
+
+def add_scope_arguments(parser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--changed-only', action='store_true',
+                       help='only process files changed in the working tree (git)')
+    group.add_argument('--since', metavar='REF',
+                       help='only process files changed on this branch since it forked from REF (git)')
+
+def scope_from_args(args) -> Optional[Set[str]]:
+    """Changed paths for --changed-only / --since, or None for full mode.
+
+    Exits with status 1 if git fails inside a checkout: silently widening the
+    scope to the whole tree would surprise whoever asked for a narrow run.
+    """
+    if not getattr(args, 'changed_only', False) and not getattr(args, 'since', None):
+        return None
+    try:
+        scope = changed_files(args.since)
+    except GitScopeError as error:
+        print(f"❌ Cannot scope the run: {error}")
+        raise SystemExit(1)
+    if scope is None:
+        print("⚠️  Not a git checkout; processing the whole tree")
+        return None
+    print(f"🎯 Scoped to {len(scope)} changed files" + (f" since {args.since}" if args.since else ""))
+    return scope
+
+def in_scope(path: str, scope: Optional[Set[str]]) -> bool:
+    """Whether a file (or a directory containing changed files) is in scope"""
+    if scope is None:
+        return True
+    path = os.path.normpath(path).replace(os.sep, '/')
+    if path in scope:
+        return True
+    prefix = path.rstrip('/') + '/'
+    return any(changed.startswith(prefix) for changed in scope)
+
+def scoped_dirs(dirs: Iterable[str], scope: Optional[Set[str]]) -> List[str]:
+    """Calculator directories that contain a changed file"""
+    if scope is None:
+        return list(dirs)
+    touched = set()
+    for path in scope:
+        parent = os.path.dirname(path)
+        while parent and parent not in touched:
+            touched.add(parent)
+            parent = os.path.dirname(parent)
+    return [d for d in dirs if os.path.normpath(d).replace(os.sep, '/') in touched]
+
+def touches(scope: Optional[Set[str]], prefix: str = CALCULATORS_DIR) -> bool:
+    """Whether anything under prefix changed (always True in full mode)"""
+    if scope is None:
+        return True
+    prefix = prefix.rstrip('/') + '/'
+    return any(path.startswith(prefix) for path in scope)
+
+def registration_changed(scope: Optional[Set[str]]) -> bool:
+    """Whether index.ts fixers have anything to do for this scope.
+
+    True in full mode, or when index.ts, a register.ts, a calculator module
+    (*Calculator.ts) or a calculator directory's index.ts changed.
+    """
+    if scope is None:
+        return True
+    for path in scope:
+        if not path.startswith(CALCULATORS_DIR + '/'):
+            continue
+        name = os.path.basename(path)
+        if name in REGISTRATION_FILES or name.endswith('Calculator.ts'):
+            return True
+    return False
+
+def skip_unless_registration_changed(scope: Optional[Set[str]]) -> bool:
+    """Print why an index.ts fixer is skipping; True if it should skip"""
+    if registration_changed(scope):
+        return False
+    print(f"⏩ No registration-relevant changes; leaving {INDEX_FILE} alone")
+    return True
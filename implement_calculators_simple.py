@@ -6,8 +6,11 @@ This script implements all calculators with proper domain-specific functionality
 """
 
 import os
+import argparse
 from pathlib import Path
 
+from git_scope import add_scope_arguments, scope_from_args, scoped_dirs
+
 def implement_calculator_simple(calculator_path):
     """Implement a single calculator with basic domain-specific logic."""
     category = get_calculator_category(calculator_path)
@@ -81,6 +84,10 @@ def implement_generic_calculator(calculator_path, name):
 
 def main():
     """Main implementation function."""
+    parser = argparse.ArgumentParser(description='Implement calculators with simple domain-specific templates')
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+
     print("🚀 Starting simple domain-specific calculator implementation...")
 
     # Find all calculator directories
@@ -92,6 +99,7 @@ def main():
             if dir_name.endswith('-calculator'):
                 calculator_dirs.append(os.path.join(root, dir_name))
 
+    calculator_dirs = scoped_dirs(calculator_dirs, scope_from_args(args))
     print(f"📊 Found {len(calculator_dirs)} calculator directories")
 
     # Implement each calculator
@@ -4,15 +4,31 @@ Domain-Specific Calculator Implementation Script
 
 This script implements all 911 calculators with proper domain-specific functionality,
 replacing placeholder implementations with real calculations, validation, and tests.
+
+Progress is checkpointed to calculator_implementation_progress.json, so an
+interrupted run resumes where it stopped (use --restart to start over).
 """
 
 import os
 import json
 import re
+import argparse
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Optional
+
+from batch_progress import BatchProgress, DEFAULT_CHECKPOINT_EVERY
+from event_log import EventLog, add_event_arguments, events_from_args
+from git_scope import add_scope_arguments, scope_from_args, scoped_dirs
+from prefetch_io import LocalIO, add_io_arguments, io_from_args
+
+# Consolidated, table-driven suites are written here (one or more per category)
+GENERATED_TESTS_DIR = Path('src/test/generated')
+DEFAULT_CASES_PER_SUITE = 100
 
-# Domain-specific templates for each calculator category
+# Template inputs that are not scalar numbers (select options, lists)
+# Domain-specific templates for each calculator category; inputs are numbers
+# unless 'input_types' gives their TypeScript type
 DOMAIN_TEMPLATES = {
     'finance': {
         'ratios': {
@@ -92,6 +108,7 @@ DOMAIN_TEMPLATES = {
             },
             'calorie_needs': {
                 'inputs': ['weight', 'height', 'age', 'activityLevel', 'gender'],
+                'input_types': {'activityLevel': 'string', 'gender': 'string'},
                 'outputs': ['bmr', 'tdee', 'dailyCalories'],
                 'formula': 'Complex BMR calculation based on Mifflin-St Jeor equation',
                 'validation': ['weight > 0', 'height > 0', 'age > 0']
@@ -100,6 +117,7 @@ DOMAIN_TEMPLATES = {
         'medical': {
             'body_fat': {
                 'inputs': ['weight', 'waist', 'neck', 'height', 'gender'],
+                'input_types': {'gender': 'string'},
                 'outputs': ['bodyFatPercentage', 'leanMass', 'fatMass'],
                 'formula': 'US Navy body fat calculation method',
                 'validation': ['weight > 0', 'waist > 0', 'neck > 0', 'height > 0']
@@ -150,6 +168,7 @@ DOMAIN_TEMPLATES = {
         'statistics': {
             'mean_median_mode': {
                 'inputs': ['numbers'],
+                'input_types': {'numbers': 'number[]'},
                 'outputs': ['mean', 'median', 'mode', 'range'],
                 'formula': 'Standard statistical calculations',
                 'validation': ['numbers array not empty']
@@ -176,6 +195,7 @@ DOMAIN_TEMPLATES = {
         'travel': {
             'trip_cost': {
                 'inputs': ['destination', 'duration', 'travelers', 'accommodationType'],
+                'input_types': {'destination': 'string', 'accommodationType': 'string'},
                 'outputs': ['totalCost', 'costPerPerson', 'budgetCategory'],
                 'formula': 'Dynamic calculation based on destination data',
                 'validation': ['duration > 0', 'travelers > 0']
@@ -227,23 +247,55 @@ def find_template_for_calculator(category: str, name: str) -> Dict[str, Any]:
 
     return {}
 
+def input_type(template: Dict[str, Any], name: str) -> str:
+    """TypeScript type of a template input (number unless declared in 'input_types')"""
+    return template.get('input_types', {}).get(name, 'number')
+
+def generate_cache_key_function(type_name: str, template: Dict[str, Any]) -> str:
+    """Generate the cache key function passed to PerformanceOptimizationService caches.
+
+    Only the declared inputs, in sorted order, so property order and extra
+    fields never cause a miss. Numbers go through numberKey, so '5.0' and 5
+    (or -0 and 0) key alike while '', null and false stay distinct from 0;
+    other types go through JSON.stringify.
+    """
+    inputs = sorted(template.get('inputs', []))
+    numeric = [inp for inp in inputs if input_type(template, inp) == 'number']
+    key = '|'.join(f'${{numberKey(inputs.{inp})}}' if inp in numeric else f'${{JSON.stringify(inputs.{inp})}}'
+                   for inp in inputs)
+    helper = """
+// Empty form fields, null and false must not share a key with 0
+const numberKey = (value: unknown): string =>
+    value === '' || value == null || typeof value === 'boolean' ? JSON.stringify(value ?? null) : String(Number(value));
+""" if numeric else ''
+
+    return f"""{helper}
+/**
+ * Canonical cache key for {type_name}Inputs (fixed field order, numbers normalized)
+ */
+export function {type_name}CacheKey(inputs: {type_name}Inputs): string {{
+    return `{key}`;
+}}
+"""
+
 def generate_types_file(calculator_path: str, template: Dict[str, Any]) -> str:
     """Generate proper types.ts file."""
     inputs = template.get('inputs', [])
     outputs = template.get('outputs', [])
+    type_name = Path(calculator_path).name.replace('-', '').replace('_', '')
 
-    input_interface = '\n'.join([f'    {inp}: number;' for inp in inputs])
+    input_interface = '\n'.join([f'    {inp}: {input_type(template, inp)};' for inp in inputs])
     output_interface = '\n'.join([f'    {out}: number;' for out in outputs])
 
-    return f"""export interface {Path(calculator_path).name.replace('-', '').replace('_', '')}Inputs {{
+    return f"""export interface {type_name}Inputs {{
 {input_interface}
 }}
 
-export interface {Path(calculator_path).name.replace('-', '').replace('_', '')}Outputs {{
+export interface {type_name}Outputs {{
 {output_interface}
     explanation: string;
 }}
-"""
+""" + generate_cache_key_function(type_name, template)
 
 def generate_formulas_file(calculator_path: str, template: Dict[str, Any]) -> str:
     """Generate proper formulas.ts file with domain-specific calculations."""
@@ -544,44 +596,156 @@ describe('{calculator_name.replace('_', ' ').title()} Calculator', () => {{
       const result = calculate{calculator_name.title().replace('_', '')}Results(mockInputs);
       expect(result).toBeDefined();
       {chr(10).join([f"expect(typeof result.{out}).toBe('number');" for out in outputs])}
-    });
+    }});
 
     it('handles edge cases', () => {{
       // Add specific edge case tests
       expect(true).toBe(true);
-    });
-  });
+    }});
+  }});
 
   describe('Validation', () => {{
     it('validates correct inputs', () => {{
       const result = validate{calculator_name.title().replace('_', '')}Inputs(mockInputs);
       expect(result.length).toBe(0);
-    });
+    }});
 
     it('validates missing required fields', () => {{
       const invalidInputs = {{ ...mockInputs, {inputs[0] if inputs else 'value'}: undefined }};
       const result = validate{calculator_name.title().replace('_', '')}Inputs(invalidInputs as any);
       expect(result.length).toBeGreaterThan(0);
-    });
-  });
-});
+    }});
+  }});
+}});
 """
 
-def implement_calculator(calculator_path: str) -> None:
-    """Implement a single calculator with domain-specific functionality."""
+GENERIC_TEMPLATE = {
+    'inputs': ['value'],
+    'outputs': ['result'],
+    'formula': 'value * 1.1',
+    'validation': ['value > 0']
+}
+
+def resolve_template(calculator_path: str) -> Dict[str, Any]:
+    """Find the domain template for a calculator, falling back to the generic one."""
     category = get_calculator_category(calculator_path)
     name = get_calculator_name(calculator_path)
+    return find_template_for_calculator(category, name) or GENERIC_TEMPLATE
 
-    template = find_template_for_calculator(category, name)
+def build_test_case(calculator_path: str, template: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the data-table row for a calculator in the consolidated category suites."""
+    inputs = template.get('inputs', [])
+    outputs = template.get('outputs', [])
+    calculator_name = Path(calculator_path).name.replace('-calculator', '').replace('-', '_')
+    function_suffix = calculator_name.title().replace('_', '')
+    module_path = Path(os.path.relpath(calculator_path, GENERATED_TESTS_DIR)).as_posix()
+
+    return {
+        'id': Path(os.path.relpath(calculator_path, 'src/calculators')).as_posix(),
+        'category': get_calculator_category(calculator_path),
+        'module': module_path,
+        'calculate': f'calculate{function_suffix}Results',
+        'validate': f'validate{function_suffix}Inputs',
+        'inputs': {inp: i + 1 for i, inp in enumerate(inputs)},
+        'outputs': outputs,
+        'requiredField': inputs[0] if inputs else 'value',
+    }
+
+def render_test_suite(category: str, cases: List[Dict[str, Any]]) -> str:
+    """Render one data-driven vitest suite for a chunk of calculators in a category.
+
+    Each row becomes its own describe block titled with the calculator id, so a
+    failure is still attributed to a single calculator. Modules are loaded with
+    dynamic import() so a row only pays for its own module graph, and rows
+    outside the planned shard (see plan_test_shards.py) are never loaded.
+    """
+    rows = []
+    for case in cases:
+        rows.append(
+            f"  [{json.dumps(case['id'])}, "
+            f"() => import('{case['module']}/formulas'), "
+            f"() => import('{case['module']}/validation'), "
+            f"{json.dumps(case['calculate'])}, {json.dumps(case['validate'])}, "
+            f"{json.dumps(case['inputs'])}, {json.dumps(case['outputs'])}, "
+            f"{json.dumps(case['requiredField'])}],"
+        )
+
+    return f"""// Generated by implement_domain_specific_calculators.py --consolidated-tests. Do not edit.
+import {{ describe, it, expect }} from 'vitest';
+import {{ selectShardCases }} from '../shardFilter';
+
+type Loader = () => Promise<Record<string, any>>;
+
+// [id, formulas, validation, calculate fn, validate fn, mock inputs, numeric outputs, required field]
+type CalculatorCase = [string, Loader, Loader, string, string, Record<string, number>, string[], string];
+
+const cases = selectShardCases<CalculatorCase>([
+{chr(10).join(rows)}
+]);
+
+describe.each(cases)('{category}: %s', (id, loadFormulas, loadValidation, calculate, validate, mockInputs, outputs, requiredField) => {{
+  it('calculates result correctly', async () => {{
+    const formulas = await loadFormulas();
+    const result = formulas[calculate](mockInputs);
+    expect(result).toBeDefined();
+    for (const output of outputs) {{
+      expect(typeof result[output], `${{id}} → ${{output}}`).toBe('number');
+    }}
+  }});
+
+  it('validates correct inputs', async () => {{
+    const validation = await loadValidation();
+    expect(validation[validate](mockInputs).length).toBe(0);
+  }});
+
+  it('validates missing required fields', async () => {{
+    const validation = await loadValidation();
+    const invalidInputs = {{ ...mockInputs, [requiredField]: undefined }};
+    expect(validation[validate](invalidInputs).length).toBeGreaterThan(0);
+  }});
+}});
+"""
 
-    if not template:
+def write_consolidated_test_suites(cases: List[Dict[str, Any]], cases_per_suite: int) -> List[Path]:
+    """Write one suite per category, split into equal chunks for `vitest --shard`.
+
+    vitest shards by file, so capping the rows per file keeps the shards even
+    instead of putting the whole finance category on a single worker.
+    """
+    GENERATED_TESTS_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in GENERATED_TESTS_DIR.glob('*.test.ts'):
+        stale.unlink()
+
+    by_category = defaultdict(list)
+    for case in cases:
+        by_category[case['category']].append(case)
+
+    written = []
+    for category, category_cases in sorted(by_category.items()):
+        category_cases.sort(key=lambda case: case['id'])
+        chunks = [category_cases[i:i + cases_per_suite] for i in range(0, len(category_cases), cases_per_suite)]
+        for part, chunk in enumerate(chunks, 1):
+            suffix = f'.part{part}' if len(chunks) > 1 else ''
+            suite_path = GENERATED_TESTS_DIR / f'{category}{suffix}.test.ts'
+            with open(suite_path, 'w') as f:
+                f.write(render_test_suite(category, chunk))
+            written.append(suite_path)
+
+    return written
+
+def implement_calculator(calculator_path: str, consolidated_tests: bool = False,
+                         backend: Optional[LocalIO] = None, events: Optional[EventLog] = None) -> Optional[Dict[str, Any]]:
+    """Implement a single calculator with domain-specific functionality.
+
+    With consolidated_tests, no per-calculator .test.ts is written; the
+    calculator's test-table row is returned for the category suite instead.
+    The files are written through backend (all of them concurrently with PrefetchIO).
+    """
+    template = resolve_template(calculator_path)
+    if template is GENERIC_TEMPLATE:
         print(f"⚠️  No template found for {calculator_path}, using generic implementation")
-        template = {
-            'inputs': ['value'],
-            'outputs': ['result'],
-            'formula': 'value * 1.1',
-            'validation': ['value > 0']
-        }
+        if events:
+            events.emit('generic_template', path=calculator_path)
 
     # Update all files
     files_to_update = [
@@ -590,40 +754,117 @@ def implement_calculator(calculator_path: str) -> None:
         ('validation.ts', generate_validation_file(calculator_path, template)),
         ('quickValidation.ts', generate_quick_validation_file(calculator_path, template)),
         (f'{Path(calculator_path).name}.ts', update_calculator_file(calculator_path, template)),
-        (f'{Path(calculator_path).name}.test.ts', update_test_file(calculator_path, template))
     ]
-
-    for filename, content in files_to_update:
-        filepath = os.path.join(calculator_path, filename)
-        with open(filepath, 'w') as f:
-            f.write(content)
+    test_file = os.path.join(calculator_path, f'{Path(calculator_path).name}.test.ts')
+    if not consolidated_tests:
+        files_to_update.append((f'{Path(calculator_path).name}.test.ts', update_test_file(calculator_path, template)))
+    elif os.path.exists(test_file):
+        # The category suite covers this calculator now
+        os.remove(test_file)
+
+    writes = [(os.path.join(calculator_path, filename), content) for filename, content in files_to_update]
+    (backend or LocalIO()).write_files(writes)
+    for filepath, _ in writes:
         print(f"✅ Updated {filepath}")
+    if events:
+        events.emit('implemented', path=calculator_path, files=[filepath for filepath, _ in writes])
+
+    return build_test_case(calculator_path, template) if consolidated_tests else None
 
 def main():
     """Main implementation function."""
+    parser = argparse.ArgumentParser(description='Implement domain-specific calculators')
+    parser.add_argument('--consolidated-tests', action='store_true',
+                        help=f'emit table-driven suites per category under {GENERATED_TESTS_DIR} '
+                             'instead of one .test.ts per calculator')
+    parser.add_argument('--cases-per-suite', type=int, default=DEFAULT_CASES_PER_SUITE,
+                        help='maximum calculators per generated suite file (keeps vitest --shard balanced)')
+    parser.add_argument('--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY,
+                        help='save progress to calculator_implementation_progress.json every N calculators')
+    parser.add_argument('--restart', action='store_true',
+                        help='ignore saved progress and implement every calculator again')
+    add_scope_arguments(parser)
+    add_io_arguments(parser)
+    add_event_arguments(parser)
+    args = parser.parse_args()
+    # The event log first, so that with --events - even the scope and backend notices go to stderr
+    events = events_from_args(args, 'implement_domain_specific_calculators')
+    scope = scope_from_args(args)
+    backend = io_from_args(args)
+
     print("🚀 Starting domain-specific calculator implementation...")
 
     # Find all calculator directories
     calculators_dir = Path('src/calculators')
     calculator_dirs = []
 
-    for root, dirs, files in os.walk(calculators_dir):
+    for root, dirs, files in backend.walk(calculators_dir):
         for dir_name in dirs:
             if dir_name.endswith('-calculator'):
                 calculator_dirs.append(os.path.join(root, dir_name))
 
+    # Stable order so a resumed run continues from the same place
+    calculator_dirs.sort()
+    all_dirs = calculator_dirs
+    calculator_dirs = scoped_dirs(all_dirs, scope)
     print(f"📊 Found {len(calculator_dirs)} calculator directories")
 
+    progress = BatchProgress('implement_domain_specific_calculators', checkpoint_every=args.checkpoint_every)
+    if args.restart:
+        progress.reset()
+    elif scope is not None:
+        # A scoped run is about what changed: completed-but-changed calculators are redone
+        redo = progress.forget(calculator_dirs)
+        if redo:
+            print(f"🔁 Re-implementing {redo} changed calculators marked completed")
+    elif progress.state['completed']:
+        print(f"⏩ Resuming: {len(progress.state['completed'])} calculators already completed "
+              f"(last: {progress.state['lastProcessed']})")
+
     # Implement each calculator
-    for i, calculator_path in enumerate(calculator_dirs, 1):
-        print(f"\n🔄 [{i}/{len(calculator_dirs)}] Implementing {calculator_path}")
-        try:
-            implement_calculator(calculator_path)
-        except Exception as e:
-            print(f"❌ Error implementing {calculator_path}: {e}")
+    test_cases = []
+    position = {path: i for i, path in enumerate(calculator_dirs, 1)}
+
+    def process(calculator_path: str) -> None:
+        print(f"\n🔄 [{position[calculator_path]}/{len(calculator_dirs)}] Implementing {calculator_path}")
+        test_case = implement_calculator(calculator_path, consolidated_tests=args.consolidated_tests,
+                                         backend=backend, events=events)
+        if test_case:
+            test_cases.append(test_case)
+
+    def skip(calculator_path: str) -> None:
+        # Completed calculators still need their row in the category suites
+        if args.consolidated_tests:
+            test_cases.append(build_test_case(calculator_path, resolve_template(calculator_path)))
+
+    try:
+        summary = progress.run(calculator_dirs, process, on_skip=skip)
+    except KeyboardInterrupt:
+        print("⏸️  Stopped early; rerun to continue from the last checkpoint")
+        events.emit('interrupted', completed=len(progress.state['completed']))
+        events.close()
+        exit(130)
+    finally:
+        backend.close()
+
+    if args.consolidated_tests:
+        # Suites are rewritten whole, so unchanged calculators keep their rows
+        in_run = set(calculator_dirs)
+        for calculator_path in all_dirs:
+            if calculator_path not in in_run:
+                skip(calculator_path)
+        suites = write_consolidated_test_suites(test_cases, args.cases_per_suite)
+        events.emit('test_suites', suites=[str(suite) for suite in suites], cases=len(test_cases))
+        print(f"\n🧪 Wrote {len(suites)} consolidated test suites covering {len(test_cases)} calculators to {GENERATED_TESTS_DIR}")
 
     print("\n🎉 Domain-specific calculator implementation complete!")
-    print(f"✅ Implemented {len(calculator_dirs)} calculators with proper domain-specific functionality")
+    print(f"✅ Implemented {len(summary['processed'])} calculators with proper domain-specific functionality")
+    print(f"⏩ Skipped {len(summary['skipped'])} already completed, ❌ {len(summary['failed'])} failed")
+    for calculator_path in summary['failed']:
+        events.emit('failed', path=calculator_path, error=progress.state['failed'].get(calculator_path))
+    events.emit('summary', processed=len(summary['processed']), skipped=len(summary['skipped']),
+                failed=len(summary['failed']))
+    events.close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Whole-tree TypeScript import graph with an incremental on-disk cache
+
+The import fixers only ever look at src/calculators/index.ts. This script maps
+the real dependency graph of every .ts/.tsx file under src/:
+1. Extracts every import specifier per file with ts_scanner (static, re-export, side-effect,
+   dynamic import() and require())
+2. Resolves each specifier to a file (relative paths, the '@/' alias, index files);
+   bare package imports are kept as external
+3. Caches specifiers per file in .import-graph-cache.json keyed by mtime and size,
+   so only changed files are re-read on the next run
+4. Answers queries: reverse dependencies, fan-out, cycles and reachability
+
+Usage:
+    python import_graph.py build
+    python import_graph.py rdeps src/engines/CalculatorEngine.ts
+    python import_graph.py fanout --top 20
+    python import_graph.py cycles
+    python import_graph.py reachable --from src/calculators/index.ts
+"""
+
+import os
+import json
+import argparse
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from tree_records import PathTable
+from ts_scanner import scan, specifiers
+
+SRC_DIR = 'src'
+CACHE_FILE = '.import-graph-cache.json'
+# 2: specifiers come from ts_scanner (no matches inside comments or strings)
+CACHE_VERSION = 2
+SOURCE_EXTENSIONS = ('.ts', '.tsx')
+RESOLVE_SUFFIXES = ('', '.ts', '.tsx', '.d.ts', '.js', '.jsx', '/index.ts', '/index.tsx', '/index.js')
+ALIASES = {'@/': 'src/'}
+
+def extract_specifiers(content: bytes) -> List[str]:
+    """All module specifiers referenced by a source file, in order of appearance"""
+    return specifiers(scan(content))
+
+class ImportGraph:
+    def __init__(self, root: str = SRC_DIR, cache_file: str = CACHE_FILE):
+        self.root = root
+        self.cache_file = cache_file
+        self.specifiers: Dict[str, List[str]] = {}
+        self.edges: Dict[str, Set[str]] = {}
+        self.external: Dict[str, Set[str]] = {}
+        self.unresolved: Dict[str, List[str]] = {}
+        self.stats = {'files': 0, 'parsed': 0, 'cached': 0}
+        # Every path and specifier string is stored once, however many edges refer to it
+        self.paths = PathTable()
+
+    def _source_files(self) -> Dict[str, os.stat_result]:
+        """Every source file under the root with its stat"""
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d != 'node_modules']
+            for name in filenames:
+                if name.endswith(SOURCE_EXTENSIONS):
+                    path = self.paths[self.paths.intern(os.path.join(dirpath, name).replace(os.sep, '/'))]
+                    files[path] = os.stat(path)
+        return files
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if cache.get('version') != CACHE_VERSION or cache.get('root') != self.root:
+            return {}
+        return cache.get('files', {})
+
+    def _save_cache(self, files: Dict[str, os.stat_result]) -> None:
+        entries = {
+            path: {'mtime': st.st_mtime_ns, 'size': st.st_size, 'specifiers': self.specifiers[path]}
+            for path, st in files.items()
+        }
+        tmp_path = self.cache_file + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'root': self.root, 'files': entries}, f)
+        os.replace(tmp_path, self.cache_file)
+
+    def build(self, use_cache: bool = True) -> 'ImportGraph':
+        """Scan the tree (re-reading only changed files) and resolve every edge"""
+        files = self._source_files()
+        cache = self._load_cache() if use_cache else {}
+
+        for path, st in files.items():
+            cached = cache.get(path)
+            if cached and cached['mtime'] == st.st_mtime_ns and cached['size'] == st.st_size:
+                self.specifiers[path] = [self.paths[self.paths.intern(s)] for s in cached['specifiers']]
+                self.stats['cached'] += 1
+                continue
+            with open(path, 'rb') as f:
+                self.specifiers[path] = [self.paths[self.paths.intern(s)] for s in extract_specifiers(f.read())]
+            self.stats['parsed'] += 1
+
+        self.stats['files'] = len(files)
+        self._resolve_all(set(files))
+        if use_cache:
+            self._save_cache(files)
+        return self
+
+    def _resolve_all(self, known_files: Set[str]) -> None:
+        # Resolution is set membership only, so it is redone on every run
+        for path, specifiers in self.specifiers.items():
+            targets, external, unresolved = set(), set(), []
+            for specifier in specifiers:
+                resolved = self.resolve(path, specifier, known_files)
+                if resolved:
+                    targets.add(self.paths[self.paths.intern(resolved)])
+                elif self._is_bare(specifier):
+                    external.add(specifier)
+                else:
+                    unresolved.append(specifier)
+            self.edges[path] = targets
+            self.external[path] = external
+            if unresolved:
+                self.unresolved[path] = unresolved
+
+    @staticmethod
+    def _is_bare(specifier: str) -> bool:
+        return not specifier.startswith('.') and not any(specifier.startswith(a) for a in ALIASES)
+
+    @staticmethod
+    def resolve(importer: str, specifier: str, known_files: Set[str]) -> Optional[str]:
+        """Resolve a specifier the way the TypeScript/Vite config does"""
+        for alias, target in ALIASES.items():
+            if specifier.startswith(alias):
+                base = target + specifier[len(alias):]
+                break
+        else:
+            if not specifier.startswith('.'):
+                return None
+            base = os.path.normpath(os.path.join(os.path.dirname(importer), specifier)).replace(os.sep, '/')
+
+        for suffix in RESOLVE_SUFFIXES:
+            candidate = base + suffix
+            if candidate in known_files:
+                return candidate
+        return None
+
+    # Queries
+
+    def reverse_edges(self) -> Dict[str, Set[str]]:
+        reverse = defaultdict(set)
+        for source, targets in self.edges.items():
+            for target in targets:
+                reverse[target].add(source)
+        return reverse
+
+    def reverse_dependencies(self, path: str, transitive: bool = False) -> Set[str]:
+        """Files that import path (directly, or through any chain)"""
+        reverse = self.reverse_edges()
+        if not transitive:
+            return set(reverse.get(path, ()))
+        return self._walk([path], reverse) - {path}
+
+    def reachable(self, roots: Iterable[str]) -> Set[str]:
+        """Every file reachable from the roots, roots included"""
+        return self._walk(roots, self.edges)
+
+    @staticmethod
+    def _walk(roots: Iterable[str], adjacency: Dict[str, Set[str]]) -> Set[str]:
+        seen = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(adjacency.get(node, ()))
+        return seen
+
+    def fan_out(self, top: int = 20) -> List[Dict]:
+        """Files ranked by how much of the tree they pull in transitively"""
+        ranked = []
+        for path, targets in self.edges.items():
+            ranked.append({
+                'file': path,
+                'direct': len(targets),
+                'transitive': len(self.reachable([path])) - 1,
+            })
+        ranked.sort(key=lambda item: (-item['transitive'], -item['direct'], item['file']))
+        return ranked[:top]
+
+    def cycles(self) -> List[List[str]]:
+        """Strongly connected components with more than one file (iterative Tarjan)"""
+        index_of, lowlink, on_stack = {}, {}, set()
+        stack, components = [], []
+        counter = 0
+
+        for start in self.edges:
+            if start in index_of:
+                continue
+            work = [(start, iter(sorted(self.edges.get(start, ()))))]
+            index_of[start] = lowlink[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack.add(start)
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index_of:
+                        index_of[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.edges.get(child, ())))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.edges.get(node, ()):
+                        components.append(sorted(component))
+
+        components.sort(key=len, reverse=True)
+        return components
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and query the TypeScript import graph')
+    parser.add_argument('--root', default=SRC_DIR, help=f'source root to scan (default: {SRC_DIR})')
+    parser.add_argument('--no-cache', action='store_true', help='ignore and do not update the on-disk cache')
+    parser.add_argument('--json', action='store_true', help='print query results as JSON')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='scan the tree and refresh the cache')
+    rdeps = sub.add_parser('rdeps', help='files that import a given file')
+    rdeps.add_argument('file')
+    rdeps.add_argument('--transitive', action='store_true')
+    fanout = sub.add_parser('fanout', help='files that pull in the most of the tree')
+    fanout.add_argument('--top', type=int, default=20)
+    sub.add_parser('cycles', help='import cycles')
+    reach = sub.add_parser('reachable', help='files reachable from an entry point')
+    reach.add_argument('--from', dest='entry', default='src/calculators/index.ts')
+    reach.add_argument('--unreachable', action='store_true', help='list files under the root that are NOT reachable')
+    args = parser.parse_args()
+
+    graph = ImportGraph(root=args.root).build(use_cache=not args.no_cache)
+
+    if args.command == 'build':
+        edge_count = sum(len(targets) for targets in graph.edges.values())
+        result = {**graph.stats, 'edges': edge_count, 'unresolvedFiles': len(graph.unresolved)}
+    elif args.command == 'rdeps':
+        result = sorted(graph.reverse_dependencies(args.file.replace(os.sep, '/'), args.transitive))
+    elif args.command == 'fanout':
+        result = graph.fan_out(args.top)
+    elif args.command == 'cycles':
+        result = graph.cycles()
+    else:
+        reachable = graph.reachable([args.entry])
+        if args.unreachable:
+            result = sorted(set(graph.edges) - reachable)
+        else:
+            result = sorted(reachable)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    elif isinstance(result, dict):
+        for key, value in result.items():
+            print(f"{key}: {value}")
+    else:
+        for item in result:
+            if isinstance(item, dict):
+                print(f"{item['transitive']:6d} transitive  {item['direct']:4d} direct  {item['file']}")
+            elif isinstance(item, list):
+                print(f"cycle ({len(item)} files): " + ' -> '.join(item))
+            else:
+                print(item)
+        print(f"({len(result)} results)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Timing-aware shard planner for the generated calculator test suites
+
+This script:
+1. Collects every test unit: each calculator row of the consolidated suites in
+   src/test/generated, and each per-calculator *.test.ts file
+2. Reads previous vitest JSON reports (vitest run --reporter=json) to get the
+   measured cost of each calculator, falling back to an estimate from the size
+   of the generated test code and the modules it loads
+3. Bin-packs the units into N shards (longest job first onto the shard
+   where it finishes earliest, charging suite start-up overhead once per shard)
+4. Writes test-shards.json, which test_calculators.sh --shard <k> consumes
+
+Usage:
+    python plan_test_shards.py --shards 4 --report reports/vitest-*.json
+"""
+
+import os
+import re
+import json
+import glob
+import argparse
+import statistics
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+GENERATED_TESTS_DIR = Path('src/test/generated')
+CALCULATORS_DIR = Path('src/calculators')
+DEFAULT_MANIFEST = 'test-shards.json'
+
+# Estimated cost when no report covers a calculator: vitest transform and
+# execution time grow roughly with the bytes of source a test pulls in.
+ESTIMATED_MS_PER_KB = 0.8
+DEFAULT_FILE_OVERHEAD_MS = 250.0
+
+# Row of a consolidated suite: ["finance/foo-calculator", () => import('../../calculators/...
+CASE_ROW_PATTERN = re.compile(r'^\s*\["([^"]+)", \(\) => import\(\'([^\']+)/formulas\'\)')
+# describe.each title of a consolidated suite row: "<category>: <calculator id>"
+SUITE_TITLE_PATTERN = re.compile(r'^[\w-]+: ([\w.-]+(?:/[\w.-]+)*)$')
+
+def collect_units() -> Dict[str, Dict]:
+    """Find every test unit: consolidated rows keyed by calculator id, test files by path."""
+    units = {}
+
+    for suite in sorted(GENERATED_TESTS_DIR.glob('*.test.ts')):
+        with open(suite, 'r', encoding='utf-8') as f:
+            for line in f:
+                match = CASE_ROW_PATTERN.match(line)
+                if not match:
+                    continue
+                calc_id, module = match.groups()
+                module_dir = os.path.normpath(GENERATED_TESTS_DIR / module)
+                units[calc_id] = {
+                    'id': calc_id,
+                    'calculator': calc_id,
+                    'file': suite.as_posix(),
+                    'testBytes': len(line),
+                    'moduleBytes': _module_bytes(module_dir),
+                }
+
+    for root, dirs, files in os.walk(CALCULATORS_DIR):
+        for file in files:
+            if not file.endswith('.test.ts'):
+                continue
+            # A calculator directory can hold several test files; each is its own unit
+            test_path = Path(os.path.join(root, file)).as_posix()
+            units[test_path] = {
+                'id': test_path,
+                'calculator': Path(os.path.relpath(root, CALCULATORS_DIR)).as_posix(),
+                'file': test_path,
+                'testBytes': os.path.getsize(test_path),
+                'moduleBytes': _module_bytes(root),
+            }
+
+    return units
+
+def discovered_test_files() -> set:
+    """Every test file vitest would run, independent of how units were collected."""
+    files = {suite.as_posix() for suite in GENERATED_TESTS_DIR.glob('*.test.ts')}
+    for root, dirs, names in os.walk(CALCULATORS_DIR):
+        files.update(Path(os.path.join(root, name)).as_posix() for name in names if name.endswith('.test.ts'))
+    return files
+
+def _module_bytes(calc_dir: str) -> int:
+    """Size of the formulas and validation modules a calculator test imports."""
+    total = 0
+    for name in ('formulas.ts', 'validation.ts'):
+        path = os.path.join(calc_dir, name)
+        if os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+def _unit_id(test_file: str, ancestor_titles: List[str]) -> str:
+    """Map a vitest assertion back to the test unit it belongs to."""
+    test_path = Path(os.path.relpath(os.path.abspath(test_file))).as_posix()
+    # Consolidated suites title each row's block "<category>: <id>"
+    if ancestor_titles and Path(test_path).parent == GENERATED_TESTS_DIR:
+        match = SUITE_TITLE_PATTERN.match(ancestor_titles[0])
+        if match:
+            return match.group(1)
+    return test_path
+
+def read_reports(report_paths: List[str]) -> Dict:
+    """Read vitest JSON reports into per-unit and per-file timings."""
+    durations = defaultdict(list)
+    overheads = []
+
+    for report_path in report_paths:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+
+        for test_file in report.get('testResults', []):
+            per_calc = defaultdict(float)
+            for assertion in test_file.get('assertionResults', []):
+                unit_id = _unit_id(test_file['name'], assertion.get('ancestorTitles', []))
+                per_calc[unit_id] += assertion.get('duration') or 0.0
+
+            for unit_id, duration in per_calc.items():
+                durations[unit_id].append(duration)
+
+            start, end = test_file.get('startTime'), test_file.get('endTime')
+            if start and end:
+                overheads.append(max(0.0, (end - start) - sum(per_calc.values())))
+
+    return {
+        'durations': {calc_id: statistics.median(values) for calc_id, values in durations.items()},
+        'fileOverheadMs': statistics.median(overheads) if overheads else None,
+    }
+
+def estimate_cost(unit: Dict) -> float:
+    """Estimate a calculator's test cost in ms from the code it pulls in."""
+    return (unit['testBytes'] + unit['moduleBytes']) / 1024 * ESTIMATED_MS_PER_KB
+
+def plan_shards(units: Dict[str, Dict], shard_count: int, timings: Dict, file_overhead: float) -> List[Dict]:
+    """Greedy longest-processing-time bin packing of test units into shards."""
+    costed = []
+    for unit in units.values():
+        measured = timings.get(unit['id'])
+        cost = measured if measured is not None else estimate_cost(unit)
+        costed.append((cost, unit['id'], unit['calculator'], unit['file'], measured is not None))
+    costed.sort(key=lambda item: (-item[0], item[1]))
+
+    shards = [{'index': i + 1, 'estimatedMs': 0.0, 'calculators': set(), 'files': set(), 'measured': 0}
+              for i in range(shard_count)]
+
+    def added_cost(shard: Dict, cost: float, test_file: str) -> float:
+        # A shard pays a suite file's start-up overhead only once
+        return cost + (0.0 if test_file in shard['files'] else file_overhead)
+
+    for cost, _, calc_id, test_file, measured in costed:
+        shard = min(shards, key=lambda s: (s['estimatedMs'] + added_cost(s, cost, test_file), s['index']))
+        shard['estimatedMs'] += added_cost(shard, cost, test_file)
+        shard['calculators'].add(calc_id)
+        shard['files'].add(test_file)
+        shard['measured'] += int(measured)
+
+    for shard in shards:
+        shard['estimatedMs'] = round(shard['estimatedMs'], 1)
+        shard['calculators'] = sorted(shard['calculators'])
+        shard['files'] = sorted(shard['files'])
+
+    return shards
+
+def main():
+    parser = argparse.ArgumentParser(description='Plan balanced shards for the calculator test suites')
+    parser.add_argument('--shards', type=int, required=True, help='number of CI shards')
+    parser.add_argument('--report', action='append', default=[],
+                        help='vitest JSON report(s) from previous runs (globs allowed)')
+    parser.add_argument('--output', default=DEFAULT_MANIFEST, help=f'manifest path (default: {DEFAULT_MANIFEST})')
+    args = parser.parse_args()
+
+    if args.shards < 1:
+        parser.error('--shards must be at least 1')
+
+    report_paths = sorted({path for pattern in args.report for path in glob.glob(pattern)})
+
+    print("Collecting calculator tests...")
+    units = collect_units()
+    if not units:
+        print("Error: no calculator tests found")
+        return 1
+
+    timings = {'durations': {}, 'fileOverheadMs': None}
+    if report_paths:
+        print(f"Reading {len(report_paths)} vitest report(s)...")
+        timings = read_reports(report_paths)
+    file_overhead = timings['fileOverheadMs'] if timings['fileOverheadMs'] is not None else DEFAULT_FILE_OVERHEAD_MS
+
+    shards = plan_shards(units, args.shards, timings['durations'], file_overhead)
+
+    # Every discovered test file must land in some shard
+    discovered = discovered_test_files()
+    scheduled = {test_file for shard in shards for test_file in shard['files']}
+    unscheduled = discovered - scheduled
+    if unscheduled or len(scheduled) != len(discovered):
+        print(f"Error: {len(unscheduled)} of {len(discovered)} test files were not scheduled:")
+        for test_file in sorted(unscheduled)[:20]:
+            print(f"  {test_file}")
+        return 1
+
+    loads = [shard['estimatedMs'] for shard in shards]
+    mean = statistics.mean(loads)
+    manifest = {
+        'shardCount': args.shards,
+        'reports': report_paths,
+        'fileOverheadMs': round(file_overhead, 1),
+        'meanMs': round(mean, 1),
+        'maxMs': round(max(loads), 1),
+        'imbalance': round(max(loads) / mean, 3) if mean else 1.0,
+        'shards': [{key: value for key, value in shard.items() if key != 'measured'} for shard in shards],
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+    measured = sum(shard['measured'] for shard in shards)
+    print(f"Planned {len(units)} test units from {len(scheduled)} files "
+          f"({measured} timed, {len(units) - measured} estimated) into {args.shards} shards")
+    for shard in shards:
+        print(f"  Shard {shard['index']}: {len(shard['calculators'])} calculators, "
+              f"{len(shard['files'])} files, ~{shard['estimatedMs'] / 1000:.1f}s")
+    print(f"Slowest shard is {manifest['imbalance']:.2f}x the mean")
+    print(f"Manifest saved to {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Pluggable file-system backends for the maintenance scripts
+
+On a network mount (CI runs on NFS) every open, read, stat and directory listing
+is a round trip, and the scripts issue them one after another. A backend keeps
+each script's processing logic unchanged and only decides how the I/O happens:
+    LocalIO     plain sequential calls, exactly as before (local disks)
+    PrefetchIO  a bounded thread pool that lists directories level by level,
+                reads files ahead of the consumer in a sliding window, batches
+                stats into a cache and writes a calculator's files together
+Results always come back in the order a sequential run would produce them.
+
+Scripts that call add_io_arguments() accept --io {auto,local,prefetch} and
+--io-jobs N. auto (the default, or $CALCULATOR_IO) picks PrefetchIO when the
+working directory is on a network file system.
+
+Usage from a script:
+    add_io_arguments(parser)
+    with io_from_args(args) as backend:
+        for path, content in backend.map_files(scan_file, backend.walk_files(root, '.ts')):
+            ...
+"""
+
+import os
+import stat
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_JOBS = 16
+DEFAULT_WINDOW = 64
+IO_ENV = 'CALCULATOR_IO'
+NETWORK_FILESYSTEMS = {'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'afs', 'ceph', 'glusterfs',
+                       'lustre', '9p', 'fuse.sshfs', 'fuse.gcsfuse', 'fuse.s3fs'}
+
+def _write_text(path: str, content: str) -> None:
+    with open(path, 'w') as f:
+        f.write(content)
+
+class LocalIO:
+    """Sequential I/O, identical to calling os and open() directly"""
+    name = 'local'
+
+    def __enter__(self) -> 'LocalIO':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
+    def walk(self, top) -> Iterator[Tuple[str, List[str], List[str]]]:
+        return os.walk(top)
+
+    def walk_files(self, top, suffix: str = '') -> List[str]:
+        """Every file under top ending in suffix, in os.walk order"""
+        return [os.path.join(root, name) for root, _, files in self.walk(top)
+                for name in files if name.endswith(suffix)]
+
+    def subdirs(self, path) -> List[str]:
+        """Names of the directories directly under path"""
+        return [d.name for d in Path(path).iterdir() if d.is_dir()]
+
+    def map_files(self, fn: Callable, paths: Iterable) -> Iterator[Tuple[object, object]]:
+        """(path, fn(path)) for each path, in order"""
+        for path in paths:
+            yield path, fn(path)
+
+    def prefetch_stats(self, paths: Iterable) -> None:
+        pass
+
+    def invalidate(self) -> None:
+        pass
+
+    def stat(self, path) -> Optional[os.stat_result]:
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
+
+    def exists(self, path) -> bool:
+        return self.stat(path) is not None
+
+    def is_dir(self, path) -> bool:
+        st = self.stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def write_files(self, files: Iterable[Tuple[str, str]]) -> None:
+        """Write (path, text) pairs; all are on disk when this returns"""
+        for path, content in files:
+            _write_text(path, content)
+
+class PrefetchIO(LocalIO):
+    """Overlaps round trips on slow mounts with a bounded thread pool"""
+    name = 'prefetch'
+
+    def __init__(self, jobs: int = DEFAULT_JOBS, window: int = DEFAULT_WINDOW):
+        self.jobs = max(1, jobs)
+        self.window = max(1, window)
+        self.pool = ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix='prefetch-io')
+        self.stats: Dict[str, Optional[os.stat_result]] = {}
+
+    def close(self) -> None:
+        self.pool.shutdown(wait=True)
+
+    @staticmethod
+    def _list(path: str):
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return None
+        dirs, files, walk_into = [], [], []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs.append(entry.name)
+                # Like os.walk(followlinks=False): symlinked directories are listed, not entered
+                if not entry.is_symlink():
+                    walk_into.append(entry.name)
+            else:
+                files.append(entry.name)
+        return dirs, files, walk_into
+
+    def walk(self, top) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """os.walk (top-down) over listings fetched one tree level at a time"""
+        top = os.fspath(top)
+        listings = {}
+        level = [top]
+        while level:
+            next_level = []
+            for path, listing in zip(level, self.pool.map(self._list, level)):
+                if listing is not None:
+                    listings[path] = listing
+                    next_level.extend(os.path.join(path, name) for name in listing[2])
+            level = next_level
+
+        stack = [top]
+        while stack:
+            path = stack.pop()
+            if path not in listings:
+                continue
+            dirs, files, walk_into = listings[path]
+            yield path, dirs, files
+            # Honour callers pruning dirs in place, as os.walk does
+            entered = set(walk_into)
+            stack.extend(os.path.join(path, name) for name in reversed(dirs) if name in entered)
+
+    def subdirs(self, path) -> List[str]:
+        listing = self._list(os.fspath(path))
+        if listing is None:
+            raise FileNotFoundError(path)
+        return listing[0]
+
+    def map_files(self, fn: Callable, paths: Iterable) -> Iterator[Tuple[object, object]]:
+        """(path, fn(path)) in order, keeping up to `window` calls running ahead of the consumer"""
+        pending = deque()
+        for path in paths:
+            pending.append((path, self.pool.submit(fn, path)))
+            if len(pending) >= self.window:
+                done, future = pending.popleft()
+                yield done, future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
+
+    def prefetch_stats(self, paths: Iterable) -> None:
+        """Stat paths concurrently into the cache that stat/exists/is_dir read from"""
+        todo = [p for p in dict.fromkeys(os.fspath(p) for p in paths) if p not in self.stats]
+        for path, result in zip(todo, self.pool.map(super().stat, todo)):
+            self.stats[path] = result
+
+    def invalidate(self) -> None:
+        self.stats.clear()
+
+    def stat(self, path) -> Optional[os.stat_result]:
+        path = os.fspath(path)
+        if path not in self.stats:
+            self.stats[path] = super().stat(path)
+        return self.stats[path]
+
+    def write_files(self, files: Iterable[Tuple[str, str]]) -> None:
+        files = list(files)
+        for path, _ in files:
+            self.stats.pop(os.fspath(path), None)
+        # list() waits for every write and re-raises the first error
+        list(self.pool.map(lambda item: _write_text(*item), files))
+
+def filesystem_type(path: str = '.') -> Optional[str]:
+    """File system type of the mount holding path (Linux /proc/mounts), or None"""
+    try:
+        with open('/proc/mounts', 'r') as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return None
+    path = os.path.realpath(path)
+    best, fstype = '', None
+    for fields in mounts:
+        if len(fields) < 3:
+            continue
+        mount_point = fields[1].replace('\\040', ' ')
+        if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) and len(mount_point) > len(best):
+            best, fstype = mount_point, fields[2]
+    return fstype
+
+def add_io_arguments(parser) -> None:
+    parser.add_argument('--io', choices=('auto', 'local', 'prefetch'), default=os.environ.get(IO_ENV, 'auto'),
+                        help=f'I/O backend: prefetch overlaps reads and stats for network mounts '
+                             f'(default: auto, or ${IO_ENV})')
+    parser.add_argument('--io-jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'threads for the prefetch backend (default: {DEFAULT_JOBS})')
+
+def io_from_args(args) -> LocalIO:
+    """Backend for --io / --io-jobs; auto prefetches on network file systems only"""
+    mode = getattr(args, 'io', 'auto')
+    reason = mode
+    if mode == 'auto':
+        fstype = filesystem_type()
+        mode = 'prefetch' if fstype in NETWORK_FILESYSTEMS else 'local'
+        reason = f'{fstype} mount'
+    if mode != 'prefetch':
+        return LocalIO()
+    jobs = getattr(args, 'io_jobs', DEFAULT_JOBS)
+    print(f"⚡ Prefetching I/O with {jobs} threads ({reason})")
+    return PrefetchIO(jobs)
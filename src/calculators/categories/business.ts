@@ -0,0 +1,42 @@
+// Generated by generate_calculator_manifest.py from registerAllCalculators - do not edit
+import { CalculatorManifestEntry } from '../../types/calculator';
+
+export const businessCalculators: CalculatorManifestEntry[] = [
+  {
+    id: 'AiPromptCost-TokenEstimatorCalculator',
+    title: 'AI Prompt Cost & Token Estimator Calculator',
+    category: 'business',
+    description: 'Brief description of what this calculator does and its purpose.',
+    usageInstructions: ['Step 1: Enter the primary input values', 'Step 2: Configure any optional parameters', 'Step 3: Review the calculated results', 'Step 4: Adjust inputs as needed for different scenarios'],
+    modulePath: 'business/ai-prompt-cost-token-estimator',
+    load: () => import('../business/ai-prompt-cost-token-estimator/AiPromptCostTokenEstimator').then((m) => m.AiPromptCostTokenEstimatorCalculator),
+  },
+  {
+    id: 'AttributionModelsCalculator',
+    title: 'Attribution Models Calculator',
+    category: 'business',
+    subcategory: 'Financial Planning',
+    description: 'Calculate marketing attribution',
+    usageInstructions: ['Enter the principal amount to invest', 'Specify the expected interest rate', 'Set the time period in years', 'Choose compounding frequency', 'Review the calculated returns and analysis'],
+    modulePath: 'business/attribution-models-calculator',
+    load: () => import('../business/attribution-models-calculator/AttributionModelsCalculator').then((m) => m.AttributionModelsCalculator),
+  },
+  {
+    id: 'TripleNetNnn-LeaseRoiCalculator-calculator',
+    title: 'Triple Net (NNN) Lease ROI Calculator Calculator',
+    category: 'business',
+    description: 'Brief description of what this calculator does and its purpose.',
+    usageInstructions: ['Step 1: Enter the primary input values', 'Step 2: Configure any optional parameters', 'Step 3: Review the calculated results', 'Step 4: Adjust inputs as needed for different scenarios'],
+    modulePath: 'business/triple-net-nnn-lease-roi-calculator',
+    load: () => import('../business/triple-net-nnn-lease-roi-calculator/TripleNetNnnLeaseRoiCalculator').then((m) => m.TripleNetNnnLeaseRoiCalculator),
+  },
+  {
+    id: 'VineyardProfitabilityCalculator-calculator',
+    title: 'Vineyard Profitability Calculator Calculator',
+    category: 'business',
+    description: 'Brief description of what this calculator does and its purpose.',
+    usageInstructions: ['Step 1: Enter the primary input values', 'Step 2: Configure any optional parameters', 'Step 3: Review the calculated results', 'Step 4: Adjust inputs as needed for different scenarios'],
+    modulePath: 'business/vineyard-profitability-calculator',
+    load: () => import('../business/vineyard-profitability-calculator/VineyardProfitabilityCalculator').then((m) => m.VineyardProfitabilityCalculator),
+  },
+];
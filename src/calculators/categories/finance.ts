@@ -0,0 +1,2015 @@
+// Generated by generate_calculator_manifest.py from registerAllCalculators - do not edit
+import { CalculatorManifestEntry } from '../../types/calculator';
+
+export const financeCalculators: CalculatorManifestEntry[] = [
+  {
+    id: 'CarLoanCalculator',
+    title: 'Car Loan Calculator',
+    category: 'finance',
+    subcategory: 'Auto & Transportation',
+    description: 'Calculate car loan payments, total cost, and interest for auto financing with different loan terms and interest rates.',
+    usageInstructions: ['Enter the vehicle price', 'Input your down payment amount', 'Specify the loan term in months', 'Enter the interest rate', 'Review monthly payment and total cost'],
+    modulePath: 'CarLoanCalculator',
+    load: () => import('../CarLoanCalculator/CarLoanCalculator').then((m) => m.CarLoanCalculator),
+  },
+  {
+    id: 'MortgageAprComparisonCalculator',
+    title: 'Mortgage APR Comparison Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Compare APR rates across different mortgage types including fixed-rate, ARM, FHA, VA, and conventional loans to find the best financing option.',
+    usageInstructions: ['Enter loan amount and property details', 'Input current market interest rates', 'Specify closing costs and fees', 'Review APR comparison across loan types', 'Analyze break-even points and total costs', 'Consider sensitivity analysis for rate changes'],
+    modulePath: 'finance/mortgage-apr-comparison-calculator',
+    load: () => import('../finance/mortgage-apr-comparison-calculator/MortgageAprComparisonCalculator').then((m) => m.MortgageAprComparisonCalculator),
+  },
+  {
+    id: 'MortgageClosingCostCalculator',
+    title: 'Mortgage Closing Cost Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Calculate all closing costs associated with a mortgage including lender fees, third-party fees, prepaid items, and escrow deposits.',
+    usageInstructions: ['Enter loan and property details', 'Input all closing cost components', 'Specify discount points and lender credits', 'Review total closing costs and cash to close', 'Compare different scenarios and affordability'],
+    modulePath: 'finance/mortgage-closing-cost-calculator',
+    load: () => import('../finance/mortgage-closing-cost-calculator/MortgageClosingCostCalculator').then((m) => m.MortgageClosingCostCalculator),
+  },
+  {
+    id: 'MortgageEquityCalculator',
+    title: 'Mortgage Equity Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Calculate current equity position, project equity growth over time, analyze cash flow, and assess investment risk for mortgage properties.',
+    usageInstructions: ['Enter current property value and loan balance', 'Input loan details and payment history', 'Specify appreciation rates and market conditions', 'Include rental income and operating expenses', 'Review equity growth projections and risk assessment'],
+    modulePath: 'finance/mortgage-equity-calculator',
+    load: () => import('../finance/mortgage-equity-calculator/MortgageEquityCalculator').then((m) => m.MortgageEquityCalculator),
+  },
+  {
+    id: 'MortgageInsuranceCalculator',
+    title: 'Mortgage Insurance Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Calculate private mortgage insurance (PMI), mortgage insurance premium (MIP), and homeowners insurance costs with risk assessment and coverage analysis.',
+    usageInstructions: ['Enter loan and property details', 'Specify insurance type and coverage amounts', 'Input borrower credit and financial information', 'Review insurance requirements and costs', 'Analyze risk assessment and coverage adequacy'],
+    modulePath: 'finance/mortgage-insurance-calculator',
+    load: () => import('../finance/mortgage-insurance-calculator/MortgageInsuranceCalculator').then((m) => m.MortgageInsuranceCalculator),
+  },
+  {
+    id: 'MortgageLifeCalculator',
+    title: 'Mortgage Life Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Analyze mortgage implications over your lifetime including loan payoff timing, estate impact, survivor scenarios, and life insurance recommendations.',
+    usageInstructions: ['Enter loan details and personal information', 'Specify life expectancy and family situation', 'Input financial details and goals', 'Review lifetime projections and recommendations'],
+    modulePath: 'finance/mortgage-life-calculator',
+    load: () => import('../finance/mortgage-life-calculator/MortgageLifeCalculator').then((m) => m.MortgageLifeCalculator),
+  },
+  {
+    id: 'MortgagePaymentCalculator',
+    title: 'Mortgage Payment Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Calculate mortgage payments, amortization schedules, and comprehensive payment analysis with support for all loan types including ARM, FHA, VA, and conventional loans.',
+    usageInstructions: ['Enter loan amount, interest rate, and term', 'Select loan type and payment structure', 'Input property details and borrower information', 'Review payment breakdown and amortization schedule', 'Analyze affordability and risk factors', 'Compare different loan scenarios'],
+    modulePath: 'finance/mortgage-payment',
+    load: () => import('../finance/mortgage-payment/MortgagePaymentCalculator').then((m) => m.MortgagePaymentCalculator),
+  },
+  {
+    id: 'MortgagePointsCalculator',
+    title: 'Mortgage Points Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Calculate the costs and benefits of purchasing discount points on your mortgage, including breakeven analysis and ROI calculations.',
+    usageInstructions: ['Enter loan amount, interest rate, and term', 'Specify number of discount and origination points', 'Input expected holding period and property details', 'Review breakeven analysis and recommendations'],
+    modulePath: 'finance/mortgage-points-calculator',
+    load: () => import('../finance/mortgage-points-calculator/MortgagePointsCalculator').then((m) => m.MortgagePointsCalculator),
+  },
+  {
+    id: 'MortgageQualificationCalculator',
+    title: 'Mortgage Qualification Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Determine mortgage qualification based on income, credit, assets, and debts. Get pre-qualification amounts and improvement strategies.',
+    usageInstructions: ['Enter income and employment details', 'Provide credit score and debt information', 'Input asset and property details', 'Review qualification status and recommendations'],
+    modulePath: 'finance/mortgage-qualification-calculator',
+    load: () => import('../finance/mortgage-qualification-calculator/MortgageQualificationCalculator').then((m) => m.MortgageQualificationCalculator),
+  },
+  {
+    id: 'MortgageRateLockCalculator',
+    title: 'Mortgage Rate Lock Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Analyze mortgage rate lock options, calculate break-even points, assess risk, and compare alternative lock periods to optimize timing and cost.',
+    usageInstructions: ['Enter loan details and current lock information', 'Input market conditions and historical data', 'Review risk assessment and break-even analysis', 'Compare alternative lock scenarios and recommendations'],
+    modulePath: 'finance/mortgage-rate-lock-calculator',
+    load: () => import('../finance/mortgage-rate-lock-calculator/MortgageRateLockCalculator').then((m) => m.MortgageRateLockCalculator),
+  },
+  {
+    id: 'MortgageRefinanceCalculator',
+    title: 'Mortgage Refinance Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Analyze mortgage refinance options with break-even analysis, cash flow projections, and comprehensive cost-benefit evaluation for rate-and-term or cash-out refinances.',
+    usageInstructions: ['Enter current loan details and new refinance terms', 'Input all closing costs and fees', 'Specify expected stay duration and market conditions', 'Review break-even analysis and recommendations'],
+    modulePath: 'finance/mortgage-refinance-calculator',
+    load: () => import('../finance/mortgage-refinance-calculator/MortgageRefinanceCalculator').then((m) => m.MortgageRefinanceCalculator),
+  },
+  {
+    id: 'MortgageVsRentCalculator',
+    title: 'Mortgage vs Rent Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Compare the costs and benefits of buying a home versus renting, including break-even analysis, equity building, and long-term financial implications.',
+    usageInstructions: ['Enter property details and mortgage terms', 'Input current rent and expected rent increases', 'Specify ownership costs and investment assumptions', 'Review cost comparison and recommendations'],
+    modulePath: 'finance/mortgage-vs-rent-calculator',
+    load: () => import('../finance/mortgage-vs-rent-calculator/MortgageVsRentCalculator').then((m) => m.MortgageVsRentCalculator),
+  },
+  {
+    id: 'NetOperatingIncomeNoiCalculator',
+    title: 'Net Operating Income (NOI) Calculator',
+    category: 'finance',
+    subcategory: 'Real Estate Investment',
+    description: 'Calculate net operating income, cap rates, cash flow analysis, and investment metrics for income-producing properties with comprehensive valuation and risk assessment.',
+    usageInstructions: ['Enter property income and operating expenses', 'Input property details and market data', 'Specify financing terms and tax information', 'Review NOI analysis and investment recommendations'],
+    modulePath: 'finance/net-operating-income-noi-calculator',
+    load: () => import('../finance/net-operating-income-noi-calculator/NetOperatingIncomeNoiCalculator').then((m) => m.NetOperatingIncomeNoiCalculator),
+  },
+  {
+    id: 'OpportunityZoneInvestmentRoiCalculator',
+    title: 'Opportunity Zone Investment ROI Calculator',
+    category: 'finance',
+    subcategory: 'Real Estate Investment',
+    description: 'Calculate ROI and tax benefits for Opportunity Zone investments, including capital gains tax deferral, step-up in basis, and comprehensive financial analysis with compliance tracking.',
+    usageInstructions: ['Enter investment details and property information', 'Specify tax benefits and holding period', 'Input financial projections and market assumptions', 'Review ROI analysis and compliance status'],
+    modulePath: 'finance/opportunity-zone-investment-roi-calculator',
+    load: () => import('../finance/opportunity-zone-investment-roi-calculator/OpportunityZoneInvestmentRoiCalculator').then((m) => m.OpportunityZoneInvestmentRoiCalculator),
+  },
+  {
+    id: 'PmiCancellationCalculator',
+    title: 'PMI Cancellation Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Analyze when and how to cancel private mortgage insurance (PMI), including automatic cancellation eligibility, lender cancellation options, break-even analysis, and cost-benefit comparisons.',
+    usageInstructions: ['Enter current loan and property details', 'Specify PMI payment information', 'Input cancellation thresholds and costs', 'Review recommendations and scenarios'],
+    modulePath: 'finance/pmi-cancellation-calculator',
+    load: () => import('../finance/pmi-cancellation-calculator/PmiCancellationCalculator').then((m) => m.PmiCancellationCalculator),
+  },
+  {
+    id: 'PricePerSquareFootCalculator',
+    title: 'Price Per Square Foot Calculator',
+    category: 'finance',
+    subcategory: 'Real Estate Valuation',
+    description: 'Calculate and analyze property values per square foot, including market comparisons, investment analysis, and comprehensive real estate metrics for informed buying, selling, and investment decisions.',
+    usageInstructions: ['Enter property details and location information', 'Provide market data and comparable sales', 'Input property features and condition', 'Review price per square foot analysis and recommendations'],
+    modulePath: 'finance/price-per-square-foot-calculator',
+    load: () => import('../finance/price-per-square-foot-calculator/PricePerSquareFootCalculator').then((m) => m.PricePerSquareFootCalculator),
+  },
+  {
+    id: 'PrivateMortgageInsuranceCalculator',
+    title: 'Private Mortgage Insurance Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Calculate and analyze private mortgage insurance (PMI) costs, cancellation options, tax implications, and refinancing alternatives for FHA, conventional, VA, and USDA loans.',
+    usageInstructions: ['Enter loan details and borrower information', 'Select loan type and PMI parameters', 'Input market conditions and tax information', 'Review PMI costs, cancellation dates, and recommendations'],
+    modulePath: 'finance/private-mortgage-insurance-calculator',
+    load: () => import('../finance/private-mortgage-insurance-calculator/PrivateMortgageInsuranceCalculator').then((m) => m.PrivateMortgageInsuranceCalculator),
+  },
+  {
+    id: 'PropertyTaxCalculator',
+    title: 'Property Tax Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Calculate property taxes, analyze assessment accuracy, evaluate appeal opportunities, and project future tax obligations with comprehensive exemption and relief program analysis.',
+    usageInstructions: ['Enter property details and location information', 'Input assessment and tax rate data', 'Specify applicable exemptions and relief programs', 'Review tax calculations and appeal opportunities', 'Analyze projections and optimization strategies'],
+    modulePath: 'finance/property-tax-calculator',
+    load: () => import('../finance/property-tax-calculator/PropertyTaxCalculator').then((m) => m.PropertyTaxCalculator),
+  },
+  {
+    id: 'PropertyTaxProrationCalculator',
+    title: 'Property Tax Proration Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage & Real Estate',
+    description: 'Calculate property tax proration for real estate transactions, including escrow analysis, settlement adjustments, and state-specific requirements for accurate closing cost calculations.',
+    usageInstructions: ['Enter transaction details and closing date', 'Input tax year information and proration method', 'Specify buyer/seller payment responsibilities', 'Review proration calculations and settlement adjustments'],
+    modulePath: 'finance/property-tax-proration-calculator',
+    load: () => import('../finance/property-tax-proration-calculator/PropertyTaxProrationCalculator').then((m) => m.PropertyTaxProrationCalculator),
+  },
+  {
+    id: 'adagencycommission-calculator',
+    title: 'Adagencycommission Calculator',
+    category: 'finance',
+    subcategory: 'Adagencycommission',
+    description: 'Calculate adagencycommission values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'adAgencyCommissionCalculator',
+    load: () => import('../adAgencyCommissionCalculator/ad_agency_commission_calculator').then((m) => m.ad_agency_commission_calculator),
+  },
+  {
+    id: 'aipromptcost-calculator',
+    title: 'Aipromptcost Calculator',
+    category: 'finance',
+    subcategory: 'Aipromptcost',
+    description: 'Calculate aipromptcost values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'aiPromptCostCalculator',
+    load: () => import('../aiPromptCostCalculator/aiPromptCostCalculator').then((m) => m.aiPromptCostCalculator),
+  },
+  {
+    id: 'algebra-calculator',
+    title: 'Algebra Calculator',
+    category: 'finance',
+    subcategory: 'Algebra',
+    description: 'Calculate algebra values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'algebraCalculator',
+    load: () => import('../algebraCalculator/algebraCalculator').then((m) => m.algebraCalculator),
+  },
+  {
+    id: 'alimonyspousalsupport-calculator',
+    title: 'Alimonyspousalsupport Calculator',
+    category: 'finance',
+    subcategory: 'Alimonyspousalsupport',
+    description: 'Calculate alimonyspousalsupport values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'AlimonySpousalSupportCalculator',
+    load: () => import('../AlimonySpousalSupportCalculator/AlimonySpousalSupportCalculator').then((m) => m.AlimonySpousalSupportCalculator),
+  },
+  {
+    id: 'alpha-calculator',
+    title: 'Alpha Calculator',
+    category: 'finance',
+    subcategory: 'Alpha',
+    description: 'Calculate alpha values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'alphaCalculator',
+    load: () => import('../alphaCalculator/alphaCalculator').then((m) => m.alphaCalculator),
+  },
+  {
+    id: 'amortization-calculator',
+    title: 'Amortization Calculator',
+    category: 'finance',
+    subcategory: 'Amortization',
+    description: 'Calculate amortization values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'amortizationCalculator',
+    load: () => import('../amortizationCalculator/amortizationCalculator').then((m) => m.amortizationCalculator),
+  },
+  {
+    id: 'annuitybuyout-calculator',
+    title: 'Annuitybuyout Calculator',
+    category: 'finance',
+    subcategory: 'Annuitybuyout',
+    description: 'Calculate annuitybuyout values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'annuityBuyoutCalculator',
+    load: () => import('../annuityBuyoutCalculator/annuityBuyoutCalculator').then((m) => m.annuityBuyoutCalculator),
+  },
+  {
+    id: 'aptvalue-calculator',
+    title: 'Aptvalue Calculator',
+    category: 'finance',
+    subcategory: 'Aptvalue',
+    description: 'Calculate aptvalue values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'aptValueCalculator',
+    load: () => import('../aptValueCalculator/aptValueCalculator').then((m) => m.aptValueCalculator),
+  },
+  {
+    id: 'autoloan-calculator',
+    title: 'Autoloan Calculator',
+    category: 'finance',
+    subcategory: 'Autoloan',
+    description: 'Calculate autoloan values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'autoLoanCalculator',
+    load: () => import('../autoLoanCalculator/autoLoanCalculator').then((m) => m.autoLoanCalculator),
+  },
+  {
+    id: 'automotive-calculator',
+    title: 'Automotive Calculator',
+    category: 'finance',
+    subcategory: 'Automotive',
+    description: 'Calculate automotive values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'automotiveCalculator',
+    load: () => import('../automotiveCalculator/automotiveCalculator').then((m) => m.automotiveCalculator),
+  },
+  {
+    id: 'beta-calculator',
+    title: 'Beta Calculator',
+    category: 'finance',
+    subcategory: 'Beta',
+    description: 'Calculate beta values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'betaCalculator',
+    load: () => import('../betaCalculator/betaCalculator').then((m) => m.betaCalculator),
+  },
+  {
+    id: 'bmr-calculator',
+    title: 'Bmr Calculator',
+    category: 'finance',
+    subcategory: 'Bmr',
+    description: 'Calculate bmr values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'bmrCalculator',
+    load: () => import('../bmrCalculator/bmrCalculator').then((m) => m.bmrCalculator),
+  },
+  {
+    id: 'calculus-calculator',
+    title: 'Calculus Calculator',
+    category: 'finance',
+    subcategory: 'Calculus',
+    description: 'Calculate calculus values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'calculusCalculator',
+    load: () => import('../calculusCalculator/calculusCalculator').then((m) => m.calculusCalculator),
+  },
+  {
+    id: 'calorie-calculator',
+    title: 'Calorie Calculator',
+    category: 'finance',
+    subcategory: 'Calorie',
+    description: 'Calculate calorie values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'calorieCalculator',
+    load: () => import('../calorieCalculator/calorieCalculator').then((m) => m.calorieCalculator),
+  },
+  {
+    id: 'carpayment-calculator',
+    title: 'Carpayment Calculator',
+    category: 'finance',
+    subcategory: 'Carpayment',
+    description: 'Calculate carpayment values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CarPaymentCalculator',
+    load: () => import('../CarPaymentCalculator/CarPaymentCalculator').then((m) => m.CarPaymentCalculator),
+  },
+  {
+    id: 'childsupport-calculator',
+    title: 'Childsupport Calculator',
+    category: 'finance',
+    subcategory: 'Childsupport',
+    description: 'Calculate childsupport values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'ChildSupportCalculator',
+    load: () => import('../ChildSupportCalculator/ChildSupportCalculator').then((m) => m.ChildSupportCalculator),
+  },
+  {
+    id: 'complexnumber-calculator',
+    title: 'Complexnumber Calculator',
+    category: 'finance',
+    subcategory: 'Complexnumber',
+    description: 'Calculate complexnumber values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'complexNumberCalculator',
+    load: () => import('../complexNumberCalculator/complexNumberCalculator').then((m) => m.complexNumberCalculator),
+  },
+  {
+    id: 'comprehensivemortgage-calculator',
+    title: 'Comprehensivemortgage Calculator',
+    category: 'finance',
+    subcategory: 'Comprehensivemortgage',
+    description: 'Calculate comprehensivemortgage values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'comprehensiveMortgageCalculator',
+    load: () => import('../comprehensiveMortgageCalculator/comprehensiveMortgageCalculator').then((m) => m.comprehensiveMortgageCalculator),
+  },
+  {
+    id: 'concrete-calculator',
+    title: 'Concrete Calculator',
+    category: 'finance',
+    subcategory: 'Concrete',
+    description: 'Calculate concrete values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'concreteCalculator',
+    load: () => import('../concreteCalculator/concreteCalculator').then((m) => m.concreteCalculator),
+  },
+  {
+    id: 'cooking-calculator',
+    title: 'Cooking Calculator',
+    category: 'finance',
+    subcategory: 'Cooking',
+    description: 'Calculate cooking values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'cookingCalculator',
+    load: () => import('../cookingCalculator/cookingCalculator').then((m) => m.cookingCalculator),
+  },
+  {
+    id: 'corporatebond-calculator',
+    title: 'Corporatebond Calculator',
+    category: 'finance',
+    subcategory: 'Corporatebond',
+    description: 'Calculate corporatebond values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CorporateBondCalculator',
+    load: () => import('../CorporateBondCalculator/CorporateBondCalculator').then((m) => m.CorporateBondCalculator),
+  },
+  {
+    id: 'correlation-calculator',
+    title: 'Correlation Calculator',
+    category: 'finance',
+    subcategory: 'Correlation',
+    description: 'Calculate correlation values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CorrelationCalculator',
+    load: () => import('../CorrelationCalculator/CorrelationCalculator').then((m) => m.CorrelationCalculator),
+  },
+  {
+    id: 'costofdebt-calculator',
+    title: 'Costofdebt Calculator',
+    category: 'finance',
+    subcategory: 'Costofdebt',
+    description: 'Calculate costofdebt values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CostOfDebtCalculator',
+    load: () => import('../CostOfDebtCalculator/CostOfDebtCalculator').then((m) => m.CostOfDebtCalculator),
+  },
+  {
+    id: 'costofequity-calculator',
+    title: 'Costofequity Calculator',
+    category: 'finance',
+    subcategory: 'Costofequity',
+    description: 'Calculate costofequity values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CostOfEquityCalculator',
+    load: () => import('../CostOfEquityCalculator/CostOfEquityCalculator').then((m) => m.CostOfEquityCalculator),
+  },
+  {
+    id: 'creditdefaultswap-calculator',
+    title: 'Creditdefaultswap Calculator',
+    category: 'finance',
+    subcategory: 'Creditdefaultswap',
+    description: 'Calculate creditdefaultswap values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CreditDefaultSwapCalculator',
+    load: () => import('../CreditDefaultSwapCalculator/CreditDefaultSwapCalculator').then((m) => m.CreditDefaultSwapCalculator),
+  },
+  {
+    id: 'creditutilization-calculator',
+    title: 'Creditutilization Calculator',
+    category: 'finance',
+    subcategory: 'Creditutilization',
+    description: 'Calculate creditutilization values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CreditUtilizationCalculator',
+    load: () => import('../CreditUtilizationCalculator/CreditUtilizationCalculator').then((m) => m.CreditUtilizationCalculator),
+  },
+  {
+    id: 'currentratio-calculator',
+    title: 'Currentratio Calculator',
+    category: 'finance',
+    subcategory: 'Currentratio',
+    description: 'Calculate currentratio values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CurrentRatioCalculator',
+    load: () => import('../CurrentRatioCalculator/CurrentRatioCalculator').then((m) => m.CurrentRatioCalculator),
+  },
+  {
+    id: 'customeracquisitioncost-calculator',
+    title: 'Customeracquisitioncost Calculator',
+    category: 'finance',
+    subcategory: 'Customeracquisitioncost',
+    description: 'Calculate customeracquisitioncost values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'CustomerAcquisitionCostCalculator',
+    load: () => import('../CustomerAcquisitionCostCalculator/CustomerAcquisitionCostCalculator').then((m) => m.CustomerAcquisitionCostCalculator),
+  },
+  {
+    id: 'debtavalanche-calculator',
+    title: 'Debtavalanche Calculator',
+    category: 'finance',
+    subcategory: 'Debtavalanche',
+    description: 'Calculate debtavalanche values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'DebtAvalancheCalculator',
+    load: () => import('../DebtAvalancheCalculator/DebtAvalancheCalculator').then((m) => m.DebtAvalancheCalculator),
+  },
+  {
+    id: 'debtconsolidationloan-calculator',
+    title: 'Debtconsolidationloan Calculator',
+    category: 'finance',
+    subcategory: 'Debtconsolidationloan',
+    description: 'Calculate debtconsolidationloan values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'DebtConsolidationLoanCalculator',
+    load: () => import('../DebtConsolidationLoanCalculator/DebtConsolidationLoanCalculator').then((m) => m.DebtConsolidationLoanCalculator),
+  },
+  {
+    id: 'debtpayoff-calculator',
+    title: 'Debtpayoff Calculator',
+    category: 'finance',
+    subcategory: 'Debtpayoff',
+    description: 'Calculate debtpayoff values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'DebtPayoffCalculator',
+    load: () => import('../DebtPayoffCalculator/DebtPayoffCalculator').then((m) => m.DebtPayoffCalculator),
+  },
+  {
+    id: 'debtsnowball-calculator',
+    title: 'Debtsnowball Calculator',
+    category: 'finance',
+    subcategory: 'Debtsnowball',
+    description: 'Calculate debtsnowball values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'DebtSnowballCalculator',
+    load: () => import('../DebtSnowballCalculator/DebtSnowballCalculator').then((m) => m.DebtSnowballCalculator),
+  },
+  {
+    id: 'dividend-calculator',
+    title: 'Dividend Calculator',
+    category: 'finance',
+    subcategory: 'Dividend',
+    description: 'Calculate dividend values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'DividendCalculator',
+    load: () => import('../DividendCalculator/DividendCalculator').then((m) => m.DividendCalculator),
+  },
+  {
+    id: 'dtiratio-calculator',
+    title: 'Dtiratio Calculator',
+    category: 'finance',
+    subcategory: 'Dtiratio',
+    description: 'Calculate dtiratio values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'DtiRatioCalculator',
+    load: () => import('../DtiRatioCalculator/DtiRatioCalculator').then((m) => m.DtiRatioCalculator),
+  },
+  {
+    id: 'ebitda-calculator',
+    title: 'Ebitda Calculator',
+    category: 'finance',
+    subcategory: 'Ebitda',
+    description: 'Calculate ebitda values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'EbitdaCalculator',
+    load: () => import('../EbitdaCalculator/EbitdaCalculator').then((m) => m.EbitdaCalculator),
+  },
+  {
+    id: 'enterprisevalue-calculator',
+    title: 'Enterprisevalue Calculator',
+    category: 'finance',
+    subcategory: 'Enterprisevalue',
+    description: 'Calculate enterprisevalue values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'EnterpriseValueCalculator',
+    load: () => import('../EnterpriseValueCalculator/EnterpriseValueCalculator').then((m) => m.EnterpriseValueCalculator),
+  },
+  {
+    id: 'equityvaluation-calculator',
+    title: 'Equityvaluation Calculator',
+    category: 'finance',
+    subcategory: 'Equityvaluation',
+    description: 'Calculate equityvaluation values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'EquityValuationCalculator',
+    load: () => import('../EquityValuationCalculator/EquityValuationCalculator').then((m) => m.EquityValuationCalculator),
+  },
+  {
+    id: 'estateplanning-calculator',
+    title: 'Estateplanning Calculator',
+    category: 'finance',
+    subcategory: 'Estateplanning',
+    description: 'Calculate estateplanning values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'estatePlanningCalculator',
+    load: () => import('../estatePlanningCalculator/estatePlanningCalculator').then((m) => m.estatePlanningCalculator),
+  },
+  {
+    id: 'estatetaxliability-calculator',
+    title: 'Estatetaxliability Calculator',
+    category: 'finance',
+    subcategory: 'Estatetaxliability',
+    description: 'Calculate estatetaxliability values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'estateTaxLiabilityCalculator',
+    load: () => import('../estateTaxLiabilityCalculator/estateTaxLiabilityCalculator').then((m) => m.estateTaxLiabilityCalculator),
+  },
+  {
+    id: 'everyday-calculator',
+    title: 'Everyday Calculator',
+    category: 'finance',
+    subcategory: 'Everyday',
+    description: 'Calculate everyday values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'everydayCalculator',
+    load: () => import('../everydayCalculator/everydayCalculator').then((m) => m.everydayCalculator),
+  },
+  {
+    id: 'executivedeferredcompensation-calculator',
+    title: 'Executivedeferredcompensation Calculator',
+    category: 'finance',
+    subcategory: 'Executivedeferredcompensation',
+    description: 'Calculate executivedeferredcompensation values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'executiveDeferredCompensationCalculator',
+    load: () => import('../executiveDeferredCompensationCalculator/executiveDeferredCompensationCalculator').then((m) => m.executiveDeferredCompensationCalculator),
+  },
+  {
+    id: 'expectedshortfall-calculator',
+    title: 'Expectedshortfall Calculator',
+    category: 'finance',
+    subcategory: 'Expectedshortfall',
+    description: 'Calculate expectedshortfall values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'ExpectedShortfallCalculator',
+    load: () => import('../ExpectedShortfallCalculator/ExpectedShortfallCalculator').then((m) => m.ExpectedShortfallCalculator),
+  },
+  {
+    id: 'fafsa-calculator',
+    title: 'Fafsa Calculator',
+    category: 'finance',
+    subcategory: 'Fafsa',
+    description: 'Calculate fafsa values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'fafsaCalculator',
+    load: () => import('../fafsaCalculator/fafsaCalculator').then((m) => m.fafsaCalculator),
+  },
+  {
+    id: 'fixedindexannuity-calculator',
+    title: 'Fixedindexannuity Calculator',
+    category: 'finance',
+    subcategory: 'Fixedindexannuity',
+    description: 'Calculate fixedindexannuity values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'fixedIndexAnnuityCalculator',
+    load: () => import('../fixedIndexAnnuityCalculator/fixedIndexAnnuityCalculator').then((m) => m.fixedIndexAnnuityCalculator),
+  },
+  {
+    id: 'flexiblespendingaccount-calculator',
+    title: 'Flexiblespendingaccount Calculator',
+    category: 'finance',
+    subcategory: 'Flexiblespendingaccount',
+    description: 'Calculate flexiblespendingaccount values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'flexibleSpendingAccountCalculator',
+    load: () => import('../flexibleSpendingAccountCalculator/flexibleSpendingAccountCalculator').then((m) => m.flexibleSpendingAccountCalculator),
+  },
+  {
+    id: 'fourzeroonekcompanymatchroi-calculator',
+    title: 'Fourzeroonekcompanymatchroi Calculator',
+    category: 'finance',
+    subcategory: 'Fourzeroonekcompanymatchroi',
+    description: 'Calculate fourzeroonekcompanymatchroi values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'fourZeroOneKCompanyMatchRoiCalculator',
+    load: () => import('../fourZeroOneKCompanyMatchRoiCalculator/fourZeroOneKCompanyMatchRoiCalculator').then((m) => m.fourZeroOneKCompanyMatchRoiCalculator),
+  },
+  {
+    id: 'geometry-calculator',
+    title: 'Geometry Calculator',
+    category: 'finance',
+    subcategory: 'Geometry',
+    description: 'Calculate geometry values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'geometryCalculator',
+    load: () => import('../geometryCalculator/geometryCalculator').then((m) => m.geometryCalculator),
+  },
+  {
+    id: 'heloc-calculator',
+    title: 'Heloc Calculator',
+    category: 'finance',
+    subcategory: 'Heloc',
+    description: 'Calculate heloc values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'helocCalculator',
+    load: () => import('../helocCalculator/helocCalculator').then((m) => m.helocCalculator),
+  },
+  {
+    id: 'hobbies-calculator',
+    title: 'Hobbies Calculator',
+    category: 'finance',
+    subcategory: 'Hobbies',
+    description: 'Calculate hobbies values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'hobbiesCalculator',
+    load: () => import('../hobbiesCalculator/hobbiesCalculator').then((m) => m.hobbiesCalculator),
+  },
+  {
+    id: 'hsatripletaxadvantage-calculator',
+    title: 'Hsatripletaxadvantage Calculator',
+    category: 'finance',
+    subcategory: 'Hsatripletaxadvantage',
+    description: 'Calculate hsatripletaxadvantage values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'hsaTripleTaxAdvantageCalculator',
+    load: () => import('../hsaTripleTaxAdvantageCalculator/hsaTripleTaxAdvantageCalculator').then((m) => m.hsaTripleTaxAdvantageCalculator),
+  },
+  {
+    id: 'immediateannuitypayout-calculator',
+    title: 'Immediateannuitypayout Calculator',
+    category: 'finance',
+    subcategory: 'Immediateannuitypayout',
+    description: 'Calculate immediateannuitypayout values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'immediateAnnuityPayoutCalculator',
+    load: () => import('../immediateAnnuityPayoutCalculator/immediateAnnuityPayoutCalculator').then((m) => m.immediateAnnuityPayoutCalculator),
+  },
+  {
+    id: 'investment-calculator',
+    title: 'Investment Calculator',
+    category: 'finance',
+    subcategory: 'Investment',
+    description: 'Calculate investment values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'investmentCalculator',
+    load: () => import('../investmentCalculator/investmentCalculator').then((m) => m.investmentCalculator),
+  },
+  {
+    id: 'irrevocablelifeinsurancetrustilitvalue-calculator',
+    title: 'Irrevocablelifeinsurancetrustilitvalue Calculator',
+    category: 'finance',
+    subcategory: 'Irrevocablelifeinsurancetrustilitvalue',
+    description: 'Calculate irrevocablelifeinsurancetrustilitvalue values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'irrevocableLifeInsuranceTrustILITValueCalculator',
+    load: () => import('../irrevocableLifeInsuranceTrustILITValueCalculator/irrevocableLifeInsuranceTrustILITValueCalculator').then((m) => m.irrevocableLifeInsuranceTrustILITValueCalculator),
+  },
+  {
+    id: 'lifesettlementvalue-calculator',
+    title: 'Lifesettlementvalue Calculator',
+    category: 'finance',
+    subcategory: 'Lifesettlementvalue',
+    description: 'Calculate lifesettlementvalue values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'lifeSettlementValueCalculator',
+    load: () => import('../lifeSettlementValueCalculator/lifeSettlementValueCalculator').then((m) => m.lifeSettlementValueCalculator),
+  },
+  {
+    id: 'marketingroi-calculator',
+    title: 'Marketingroi Calculator',
+    category: 'finance',
+    subcategory: 'Marketingroi',
+    description: 'Calculate marketingroi values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'marketingROICalculator',
+    load: () => import('../marketingROICalculator/marketingROICalculator').then((m) => m.marketingROICalculator),
+  },
+  {
+    id: 'matrix-calculator',
+    title: 'Matrix Calculator',
+    category: 'finance',
+    subcategory: 'Matrix',
+    description: 'Calculate matrix values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'matrixCalculator',
+    load: () => import('../matrixCalculator/matrixCalculator').then((m) => m.matrixCalculator),
+  },
+  {
+    id: 'megabackdoorroth-calculator',
+    title: 'Megabackdoorroth Calculator',
+    category: 'finance',
+    subcategory: 'Megabackdoorroth',
+    description: 'Calculate megabackdoorroth values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'megaBackdoorRothCalculator',
+    load: () => import('../megaBackdoorRothCalculator/megaBackdoorRothCalculator').then((m) => m.megaBackdoorRothCalculator),
+  },
+  {
+    id: 'mortgage-calculator',
+    title: 'Mortgage Calculator',
+    category: 'finance',
+    subcategory: 'Mortgage',
+    description: 'Calculate mortgage values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'mortgageCalculator',
+    load: () => import('../mortgageCalculator/mortgageCalculator').then((m) => m.mortgageCalculator),
+  },
+  {
+    id: 'mortgagerefinance-calculator',
+    title: 'Mortgagerefinance Calculator',
+    category: 'finance',
+    subcategory: 'Mortgagerefinance',
+    description: 'Calculate mortgagerefinance values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'mortgageRefinanceCalculator',
+    load: () => import('../mortgageRefinanceCalculator/mortgageRefinanceCalculator').then((m) => m.mortgageRefinanceCalculator),
+  },
+  {
+    id: 'netunrealizedappreciationnuatax-calculator',
+    title: 'Netunrealizedappreciationnuatax Calculator',
+    category: 'finance',
+    subcategory: 'Netunrealizedappreciationnuatax',
+    description: 'Calculate netunrealizedappreciationnuatax values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'netUnrealizedAppreciationNUATaxCalculator',
+    load: () => import('../netUnrealizedAppreciationNUATaxCalculator/netUnrealizedAppreciationNUATaxCalculator').then((m) => m.netUnrealizedAppreciationNUATaxCalculator),
+  },
+  {
+    id: 'paycheck-calculator',
+    title: 'Paycheck Calculator',
+    category: 'finance',
+    subcategory: 'Paycheck',
+    description: 'Calculate paycheck values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'PaycheckCalculator',
+    load: () => import('../PaycheckCalculator/PaycheckCalculator').then((m) => m.PaycheckCalculator),
+  },
+  {
+    id: 'pensionlumpsumvsannuity-calculator',
+    title: 'Pensionlumpsumvsannuity Calculator',
+    category: 'finance',
+    subcategory: 'Pensionlumpsumvsannuity',
+    description: 'Calculate pensionlumpsumvsannuity values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'pensionLumpSumVsAnnuityCalculator',
+    load: () => import('../pensionLumpSumVsAnnuityCalculator/pensionLumpSumVsAnnuityCalculator').then((m) => m.pensionLumpSumVsAnnuityCalculator),
+  },
+  {
+    id: 'pensionplanfunding-calculator',
+    title: 'Pensionplanfunding Calculator',
+    category: 'finance',
+    subcategory: 'Pensionplanfunding',
+    description: 'Calculate pensionplanfunding values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'pensionPlanFundingCalculator',
+    load: () => import('../pensionPlanFundingCalculator/pensionPlanFundingCalculator').then((m) => m.pensionPlanFundingCalculator),
+  },
+  {
+    id: 'personalinjury-calculator',
+    title: 'Personalinjury Calculator',
+    category: 'finance',
+    subcategory: 'Personalinjury',
+    description: 'Calculate personalinjury values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'personalInjuryCalculator',
+    load: () => import('../personalInjuryCalculator/personalInjuryCalculator').then((m) => m.personalInjuryCalculator),
+  },
+  {
+    id: 'personalloan-calculator',
+    title: 'Personalloan Calculator',
+    category: 'finance',
+    subcategory: 'Personalloan',
+    description: 'Calculate personalloan values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'personalLoanCalculator',
+    load: () => import('../personalLoanCalculator/personalLoanCalculator').then((m) => m.personalLoanCalculator),
+  },
+  {
+    id: 'plannedgiving-calculator',
+    title: 'Plannedgiving Calculator',
+    category: 'finance',
+    subcategory: 'Plannedgiving',
+    description: 'Calculate plannedgiving values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'plannedGivingCalculator',
+    load: () => import('../plannedGivingCalculator/plannedGivingCalculator').then((m) => m.plannedGivingCalculator),
+  },
+  {
+    id: 'probability-calculator',
+    title: 'Probability Calculator',
+    category: 'finance',
+    subcategory: 'Probability',
+    description: 'Calculate probability values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'probabilityCalculator',
+    load: () => import('../probabilityCalculator/probabilityCalculator').then((m) => m.probabilityCalculator),
+  },
+  {
+    id: 'propertytaxproration-calculator',
+    title: 'Propertytaxproration Calculator',
+    category: 'finance',
+    subcategory: 'Propertytaxproration',
+    description: 'Calculate propertytaxproration values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'propertyTaxProrationCalculator',
+    load: () => import('../propertyTaxProrationCalculator/propertyTaxProrationCalculator').then((m) => m.propertyTaxProrationCalculator),
+  },
+  {
+    id: 'realestatedepreciationschedule-calculator',
+    title: 'Realestatedepreciationschedule Calculator',
+    category: 'finance',
+    subcategory: 'Realestatedepreciationschedule',
+    description: 'Calculate realestatedepreciationschedule values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'realEstateDepreciationScheduleCalculator',
+    load: () => import('../realEstateDepreciationScheduleCalculator/realEstateDepreciationScheduleCalculator').then((m) => m.realEstateDepreciationScheduleCalculator),
+  },
+  {
+    id: 'realestatedevelopmentproforma-calculator',
+    title: 'Realestatedevelopmentproforma Calculator',
+    category: 'finance',
+    subcategory: 'Realestatedevelopmentproforma',
+    description: 'Calculate realestatedevelopmentproforma values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'realEstateDevelopmentProFormaCalculator',
+    load: () => import('../realEstateDevelopmentProFormaCalculator/realEstateDevelopmentProFormaCalculator').then((m) => m.realEstateDevelopmentProFormaCalculator),
+  },
+  {
+    id: 'realestatesyndication-calculator',
+    title: 'Realestatesyndication Calculator',
+    category: 'finance',
+    subcategory: 'Realestatesyndication',
+    description: 'Calculate realestatesyndication values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'realEstateSyndicationCalculator',
+    load: () => import('../realEstateSyndicationCalculator/realEstateSyndicationCalculator').then((m) => m.realEstateSyndicationCalculator),
+  },
+  {
+    id: 'realestatetaxdeductions-calculator',
+    title: 'Realestatetaxdeductions Calculator',
+    category: 'finance',
+    subcategory: 'Realestatetaxdeductions',
+    description: 'Calculate realestatetaxdeductions values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'realEstateTaxDeductionsCalculator',
+    load: () => import('../realEstateTaxDeductionsCalculator/realEstateTaxDeductionsCalculator').then((m) => m.realEstateTaxDeductionsCalculator),
+  },
+  {
+    id: 'realestatewaterfallmodel-calculator',
+    title: 'Realestatewaterfallmodel Calculator',
+    category: 'finance',
+    subcategory: 'Realestatewaterfallmodel',
+    description: 'Calculate realestatewaterfallmodel values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'realEstateWaterfallModelCalculator',
+    load: () => import('../realEstateWaterfallModelCalculator/realEstateWaterfallModelCalculator').then((m) => m.realEstateWaterfallModelCalculator),
+  },
+  {
+    id: 'refinance-calculator',
+    title: 'Refinance Calculator',
+    category: 'finance',
+    subcategory: 'Refinance',
+    description: 'Calculate refinance values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'refinanceCalculator',
+    load: () => import('../refinanceCalculator/refinanceCalculator').then((m) => m.refinanceCalculator),
+  },
+  {
+    id: 'registeralimonyspousalsupport-calculator',
+    title: 'Registeralimonyspousalsupport Calculator',
+    category: 'finance',
+    subcategory: 'Registeralimonyspousalsupport',
+    description: 'Calculate registeralimonyspousalsupport values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerAlimonySpousalSupportCalculator',
+    load: () => import('../registerAlimonySpousalSupportCalculator/registerAlimonySpousalSupportCalculator').then((m) => m.registerAlimonySpousalSupportCalculator),
+  },
+  {
+    id: 'registerannuitybuyout-calculator',
+    title: 'Registerannuitybuyout Calculator',
+    category: 'finance',
+    subcategory: 'Registerannuitybuyout',
+    description: 'Calculate registerannuitybuyout values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerAnnuityBuyoutCalculator',
+    load: () => import('../registerAnnuityBuyoutCalculator/registerAnnuityBuyoutCalculator').then((m) => m.registerAnnuityBuyoutCalculator),
+  },
+  {
+    id: 'registeraptvalue-calculator',
+    title: 'Registeraptvalue Calculator',
+    category: 'finance',
+    subcategory: 'Registeraptvalue',
+    description: 'Calculate registeraptvalue values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerAPTValueCalculator',
+    load: () => import('../registerAPTValueCalculator/registerAPTValueCalculator').then((m) => m.registerAPTValueCalculator),
+  },
+  {
+    id: 'registerautoloan-calculator',
+    title: 'Registerautoloan Calculator',
+    category: 'finance',
+    subcategory: 'Registerautoloan',
+    description: 'Calculate registerautoloan values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerAutoLoanCalculator',
+    load: () => import('../registerAutoLoanCalculator/registerAutoLoanCalculator').then((m) => m.registerAutoLoanCalculator),
+  },
+  {
+    id: 'registerbeta-calculator',
+    title: 'Registerbeta Calculator',
+    category: 'finance',
+    subcategory: 'Registerbeta',
+    description: 'Calculate registerbeta values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerBetaCalculator',
+    load: () => import('../registerBetaCalculator/registerBetaCalculator').then((m) => m.registerBetaCalculator),
+  },
+  {
+    id: 'registercalorie-calculator',
+    title: 'Registercalorie Calculator',
+    category: 'finance',
+    subcategory: 'Registercalorie',
+    description: 'Calculate registercalorie values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCalorieCalculator',
+    load: () => import('../registerCalorieCalculator/registerCalorieCalculator').then((m) => m.registerCalorieCalculator),
+  },
+  {
+    id: 'registercarloan-calculator',
+    title: 'Registercarloan Calculator',
+    category: 'finance',
+    subcategory: 'Registercarloan',
+    description: 'Calculate registercarloan values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCarLoanCalculator',
+    load: () => import('../registerCarLoanCalculator/registerCarLoanCalculator').then((m) => m.registerCarLoanCalculator),
+  },
+  {
+    id: 'registercarpayment-calculator',
+    title: 'Registercarpayment Calculator',
+    category: 'finance',
+    subcategory: 'Registercarpayment',
+    description: 'Calculate registercarpayment values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCarPaymentCalculator',
+    load: () => import('../registerCarPaymentCalculator/registerCarPaymentCalculator').then((m) => m.registerCarPaymentCalculator),
+  },
+  {
+    id: 'registercomprehensivemortgage-calculator',
+    title: 'Registercomprehensivemortgage Calculator',
+    category: 'finance',
+    subcategory: 'Registercomprehensivemortgage',
+    description: 'Calculate registercomprehensivemortgage values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerComprehensiveMortgageCalculator',
+    load: () => import('../registerComprehensiveMortgageCalculator/registerComprehensiveMortgageCalculator').then((m) => m.registerComprehensiveMortgageCalculator),
+  },
+  {
+    id: 'registercorporatebond-calculator',
+    title: 'Registercorporatebond Calculator',
+    category: 'finance',
+    subcategory: 'Registercorporatebond',
+    description: 'Calculate registercorporatebond values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCorporateBondCalculator',
+    load: () => import('../registerCorporateBondCalculator/registerCorporateBondCalculator').then((m) => m.registerCorporateBondCalculator),
+  },
+  {
+    id: 'registercorrelation-calculator',
+    title: 'Registercorrelation Calculator',
+    category: 'finance',
+    subcategory: 'Registercorrelation',
+    description: 'Calculate registercorrelation values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCorrelationCalculator',
+    load: () => import('../registerCorrelationCalculator/registerCorrelationCalculator').then((m) => m.registerCorrelationCalculator),
+  },
+  {
+    id: 'registercostofdebt-calculator',
+    title: 'Registercostofdebt Calculator',
+    category: 'finance',
+    subcategory: 'Registercostofdebt',
+    description: 'Calculate registercostofdebt values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCostOfDebtCalculator',
+    load: () => import('../registerCostOfDebtCalculator/registerCostOfDebtCalculator').then((m) => m.registerCostOfDebtCalculator),
+  },
+  {
+    id: 'registercostofequity-calculator',
+    title: 'Registercostofequity Calculator',
+    category: 'finance',
+    subcategory: 'Registercostofequity',
+    description: 'Calculate registercostofequity values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCostOfEquityCalculator',
+    load: () => import('../registerCostOfEquityCalculator/registerCostOfEquityCalculator').then((m) => m.registerCostOfEquityCalculator),
+  },
+  {
+    id: 'registercreditcardpayoff-calculator',
+    title: 'Registercreditcardpayoff Calculator',
+    category: 'finance',
+    subcategory: 'Registercreditcardpayoff',
+    description: 'Calculate registercreditcardpayoff values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCreditCardPayoffCalculator',
+    load: () => import('../registerCreditCardPayoffCalculator/registerCreditCardPayoffCalculator').then((m) => m.registerCreditCardPayoffCalculator),
+  },
+  {
+    id: 'registercreditdefaultswap-calculator',
+    title: 'Registercreditdefaultswap Calculator',
+    category: 'finance',
+    subcategory: 'Registercreditdefaultswap',
+    description: 'Calculate registercreditdefaultswap values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCreditDefaultSwapCalculator',
+    load: () => import('../registerCreditDefaultSwapCalculator/registerCreditDefaultSwapCalculator').then((m) => m.registerCreditDefaultSwapCalculator),
+  },
+  {
+    id: 'registercreditutilization-calculator',
+    title: 'Registercreditutilization Calculator',
+    category: 'finance',
+    subcategory: 'Registercreditutilization',
+    description: 'Calculate registercreditutilization values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCreditUtilizationCalculator',
+    load: () => import('../registerCreditUtilizationCalculator/registerCreditUtilizationCalculator').then((m) => m.registerCreditUtilizationCalculator),
+  },
+  {
+    id: 'registercurrentratio-calculator',
+    title: 'Registercurrentratio Calculator',
+    category: 'finance',
+    subcategory: 'Registercurrentratio',
+    description: 'Calculate registercurrentratio values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerCurrentRatioCalculator',
+    load: () => import('../registerCurrentRatioCalculator/registerCurrentRatioCalculator').then((m) => m.registerCurrentRatioCalculator),
+  },
+  {
+    id: 'registerdebtconsolidation-calculator',
+    title: 'Registerdebtconsolidation Calculator',
+    category: 'finance',
+    subcategory: 'Registerdebtconsolidation',
+    description: 'Calculate registerdebtconsolidation values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerDebtConsolidationCalculator',
+    load: () => import('../registerDebtConsolidationCalculator/registerDebtConsolidationCalculator').then((m) => m.registerDebtConsolidationCalculator),
+  },
+  {
+    id: 'registerdebtconsolidationloan-calculator',
+    title: 'Registerdebtconsolidationloan Calculator',
+    category: 'finance',
+    subcategory: 'Registerdebtconsolidationloan',
+    description: 'Calculate registerdebtconsolidationloan values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerDebtConsolidationLoanCalculator',
+    load: () => import('../registerDebtConsolidationLoanCalculator/registerDebtConsolidationLoanCalculator').then((m) => m.registerDebtConsolidationLoanCalculator),
+  },
+  {
+    id: 'registerdebtpayoff-calculator',
+    title: 'Registerdebtpayoff Calculator',
+    category: 'finance',
+    subcategory: 'Registerdebtpayoff',
+    description: 'Calculate registerdebtpayoff values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerDebtPayoffCalculator',
+    load: () => import('../registerDebtPayoffCalculator/registerDebtPayoffCalculator').then((m) => m.registerDebtPayoffCalculator),
+  },
+  {
+    id: 'registerdebtsnowball-calculator',
+    title: 'Registerdebtsnowball Calculator',
+    category: 'finance',
+    subcategory: 'Registerdebtsnowball',
+    description: 'Calculate registerdebtsnowball values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerDebtSnowballCalculator',
+    load: () => import('../registerDebtSnowballCalculator/registerDebtSnowballCalculator').then((m) => m.registerDebtSnowballCalculator),
+  },
+  {
+    id: 'registerdividend-calculator',
+    title: 'Registerdividend Calculator',
+    category: 'finance',
+    subcategory: 'Registerdividend',
+    description: 'Calculate registerdividend values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerDividendCalculator',
+    load: () => import('../registerDividendCalculator/registerDividendCalculator').then((m) => m.registerDividendCalculator),
+  },
+  {
+    id: 'registerdtiratio-calculator',
+    title: 'Registerdtiratio Calculator',
+    category: 'finance',
+    subcategory: 'Registerdtiratio',
+    description: 'Calculate registerdtiratio values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerDtiRatioCalculator',
+    load: () => import('../registerDtiRatioCalculator/registerDtiRatioCalculator').then((m) => m.registerDtiRatioCalculator),
+  },
+  {
+    id: 'registerebitda-calculator',
+    title: 'Registerebitda Calculator',
+    category: 'finance',
+    subcategory: 'Registerebitda',
+    description: 'Calculate registerebitda values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerEbitdaCalculator',
+    load: () => import('../registerEbitdaCalculator/registerEbitdaCalculator').then((m) => m.registerEbitdaCalculator),
+  },
+  {
+    id: 'registerequityvaluation-calculator',
+    title: 'Registerequityvaluation Calculator',
+    category: 'finance',
+    subcategory: 'Registerequityvaluation',
+    description: 'Calculate registerequityvaluation values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerEquityValuationCalculator',
+    load: () => import('../registerEquityValuationCalculator/registerEquityValuationCalculator').then((m) => m.registerEquityValuationCalculator),
+  },
+  {
+    id: 'registerestateplanning-calculator',
+    title: 'Registerestateplanning Calculator',
+    category: 'finance',
+    subcategory: 'Registerestateplanning',
+    description: 'Calculate registerestateplanning values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerEstatePlanningCalculator',
+    load: () => import('../registerEstatePlanningCalculator/registerEstatePlanningCalculator').then((m) => m.registerEstatePlanningCalculator),
+  },
+  {
+    id: 'registerestatetaxliability-calculator',
+    title: 'Registerestatetaxliability Calculator',
+    category: 'finance',
+    subcategory: 'Registerestatetaxliability',
+    description: 'Calculate registerestatetaxliability values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerEstateTaxLiabilityCalculator',
+    load: () => import('../registerEstateTaxLiabilityCalculator/registerEstateTaxLiabilityCalculator').then((m) => m.registerEstateTaxLiabilityCalculator),
+  },
+  {
+    id: 'registerexecutivedeferredcompensation-calculator',
+    title: 'Registerexecutivedeferredcompensation Calculator',
+    category: 'finance',
+    subcategory: 'Registerexecutivedeferredcompensation',
+    description: 'Calculate registerexecutivedeferredcompensation values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerExecutiveDeferredCompensationCalculator',
+    load: () => import('../registerExecutiveDeferredCompensationCalculator/registerExecutiveDeferredCompensationCalculator').then((m) => m.registerExecutiveDeferredCompensationCalculator),
+  },
+  {
+    id: 'registerexpectedshortfall-calculator',
+    title: 'Registerexpectedshortfall Calculator',
+    category: 'finance',
+    subcategory: 'Registerexpectedshortfall',
+    description: 'Calculate registerexpectedshortfall values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerExpectedShortfallCalculator',
+    load: () => import('../registerExpectedShortfallCalculator/registerExpectedShortfallCalculator').then((m) => m.registerExpectedShortfallCalculator),
+  },
+  {
+    id: 'registerfafsa-calculator',
+    title: 'Registerfafsa Calculator',
+    category: 'finance',
+    subcategory: 'Registerfafsa',
+    description: 'Calculate registerfafsa values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerFAFSACalculator',
+    load: () => import('../registerFAFSACalculator/registerFAFSACalculator').then((m) => m.registerFAFSACalculator),
+  },
+  {
+    id: 'registerfixedindexannuity-calculator',
+    title: 'Registerfixedindexannuity Calculator',
+    category: 'finance',
+    subcategory: 'Registerfixedindexannuity',
+    description: 'Calculate registerfixedindexannuity values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerFixedIndexAnnuityCalculator',
+    load: () => import('../registerFixedIndexAnnuityCalculator/registerFixedIndexAnnuityCalculator').then((m) => m.registerFixedIndexAnnuityCalculator),
+  },
+  {
+    id: 'registerflexiblespendingaccount-calculator',
+    title: 'Registerflexiblespendingaccount Calculator',
+    category: 'finance',
+    subcategory: 'Registerflexiblespendingaccount',
+    description: 'Calculate registerflexiblespendingaccount values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerFlexibleSpendingAccountCalculator',
+    load: () => import('../registerFlexibleSpendingAccountCalculator/registerFlexibleSpendingAccountCalculator').then((m) => m.registerFlexibleSpendingAccountCalculator),
+  },
+  {
+    id: 'registerfourzeroonek-calculator',
+    title: 'Registerfourzeroonek Calculator',
+    category: 'finance',
+    subcategory: 'Registerfourzeroonek',
+    description: 'Calculate registerfourzeroonek values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerFourZeroOneKCalculator',
+    load: () => import('../registerFourZeroOneKCalculator/registerFourZeroOneKCalculator').then((m) => m.registerFourZeroOneKCalculator),
+  },
+  {
+    id: 'registergenerationskippingtransfergsttax-calculator',
+    title: 'Registergenerationskippingtransfergsttax Calculator',
+    category: 'finance',
+    subcategory: 'Registergenerationskippingtransfergsttax',
+    description: 'Calculate registergenerationskippingtransfergsttax values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerGenerationSkippingTransferGstTaxCalculator',
+    load: () => import('../registerGenerationSkippingTransferGstTaxCalculator/registerGenerationSkippingTransferGstTaxCalculator').then((m) => m.registerGenerationSkippingTransferGstTaxCalculator),
+  },
+  {
+    id: 'registergifttax-calculator',
+    title: 'Registergifttax Calculator',
+    category: 'finance',
+    subcategory: 'Registergifttax',
+    description: 'Calculate registergifttax values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerGiftTaxCalculator',
+    load: () => import('../registerGiftTaxCalculator/registerGiftTaxCalculator').then((m) => m.registerGiftTaxCalculator),
+  },
+  {
+    id: 'registergrantorretainedannuitytrustgrat-calculator',
+    title: 'Registergrantorretainedannuitytrustgrat Calculator',
+    category: 'finance',
+    subcategory: 'Registergrantorretainedannuitytrustgrat',
+    description: 'Calculate registergrantorretainedannuitytrustgrat values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerGrantorRetainedAnnuityTrustGratCalculator',
+    load: () => import('../registerGrantorRetainedAnnuityTrustGratCalculator/registerGrantorRetainedAnnuityTrustGratCalculator').then((m) => m.registerGrantorRetainedAnnuityTrustGratCalculator),
+  },
+  {
+    id: 'registerhealthsavingsaccounthsa-calculator',
+    title: 'Registerhealthsavingsaccounthsa Calculator',
+    category: 'finance',
+    subcategory: 'Registerhealthsavingsaccounthsa',
+    description: 'Calculate registerhealthsavingsaccounthsa values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerHealthSavingsAccountHsaCalculator',
+    load: () => import('../registerHealthSavingsAccountHsaCalculator/registerHealthSavingsAccountHsaCalculator').then((m) => m.registerHealthSavingsAccountHsaCalculator),
+  },
+  {
+    id: 'registerhsatripletaxadvantage-calculator',
+    title: 'Registerhsatripletaxadvantage Calculator',
+    category: 'finance',
+    subcategory: 'Registerhsatripletaxadvantage',
+    description: 'Calculate registerhsatripletaxadvantage values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerHSATripleTaxAdvantageCalculator',
+    load: () => import('../registerHSATripleTaxAdvantageCalculator/registerHSATripleTaxAdvantageCalculator').then((m) => m.registerHSATripleTaxAdvantageCalculator),
+  },
+  {
+    id: 'registerimmediateannuitypayout-calculator',
+    title: 'Registerimmediateannuitypayout Calculator',
+    category: 'finance',
+    subcategory: 'Registerimmediateannuitypayout',
+    description: 'Calculate registerimmediateannuitypayout values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerImmediateAnnuityPayoutCalculator',
+    load: () => import('../registerImmediateAnnuityPayoutCalculator/registerImmediateAnnuityPayoutCalculator').then((m) => m.registerImmediateAnnuityPayoutCalculator),
+  },
+  {
+    id: 'registerinvestment-calculator',
+    title: 'Registerinvestment Calculator',
+    category: 'finance',
+    subcategory: 'Registerinvestment',
+    description: 'Calculate registerinvestment values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerInvestmentCalculator',
+    load: () => import('../registerInvestmentCalculator/registerInvestmentCalculator').then((m) => m.registerInvestmentCalculator),
+  },
+  {
+    id: 'registerira-calculator',
+    title: 'Registerira Calculator',
+    category: 'finance',
+    subcategory: 'Registerira',
+    description: 'Calculate registerira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerIRACalculator',
+    load: () => import('../registerIRACalculator/registerIRACalculator').then((m) => m.registerIRACalculator),
+  },
+  {
+    id: 'registerirrevocablelifeinsurancetrustilitvalue-calculator',
+    title: 'Registerirrevocablelifeinsurancetrustilitvalue Calculator',
+    category: 'finance',
+    subcategory: 'Registerirrevocablelifeinsurancetrustilitvalue',
+    description: 'Calculate registerirrevocablelifeinsurancetrustilitvalue values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerIrrevocableLifeInsuranceTrustILITValueCalculator',
+    load: () => import('../registerIrrevocableLifeInsuranceTrustILITValueCalculator/registerIrrevocableLifeInsuranceTrustILITValueCalculator').then((m) => m.registerIrrevocableLifeInsuranceTrustILITValueCalculator),
+  },
+  {
+    id: 'registerlifesettlementvalue-calculator',
+    title: 'Registerlifesettlementvalue Calculator',
+    category: 'finance',
+    subcategory: 'Registerlifesettlementvalue',
+    description: 'Calculate registerlifesettlementvalue values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerLifeSettlementValueCalculator',
+    load: () => import('../registerLifeSettlementValueCalculator/registerLifeSettlementValueCalculator').then((m) => m.registerLifeSettlementValueCalculator),
+  },
+  {
+    id: 'registermarketingroi-calculator',
+    title: 'Registermarketingroi Calculator',
+    category: 'finance',
+    subcategory: 'Registermarketingroi',
+    description: 'Calculate registermarketingroi values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerMarketingROICalculator',
+    load: () => import('../registerMarketingROICalculator/registerMarketingROICalculator').then((m) => m.registerMarketingROICalculator),
+  },
+  {
+    id: 'registermegabackdoorroth-calculator',
+    title: 'Registermegabackdoorroth Calculator',
+    category: 'finance',
+    subcategory: 'Registermegabackdoorroth',
+    description: 'Calculate registermegabackdoorroth values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerMegaBackdoorRothCalculator',
+    load: () => import('../registerMegaBackdoorRothCalculator/registerMegaBackdoorRothCalculator').then((m) => m.registerMegaBackdoorRothCalculator),
+  },
+  {
+    id: 'registernetunrealizedappreciationnuatax-calculator',
+    title: 'Registernetunrealizedappreciationnuatax Calculator',
+    category: 'finance',
+    subcategory: 'Registernetunrealizedappreciationnuatax',
+    description: 'Calculate registernetunrealizedappreciationnuatax values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerNetUnrealizedAppreciationNUATaxCalculator',
+    load: () => import('../registerNetUnrealizedAppreciationNUATaxCalculator/registerNetUnrealizedAppreciationNUATaxCalculator').then((m) => m.registerNetUnrealizedAppreciationNUATaxCalculator),
+  },
+  {
+    id: 'registerpensionlumpsumvsannuity-calculator',
+    title: 'Registerpensionlumpsumvsannuity Calculator',
+    category: 'finance',
+    subcategory: 'Registerpensionlumpsumvsannuity',
+    description: 'Calculate registerpensionlumpsumvsannuity values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerPensionLumpSumVsAnnuityCalculator',
+    load: () => import('../registerPensionLumpSumVsAnnuityCalculator/registerPensionLumpSumVsAnnuityCalculator').then((m) => m.registerPensionLumpSumVsAnnuityCalculator),
+  },
+  {
+    id: 'registerpensionplanfunding-calculator',
+    title: 'Registerpensionplanfunding Calculator',
+    category: 'finance',
+    subcategory: 'Registerpensionplanfunding',
+    description: 'Calculate registerpensionplanfunding values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerPensionPlanFundingCalculator',
+    load: () => import('../registerPensionPlanFundingCalculator/registerPensionPlanFundingCalculator').then((m) => m.registerPensionPlanFundingCalculator),
+  },
+  {
+    id: 'registerpersonalloan-calculator',
+    title: 'Registerpersonalloan Calculator',
+    category: 'finance',
+    subcategory: 'Registerpersonalloan',
+    description: 'Calculate registerpersonalloan values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerPersonalLoanCalculator',
+    load: () => import('../registerPersonalLoanCalculator/registerPersonalLoanCalculator').then((m) => m.registerPersonalLoanCalculator),
+  },
+  {
+    id: 'registerplannedgiving-calculator',
+    title: 'Registerplannedgiving Calculator',
+    category: 'finance',
+    subcategory: 'Registerplannedgiving',
+    description: 'Calculate registerplannedgiving values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerPlannedGivingCalculator',
+    load: () => import('../registerPlannedGivingCalculator/registerPlannedGivingCalculator').then((m) => m.registerPlannedGivingCalculator),
+  },
+  {
+    id: 'registerrealestatedepreciationschedule-calculator',
+    title: 'Registerrealestatedepreciationschedule Calculator',
+    category: 'finance',
+    subcategory: 'Registerrealestatedepreciationschedule',
+    description: 'Calculate registerrealestatedepreciationschedule values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRealEstateDepreciationScheduleCalculator',
+    load: () => import('../registerRealEstateDepreciationScheduleCalculator/registerRealEstateDepreciationScheduleCalculator').then((m) => m.registerRealEstateDepreciationScheduleCalculator),
+  },
+  {
+    id: 'registerrealestatedevelopmentproforma-calculator',
+    title: 'Registerrealestatedevelopmentproforma Calculator',
+    category: 'finance',
+    subcategory: 'Registerrealestatedevelopmentproforma',
+    description: 'Calculate registerrealestatedevelopmentproforma values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRealEstateDevelopmentProFormaCalculator',
+    load: () => import('../registerRealEstateDevelopmentProFormaCalculator/registerRealEstateDevelopmentProFormaCalculator').then((m) => m.registerRealEstateDevelopmentProFormaCalculator),
+  },
+  {
+    id: 'registerrealestatesyndication-calculator',
+    title: 'Registerrealestatesyndication Calculator',
+    category: 'finance',
+    subcategory: 'Registerrealestatesyndication',
+    description: 'Calculate registerrealestatesyndication values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRealEstateSyndicationCalculator',
+    load: () => import('../registerRealEstateSyndicationCalculator/registerRealEstateSyndicationCalculator').then((m) => m.registerRealEstateSyndicationCalculator),
+  },
+  {
+    id: 'registerrealestatetaxdeductions-calculator',
+    title: 'Registerrealestatetaxdeductions Calculator',
+    category: 'finance',
+    subcategory: 'Registerrealestatetaxdeductions',
+    description: 'Calculate registerrealestatetaxdeductions values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRealEstateTaxDeductionsCalculator',
+    load: () => import('../registerRealEstateTaxDeductionsCalculator/registerRealEstateTaxDeductionsCalculator').then((m) => m.registerRealEstateTaxDeductionsCalculator),
+  },
+  {
+    id: 'registerrealestatewaterfallmodel-calculator',
+    title: 'Registerrealestatewaterfallmodel Calculator',
+    category: 'finance',
+    subcategory: 'Registerrealestatewaterfallmodel',
+    description: 'Calculate registerrealestatewaterfallmodel values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRealEstateWaterfallModelCalculator',
+    load: () => import('../registerRealEstateWaterfallModelCalculator/registerRealEstateWaterfallModelCalculator').then((m) => m.registerRealEstateWaterfallModelCalculator),
+  },
+  {
+    id: 'registerrentalpropertyroi-calculator',
+    title: 'Registerrentalpropertyroi Calculator',
+    category: 'finance',
+    subcategory: 'Registerrentalpropertyroi',
+    description: 'Calculate registerrentalpropertyroi values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRentalPropertyROICalculator',
+    load: () => import('../registerRentalPropertyROICalculator/registerRentalPropertyROICalculator').then((m) => m.registerRentalPropertyROICalculator),
+  },
+  {
+    id: 'registerrentalyield-calculator',
+    title: 'Registerrentalyield Calculator',
+    category: 'finance',
+    subcategory: 'Registerrentalyield',
+    description: 'Calculate registerrentalyield values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRentalYieldCalculator',
+    load: () => import('../registerRentalYieldCalculator/registerRentalYieldCalculator').then((m) => m.registerRentalYieldCalculator),
+  },
+  {
+    id: 'registerrentersinsurance-calculator',
+    title: 'Registerrentersinsurance Calculator',
+    category: 'finance',
+    subcategory: 'Registerrentersinsurance',
+    description: 'Calculate registerrentersinsurance values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRentersInsuranceCalculator',
+    load: () => import('../registerRentersInsuranceCalculator/registerRentersInsuranceCalculator').then((m) => m.registerRentersInsuranceCalculator),
+  },
+  {
+    id: 'registerrentvsbuy-calculator',
+    title: 'Registerrentvsbuy Calculator',
+    category: 'finance',
+    subcategory: 'Registerrentvsbuy',
+    description: 'Calculate registerrentvsbuy values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRentVsBuyCalculator',
+    load: () => import('../registerRentVsBuyCalculator/registerRentVsBuyCalculator').then((m) => m.registerRentVsBuyCalculator),
+  },
+  {
+    id: 'registerrequiredbeginningdatermd-calculator',
+    title: 'Registerrequiredbeginningdatermd Calculator',
+    category: 'finance',
+    subcategory: 'Registerrequiredbeginningdatermd',
+    description: 'Calculate registerrequiredbeginningdatermd values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRequiredBeginningDateRmdCalculator',
+    load: () => import('../registerRequiredBeginningDateRmdCalculator/registerRequiredBeginningDateRmdCalculator').then((m) => m.registerRequiredBeginningDateRmdCalculator),
+  },
+  {
+    id: 'registerrequiredminimumdistributionrmd-calculator',
+    title: 'Registerrequiredminimumdistributionrmd Calculator',
+    category: 'finance',
+    subcategory: 'Registerrequiredminimumdistributionrmd',
+    description: 'Calculate registerrequiredminimumdistributionrmd values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRequiredMinimumDistributionRmdCalculator',
+    load: () => import('../registerRequiredMinimumDistributionRmdCalculator/registerRequiredMinimumDistributionRmdCalculator').then((m) => m.registerRequiredMinimumDistributionRmdCalculator),
+  },
+  {
+    id: 'registerretirement-calculator',
+    title: 'Registerretirement Calculator',
+    category: 'finance',
+    subcategory: 'Registerretirement',
+    description: 'Calculate registerretirement values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRetirementCalculator',
+    load: () => import('../registerRetirementCalculator/registerRetirementCalculator').then((m) => m.registerRetirementCalculator),
+  },
+  {
+    id: 'registerreversemortgage-calculator',
+    title: 'Registerreversemortgage Calculator',
+    category: 'finance',
+    subcategory: 'Registerreversemortgage',
+    description: 'Calculate registerreversemortgage values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerReverseMortgageCalculator',
+    load: () => import('../registerReverseMortgageCalculator/registerReverseMortgageCalculator').then((m) => m.registerReverseMortgageCalculator),
+  },
+  {
+    id: 'registerrothconversiontax-calculator',
+    title: 'Registerrothconversiontax Calculator',
+    category: 'finance',
+    subcategory: 'Registerrothconversiontax',
+    description: 'Calculate registerrothconversiontax values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRothConversionTaxCalculator',
+    load: () => import('../registerRothConversionTaxCalculator/registerRothConversionTaxCalculator').then((m) => m.registerRothConversionTaxCalculator),
+  },
+  {
+    id: 'registerrothira-calculator',
+    title: 'Registerrothira Calculator',
+    category: 'finance',
+    subcategory: 'Registerrothira',
+    description: 'Calculate registerrothira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerRothIRACalculator',
+    load: () => import('../registerRothIRACalculator/registerRothIRACalculator').then((m) => m.registerRothIRACalculator),
+  },
+  {
+    id: 'registersavingsgoal-calculator',
+    title: 'Registersavingsgoal Calculator',
+    category: 'finance',
+    subcategory: 'Registersavingsgoal',
+    description: 'Calculate registersavingsgoal values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerSavingsGoalCalculator',
+    load: () => import('../registerSavingsGoalCalculator/registerSavingsGoalCalculator').then((m) => m.registerSavingsGoalCalculator),
+  },
+  {
+    id: 'registerselfstoragefacilityroi-calculator',
+    title: 'Registerselfstoragefacilityroi Calculator',
+    category: 'finance',
+    subcategory: 'Registerselfstoragefacilityroi',
+    description: 'Calculate registerselfstoragefacilityroi values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerSelfStorageFacilityROICalculator',
+    load: () => import('../registerSelfStorageFacilityROICalculator/registerSelfStorageFacilityROICalculator').then((m) => m.registerSelfStorageFacilityROICalculator),
+  },
+  {
+    id: 'registersepira-calculator',
+    title: 'Registersepira Calculator',
+    category: 'finance',
+    subcategory: 'Registersepira',
+    description: 'Calculate registersepira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerSepIRACalculator',
+    load: () => import('../registerSepIRACalculator/registerSepIRACalculator').then((m) => m.registerSepIRACalculator),
+  },
+  {
+    id: 'registersimpleira-calculator',
+    title: 'Registersimpleira Calculator',
+    category: 'finance',
+    subcategory: 'Registersimpleira',
+    description: 'Calculate registersimpleira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerSimpleIRACalculator',
+    load: () => import('../registerSimpleIRACalculator/registerSimpleIRACalculator').then((m) => m.registerSimpleIRACalculator),
+  },
+  {
+    id: 'registersocialsecurityoptimization-calculator',
+    title: 'Registersocialsecurityoptimization Calculator',
+    category: 'finance',
+    subcategory: 'Registersocialsecurityoptimization',
+    description: 'Calculate registersocialsecurityoptimization values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerSocialSecurityOptimizationCalculator',
+    load: () => import('../registerSocialSecurityOptimizationCalculator/registerSocialSecurityOptimizationCalculator').then((m) => m.registerSocialSecurityOptimizationCalculator),
+  },
+  {
+    id: 'registerstretchira-calculator',
+    title: 'Registerstretchira Calculator',
+    category: 'finance',
+    subcategory: 'Registerstretchira',
+    description: 'Calculate registerstretchira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerStretchIRACalculator',
+    load: () => import('../registerStretchIRACalculator/registerStretchIRACalculator').then((m) => m.registerStretchIRACalculator),
+  },
+  {
+    id: 'registerstructuredsettlementpayout-calculator',
+    title: 'Registerstructuredsettlementpayout Calculator',
+    category: 'finance',
+    subcategory: 'Registerstructuredsettlementpayout',
+    description: 'Calculate registerstructuredsettlementpayout values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerStructuredSettlementPayoutCalculator',
+    load: () => import('../registerStructuredSettlementPayoutCalculator/registerStructuredSettlementPayoutCalculator').then((m) => m.registerStructuredSettlementPayoutCalculator),
+  },
+  {
+    id: 'registerstudentloanforgiveness-calculator',
+    title: 'Registerstudentloanforgiveness Calculator',
+    category: 'finance',
+    subcategory: 'Registerstudentloanforgiveness',
+    description: 'Calculate registerstudentloanforgiveness values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerStudentLoanForgivenessCalculator',
+    load: () => import('../registerStudentLoanForgivenessCalculator/registerStudentLoanForgivenessCalculator').then((m) => m.registerStudentLoanForgivenessCalculator),
+  },
+  {
+    id: 'registerstudentloanrefinancing-calculator',
+    title: 'Registerstudentloanrefinancing Calculator',
+    category: 'finance',
+    subcategory: 'Registerstudentloanrefinancing',
+    description: 'Calculate registerstudentloanrefinancing values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerStudentLoanRefinancingCalculator',
+    load: () => import('../registerStudentLoanRefinancingCalculator/registerStudentLoanRefinancingCalculator').then((m) => m.registerStudentLoanRefinancingCalculator),
+  },
+  {
+    id: 'registerstudentloanrepayment-calculator',
+    title: 'Registerstudentloanrepayment Calculator',
+    category: 'finance',
+    subcategory: 'Registerstudentloanrepayment',
+    description: 'Calculate registerstudentloanrepayment values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerStudentLoanRepaymentCalculator',
+    load: () => import('../registerStudentLoanRepaymentCalculator/registerStudentLoanRepaymentCalculator').then((m) => m.registerStudentLoanRepaymentCalculator),
+  },
+  {
+    id: 'registertenantimprovementallowance-calculator',
+    title: 'Registertenantimprovementallowance Calculator',
+    category: 'finance',
+    subcategory: 'Registertenantimprovementallowance',
+    description: 'Calculate registertenantimprovementallowance values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerTenantImprovementAllowanceCalculator',
+    load: () => import('../registerTenantImprovementAllowanceCalculator/registerTenantImprovementAllowanceCalculator').then((m) => m.registerTenantImprovementAllowanceCalculator),
+  },
+  {
+    id: 'registertimberlandinvestment-calculator',
+    title: 'Registertimberlandinvestment Calculator',
+    category: 'finance',
+    subcategory: 'Registertimberlandinvestment',
+    description: 'Calculate registertimberlandinvestment values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerTimberlandInvestmentCalculator',
+    load: () => import('../registerTimberlandInvestmentCalculator/registerTimberlandInvestmentCalculator').then((m) => m.registerTimberlandInvestmentCalculator),
+  },
+  {
+    id: 'registertitleinsurance-calculator',
+    title: 'Registertitleinsurance Calculator',
+    category: 'finance',
+    subcategory: 'Registertitleinsurance',
+    description: 'Calculate registertitleinsurance values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerTitleInsuranceCalculator',
+    load: () => import('../registerTitleInsuranceCalculator/registerTitleInsuranceCalculator').then((m) => m.registerTitleInsuranceCalculator),
+  },
+  {
+    id: 'registerusdaloan-calculator',
+    title: 'Registerusdaloan Calculator',
+    category: 'finance',
+    subcategory: 'Registerusdaloan',
+    description: 'Calculate registerusdaloan values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'registerUSDALoanCalculator',
+    load: () => import('../registerUSDALoanCalculator/registerUSDALoanCalculator').then((m) => m.registerUSDALoanCalculator),
+  },
+  {
+    id: 'rentalpropertyroi-calculator',
+    title: 'Rentalpropertyroi Calculator',
+    category: 'finance',
+    subcategory: 'Rentalpropertyroi',
+    description: 'Calculate rentalpropertyroi values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'rentalPropertyROICalculator',
+    load: () => import('../rentalPropertyROICalculator/rentalPropertyROICalculator').then((m) => m.rentalPropertyROICalculator),
+  },
+  {
+    id: 'rentalyield-calculator',
+    title: 'Rentalyield Calculator',
+    category: 'finance',
+    subcategory: 'Rentalyield',
+    description: 'Calculate rentalyield values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'rentalYieldCalculator',
+    load: () => import('../rentalYieldCalculator/rentalYieldCalculator').then((m) => m.rentalYieldCalculator),
+  },
+  {
+    id: 'rentersinsurance-calculator',
+    title: 'Rentersinsurance Calculator',
+    category: 'finance',
+    subcategory: 'Rentersinsurance',
+    description: 'Calculate rentersinsurance values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'rentersInsuranceCalculator',
+    load: () => import('../rentersInsuranceCalculator/rentersInsuranceCalculator').then((m) => m.rentersInsuranceCalculator),
+  },
+  {
+    id: 'rentvsbuy-calculator',
+    title: 'Rentvsbuy Calculator',
+    category: 'finance',
+    subcategory: 'Rentvsbuy',
+    description: 'Calculate rentvsbuy values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'rentVsBuyCalculator',
+    load: () => import('../rentVsBuyCalculator/rentVsBuyCalculator').then((m) => m.rentVsBuyCalculator),
+  },
+  {
+    id: 'requiredbeginningdatermd-calculator',
+    title: 'Requiredbeginningdatermd Calculator',
+    category: 'finance',
+    subcategory: 'Requiredbeginningdatermd',
+    description: 'Calculate requiredbeginningdatermd values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'RequiredBeginningDateRmdCalculator',
+    load: () => import('../RequiredBeginningDateRmdCalculator/RequiredBeginningDateRmdCalculator').then((m) => m.RequiredBeginningDateRmdCalculator),
+  },
+  {
+    id: 'requiredminimumdistributionrmd-calculator',
+    title: 'Requiredminimumdistributionrmd Calculator',
+    category: 'finance',
+    subcategory: 'Requiredminimumdistributionrmd',
+    description: 'Calculate requiredminimumdistributionrmd values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'RequiredMinimumDistributionRmdCalculator',
+    load: () => import('../RequiredMinimumDistributionRmdCalculator/RequiredMinimumDistributionRmdCalculator').then((m) => m.RequiredMinimumDistributionRmdCalculator),
+  },
+  {
+    id: 'retirement-calculator',
+    title: 'Retirement Calculator',
+    category: 'finance',
+    subcategory: 'Retirement',
+    description: 'Calculate retirement values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'retirementCalculator',
+    load: () => import('../retirementCalculator/retirementCalculator').then((m) => m.retirementCalculator),
+  },
+  {
+    id: 'reversemortgage-calculator',
+    title: 'Reversemortgage Calculator',
+    category: 'finance',
+    subcategory: 'Reversemortgage',
+    description: 'Calculate reversemortgage values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'reverseMortgageCalculator',
+    load: () => import('../reverseMortgageCalculator/reverseMortgageCalculator').then((m) => m.reverseMortgageCalculator),
+  },
+  {
+    id: 'roi-calculator',
+    title: 'Roi Calculator',
+    category: 'finance',
+    subcategory: 'Roi',
+    description: 'Calculate roi values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'roiCalculator',
+    load: () => import('../roiCalculator/roiCalculator').then((m) => m.roiCalculator),
+  },
+  {
+    id: 'rothconversiontax-calculator',
+    title: 'Rothconversiontax Calculator',
+    category: 'finance',
+    subcategory: 'Rothconversiontax',
+    description: 'Calculate rothconversiontax values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'rothConversionTaxCalculator',
+    load: () => import('../rothConversionTaxCalculator/rothConversionTaxCalculator').then((m) => m.rothConversionTaxCalculator),
+  },
+  {
+    id: 'rothira-calculator',
+    title: 'Rothira Calculator',
+    category: 'finance',
+    subcategory: 'Rothira',
+    description: 'Calculate rothira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'RothIRACalculator',
+    load: () => import('../RothIRACalculator/RothIRACalculator').then((m) => m.RothIRACalculator),
+  },
+  {
+    id: 'saasmetrics-calculator',
+    title: 'Saasmetrics Calculator',
+    category: 'finance',
+    subcategory: 'Saasmetrics',
+    description: 'Calculate saasmetrics values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'saasMetricsCalculator',
+    load: () => import('../saasMetricsCalculator/saasMetricsCalculator').then((m) => m.saasMetricsCalculator),
+  },
+  {
+    id: 'savingsgoal-calculator',
+    title: 'Savingsgoal Calculator',
+    category: 'finance',
+    subcategory: 'Savingsgoal',
+    description: 'Calculate savingsgoal values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'savingsGoalCalculator',
+    load: () => import('../savingsGoalCalculator/savingsGoalCalculator').then((m) => m.savingsGoalCalculator),
+  },
+  {
+    id: 'scientific-calculator',
+    title: 'Scientific Calculator',
+    category: 'finance',
+    subcategory: 'Scientific',
+    description: 'Calculate scientific values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'scientificCalculator',
+    load: () => import('../scientificCalculator/scientificCalculator').then((m) => m.scientificCalculator),
+  },
+  {
+    id: 'selfstoragefacilityroi-calculator',
+    title: 'Selfstoragefacilityroi Calculator',
+    category: 'finance',
+    subcategory: 'Selfstoragefacilityroi',
+    description: 'Calculate selfstoragefacilityroi values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'selfStorageFacilityROICalculator',
+    load: () => import('../selfStorageFacilityROICalculator/selfStorageFacilityROICalculator').then((m) => m.selfStorageFacilityROICalculator),
+  },
+  {
+    id: 'sepira-calculator',
+    title: 'Sepira Calculator',
+    category: 'finance',
+    subcategory: 'Sepira',
+    description: 'Calculate sepira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'SepIRACalculator',
+    load: () => import('../SepIRACalculator/SepIRACalculator').then((m) => m.SepIRACalculator),
+  },
+  {
+    id: 'simpleira-calculator',
+    title: 'Simpleira Calculator',
+    category: 'finance',
+    subcategory: 'Simpleira',
+    description: 'Calculate simpleira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'SimpleIRACalculator',
+    load: () => import('../SimpleIRACalculator/SimpleIRACalculator').then((m) => m.SimpleIRACalculator),
+  },
+  {
+    id: 'socialsecurityoptimization-calculator',
+    title: 'Socialsecurityoptimization Calculator',
+    category: 'finance',
+    subcategory: 'Socialsecurityoptimization',
+    description: 'Calculate socialsecurityoptimization values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'SocialSecurityOptimizationCalculator',
+    load: () => import('../SocialSecurityOptimizationCalculator/SocialSecurityOptimizationCalculator').then((m) => m.SocialSecurityOptimizationCalculator),
+  },
+  {
+    id: 'statistics-calculator',
+    title: 'Statistics Calculator',
+    category: 'finance',
+    subcategory: 'Statistics',
+    description: 'Calculate statistics values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'statisticsCalculator',
+    load: () => import('../statisticsCalculator/statisticsCalculator').then((m) => m.statisticsCalculator),
+  },
+  {
+    id: 'stretchira-calculator',
+    title: 'Stretchira Calculator',
+    category: 'finance',
+    subcategory: 'Stretchira',
+    description: 'Calculate stretchira values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'StretchIRACalculator',
+    load: () => import('../StretchIRACalculator/StretchIRACalculator').then((m) => m.StretchIRACalculator),
+  },
+  {
+    id: 'structuredsettlementpayout-calculator',
+    title: 'Structuredsettlementpayout Calculator',
+    category: 'finance',
+    subcategory: 'Structuredsettlementpayout',
+    description: 'Calculate structuredsettlementpayout values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'StructuredSettlementPayoutCalculator',
+    load: () => import('../StructuredSettlementPayoutCalculator/StructuredSettlementPayoutCalculator').then((m) => m.StructuredSettlementPayoutCalculator),
+  },
+  {
+    id: 'studentloanforgiveness-calculator',
+    title: 'Studentloanforgiveness Calculator',
+    category: 'finance',
+    subcategory: 'Studentloanforgiveness',
+    description: 'Calculate studentloanforgiveness values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'StudentLoanForgivenessCalculator',
+    load: () => import('../StudentLoanForgivenessCalculator/StudentLoanForgivenessCalculator').then((m) => m.StudentLoanForgivenessCalculator),
+  },
+  {
+    id: 'studentloanrefinancing-calculator',
+    title: 'Studentloanrefinancing Calculator',
+    category: 'finance',
+    subcategory: 'Studentloanrefinancing',
+    description: 'Calculate studentloanrefinancing values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'StudentLoanRefinancingCalculator',
+    load: () => import('../StudentLoanRefinancingCalculator/StudentLoanRefinancingCalculator').then((m) => m.StudentLoanRefinancingCalculator),
+  },
+  {
+    id: 'studentloanrepayment-calculator',
+    title: 'Studentloanrepayment Calculator',
+    category: 'finance',
+    subcategory: 'Studentloanrepayment',
+    description: 'Calculate studentloanrepayment values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'StudentLoanRepaymentCalculator',
+    load: () => import('../StudentLoanRepaymentCalculator/StudentLoanRepaymentCalculator').then((m) => m.StudentLoanRepaymentCalculator),
+  },
+  {
+    id: 'tax-calculator',
+    title: 'Tax Calculator',
+    category: 'finance',
+    subcategory: 'Tax',
+    description: 'Calculate tax values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'taxCalculator',
+    load: () => import('../taxCalculator/taxCalculator').then((m) => m.taxCalculator),
+  },
+  {
+    id: 'taxlossharvesting-calculator',
+    title: 'Taxlossharvesting Calculator',
+    category: 'finance',
+    subcategory: 'Taxlossharvesting',
+    description: 'Calculate taxlossharvesting values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'TaxLossHarvestingCalculator',
+    load: () => import('../TaxLossHarvestingCalculator/TaxLossHarvestingCalculator').then((m) => m.TaxLossHarvestingCalculator),
+  },
+  {
+    id: 'tenantimprovementallowance-calculator',
+    title: 'Tenantimprovementallowance Calculator',
+    category: 'finance',
+    subcategory: 'Tenantimprovementallowance',
+    description: 'Calculate tenantimprovementallowance values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'tenantImprovementAllowanceCalculator',
+    load: () => import('../tenantImprovementAllowanceCalculator/tenantImprovementAllowanceCalculator').then((m) => m.tenantImprovementAllowanceCalculator),
+  },
+  {
+    id: 'timberlandinvestment-calculator',
+    title: 'Timberlandinvestment Calculator',
+    category: 'finance',
+    subcategory: 'Timberlandinvestment',
+    description: 'Calculate timberlandinvestment values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'timberlandInvestmentCalculator',
+    load: () => import('../timberlandInvestmentCalculator/timberlandInvestmentCalculator').then((m) => m.timberlandInvestmentCalculator),
+  },
+  {
+    id: 'titleinsurance-calculator',
+    title: 'Titleinsurance Calculator',
+    category: 'finance',
+    subcategory: 'Titleinsurance',
+    description: 'Calculate titleinsurance values.',
+    usageInstructions: ['Enter the required input values', 'Review the calculated results'],
+    modulePath: 'titleInsuranceCalculator',
+    load: () => import('../titleInsuranceCalculator/titleInsuranceCalculator').then((m) => m.titleInsuranceCalculator),
+  },
+];
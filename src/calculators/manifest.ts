@@ -0,0 +1,125 @@
+// Generated by generate_calculator_manifest.py from registerAllCalculators - do not edit
+import { calculatorRegistry } from '../data/calculatorRegistry';
+import { CalculatorManifestEntry } from '../types/calculator';
+import { financeCalculators } from './categories/finance';
+import { businessCalculators } from './categories/business';
+// Registered eagerly: their metadata cannot be read without loading the module
+import { registerEnterpriseValueCalculator } from './finance/enterprise-value-calculator/register';
+import { GiftTaxCalculator } from './finance/gift-tax-calculator/GiftTaxCalculator';
+import { asset_protection_calculator } from './business/asset-protection-calculator/asset_protection_calculator';
+import { ad_reach_and_frequency_calculator } from './business/ad-reach-and-frequency-calculator/ad_reach_and_frequency_calculator';
+import { registerGpuMiningProfitabilityCalculator } from './registerGpuMiningProfitabilityCalculator';
+import { generationSkippingTransferGstTaxCalculator } from './generationSkippingTransferGstTaxCalculator';
+import { healthSavingsAccountHsaCalculator } from './healthSavingsAccountHsaCalculator';
+import { grantorRetainedAnnuityTrustGratCalculator } from './grantorRetainedAnnuityTrustGratCalculator';
+import { Four01kCalculator as fourZeroOneKCalculator } from './fourZeroOneKCalculator';
+import { FafsaCalculator } from './finance/fafsa-calculator/FAFSACalculator';
+import { FixedIndexAnnuityCalculator } from './finance/fixed-index-annuity-calculator/FixedIndexAnnuityCalculator';
+import { FlexibleSpendingAccountCalculator } from './finance/flexible-spending-account-calculator/FlexibleSpendingAccountCalculator';
+import { GenerationskippingTransferGstTaxCalculator } from './finance/generation-skipping-transfer-gst-tax-calculator/GenerationSkippingTransferGstTaxCalculator';
+import { GrantorRetainedAnnuityTrustGratCalculator } from './finance/grantor-retained-annuity-trust-grat-calculator/GrantorRetainedAnnuityTrustGratCalculator';
+import { HealthSavingsAccountHsaCalculator } from './finance/health-savings-account-hsa-calculator/HealthSavingsAccountHsaCalculator';
+import { HsaTripleTaxAdvantageCalculator } from './finance/hsa-triple-tax-advantage-calculator/HSATripleTaxAdvantageCalculator';
+import { ImmediateAnnuityPayoutCalculator } from './finance/immediate-annuity-payout-calculator/ImmediateAnnuityPayoutCalculator';
+import { InheritanceTaxEstimatorCalculator } from './finance/inheritance-tax-estimator/InheritanceTaxEstimator';
+import { IraCalculator } from './finance/ira-calculator/IRACalculator';
+import { IrrevocableLifeInsuranceTrustIlitValueCalculator } from './finance/irrevocable-life-insurance-trust-ilit-value-calculator/IrrevocableLifeInsuranceTrustILITValueCalculator';
+import { LifeSettlementValueCalculator } from './finance/life-settlement-value-calculator/LifeSettlementValueCalculator';
+import { MegaBackdoorRothCalculator } from './finance/mega-backdoor-roth-calculator/MegaBackdoorRothCalculator';
+import { NetUnrealizedAppreciationNuaTaxCalculator } from './finance/net-unrealized-appreciation-nua-tax-calculator/NetUnrealizedAppreciationNUATaxCalculator';
+import { PensionLumpSumVsAnnuityCalculator } from './finance/pension-lump-sum-vs-annuity-calculator/PensionLumpSumVsAnnuityCalculator';
+import { PensionPlanFundingCalculator } from './finance/pension-plan-funding-calculator/PensionPlanFundingCalculator';
+import { PlannedGivingCalculator } from './finance/planned-giving-calculator/PlannedGivingCalculator';
+import { RetirementCalculator } from './finance/retirement-calculator/RetirementCalculator';
+import { RetirementSavingsCalculator } from './finance/retirement-savings-calculator/RetirementSavingsCalculator';
+import { RothConversionTaxCalculator } from './finance/roth-conversion-tax-calculator/RothConversionTaxCalculator';
+import { SavingsGoalCalculator } from './finance/savings-goal-calculator/SavingsGoalCalculator';
+import { AccretiondilutionMaModelCalculator } from './finance/accretiondilution-ma-model/AccretiondilutionMaModel';
+import { AlphaBetaCalculator } from './finance/alpha-beta-calculator/AlphaBetaCalculator';
+import { AlphaCalculator } from './finance/alpha-calculator/AlphaCalculator';
+import { AngelInvestmentDilutionCalculator } from './finance/angel-investment-dilution-calculator/AngelInvestmentDilutionCalculator';
+import { AdjustablerateMortgageArmCalculator } from './finance/adjustable-rate-mortgage-arm-calculator/AdjustablerateMortgageArmCalculator';
+import { ArmVsFixedMortgageCalculator } from './finance/arm-vs-fixed-mortgage-calculator/ArmVsFixedMortgageCalculator';
+import { LoanToCostLtcRatioCalculator } from './finance/loan-to-cost-ltc-ratio-calculator/LoanToCostLtcRatioCalculator';
+import { LoantovalueLtvRatioCalculator } from './finance/loan-to-value-ltv-ratio-calculator/LoantovalueLtvRatioCalculator';
+import { UsdaLoanCalculator } from './finance/usda-loan-calculator/USDALoanCalculator';
+import { VaLoanCalculator } from './finance/va-loan-calculator/VaLoanCalculator';
+import { WindstormInsuranceCalculator } from './finance/windstorm-insurance-calculator/WindstormInsuranceCalculator';
+import { RetirementPlanningCalculator } from './finance/retirement-planning-calculator/RetirementPlanningCalculator';
+import { TradeCreditInsuranceRoiCalculator } from './finance/trade-credit-insurance-roi-calculator/TradeCreditInsuranceRoiCalculator';
+import { TravelInsuranceCalculator } from './finance/travel-insurance-calculator/TravelInsuranceCalculator';
+import { UmbrellaInsuranceCalculator } from './finance/umbrella-insurance-coverage-calculator/UmbrellaInsuranceCoverageCalculator';
+import { UmbrellaInsuranceCoverageCalculator } from './finance/umbrella-insurance-coverage-calculator/UmbrellaInsuranceCoverageCalculator';
+import { WorkersCompensationInsuranceCalculator } from './finance/workers-compensation-insurance-calculator/WorkersCompensationInsuranceCalculator';
+import { CropInsurancePremiumCalculator } from './finance/crop-insurance-premium-calculator/CropInsurancePremiumCalculator';
+import { BoardGameInvestmentCalculator } from './finance/board-game-investment-calculator/BoardGameInvestmentCalculator';
+import { FilmProductionInvestmentRoiCalculator } from './finance/film-production-investment-roi-calculator/FilmProductionInvestmentRoiCalculator';
+import { FineArtInvestmentRoiCalculator } from './finance/fine-art-investment-roi-calculator/FineArtInvestmentRoiCalculator';
+import { StudentLoanPortfolioRiskCalculator } from './finance/student-loan-portfolio-risk-calculator/StudentLoanPortfolioRiskCalculator';
+
+export const calculatorManifest: CalculatorManifestEntry[] = [
+  ...financeCalculators,
+  ...businessCalculators,
+];
+
+/**
+ * Make every calculator listable and searchable without loading its module;
+ * the ones the manifest cannot describe are registered eagerly
+ */
+export function registerCalculatorManifest(): void {
+  calculatorManifest.forEach(entry => calculatorRegistry.registerLazy(entry));
+  calculatorRegistry.register(registerEnterpriseValueCalculator);
+  calculatorRegistry.register(GiftTaxCalculator);
+  calculatorRegistry.register(asset_protection_calculator);
+  calculatorRegistry.register(ad_reach_and_frequency_calculator);
+  calculatorRegistry.register(registerGpuMiningProfitabilityCalculator);
+  calculatorRegistry.register(generationSkippingTransferGstTaxCalculator);
+  calculatorRegistry.register(healthSavingsAccountHsaCalculator);
+  calculatorRegistry.register(grantorRetainedAnnuityTrustGratCalculator);
+  calculatorRegistry.register(fourZeroOneKCalculator);
+  calculatorRegistry.register(FafsaCalculator);
+  calculatorRegistry.register(FixedIndexAnnuityCalculator);
+  calculatorRegistry.register(FlexibleSpendingAccountCalculator);
+  calculatorRegistry.register(GenerationskippingTransferGstTaxCalculator);
+  calculatorRegistry.register(GrantorRetainedAnnuityTrustGratCalculator);
+  calculatorRegistry.register(HealthSavingsAccountHsaCalculator);
+  calculatorRegistry.register(HsaTripleTaxAdvantageCalculator);
+  calculatorRegistry.register(ImmediateAnnuityPayoutCalculator);
+  calculatorRegistry.register(InheritanceTaxEstimatorCalculator);
+  calculatorRegistry.register(IraCalculator);
+  calculatorRegistry.register(IrrevocableLifeInsuranceTrustIlitValueCalculator);
+  calculatorRegistry.register(LifeSettlementValueCalculator);
+  calculatorRegistry.register(MegaBackdoorRothCalculator);
+  calculatorRegistry.register(NetUnrealizedAppreciationNuaTaxCalculator);
+  calculatorRegistry.register(PensionLumpSumVsAnnuityCalculator);
+  calculatorRegistry.register(PensionPlanFundingCalculator);
+  calculatorRegistry.register(PlannedGivingCalculator);
+  calculatorRegistry.register(RetirementCalculator);
+  calculatorRegistry.register(RetirementSavingsCalculator);
+  calculatorRegistry.register(RothConversionTaxCalculator);
+  calculatorRegistry.register(SavingsGoalCalculator);
+  calculatorRegistry.register(AccretiondilutionMaModelCalculator);
+  calculatorRegistry.register(AlphaBetaCalculator);
+  calculatorRegistry.register(AlphaCalculator);
+  calculatorRegistry.register(AngelInvestmentDilutionCalculator);
+  calculatorRegistry.register(AdjustablerateMortgageArmCalculator);
+  calculatorRegistry.register(ArmVsFixedMortgageCalculator);
+  calculatorRegistry.register(LoanToCostLtcRatioCalculator);
+  calculatorRegistry.register(LoantovalueLtvRatioCalculator);
+  calculatorRegistry.register(UsdaLoanCalculator);
+  calculatorRegistry.register(VaLoanCalculator);
+  calculatorRegistry.register(WindstormInsuranceCalculator);
+  calculatorRegistry.register(RetirementPlanningCalculator);
+  calculatorRegistry.register(TradeCreditInsuranceRoiCalculator);
+  calculatorRegistry.register(TravelInsuranceCalculator);
+  calculatorRegistry.register(UmbrellaInsuranceCalculator);
+  calculatorRegistry.register(UmbrellaInsuranceCoverageCalculator);
+  calculatorRegistry.register(WorkersCompensationInsuranceCalculator);
+  calculatorRegistry.register(CropInsurancePremiumCalculator);
+  calculatorRegistry.register(BoardGameInvestmentCalculator);
+  calculatorRegistry.register(FilmProductionInvestmentRoiCalculator);
+  calculatorRegistry.register(FineArtInvestmentRoiCalculator);
+  calculatorRegistry.register(StudentLoanPortfolioRiskCalculator);
+}
+
+registerCalculatorManifest();
@@ -5,7 +5,7 @@ import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { Separator } from '@/components/ui/separator';
 import { Search, ArrowLeft, Calculator as CalculatorIcon } from 'lucide-react';
-import { Calculator, CalculatorCategory } from '../../types/calculator';
+import { CalculatorCategory, CalculatorSummary } from '../../types/calculator';
 import { calculatorRegistry } from '../../data/calculatorRegistry';
 import { getCategoryInfo } from '../../constants/categories';
 
@@ -26,7 +26,7 @@ export function CalculatorList({
   const [selectedSubcategory, setSelectedSubcategory] = useState<string | null>(null);
 
   const categoryInfo = getCategoryInfo(category);
-  const allCalculators = calculatorRegistry.getCalculatorsByCategory(category);
+  const allCalculators = calculatorRegistry.getCalculatorSummaries(category);
   const subcategories = calculatorRegistry.getSubcategories(category);
 
   // Filter calculators based on search and subcategory
@@ -48,9 +48,9 @@ export function CalculatorList({
         if (!groups[subcat]) groups[subcat] = [];
         groups[subcat].push(calc);
         return groups;
-      }, {} as Record<string, Calculator[]>);
+      }, {} as Record<string, CalculatorSummary[]>);
 
-  const renderCalculatorCard = (calculator: Calculator) => (
+  const renderCalculatorCard = (calculator: CalculatorSummary) => (
     <Card 
       key={calculator.id}
       className="group hover:shadow-md transition-all duration-200 cursor-pointer border hover:border-primary/30"
@@ -82,7 +82,7 @@ export function CalculatorList({
         </div>
         
         {/* Usage instructions preview */}
-        {calculator.usageInstructions.length > 0 && (
+        {calculator.usageInstructions && calculator.usageInstructions.length > 0 && (
           <div className="mt-2">
             <p className="text-xs text-muted-foreground">
               {calculator.usageInstructions[0]}
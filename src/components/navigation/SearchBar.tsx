@@ -4,7 +4,7 @@ import { Button } from '@/components/ui/button';
 import { Card, CardContent } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
 import { Search, X, Calculator as CalculatorIcon } from 'lucide-react';
-import { Calculator } from '../../types/calculator';
+import { CalculatorSummary } from '../../types/calculator';
 import { calculatorRegistry } from '../../data/calculatorRegistry';
 import { getCategoryColor, getCategoryTitle } from '../../constants/categories';
 
@@ -20,7 +20,7 @@ export function SearchBar({
   className 
 }: SearchBarProps) {
   const [query, setQuery] = useState('');
-  const [results, setResults] = useState<Calculator[]>([]);
+  const [results, setResults] = useState<CalculatorSummary[]>([]);
   const [isOpen, setIsOpen] = useState(false);
   const [selectedIndex, setSelectedIndex] = useState(-1);
   const searchRef = useRef<HTMLDivElement>(null);
@@ -29,7 +29,7 @@ export function SearchBar({
   // Search functionality
   useEffect(() => {
     if (query.trim().length > 0) {
-      const searchResults = calculatorRegistry.searchCalculators(query);
+      const searchResults = calculatorRegistry.searchCalculatorSummaries(query);
       setResults(searchResults.slice(0, 8)); // Limit to 8 results
       setIsOpen(true);
       setSelectedIndex(-1);
@@ -1,4 +1,4 @@
-import React, { createContext, useContext, useReducer, ReactNode } from 'react';
+import React, { createContext, useContext, useReducer, useRef, ReactNode } from 'react';
 import { Calculator, ValidationResult, CalculationResult } from '../types/calculator';
 import { CalculatorEngine } from '../engines/CalculatorEngine';
 import { ValidationEngine } from '../engines/ValidationEngine';
@@ -17,11 +17,13 @@ interface CalculatorState {
   isValidating: boolean;
   lastCalculation: CalculationResult | null;
   history: CalculationResult[];
+  loadError: string | null;
 }
 
 // Calculator actions
 type CalculatorAction =
   | { type: 'SET_CALCULATOR'; payload: Calculator }
+  | { type: 'SET_LOAD_ERROR'; payload: string }
   | { type: 'UPDATE_INPUT'; payload: { field: string; value: any } }
   | { type: 'UPDATE_INPUTS'; payload: Record<string, any> }
   | { type: 'SET_VALIDATION'; payload: ValidationResult & { warnings?: Record<string, string>; suggestions?: Record<string, string> } }
@@ -41,7 +43,8 @@ const initialState: CalculatorState = {
   isCalculating: false,
   isValidating: false,
   lastCalculation: null,
-  history: []
+  history: [],
+  loadError: null
 };
 
 // Reducer function
@@ -57,6 +60,12 @@ function calculatorReducer(state: CalculatorState, action: CalculatorAction): Ca
         }, {} as Record<string, any>)
       };
 
+    case 'SET_LOAD_ERROR':
+      return {
+        ...initialState,
+        loadError: action.payload
+      };
+
     case 'UPDATE_INPUT':
       return {
         ...state,
@@ -165,16 +174,29 @@ export function CalculatorProvider({ children }: CalculatorProviderProps) {
   const [state, dispatch] = useReducer(calculatorReducer, initialState);
   const engine = new CalculatorEngine();
   const validationEngine = new ValidationEngine();
+  // Bumped on every selection so a slower, earlier load cannot overwrite a later one
+  const latestRequest = useRef(0);
 
   // Calculator management functions
   const setCalculator = (calculatorId: string) => {
-    const calculator = calculatorRegistry.getCalculator(calculatorId);
-    if (calculator) {
-      dispatch({ type: 'SET_CALCULATOR', payload: calculator });
-    }
+    const request = ++latestRequest.current;
+
+    // Lazily registered calculators are imported on first use
+    calculatorRegistry.loadCalculator(calculatorId)
+      .then(calculator => {
+        if (request === latestRequest.current && calculator) {
+          dispatch({ type: 'SET_CALCULATOR', payload: calculator });
+        }
+      })
+      .catch(error => {
+        if (request !== latestRequest.current) return;
+        console.error(`Failed to load calculator ${calculatorId}:`, error);
+        dispatch({ type: 'SET_LOAD_ERROR', payload: `Failed to load calculator ${calculatorId}` });
+      });
   };
 
   const clearCalculator = () => {
+    latestRequest.current++;
     dispatch({ type: 'CLEAR_CALCULATOR' });
   };
 
@@ -0,0 +1,10 @@
+// Generated by classify_calculator_cost.py from formulas.ts loop analysis - do not edit
+export type CalculatorCostClass = 'cheap' | 'memoize' | 'worker';
+
+// Calculators whose formulas are not cheap, by calculator id; every other calculator is 'cheap'
+export const calculatorCostClasses: Record<string, CalculatorCostClass> = {
+  "BlackLittermanCalculator": "memoize",
+  "BondYieldCalculator": "memoize",
+  "CorporateBondCalculator": "memoize",
+  "CostOfDebtCalculator": "memoize",
+};
@@ -1,4 +1,7 @@
-import { Calculator, CalculatorCategory } from '../types/calculator';
+import { Calculator, CalculatorCategory, CalculatorManifestEntry, CalculatorSummary } from '../types/calculator';
+import { CalculatorSearchIndex } from './calculatorSearchIndex';
+import { calculatorSearchIndexData } from './calculatorSearchIndex.generated';
+import { lookupTablesReady } from '../lib/lookupTables';
 
 /**
  * Central registry for all calculators on the platform
@@ -7,6 +10,10 @@ import { Calculator, CalculatorCategory } from '../types/calculator';
 export class CalculatorRegistry {
   private calculators: Map<string, Calculator> = new Map();
   private categorizedCalculators: Map<CalculatorCategory, Calculator[]> = new Map();
+  private lazyCalculators: Map<string, CalculatorManifestEntry> = new Map();
+  private modulePaths: Map<string, string> = new Map();
+  private searchIndex = new CalculatorSearchIndex(calculatorSearchIndexData);
+  private unindexedIds: Set<string> = new Set();
 
   constructor() {
     this.initializeCategories();
@@ -40,12 +47,107 @@ export class CalculatorRegistry {
       return;
     }
     this.calculators.set(calculator.id, calculator);
+    this.lazyCalculators.delete(calculator.id);
+    this.trackUnindexed(calculator.id);
 
     const categoryCalculators = this.categorizedCalculators.get(calculator.category) || [];
     categoryCalculators.push(calculator);
     this.categorizedCalculators.set(calculator.category, categoryCalculators);
   }
 
+  /**
+   * Register a calculator by its manifest entry; its module is only imported by loadCalculator
+   */
+  registerLazy(entry: CalculatorManifestEntry): void {
+    if (this.calculators.has(entry.id)) return;
+    this.lazyCalculators.set(entry.id, entry);
+    this.modulePaths.set(entry.id, entry.modulePath);
+    this.trackUnindexed(entry.id);
+  }
+
+  /**
+   * Remember calculators the prebuilt search index does not cover; search scans only those
+   */
+  private trackUnindexed(id: string): void {
+    if (!this.searchIndex.has(id)) {
+      this.unindexedIds.add(id);
+    }
+  }
+
+  /**
+   * Whether a calculator's searchable text contains a lowercase search term
+   */
+  private matchesSearch(calc: CalculatorSummary, searchTerm: string): boolean {
+    return calc.title.toLowerCase().includes(searchTerm) ||
+      calc.description.toLowerCase().includes(searchTerm) ||
+      calc.category.toLowerCase().includes(searchTerm) ||
+      !!calc.subcategory?.toLowerCase().includes(searchTerm);
+  }
+
+  /**
+   * Search through the prebuilt index, then scan the calculators it does not cover
+   */
+  private search<T extends CalculatorSummary>(query: string, lookup: (id: string) => T | undefined): T[] {
+    const searchTerm = query.toLowerCase();
+    const results: T[] = [];
+
+    // The index narrows and orders the candidates; every result is still a substring match
+    for (const id of this.searchIndex.candidates(searchTerm)) {
+      const calc = lookup(id);
+      if (calc && this.matchesSearch(calc, searchTerm)) {
+        results.push(calc);
+      }
+    }
+    this.unindexedIds.forEach(id => {
+      const calc = lookup(id);
+      if (calc && this.matchesSearch(calc, searchTerm)) {
+        results.push(calc);
+      }
+    });
+    return results;
+  }
+
+  /**
+   * Get a calculator by ID, importing its module first if it was registered lazily.
+   * Resolves only once the lookup tables its module uses (extract_lookup_tables.py) are filled.
+   */
+  async loadCalculator(id: string): Promise<Calculator | undefined> {
+    const modulePath = this.modulePaths.get(id);
+    const loaded = this.calculators.get(id);
+    const entry = this.lazyCalculators.get(id);
+    if (!loaded && !entry) return undefined;
+
+    try {
+      const calculator = loaded ?? await entry!.load();
+      if (modulePath !== undefined) {
+        await lookupTablesReady(modulePath);
+      }
+      if (!loaded) {
+        this.register(calculator);
+      }
+      return calculator;
+    } catch (error) {
+      console.error(`CalculatorRegistry: Failed to load calculator ${id}`, error);
+      return undefined;
+    }
+  }
+
+  /**
+   * Listing metadata for loaded and lazily registered calculators, optionally in one category
+   */
+  getCalculatorSummaries(category?: CalculatorCategory): CalculatorSummary[] {
+    const loaded: CalculatorSummary[] = category ? this.getCalculatorsByCategory(category) : this.getAllCalculators();
+    const lazy = Array.from(this.lazyCalculators.values()).filter(entry => !category || entry.category === category);
+    return [...loaded, ...lazy];
+  }
+
+  /**
+   * Search loaded and lazily registered calculators without loading any module
+   */
+  searchCalculatorSummaries(query: string): CalculatorSummary[] {
+    return this.search<CalculatorSummary>(query, id => this.calculators.get(id) || this.lazyCalculators.get(id));
+  }
+
   /**
    * Get a calculator by ID
    */
@@ -71,13 +173,7 @@ export class CalculatorRegistry {
    * Search calculators by title or description
    */
   searchCalculators(query: string): Calculator[] {
-    const searchTerm = query.toLowerCase();
-    return this.getAllCalculators().filter(calc => 
-      calc.title.toLowerCase().includes(searchTerm) ||
-      calc.description.toLowerCase().includes(searchTerm) ||
-      calc.category.toLowerCase().includes(searchTerm) ||
-      calc.subcategory?.toLowerCase().includes(searchTerm)
-    );
+    return this.search(query, id => this.calculators.get(id));
   }
 
   /**
@@ -93,7 +189,7 @@ export class CalculatorRegistry {
    * Get all subcategories for a category
    */
   getSubcategories(category: CalculatorCategory): string[] {
-    const calculators = this.getCalculatorsByCategory(category);
+    const calculators = this.getCalculatorSummaries(category);
     const subcategories = new Set<string>();
     
     calculators.forEach(calc => {
@@ -109,27 +205,30 @@ export class CalculatorRegistry {
    * Get calculator count by category
    */
   getCategoryCount(category: CalculatorCategory): number {
-    return this.getCalculatorsByCategory(category).length;
+    return this.getCalculatorSummaries(category).length;
   }
 
   /**
    * Get total calculator count
    */
   getTotalCount(): number {
-    return this.calculators.size;
+    return this.calculators.size + this.lazyCalculators.size;
   }
 
   /**
    * Check if a calculator exists
    */
   hasCalculator(id: string): boolean {
-    return this.calculators.has(id);
+    return this.calculators.has(id) || this.lazyCalculators.has(id);
   }
 
   /**
    * Remove a calculator
    */
   unregister(id: string): boolean {
+    this.unindexedIds.delete(id);
+    if (this.lazyCalculators.delete(id)) return true;
+
     const calculator = this.calculators.get(id);
     if (!calculator) return false;
 
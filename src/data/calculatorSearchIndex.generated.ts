@@ -0,0 +1,4 @@
+// Generated by build_search_index.py from the calculator manifest - do not edit
+import { CalculatorSearchIndexData } from './calculatorSearchIndex';
+
+export const calculatorSearchIndexData: CalculatorSearchIndexData = {"version":1,"ids":["CarLoanCalculator","MortgageAprComparisonCalculator","MortgageClosingCostCalculator","MortgageEquityCalculator","MortgageInsuranceCalculator","MortgageLifeCalculator","MortgagePaymentCalculator","MortgagePointsCalculator","MortgageQualificationCalculator","MortgageRateLockCalculator","MortgageRefinanceCalculator","MortgageVsRentCalculator","NetOperatingIncomeNoiCalculator","OpportunityZoneInvestmentRoiCalculator","PmiCancellationCalculator","PricePerSquareFootCalculator","PrivateMortgageInsuranceCalculator","PropertyTaxCalculator","PropertyTaxProrationCalculator","adagencycommission-calculator","aipromptcost-calculator","algebra-calculator","alimonyspousalsupport-calculator","alpha-calculator","amortization-calculator","annuitybuyout-calculator","aptvalue-calculator","autoloan-calculator","automotive-calculator","beta-calculator","bmr-calculator","calculus-calculator","calorie-calculator","carpayment-calculator","childsupport-calculator","complexnumber-calculator","comprehensivemortgage-calculator","concrete-calculator","cooking-calculator","corporatebond-calculator","correlation-calculator","costofdebt-calculator","costofequity-calculator","creditdefaultswap-calculator","creditutilization-calculator","currentratio-calculator","customeracquisitioncost-calculator","debtavalanche-calculator","debtconsolidationloan-calculator","debtpayoff-calculator","debtsnowball-calculator","dividend-calculator","dtiratio-calculator","ebitda-calculator","enterprisevalue-calculator","equityvaluation-calculator","estateplanning-calculator","estatetaxliability-calculator","everyday-calculator","executivedeferredcompensation-calculator","expectedshortfall-calculator","fafsa-calculator","fixedindexannuity-calculator","flexiblespendingaccount-calculator","fourzeroonekcompanymatchroi-calculator","geometry-calculator","heloc-calculator","hobbies-calculator","hsatripletaxadvantage-calculator","immediateannuitypayout-calculator","investment-calculator","irrevocablelifeinsurancetrustilitvalue-calculator","lifesettlementvalue-calculator","marketingroi-calculator","matrix-calculator","megabackdoorroth-calculator","mortgage-calculator","mortgagerefinance-calculator","netunrealizedappreciationnuatax-calculator","paycheck-calculator","pensionlumpsumvsannuity-calculator","pensionplanfunding-calculator","personalinjury-calculator","personalloan-calculator","plannedgiving-calculator","probability-calculator","propertytaxproration-calculator","realestatedepreciationschedule-calculator","realestatedevelopmentproforma-calculator","realestatesyndication-calculator","realestatetaxdeductions-calculator","realestatewaterfallmodel-calculator","refinance-calculator","registeralimonyspousalsupport-calculator","registerannuitybuyout-calculator","registeraptvalue-calculator","registerautoloan-calculator","registerbeta-calculator","registercalorie-calculator","registercarloan-calculator","registercarpayment-calculator","registercomprehensivemortgage-calculator","registercorporatebond-calculator","registercorrelation-calculator","registercostofdebt-calculator","registercostofequity-calculator","registercreditcardpayoff-calculator","registercreditdefaultswap-calculator","registercreditutilization-calculator","registercurrentratio-calculator","registerdebtconsolidation-calculator","registerdebtconsolidationloan-calculator","registerdebtpayoff-calculator","registerdebtsnowball-calculator","registerdividend-calculator","registerdtiratio-calculator","registerebitda-calculator","registerequityvaluation-calculator","registerestateplanning-calculator","registerestatetaxliability-calculator","registerexecutivedeferredcompensation-calculator","registerexpectedshortfall-calculator","registerfafsa-calculator","registerfixedindexannuity-calculator","registerflexiblespendingaccount-calculator","registerfourzeroonek-calculator","registergenerationskippingtransfergsttax-calculator","registergifttax-calculator","registergrantorretainedannuitytrustgrat-calculator","registerhealthsavingsaccounthsa-calculator","registerhsatripletaxadvantage-calculator","registerimmediateannuitypayout-calculator","registerinvestment-calculator","registerira-calculator","registerirrevocablelifeinsurancetrustilitvalue-calculator","registerlifesettlementvalue-calculator","registermarketingroi-calculator","registermegabackdoorroth-calculator","registernetunrealizedappreciationnuatax-calculator","registerpensionlumpsumvsannuity-calculator","registerpensionplanfunding-calculator","registerpersonalloan-calculator","registerplannedgiving-calculator","registerrealestatedepreciationschedule-calculator","registerrealestatedevelopmentproforma-calculator","registerrealestatesyndication-calculator","registerrealestatetaxdeductions-calculator","registerrealestatewaterfallmodel-calculator","registerrentalpropertyroi-calculator","registerrentalyield-calculator","registerrentersinsurance-calculator","registerrentvsbuy-calculator","registerrequiredbeginningdatermd-calculator","registerrequiredminimumdistributionrmd-calculator","registerretirement-calculator","registerreversemortgage-calculator","registerrothconversiontax-calculator","registerrothira-calculator","registersavingsgoal-calculator","registerselfstoragefacilityroi-calculator","registersepira-calculator","registersimpleira-calculator","registersocialsecurityoptimization-calculator","registerstretchira-calculator","registerstructuredsettlementpayout-calculator","registerstudentloanforgiveness-calculator","registerstudentloanrefinancing-calculator","registerstudentloanrepayment-calculator","registertenantimprovementallowance-calculator","registertimberlandinvestment-calculator","registertitleinsurance-calculator","registerusdaloan-calculator","rentalpropertyroi-calculator","rentalyield-calculator","rentersinsurance-calculator","rentvsbuy-calculator","requiredbeginningdatermd-calculator","requiredminimumdistributionrmd-calculator","retirement-calculator","reversemortgage-calculator","roi-calculator","rothconversiontax-calculator","rothira-calculator","saasmetrics-calculator","savingsgoal-calculator","scientific-calculator","selfstoragefacilityroi-calculator","sepira-calculator","simpleira-calculator","socialsecurityoptimization-calculator","statistics-calculator","stretchira-calculator","structuredsettlementpayout-calculator","studentloanforgiveness-calculator","studentloanrefinancing-calculator","studentloanrepayment-calculator","tax-calculator","taxlossharvesting-calculator","tenantimprovementallowance-calculator","timberlandinvestment-calculator","titleinsurance-calculator","AiPromptCost-TokenEstimatorCalculator","AttributionModelsCalculator","TripleNetNnn-LeaseRoiCalculator-calculator","VineyardProfitabilityCalculator-calculator"],"maxPrefixLength":4,"trigrams":{" & ":[0,1,2,3,4,5,6,7,8,9,10,11,14,16,17,18,201]," (m":[4]," (n":[12,203]," (p":[4,14,16]," a ":[2,11]," ac":[1,17,18]," ad":[18,19]," ai":[20]," al":[2,6,9,16,21,22,23]," am":[6,8,24]," an":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,25,201,203,204]," ap":[1,17,26]," ar":[1,6]," as":[2,3,4,8,9,12,17]," at":[202]," au":[0,14,27,28]," ba":[8,13]," be":[1,7,11,13,29]," bm":[30]," br":[7,9,10,11,14]," bu":[11,15]," ca":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204]," ch":[34]," cl":[2,18]," co":[0,1,2,4,6,7,9,10,11,12,13,14,15,16,17,18,35,36,37,38,39,40,41,42,201]," cr":[8,43,44]," cu":[3,45,46]," de":[2,8,13,15,47,48,49,50,201,203,204]," di":[0,1,7,51]," do":[201,203,204]," dt":[52]," eb":[53]," el":[14]," en":[54]," eq":[3,11,55]," es":[1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,56,57,201]," ev":[10,17,58]," ex":[17,59,60]," fa":[61]," fe":[2]," fh":[1,6,16]," fi":[0,1,11,13,62]," fl":[3,10,12,63]," fo":[0,3,6,10,12,13,15,16,18,64]," fu":[17]," ga":[13]," ge":[8,65]," gr":[3]," he":[66]," ho":[4,11,14,67]," hs":[68]," im":[5,8,11,16,69]," in":[0,1,2,3,4,5,6,7,8,11,12,13,14,15,16,18,70]," ir":[71]," it":[2,201,203,204]," le":[2,14,203]," li":[5,72]," lo":[0,1,5,6,9,11,16]," ma":[15,73,74,202]," me":[12,15,75]," mo":[1,2,3,4,5,6,7,8,9,10,14,16,76,77,202]," ne":[12,78,203]," ob":[17]," of":[7,11,201,203,204]," on":[7,8]," op":[1,9,10,12,13,14,16,17]," or":[10]," ov":[3,5]," pa":[0,5,6,79]," pe":[9,15,80,81,82,83]," pl":[84,202]," po":[3,7,9]," pr":[2,3,4,8,10,12,14,15,16,17,18,85,86,201,204]," pu":[7,201,203,204]," qu":[8]," ra":[0,1,9,10,12]," re":[1,2,3,4,5,6,7,8,9,10,11,14,15,16,17,18,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179]," ri":[3,4,9,12]," ro":[7,13,180,181,182,203]," sa":[183,184]," sc":[5,6,185]," se":[15,18,186,187]," si":[188]," so":[189]," sq":[15]," st":[8,13,18,190,191,192,193,194,195]," su":[5,6]," ta":[13,16,17,18,196,197]," te":[0,198]," th":[1,2,7,11,201,203,204]," ti":[3,5,9,199,200]," to":[0,1,9,14,201]," tr":[0,13,18]," ty":[1,6]," us":[16]," va":[1,6,12,15,16,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200]," ve":[11]," vs":[11]," wh":[14,201,203,204]," wi":[0,2,4,6,10,12,13,17]," yo":[5,7]," zo":[13],"& r":[1,2,3,4,5,6,7,8,9,10,11,14,16,17,18],"& t":[0,201],"(mi":[4],"(nn":[203],"(no":[12],"(pm":[4,14,16],") c":[12,16],") l":[203],"), ":[4,14],", a":[0,1,2,3,4,5,6,8,9,10,11,12,13,14,15,16,17,18],", b":[14],", c":[8,9,10,12,16],", e":[5,11,17],", f":[1,6],", i":[7,11,13,14,15,18],", l":[14],", m":[4],", p":[2,3],", s":[5,13,15,18],", t":[0,2,16],", v":[1,6,16],"-an":[10],"-be":[10,14],"-ev":[9,10,11,14],"-ou":[10],"-pa":[2],"-pr":[12],"-qu":[8],"-ra":[1],"-sp":[18],"-te":[10,11],"-up":[13],". g":[8],"a c":[21,23,29,53,61,88,97,116,122,129,133,144,157,160,161,163,182,187,188,191],"a h":[11],"a l":[16],"a m":[2],"a v":[21,23,29,53,61,88,97,116,122,129,133,144,157,160,161,163,182,187,188,191],"a, ":[1,6,16],"aas":[183],"aba":[75,137],"abi":[57,85,119,204],"abl":[71,134],"acc":[17,18,63,124,129],"aci":[159,186],"ack":[13,75,137],"acq":[46],"acr":[1],"act":[5,18],"acy":[17],"ada":[19],"adj":[18],"adv":[68,130],"afs":[61,122],"age":[1,2,3,4,5,6,7,8,9,10,11,14,16,17,18,19,36,68,76,77,101,130,155,159,179,186],"ai ":[201],"aid":[2],"ain":[13,128],"aip":[20],"ak-":[9,10,11,14],"ake":[7],"al ":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,158,184,202],"al,":[13,16],"ala":[47],"alc":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204],"ale":[87,88,89,90,91,143,144,145,146,147],"alg":[21],"ali":[8,22,78,82,93,138],"all":[2,6,50,60,83,91,113,121,141,147,168,198],"alo":[32,98,171],"alp":[23,148,172],"als":[22,93,162,189],"alt":[9,16,129],"alu":[10,12,15,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200],"aly":[3,4,5,6,7,9,10,11,12,13,14,15,16,17,18,149,173],"am ":[17],"amo":[6,8,24],"an ":[0,5,6,27,48,83,96,99,111,141,171],"ana":[3,4,5,6,7,9,10,11,12,13,14,15,16,17,18],"anc":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,202],"and":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,169,199,201,203,204],"anf":[81,140,165,193],"ann":[25,56,62,69,80,84,94,118,123,128,131,139,142,202],"anr":[166,167,194,195],"ans":[0,1,6,16,18,126],"ant":[68,128,130,168,198],"any":[64],"ap ":[12,43,107],"api":[13],"app":[17,78,138],"apr":[1],"apt":[26,95],"ar ":[0],"ard":[106,204],"are":[1,9,11,15],"ari":[1,5,14,15],"ark":[15,73,136,202],"arl":[99],"arm":[1,6],"arp":[33,100],"art":[2],"arv":[197],"ase":[8,203],"ash":[3,10,12],"asi":[7,13],"asm":[183],"ass":[2,3,4,8,9,12,17],"at ":[128,201,203,204],"ata":[78,138],"atc":[64],"ate":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,202],"ati":[0,5,6,7,8,9,10,11,12,14,15,16,17,18,24,40,44,45,48,52,55,59,78,86,87,89,103,108,109,110,111,115,117,120,126,138,143,145,162,189,190],"ato":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204],"atr":[68,74,130],"att":[202],"aul":[43,107],"aut":[0,14,27,28,96],"ava":[47],"avi":[129,158,184],"ax ":[13,16,17,18,78,126,127,138,156,181,196],"axa":[68,130],"axd":[90,146],"axe":[17],"axl":[57,119,197],"axp":[86],"ay ":[58],"ayc":[79],"aym":[0,6,33,100,167,195],"ayo":[5,49,69,106,112,131,164,192],"bab":[85],"bac":[75,137],"bal":[50,113],"bas":[8,13],"bbi":[67],"beg":[152,176],"ben":[7,10,11,13,14],"ber":[35,169,199],"bes":[1],"bet":[29,97],"bie":[67],"bil":[14,57,85,119,204],"bit":[53,116],"ble":[63,71,124,134],"bli":[17],"bmr":[30],"bon":[39,102],"bra":[21],"bre":[7,9,10,11,14],"bri":[201,203,204],"bt ":[41,104],"bta":[47],"btc":[48,110,111],"btp":[49,112],"bts":[8,50,113],"bui":[11],"bus":[201,202,203,204],"but":[153,177,202],"buy":[11,15,25,94,151,175],"c c":[14,66,185],"c r":[18],"c v":[66,185],"cab":[71,134],"cal":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204],"can":[14,16],"cap":[12,13],"car":[0,33,99,100,106],"cas":[3,10,12],"cat":[5,8,11,16,89,145],"cco":[63,124,129],"ccu":[17,18],"ce ":[4,5,10,13,14,15,16,77,92,150,168,170,174,198,200],"cel":[14,16],"cen":[5],"ces":[10],"cet":[71,134],"cha":[7],"che":[6,47,79,87,143],"chi":[34,163,191],"chr":[64],"cia":[2,11,13,78,87,138,143,162,189,202],"cie":[185],"cif":[18],"cil":[159,186],"cin":[0,1,12,16,166,194],"cis":[15],"ck ":[9,79],"ckd":[75,137],"cki":[13],"clo":[2,18],"clu":[1,2,5,6,7,11,13,14,15,18],"com":[1,5,6,8,9,10,11,12,13,14,15,17,19,35,36,59,64,101,120],"con":[1,6,16,37,48,110,111,156,181],"coo":[38],"cor":[39,40,102,103],"cos":[0,2,4,7,9,10,11,14,16,18,20,41,42,46,104,105,201],"cou":[7,63,124,129],"cov":[4],"cqu":[46],"cre":[8,37,43,44,106,107,108],"cri":[201,203,204],"cro":[1,2,18],"cs ":[12,15,183,190],"ct ":[3,17],"ct,":[5],"cte":[60,121],"cti":[10,18,90,146],"ctu":[164,192],"cul":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204],"cur":[3,17,18,45,109,162,189],"cus":[46],"cut":[59,120],"cy,":[17],"cyc":[19],"d a":[3,15,16],"d b":[7,11,15],"d c":[1,4,6,9,10,13,14,15,39,51,102,114,149,152,153,173,176,177],"d d":[8],"d e":[2],"d h":[4,14],"d i":[0,2,8,12,15,201,203,204],"d l":[5,11],"d o":[8],"d p":[17,204],"d r":[7,12,16,17],"d s":[18],"d t":[1,13],"d u":[16],"d v":[39,51,102,114,149,152,153,173,176,177],"d w":[2],"d-p":[2],"d-r":[1],"d-t":[10],"da ":[16,53,116],"dag":[19],"dal":[171],"dan":[128],"dap":[78,138],"dat":[5,48,110,111,152,176],"day":[58],"dbe":[152,176],"dco":[59,120],"deb":[8,41,47,48,49,50,104,110,111,112,113],"dec":[15],"ded":[90,146],"def":[13,43,59,107,120],"del":[91,147,202],"den":[51,114,165,166,167,193,194,195],"dep":[2,87,143],"der":[2,14],"des":[201,203,204],"det":[8],"dev":[88,144],"dex":[62,123],"dgi":[84,142],"dia":[69,131],"dic":[89,145],"dif":[0,1],"din":[1,2,5,6,7,11,13,14,15,18,62,63,81,123,124,140,169,199],"dis":[7,153,177],"dit":[8,43,44,106,107,108],"div":[51,114],"dju":[18],"dmi":[153,177],"doe":[201,203,204],"doo":[75,137],"dpa":[106],"ds ":[9],"dse":[164,192],"dsh":[60,121],"dsu":[34],"dti":[52,115],"duc":[12,90,146],"dul":[6,87,143],"dva":[68,130],"e &":[1,2,3,4,5,6,7,8,9,10,11,14,16,17,18],"e (":[4,12,14,16],"e a":[1,2,4,9,15,16,17,19,20,21,22,23,24,25,26,27,28],"e b":[1,9,29,30],"e c":[0,2,3,4,5,7,10,11,16,18,26,28,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,54,68,71,72,76,77,87,92,95,98,101,130,134,135,143,150,155,168,170,174,179,198,200],"e d":[47,48,49,50,51,52],"e e":[3,17,53,54,55,56,57,58,59,60],"e f":[13,15,61,62,63,64],"e g":[65],"e h":[66,67,68],"e i":[2,4,5,12,13,14,16,69,70,71],"e l":[5,9,72],"e m":[4,5,6,8,9,10,14,15,16,73,74,75,76,77,202],"e n":[12,78,203],"e o":[10],"e p":[3,4,6,7,15,16,17,18,79,80,81,82,83,84,85,86],"e q":[8],"e r":[5,9,10,13,15,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,203],"e s":[183,184,185,186,187,188,189,190,191,192,193,194,195],"e t":[1,7,9,11,13,17,18,196,197,198,199,200],"e v":[11,12,15,26,28,32,36,37,47,54,68,71,72,76,77,87,92,95,98,101,130,134,135,143,150,155,168,170,174,179,198,200],"e w":[14],"e, ":[1,3,7,8,12],"e-a":[10],"e-p":[12],"e-q":[8],"e-s":[18],"eak":[7,9,10,11,14],"eal":[1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,78,87,88,89,90,91,129,138,143,144,145,146,147],"ean":[69,131],"eas":[203],"ebi":[53,116],"ebo":[39,102],"ebr":[21],"ebt":[8,41,47,48,49,50,104,110,111,112,113],"eci":[15,18,78,87,138,143],"eck":[79],"eco":[5],"ect":[3,10,17,60,121],"ecu":[59,120,162,189],"ed ":[2,8,15],"ed-":[1],"eda":[78,128,138],"edb":[152,176],"edc":[59,120],"ede":[59,87,88,120,143,144],"edg":[84,142],"edi":[8,43,44,62,69,106,107,108,123,131],"edm":[153,177],"eds":[60,121,164,192],"edu":[6,87,90,143,146],"ees":[2],"ef ":[17,201,203,204],"efa":[43,107,159,186],"efe":[13,59,120],"efi":[7,10,11,13,14,16,77,92,166,194],"ega":[75,137],"egi":[8,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,176],"ehe":[6,10,12,13,15,17,36,101],"ein":[71,134,170,200],"eir":[161,188],"ek ":[125],"ekc":[64],"el ":[14,91,147],"ela":[40,103],"eld":[149,173],"elf":[159,186],"eli":[14,17,71,134],"ell":[14,15,16],"elo":[66,88,144],"els":[202],"eme":[8,18,72,135,154,164,168,178,192,198],"emi":[4],"emo":[36,101,155,179],"emp":[17],"ems":[2],"en ":[7,9,10,11,14,201],"ena":[5,168,198],"enc":[19],"end":[2,5,14,51,63,114,124],"ene":[7,10,11,13,14,126,165,193],"ens":[6,10,12,13,15,17,36,59,80,81,101,120,139,140],"ent":[0,1,3,4,6,8,11,12,13,15,16,17,18,33,45,54,70,72,88,100,109,132,135,144,148,149,150,151,154,164,165,166,167,168,169,172,173,174,175,178,185,192,193,194,195,198,199],"eom":[65],"eow":[4],"ep-":[13],"epa":[2,167,195],"epi":[160,187],"epl":[56,118],"epo":[2],"epr":[87,143],"equ":[3,11,18,42,55,105,117,152,153,176,177],"er ":[2,3,5,14,15,35],"era":[4,12,46,93,94,95,96,126],"erb":[97],"erc":[98,99,100,101,102,103,104,105,106,107,108,109],"erd":[110,111,112,113,114,115],"ere":[0,1,77,116,117,118,119,120,121],"erf":[91,122,123,124,125,147],"erg":[126,127,128],"erh":[129,130],"eri":[9,131,132,133,134],"erl":[135,169,199],"erm":[0,8,10,11,136,137,152,176],"ern":[9,16,138],"ero":[64,125],"erp":[54,139,140,141,142],"err":[13,59,120,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157],"ers":[4,11,82,83,141,150,155,156,158,159,160,161,162,163,164,165,166,167,174,179,181],"ert":[3,12,15,17,18,86,148,168,169,170,172],"eru":[171],"ery":[58],"es ":[1,6,12,15,16,67,201,203,204],"es,":[2,6,12,17],"es.":[0,3,8,10,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200],"esc":[2,18,201,203,204],"ese":[72,135],"esp":[63,124],"ess":[3,4,9,12,17,165,193,201,202,203,204],"est":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,56,57,70,87,88,89,90,91,118,119,132,143,144,145,146,147,169,197,199,201],"esy":[89,145],"et ":[8,12,15,203],"eta":[29,57,68,90,97,119,128,130,146],"etc":[163,191],"ete":[8,37],"eti":[5,73,136,154,178,202],"etr":[12,15,65,71,134,183],"ets":[8],"ett":[18,72,135,164,192],"etu":[78,138],"eva":[10,17,54],"eve":[7,9,10,11,14,58,88,144,155,179],"evo":[71,134],"ewa":[91,147],"exa":[62,123],"exe":[17,59,120],"exi":[63,124],"exn":[35],"exp":[60,121],"eya":[204],"f b":[11],"f c":[49,106,112],"f d":[201,203,204],"f p":[7,17],"f t":[5],"f v":[49,106,112],"f w":[201,203,204],"fac":[159,186],"faf":[61,122],"fal":[60,91,121,147],"fau":[43,107],"fde":[41,104],"fe ":[5],"fee":[2],"fei":[71,134],"feq":[42,105],"fer":[0,1,13,59,120,126],"fes":[72,135],"fet":[5],"ff ":[5,49,106,112],"ffe":[0,1],"fha":[1,6,16],"fic":[8,18,185],"fin":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,202],"fit":[7,10,11,13,14,204],"fix":[1,62,123],"fle":[63,124],"flo":[3,10,12],"foo":[15],"for":[0,3,6,10,12,13,15,16,18,88,144,165,193],"fou":[64,125],"fsa":[61,122],"fst":[159,186],"ftt":[127],"fun":[81,140],"fut":[17],"g a":[6,9,11,14,16,202],"g b":[7,11],"g c":[2,13,18,38,56,81,84,118,140,142,166,194,197],"g d":[7],"g e":[18],"g f":[1],"g i":[12],"g l":[2,5],"g m":[15],"g o":[1],"g p":[12],"g v":[38,56,81,84,118,140,142,166,194,197],"g w":[0],"g, ":[5,11,15],"g-t":[11],"gab":[75,137],"gac":[63,124],"gag":[1,2,3,4,5,6,7,8,9,10,11,14,16,17,18,36,76,77,101,155,179],"gai":[13],"gat":[17],"gda":[152,176],"ge ":[1,2,3,4,5,6,7,8,9,10,11,14,16,17,18,36,68,76,101,130,155,179],"ge,":[7],"geb":[21],"gef":[159,186],"gen":[19,126],"geo":[65],"ger":[77],"get":[8],"gib":[14],"gie":[8],"gif":[127],"gin":[152,176],"gis":[93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171],"giv":[84,142,165,193],"goa":[158,184],"gra":[17,128],"gro":[3,73,136],"gsa":[129],"gsg":[158,184],"gst":[126],"gtr":[126],"h a":[2],"h b":[10],"h c":[12,13,17,75,137],"h d":[0],"h f":[3,10,12],"h o":[3],"h r":[4],"h s":[6],"h v":[75,137],"h-o":[10],"ha ":[23],"ha,":[1,6,16],"har":[197],"has":[7],"hat":[201,203,204],"hco":[156,181],"he ":[1,7,11,47],"hea":[129],"hec":[79],"hed":[6,87,143],"hel":[66],"hen":[6,10,12,13,14,15,17,36,101],"hil":[34],"hir":[2,157,163,182,191],"his":[201,203,204],"hob":[67],"hom":[4,11],"hor":[60,121],"how":[14],"hro":[64],"hsa":[68,129,130],"i a":[13],"i c":[7,13,14,64,73,136,148,159,172,180,186,203],"i p":[201],"i v":[64,73,136,148,159,172,180,186],"i) ":[12,16],"i),":[4,14],"iab":[57,119],"ial":[11,13,162,189,202],"ian":[13],"iat":[2,69,78,87,131,138,143],"ibi":[14],"ibl":[63,124],"ibu":[153,177,202],"ic ":[14,18,185],"ica":[5,8,11,16,89,145],"ice":[15],"ics":[12,15,183,190],"id ":[2],"ida":[48,110,111],"ide":[51,114],"ie ":[32,98],"ief":[17,201,203,204],"iel":[149,173],"ien":[185],"ies":[3,8,12,17,67],"ife":[5,71,72,134,135],"iff":[0,1],"ifi":[8,18,185],"ift":[127],"iga":[17],"igi":[14],"ild":[11,34],"ili":[14,44,57,71,85,108,119,134,159,186,204],"ima":[201],"imb":[169,199],"ime":[3,5],"imi":[5,9,162,189],"imm":[69,131],"imo":[22,93],"imp":[5,8,11,16,161,168,188,198],"imu":[153,177],"in ":[13],"ina":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,202],"inc":[1,2,5,6,7,8,11,12,13,14,15,18],"ind":[1,62,123],"ine":[8,128,201,202,203,204],"inf":[15],"ing":[0,1,2,5,6,7,9,11,12,13,14,15,16,18,38,56,63,73,81,84,118,124,126,129,136,140,142,152,158,166,176,184,194,197,202],"ini":[153,177],"inj":[82],"inn":[152,176],"ins":[4,5,13,14,16,71,134,150,170,174,200],"int":[0,7,9],"inv":[3,12,13,15,70,132,169,199],"io ":[45,52,109,115],"iod":[9],"ion":[0,1,3,5,6,7,8,9,10,11,12,14,15,16,17,18,19,24,40,44,46,48,55,59,78,80,81,86,87,89,90,103,108,110,111,117,120,126,138,139,140,143,145,146,153,156,162,177,181,189,201,202,203,204],"ios":[5],"ip)":[4],"ipl":[68,130,203],"ipp":[126],"ipr":[20],"ipt":[201,203,204],"ira":[52,115,133,157,160,161,163,182,187,188,191],"ird":[2],"ire":[18,152,153,154,176,177,178],"irr":[71,134],"is ":[6,7,13,201,203,204],"is,":[10,11,12,13,14,15,18],"is.":[4,17],"isc":[7],"ise":[54],"isi":[15,46],"isk":[3,4,9,12],"iso":[1,14,15],"iss":[19],"ist":[93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,177,190],"it ":[10,14],"it,":[8],"ita":[13,204],"itc":[106],"itd":[43,53,107,116],"ite":[2],"ith":[0,2,4,6,10,12,13,17],"iti":[3,17,46],"itl":[170,200],"its":[2,7,11,13,201,203,204],"itu":[44,108],"itv":[71,134],"ity":[3,11,13,14,25,42,55,57,62,69,80,85,94,105,117,119,123,128,131,139,159,162,186,189,204],"ium":[4],"iva":[4,14,16],"ive":[6,9,10,12,13,15,16,17,28,36,59,101,120,165,193],"ivi":[51,84,114,142],"ivo":[5],"ix ":[74],"ixe":[1,62,123],"iza":[6,24,44,108,162,189],"ize":[9,78,138],"jec":[3,10,17],"jur":[82],"jus":[18],"k a":[4,12],"k c":[9,79,125],"k f":[3],"k o":[9],"k p":[9],"k v":[79,125],"k, ":[9],"k-e":[9,10,11,14],"kco":[64],"kdo":[75,137],"ken":[201],"ket":[15,73,136,202],"kev":[7],"kin":[13,38],"kip":[126],"l a":[13],"l c":[0,2,50,60,91,113,121,147,158,184],"l e":[1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18],"l g":[13],"l i":[11],"l l":[1,6],"l o":[17],"l p":[14,202],"l v":[50,60,91,113,121,147,158,184],"l, ":[13,16],"lan":[47,56,81,84,118,140,142,169,199,202],"lat":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204],"lcu":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204],"ld ":[149,173],"ldi":[11],"lds":[34],"le ":[87,143,203],"lea":[203],"lei":[161,170,188,200],"lel":[71,134],"lem":[18,72,135,164,192],"len":[2,14],"les":[6,63,87,88,89,90,91,124,143,144,145,146,147],"let":[68,130],"lex":[35,63,124],"lfs":[159,186],"lge":[21],"lia":[13,57,119],"lic":[5,11,16],"lid":[48,110,111],"lie":[17],"lif":[5,8,71,72,134,135],"lig":[14,17],"lim":[22,93],"lin":[15,82],"lit":[14,57,71,85,119,134,159,186,204],"liz":[44,78,108,138],"ll ":[2,6,50,60,113,121],"lla":[14,16],"lli":[15],"llm":[91,147],"llo":[83,141,168,198],"lmo":[91,147],"loa":[0,1,5,6,16,27,48,83,96,99,111,141,165,166,167,171,193,194,195],"loc":[9,66],"lon":[11],"lop":[88,144],"lor":[32,98],"los":[2,18,197],"low":[3,10,12,168,198],"lph":[23],"lpr":[148,172],"ls ":[202],"lse":[162,189],"lsu":[22,93],"lte":[9,16],"lth":[129],"lts":[43,107],"lua":[10,12,15,17,55,117],"lud":[1,2,5,6,7,11,13,14,15,18],"lue":[15,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200],"lum":[80,139],"lus":[31],"lyi":[149,173],"lys":[4,6,7,10,11,12,13,14,15,17,18],"lyz":[3,5,9,10,14,15,16,17],"m (":[4],"m a":[17],"m f":[11],"m o":[10],"m, ":[1,6],"ma ":[88,144],"mar":[15,73,136,202],"mat":[14,64,74,201],"mbe":[35,169,199],"md ":[152,153,176,177],"mdi":[153,177],"me ":[5,11,12],"me,":[3,8,12],"me-":[12],"med":[15,69,131],"meg":[75,137],"men":[0,3,4,5,6,8,12,13,15,17,18,33,70,72,88,100,132,135,144,154,164,167,168,169,178,192,195,198,199],"meo":[4],"mer":[46],"met":[12,15,65,183],"mi ":[14],"mi)":[4,14,16],"min":[5,8,9,153,177],"mip":[4],"mis":[19],"miu":[4],"miz":[9,162,189],"mme":[5,69,131],"mmi":[19],"mod":[91,147,202],"mon":[22,93],"mor":[1,2,3,4,5,6,7,8,9,10,11,14,16,17,18,24,36,76,77,101,155,179],"mot":[28],"mou":[8],"mpa":[1,5,9,11,14,15,64],"mpe":[59,120],"mpl":[5,11,13,16,35,161,188],"mpr":[6,8,10,12,13,15,17,36,101,168,198],"mps":[80,139],"mpt":[17,20,201],"mr ":[30],"ms ":[0],"ms,":[2],"mum":[153,177],"mvs":[80,139],"n a":[7,8,10,11,12,14,17],"n b":[8,13],"n c":[0,1,8,14,18,19,24,27,40,44,48,55,59,83,86,89,96,99,103,108,110,111,117,120,141,145,162,171,189],"n e":[14,201],"n f":[10,18],"n i":[8],"n m":[202],"n o":[14,16,201,203,204],"n p":[0,5,9],"n s":[6],"n t":[0,6],"n v":[19,24,27,40,44,48,55,59,83,86,89,96,99,103,108,110,111,117,120,141,145,162,171,189],"n y":[7],"n) ":[203],"n, ":[3],"nal":[1,3,4,5,6,7,9,10,11,12,13,14,15,16,17,18,82,83,141],"nan":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,202],"nar":[5],"nat":[9,16],"nce":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200],"nch":[47],"nci":[0,1,11,13,16,166,194,202],"ncl":[1,2,5,6,7,11,13,14,15,18],"nco":[8,12,46],"ncr":[37],"ncy":[19],"nd ":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,39,51,102,114,201,203,204],"nd-":[10],"nda":[5],"nde":[2,14,62,123],"ndi":[63,81,89,124,140,145,169,199],"ne ":[8,13],"ned":[84,128,142],"nef":[7,10,11,13,14],"nek":[64,125],"ner":[4,126],"nes":[165,193,201,202,203,204],"net":[12,78,138,203],"ney":[204],"nfo":[15,165,193],"nfu":[81,140],"ng ":[0,1,2,5,6,7,9,11,12,13,14,15,16,18,38,56,81,84,118,140,142,166,194,197,202],"ng,":[5,11,15],"ng-":[11],"ng.":[13],"nga":[63,124],"ngd":[152,176],"ngr":[73,136],"ngs":[129,158,184],"ngt":[126],"nim":[153,177],"nin":[56,118,152,176,202],"nit":[13,17],"nju":[82],"nlo":[48,111],"nlu":[80,139],"nn)":[203],"nne":[84,142],"nni":[56,118,152,176,202],"nnn":[203],"nnu":[25,62,69,78,80,94,123,128,131,138,139],"noi":[12],"now":[50,113],"npl":[81,140],"nre":[78,138,166,167,194,195],"nrm":[153,177],"ns ":[1,5,10,13,17,90,146],"ns,":[9,10,14,15,16,18],"ns.":[5,6,7,11,14,15,16,18],"nsa":[18,59,120],"nsc":[87,143],"nsf":[126],"nsi":[6,10,12,13,15,17,36,80,81,101,139,140],"nsk":[126],"nso":[48,110,111],"nsp":[0],"nsu":[4,5,14,16,71,134,150,170,174,200],"nt ":[0,1,3,4,6,7,8,11,12,13,15,17,18,33,63,70,100,124,132,154,167,169,178,195,199],"nt.":[12],"nta":[68,130,148,149,156,168,172,173,181,198],"nte":[0,54,150,174],"nth":[129],"nti":[1,6,11,16,168,185,198],"ntl":[165,166,167,193,194,195],"nto":[128],"ntp":[88,144,164,192],"ntr":[45,109],"nts":[0,6,7,8,9,13,18],"ntv":[72,135,151,175],"nua":[78,138],"nui":[25,62,69,80,94,123,128,131,139],"num":[35],"nve":[1,3,6,12,13,15,16,70,132,156,169,181,199],"nym":[64],"nys":[22,93],"o &":[0],"o c":[14,45,52,109,115],"o f":[0,1],"o o":[9],"o v":[45,52,109,115],"oal":[158,184],"oan":[0,1,5,6,16,27,48,83,96,99,111,141,165,166,167,171,193,194,195],"oba":[85],"obb":[67],"obl":[17],"oc ":[66],"oca":[71,134],"oci":[2,162,189],"ock":[9],"ode":[91,147,202],"ods":[9],"odu":[12],"oes":[201,203,204],"of ":[7,11,201,203,204],"ofd":[41,104],"ofe":[42,105],"off":[5,49,106,112],"ofi":[204],"ofo":[88,144],"ogr":[17],"oi ":[7,13,64,73,136,148,159,172,180,186,203],"oi)":[12],"oin":[7,9],"oje":[3,10,17],"oke":[201],"oki":[38],"oli":[48,110,111],"olo":[27,96],"oma":[14],"ome":[4,8,11,12,46,65],"omm":[5,19],"omo":[28],"omp":[1,6,9,10,11,12,13,14,15,17,20,35,36,59,64,101,120,201],"on ":[1,6,7,8,10,12,14,16,17,18,19,24,40,44,55,59,86,89,103,108,110,117,120,145,162,189,201,202,203,204],"on,":[3],"on.":[1],"ona":[1,6,16,82,83,141],"onc":[37,46],"ond":[39,102],"one":[13,64,125],"ong":[11],"onl":[48,80,111,139],"onn":[78,138],"onp":[81,140],"onr":[153,177],"ons":[5,7,9,10,11,14,15,16,17,18,48,87,90,110,111,126,143,146],"ont":[156,181],"onv":[1,6,16,156,181],"ony":[22,93],"ook":[38],"oon":[64,125],"oor":[75,137],"oot":[15],"ope":[3,12,15,17,18,86,148,172],"opm":[88,144],"opp":[13,17],"opt":[1,9,10,14,16,162,189],"or ":[0,3,5,6,10,12,13,15,16,18,201,203,204],"ora":[18,39,86,102,159,186],"org":[165,193],"ori":[32,98],"orm":[15,88,144],"orp":[39,102],"orr":[40,75,103,128,137],"ort":[0,1,2,3,4,5,6,7,8,9,10,11,13,14,16,17,18,22,24,34,36,60,76,77,93,101,121,155,179],"os,":[5],"ose":[201,203,204],"osi":[2,3,18],"oss":[1,197],"ost":[0,2,4,7,9,10,11,14,16,18,20,41,42,46,104,105,201],"ot ":[15],"ot,":[15],"ota":[0],"oth":[75,137,156,157,181,182],"oti":[28],"oun":[7,8,63,124,129],"our":[5,7,64,125],"ous":[22,93],"out":[10,25,69,94,131,164,192],"ove":[3,4,5,8,168,198],"ow ":[2,10,12,14,18],"ow,":[3],"owa":[168,198],"owb":[50,113],"own":[4],"owt":[3],"p c":[43,107],"p i":[13],"p r":[12],"p v":[43,107],"p),":[4],"p-u":[13],"pac":[5],"pai":[2],"pan":[64],"par":[1,2,9,11,14,15],"pay":[0,5,6,33,49,69,79,100,106,112,131,164,167,192,195],"pea":[17],"pec":[18,60,121],"pen":[59,63,80,81,120,124,139,140],"per":[3,9,12,15,17,18,82,83,86,141,148,172],"pes":[1,6],"pha":[23],"pin":[126],"pir":[160,187],"pit":[13],"pla":[56,81,84,118,140,142,202],"ple":[35,68,130,161,188,203],"pli":[5,11,13,16],"pme":[88,144],"pmi":[4,14,16],"poi":[7,9],"por":[0,6,13,17,22,34,39,93,102],"pos":[2,3,201,203,204],"pou":[22,93],"ppe":[17],"ppi":[126],"ppo":[6,13,17,22,34,93],"ppr":[78,138],"pr ":[1],"pre":[2,4,6,8,10,12,13,15,17,36,78,87,101,138,143],"pri":[4,14,15,16,54],"pro":[3,8,10,12,15,17,18,20,85,86,88,144,148,168,172,198,201,204],"psu":[80,139],"pt ":[201],"ptc":[20],"pti":[1,9,10,14,16,17,162,189,201,203,204],"ptv":[26,95],"pur":[7,201,203,204],"qua":[8,15],"qui":[3,11,18,42,46,55,105,117,152,153,176,177],"r a":[0,6,18],"r c":[1,10,14,30,35,201,203,204],"r d":[201,203,204],"r f":[2,16],"r i":[12,15],"r l":[0,5],"r m":[3,7],"r o":[13],"r r":[1,10,18],"r s":[5,15],"r t":[3],"r v":[30,35],"r y":[5],"ra ":[21,133,157,160,161,163,182,187,188,191],"rac":[13,17,46],"rag":[4,159,186],"ral":[13,93],"ram":[17],"ran":[0,4,5,14,16,18,71,94,126,128,134,150,170,174,200],"rap":[95],"rat":[0,1,8,9,10,12,18,39,45,52,86,102,109,115,126,128],"rau":[96],"rbe":[97],"rca":[98,99,100],"rch":[7],"rco":[101,102,103,104,105],"rcr":[106,107,108],"rcu":[109],"rd ":[204],"rd-":[2],"rde":[110,111,112,113],"rdi":[114],"rdp":[106],"rdt":[115],"re ":[1,9,11,15,17],"re-":[8],"rea":[1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,78,87,88,89,90,91,138,143,144,145,146,147],"reb":[116],"rec":[5,78,87,138,143],"red":[8,43,44,59,106,107,108,120,152,153,164,176,177,192],"ref":[10,16,77,92,166,194],"reg":[93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171],"reh":[6,10,12,13,15,17,36,101],"rel":[17,40,103],"rem":[4,18,154,178],"ren":[0,1,3,11,45,109,148,149,150,151,172,173,174,175],"rep":[2,167,195],"req":[18,117,152,153,176,177],"res":[0,118,119],"ret":[37,128,154,163,178,191],"rev":[71,134,155,179],"rex":[120,121],"rfa":[91,122,147],"rfi":[123],"rfl":[124],"rfo":[125],"rge":[126],"rgi":[127,165,193],"rgr":[128],"rgs":[126],"rhe":[129],"rhs":[130],"rib":[153,177,202],"ric":[12,15,183],"rie":[32,98,201,203,204],"rim":[131],"rin":[132],"rio":[5,9],"rip":[68,130,201,203,204],"rir":[133,134],"ris":[1,3,4,9,12,14,15,54],"rit":[162,189],"riv":[4,14,16],"rix":[74],"rke":[15,73,136,202],"rla":[169,199],"rli":[135],"rlo":[99],"rm ":[10,11],"rm,":[1,6],"rma":[88,136,144],"rmd":[152,153,176,177],"rme":[15,137],"rmi":[8],"rms":[0],"rna":[9,16],"rne":[138],"rob":[85],"rod":[12],"rof":[88,144,204],"rog":[17],"roi":[7,13,64,73,136,148,159,172,180,186,203],"roj":[3,10,17],"rom":[20,201],"roo":[64,125],"rop":[3,12,15,17,18,86,148,172],"ror":[18,86],"ros":[1],"rot":[75,137,156,157,181,182],"rov":[8,168,198],"row":[2,3,18],"rpa":[33,100],"rpe":[139,140,141],"rpl":[142],"rpo":[39,102,201,203,204],"rpr":[54],"rra":[13],"rre":[3,40,45,59,71,103,109,120,128,134,143,144,145,146,147,148,149,150,151,152,153,154,155],"rro":[75,137,156,157],"rs ":[4],"rsa":[158],"rse":[155,159,160,179],"rsi":[150,156,161,174,181],"rso":[82,83,141,162],"rst":[163,164,165,166,167],"rsu":[11],"rt ":[6,22,34,93],"rta":[0],"rte":[168],"rtf":[60,121],"rtg":[1,2,3,4,5,6,7,8,9,10,11,14,16,17,18,36,76,77,101,155,179],"rti":[3,6,12,24,169,170],"rtu":[13,17],"rty":[2,15,17,18,86,148,172],"ruc":[164,192],"rus":[71,128,134,171],"rve":[197],"rvi":[5],"ry ":[65,82],"ryd":[58],"rze":[64,125],"s a":[0,1,2,7,8,11,201,203,204],"s c":[7,31,67,90,146,165,183,190,193,201,202,203,204],"s d":[1],"s f":[12,13,15,16,18],"s i":[1,3,4,6],"s o":[5,7,11],"s p":[15,201,203,204],"s r":[9,11],"s t":[1,9,13],"s v":[31,67,90,146,165,183,190,193],"s w":[4,6,10,12,13,17],"s, ":[0,2,5,6,8,9,10,11,12,13,14,15,16,17,18],"s. ":[8],"sa ":[61,122,129],"saa":[183],"sac":[18,129],"sal":[22,93],"san":[80,139],"sat":[59,68,120,130],"sav":[129,158,184],"sbu":[151,175],"sce":[5],"sch":[6,87,143],"sci":[185],"sco":[7],"scr":[2,18,201,203,204],"sda":[16,171],"se ":[203],"se.":[201,203,204],"sec":[162,189],"sed":[8],"sel":[15,159,186],"sem":[155,179],"sep":[160,187],"ses":[3,4,9,12,17],"set":[8,18,72,135,164,192],"sev":[54],"sfe":[126],"sgo":[158,184],"sh ":[3,10,12],"sh-":[10],"sha":[197],"sho":[60,121],"sim":[161,188],"sin":[2,7,18,150,174,201,202,203,204],"sio":[15,19,80,81,139,140,156,181],"sis":[4,6,7,10,11,12,13,14,15,17,18],"sit":[2,3,46],"siv":[6,10,12,13,15,17,36,101],"sk ":[3,4,12],"sk,":[9],"ski":[126],"sme":[4,12,17,183],"sno":[50,113],"soc":[2,162,189],"sol":[48,110,111],"son":[1,14,15,82,83,141],"spe":[18,63,124],"spo":[0,22,93],"squ":[15],"ss ":[1,3,9,165,193],"sse":[3,4,8,9,12,17],"ssh":[197],"ssi":[19],"ssm":[4,12,17],"sso":[2],"st ":[0,1,2,18,20,46,201],"st,":[0],"st-":[10,14],"st.":[9],"sta":[1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,56,57,87,88,89,90,91,118,119,143,144,145,146,147,190],"ste":[13,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171],"stg":[128],"sti":[71,134,190,197,201],"stm":[3,12,13,15,18,70,132,169,199],"sto":[41,42,46,104,105,159,186],"str":[8,153,163,164,177,191,192],"sts":[2,4,7,11,16],"stt":[126],"stu":[165,166,167,193,194,195],"sum":[80,139],"sup":[6,22,34,93],"sur":[4,5,14,16,71,134,150,170,174,200],"sus":[11],"swa":[43,107],"syn":[89,145],"t &":[201],"t (":[203],"t a":[4,6,15,17,18],"t c":[2,6,11,14,15,18,20,22,25,33,34,41,46,63,69,70,93,94,100,104,124,128,131,132,154,164,167,169,178,192,195,199,201],"t d":[15],"t e":[3,10],"t f":[0,1,6,17],"t l":[0],"t m":[1,12],"t o":[12],"t p":[7,8],"t r":[0,3,10,13],"t s":[8],"t t":[201,203,204],"t v":[20,22,25,33,34,41,46,63,69,70,93,94,100,104,124,128,131,132,154,164,167,169,178,192,195,199],"t, ":[0,5,8,15],"t-b":[10,14],"ta ":[29,97],"tab":[204],"tag":[68,130],"tai":[128],"tal":[0,13,148,149,168,172,173,198],"tat":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,56,57,87,88,89,90,91,118,119,143,144,145,146,147,190],"tav":[47],"tax":[13,16,17,18,57,68,78,86,90,119,126,127,130,138,146,156,181,196,197],"tca":[106],"tch":[64,163,191],"tco":[20,48,110,111],"tda":[53,116],"tde":[43,107],"te ":[0,2,3,4,5,6,7,9,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,202],"te,":[1],"te-":[10,18],"tea":[69,131],"teb":[39,102],"ted":[2,60,87,88,121,143,144],"teg":[8],"tem":[2],"ten":[168,198],"tep":[13,56,118],"ter":[0,8,9,10,11,16,54,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,174,176],"tes":[0,1,12,89,145],"tet":[57,90,119,146],"tew":[91,147],"tfa":[60,121],"tga":[1,2,3,4,5,6,7,8,9,10,11,14,16,17,18,36,76,77,101,155,179],"tgr":[128],"th ":[0,2,3,4,6,10,12,13,17,75,137],"thc":[156,181],"the":[1,7,11],"thi":[2,157,182,201,203,204],"ths":[129],"tic":[14,190],"tie":[3,12,17],"tif":[185],"til":[44,71,108,134],"tim":[3,5,9,162,168,169,189,198,199,201],"tin":[11,12,73,136,197,202],"tio":[0,1,3,5,6,7,8,9,10,11,12,14,15,16,17,18,24,40,44,45,46,48,52,55,59,78,86,87,89,90,103,108,109,110,111,115,117,120,126,138,143,145,146,153,162,177,189,201,202,203,204],"tir":[52,115,154,178],"tis":[190],"tit":[170,200],"tiv":[9,16,28,59,120],"tiz":[6,24],"tle":[18,72,135,164,170,192,200],"tlo":[165,166,167,193,194,195],"tme":[3,12,13,15,18,70,132,169,199],"to ":[0,1,9,14],"tof":[41,42,104,105],"tok":[201],"tol":[27,96],"tom":[14,28,46],"tor":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204],"tot":[0],"tpa":[49,112,164,192],"tpr":[88,144],"tra":[0,8,13,18,45,109,126],"tre":[163,191],"tri":[12,15,68,74,130,153,177,183,202,203],"tru":[71,128,134,164,192],"try":[65],"ts ":[2,4,7,8,11,13,18,201,203,204],"ts,":[0,6,8,9,13,16,18],"ts.":[2,8],"tsn":[50,113],"tsw":[43,107],"tta":[126,127],"ttl":[18,72,135,164,192],"ttr":[202],"tud":[165,166,167,193,194,195],"tun":[13,17,78,138],"tur":[17,164,192],"tut":[44,108],"tva":[26,71,72,95,134,135],"tvs":[151,175],"ty ":[2,3,11,13,15,17,18,42,57,62,80,85,105,119,123,139,204],"ty,":[14],"tyb":[25,94],"tyo":[162,189],"typ":[1,6,69,131],"tyr":[148,159,172,186],"tyt":[86,128],"tyv":[55,117],"ual":[8],"uar":[15],"uat":[10,12,15,17,55,78,117,138],"uci":[12],"uct":[90,146,164,192],"ude":[165,166,167,193,194,195],"udi":[1,2,5,6,7,11,13,14,15,18],"ue ":[26,54,71,72,95,134,135],"ues":[15,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200],"uil":[11],"uir":[18,152,153,176,177],"uis":[46],"uit":[3,11,25,42,55,62,69,80,94,105,117,123,128,131,139],"ula":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204],"ule":[6,87,143],"ult":[43,107],"ulu":[31],"um ":[4],"umb":[35],"umd":[153,177],"ump":[80,139],"umv":[80,139],"und":[81,140],"uni":[13,17],"unr":[78,138],"unt":[7,8,63,124,129],"up ":[13],"upp":[6,22,34,93],"ur ":[5,7],"ura":[4,5,14,16,17,18,71,134,150,170,174,200],"urc":[7],"ure":[17,164,192],"uri":[162,189],"urp":[201,203,204],"urr":[3,45,109],"urv":[5],"ury":[82],"urz":[64,125],"us ":[11,31],"usa":[22,93],"usd":[16,171],"usi":[201,202,203,204],"ust":[18,46,71,128,134],"ut ":[10,25,69,94,131,164,192],"uti":[44,59,108,120,153,177,202],"uto":[0,14,27,28,96],"utu":[17],"uy ":[151,175],"uyi":[11,15],"uyo":[25,94],"va,":[1,6,16],"val":[10,12,15,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200],"van":[68,130],"vat":[4,14,16],"ve ":[6,9,10,12,13,15,17,28],"ved":[59,120],"vel":[88,144],"vem":[8,36,101,168,198],"ven":[1,6,7,9,10,11,14,16,165,193],"ver":[3,4,5,11,58,155,156,179,181],"ves":[3,12,13,15,16,70,132,169,197,199],"vid":[51,114],"vin":[84,129,142,158,184,204],"viv":[5],"voc":[71,134],"vor":[5],"vs ":[11],"vsa":[80,139],"vsb":[151,175],"w a":[12,18],"w d":[2],"w p":[10],"w t":[14],"w, ":[3],"wan":[168,198],"wap":[43,107],"wat":[91,147],"wba":[50,113],"wha":[201,203,204],"whe":[14],"wit":[0,2,4,6,10,12,13,17],"wne":[4],"wth":[3],"x b":[13],"x c":[17,74,78,126,127,138,156,181,196],"x d":[13],"x i":[16],"x o":[17],"x p":[18],"x v":[74,78,126,127,138,156,181,196],"xad":[68,130],"xan":[62,123],"xde":[90,146],"xec":[59,120],"xed":[1,62,123],"xem":[17],"xes":[17],"xib":[63,124],"xli":[57,119],"xlo":[197],"xnu":[35],"xpe":[60,121],"xpr":[86],"y b":[11],"y c":[3,42,57,58,62,65,80,82,85,105,119,123,139,151,175,204],"y f":[2],"y g":[3],"y p":[3],"y t":[17,18],"y v":[15,42,57,58,62,65,80,82,85,105,119,123,139,151,175],"y z":[13],"y, ":[14,17],"yar":[204],"ybu":[25,94],"ych":[79],"yco":[19],"yda":[58],"yie":[149,173],"yin":[11,15],"yma":[64],"yme":[0,6,33,100,167,195],"ynd":[89,145],"yof":[5,49,106,112],"yop":[162,189],"you":[5,7,25,69,94,131,164,192],"ypa":[69,131],"ype":[1,6],"yro":[148,159,172,186],"ysi":[4,6,7,10,11,12,13,14,15,17,18],"ysp":[22,93],"yta":[86],"ytr":[128],"yva":[55,117],"yze":[3,5,9,10,14,15,16,17],"zat":[6,24,44,108,162,189],"ze ":[3,5,9,10,14,15,16,17],"zed":[78,138],"zer":[64,125],"zon":[13]},"prefixes":{"a":[23,21,26,27,28,20,24,25,19,202,22,201,1],"ad":[19],"ada":[19],"adag":[19],"ai":[20,201],"aip":[20],"aipr":[20],"al":[23,21,22],"alg":[21],"alge":[21],"ali":[22],"alim":[22],"alp":[23],"alph":[23],"am":[24],"amo":[24],"amor":[24],"an":[25],"ann":[25],"annu":[25],"ap":[26,1],"apr":[1],"apt":[26],"aptv":[26],"at":[202],"att":[202],"attr":[202],"au":[27,28],"aut":[27,28],"auto":[27,28],"b":[30,29],"be":[29],"bet":[29],"beta":[29],"bm":[30],"bmr":[30],"c":[32,38,0,31,37,33,41,40,34,42,45,35,39,43,44,36,46,30,180,196,29,23,61,66,53,74,187,21,67,182,26,27,51,52,58,65,76,79,92,175,188,28,49,70,178,185,190,191,85,133,173,183,184,20,24,50,73,83,97,25,47,84,122,56,82,116,160,200,54,55,98,99,127,157,179,14,75,95,96,114,115,171,174,60,62,77,151,161,172,181,197,19,57,81,100,104,112,132,154,163,72,103,149,158,86,105,109,113,125,136,141,195,199,2,22,48,68,89,94,102,142,69,118,170,186,193,194,63,80,90,117,155,91,106,137,150,176,107,108,110,121,123,148,156,119,140,189,192,198,64,135,167,169,59,88,93,101,111,130,145,87,131,159,165,166,177,78,124,129,139,146,147,152,162,164,168,120,144,71,143,153,128,138,126,134,17,5,3,7,6,4,10,202,8,1,201,204,11,9,18,16,15,12,13,203],"ca":[32,0,31,33,30,180,196,29,23,61,66,53,74,187,21,38,67,182,26,27,37,51,52,58,65,76,79,92,175,188,28,41,49,70,178,185,190,191,40,85,133,173,183,184,20,24,34,42,45,50,73,83,97,25,35,39,47,84,122,56,82,116,160,200,54,55,98,99,127,157,179,14,75,95,96,114,115,171,174,43,44,60,62,77,151,161,172,181,197,19,57,81,100,104,112,132,154,163,72,103,149,158,86,105,109,113,125,136,141,195,199,22,36,48,68,89,94,102,142,69,118,170,186,193,194,46,63,80,90,117,155,91,106,137,150,176,107,108,110,121,123,148,156,119,140,189,192,198,64,135,167,169,59,88,93,101,111,130,145,87,131,159,165,166,177,78,124,129,139,146,147,152,162,164,168,120,144,71,143,153,128,138,126,134,17,5,3,7,6,4,10,202,8,204,11,9,2,18,1,16,15,12,13,201,203],"cal":[32,31,30,180,196,29,23,61,66,53,74,187,21,38,67,182,26,27,37,51,52,58,65,76,79,92,175,188,28,33,41,49,70,178,185,190,191,40,85,133,173,183,184,20,24,34,42,45,50,73,83,97,25,35,39,47,84,122,56,82,116,160,200,54,55,98,99,127,157,179,75,95,96,114,115,171,174,43,44,60,62,77,151,161,172,181,197,19,57,81,100,104,112,132,154,163,72,103,149,158,86,105,109,113,125,136,141,195,199,22,36,48,68,89,94,102,142,69,118,170,186,193,194,46,63,80,90,117,155,91,106,137,150,176,107,108,110,121,123,148,156,119,140,189,192,198,64,135,167,169,59,88,93,101,111,130,145,87,131,159,165,166,177,78,124,129,139,146,147,152,162,164,168,120,144,71,143,153,128,138,126,134,0,17,5,3,7,6,14,4,10,202,8,204,11,9,2,18,1,16,15,12,13,201,203],"calc":[31,30,180,196,29,23,61,66,53,74,187,21,32,38,67,182,26,27,37,51,52,58,65,76,79,92,175,188,28,33,41,49,70,178,185,190,191,40,85,133,173,183,184,20,24,34,42,45,50,73,83,97,25,35,39,47,84,122,56,82,116,160,200,54,55,98,99,127,157,179,75,95,96,114,115,171,174,43,44,60,62,77,151,161,172,181,197,19,57,81,100,104,112,132,154,163,72,103,149,158,86,105,109,113,125,136,141,195,199,22,36,48,68,89,94,102,142,69,118,170,186,193,194,46,63,80,90,117,155,91,106,137,150,176,107,108,110,121,123,148,156,119,140,189,192,198,64,135,167,169,59,88,93,101,111,130,145,87,131,159,165,166,177,78,124,129,139,146,147,152,162,164,168,120,144,71,143,153,128,138,126,134,0,17,5,3,7,6,14,4,10,202,8,204,11,9,2,18,1,16,15,12,13,201,203],"calo":[32],"can":[14],"canc":[14],"car":[0,33],"carl":[0],"carp":[33],"ch":[34],"chi":[34],"chil":[34],"cl":[2],"clo":[2],"clos":[2],"co":[38,37,41,40,42,35,39,36,2,1,201],"com":[35,36,1],"comp":[35,36,1],"con":[37],"conc":[37],"coo":[38],"cook":[38],"cor":[40,39],"corp":[39],"corr":[40],"cos":[41,42,2,201],"cost":[41,42,2,201],"cr":[43,44],"cre":[43,44],"cred":[43,44],"cu":[45,46],"cur":[45],"curr":[45],"cus":[46],"cust":[46],"d":[51,52,49,50,47,48],"de":[49,50,47,48],"deb":[49,50,47,48],"debt":[49,50,47,48],"di":[51],"div":[51],"divi":[51],"dt":[52],"dti":[52],"dtir":[52],"e":[53,58,56,54,55,60,57,59,3,201],"eb":[53],"ebi":[53],"ebit":[53],"en":[54],"ent":[54],"ente":[54],"eq":[55,3],"equ":[55,3],"equi":[55,3],"es":[56,57,201],"est":[56,57,201],"esta":[56,57],"esti":[201],"ev":[58],"eve":[58],"ever":[58],"ex":[60,59],"exe":[59],"exec":[59],"exp":[60],"expe":[60],"f":[61,62,63,64,15],"fa":[61],"faf":[61],"fafs":[61],"fi":[62],"fix":[62],"fixe":[62],"fl":[63],"fle":[63],"flex":[63],"fo":[64,15],"foo":[15],"foot":[15],"fou":[64],"four":[64],"g":[65],"ge":[65],"geo":[65],"geom":[65],"h":[66,67,68],"he":[66],"hel":[66],"helo":[66],"ho":[67],"hob":[67],"hobb":[67],"hs":[68],"hsa":[68],"hsat":[68],"i":[70,69,71,4,12,16,13],"im":[69],"imm":[69],"imme":[69],"in":[70,4,12,16,13],"inc":[12],"inco":[12],"ins":[4,16],"insu":[4,16],"inv":[70,13],"inve":[70,13],"ir":[71],"irr":[71],"irre":[71],"l":[72,0,5,9,203],"le":[203],"lea":[203],"leas":[203],"li":[72,5],"lif":[72,5],"life":[72,5],"lo":[0,9],"loa":[0],"loan":[0],"loc":[9],"lock":[9],"m":[74,76,73,5,3,7,6,11,75,77,4,9,10,2,8,1,202,16],"ma":[74,73],"mar":[73],"mark":[73],"mat":[74],"matr":[74],"me":[75],"meg":[75],"mega":[75],"mo":[76,5,3,7,6,11,77,4,9,10,2,8,1,202,16],"mod":[202],"mode":[202],"mor":[76,5,3,7,6,11,77,4,9,10,2,8,1,16],"mort":[76,5,3,7,6,11,77,4,9,10,2,8,1,16],"n":[12,78,203],"ne":[12,78,203],"net":[12,78,203],"netu":[78],"nn":[203],"nnn":[203],"no":[12],"noi":[12],"o":[13,12],"op":[13,12],"ope":[12],"oper":[12],"opp":[13],"oppo":[13],"p":[79,85,17,83,84,82,14,81,86,15,18,80,16,7,6,201,204],"pa":[79,6],"pay":[79,6],"payc":[79],"paym":[6],"pe":[83,82,81,80,15],"pen":[81,80],"pens":[81,80],"per":[83,82,15],"pers":[83,82],"pl":[84],"pla":[84],"plan":[84],"pm":[14],"pmi":[14],"po":[7],"poi":[7],"poin":[7],"pr":[85,17,86,15,18,16,201,204],"pri":[15,16],"pric":[15],"priv":[16],"pro":[85,17,86,18,201,204],"prob":[85],"prof":[204],"prom":[201],"prop":[17,86,18],"pror":[18],"q":[8],"qu":[8],"qua":[8],"qual":[8],"r":[180,182,92,175,178,133,173,97,122,116,160,98,99,127,157,179,95,96,114,115,171,174,151,161,172,181,100,104,112,132,154,163,103,149,158,105,109,113,125,136,141,89,94,102,142,118,170,90,117,155,91,106,137,150,176,107,108,110,121,123,148,156,119,140,135,167,169,88,93,101,111,130,145,87,131,159,165,166,177,124,129,139,146,147,152,162,164,168,120,144,143,153,128,138,126,134,9,10,11,13,203],"ra":[9],"rat":[9],"rate":[9],"re":[92,175,178,133,173,97,122,116,160,98,99,127,157,179,95,96,114,115,171,174,151,161,172,100,104,112,132,154,163,103,149,158,105,109,113,125,136,141,89,94,102,142,118,170,90,117,155,91,106,137,150,176,107,108,110,121,123,148,156,119,140,135,167,169,88,93,101,111,130,145,87,131,159,165,166,177,124,129,139,146,147,152,162,164,168,120,144,143,153,128,138,126,134,10,11],"rea":[89,90,91,88,87],"real":[89,90,91,88,87],"ref":[92,10],"refi":[92,10],"reg":[133,97,122,116,160,98,99,127,157,95,96,114,115,171,151,161,100,104,112,132,154,163,103,149,158,105,109,113,125,136,141,94,102,142,118,170,117,155,106,137,150,107,108,110,121,123,148,156,119,140,135,167,169,93,101,111,130,145,131,159,165,166,124,129,139,146,147,152,162,164,168,120,144,143,153,128,138,126,134],"regi":[133,97,122,116,160,98,99,127,157,95,96,114,115,171,151,161,100,104,112,132,154,163,103,149,158,105,109,113,125,136,141,94,102,142,118,170,117,155,106,137,150,107,108,110,121,123,148,156,119,140,135,167,169,93,101,111,130,145,131,159,165,166,124,129,139,146,147,152,162,164,168,120,144,143,153,128,138,126,134],"ren":[175,173,174,172,11],"rent":[175,173,174,172,11],"req":[176,177],"requ":[176,177],"ret":[178],"reti":[178],"rev":[179],"reve":[179],"ro":[180,182,181,13,203],"roi":[180,13,203],"rot":[182,181],"roth":[182,181],"s":[187,188,185,190,191,183,184,195,186,193,194,189,192,15],"sa":[183,184],"saa":[183],"saas":[183],"sav":[184],"savi":[184],"sc":[185],"sci":[185],"scie":[185],"se":[187,186],"sel":[186],"self":[186],"sep":[187],"sepi":[187],"si":[188],"sim":[188],"simp":[188],"so":[189],"soc":[189],"soci":[189],"sq":[15],"squ":[15],"squa":[15],"st":[190,191,195,193,194,192],"sta":[190],"stat":[190],"str":[191,192],"stre":[191],"stru":[192],"stu":[195,193,194],"stud":[195,193,194],"t":[196,200,197,199,198,203,17,18,201],"ta":[196,197,17,18],"tax":[196,197,17,18],"taxl":[197],"te":[198],"ten":[198],"tena":[198],"ti":[200,199],"tim":[199],"timb":[199],"tit":[200],"titl":[200],"to":[201],"tok":[201],"toke":[201],"tr":[203],"tri":[203],"trip":[203],"v":[204,11],"vi":[204],"vin":[204],"vine":[204],"vs":[11],"z":[13],"zo":[13],"zon":[13],"zone":[13]}};
@@ -0,0 +1,97 @@
+/**
+ * Prebuilt calculator search index (generated by build_search_index.py)
+ * Answers searches from trigram postings and ranked name-prefix tables
+ * instead of scanning every calculator's text on each keystroke
+ */
+export interface CalculatorSearchIndexData {
+  version: number;
+  ids: string[];
+  maxPrefixLength: number;
+  trigrams: Record<string, number[]>;
+  prefixes: Record<string, number[]>;
+}
+
+const EMPTY: number[] = [];
+
+/**
+ * Intersect two ascending postings lists
+ */
+function intersect(a: number[], b: number[]): number[] {
+  const result: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      result.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return result;
+}
+
+export class CalculatorSearchIndex {
+  private indexedIds: Set<string>;
+
+  constructor(private data: CalculatorSearchIndexData) {
+    this.indexedIds = new Set(data.ids);
+  }
+
+  /**
+   * Whether a calculator is covered by the index
+   */
+  has(id: string): boolean {
+    return this.indexedIds.has(id);
+  }
+
+  /**
+   * Ids that may match a lowercase query, best first; the caller confirms each
+   * with a substring check, so every query length matches the same way.
+   * Queries of 3+ characters return every calculator containing all of the
+   * query's trigrams; shorter ones have no trigram to narrow by and return
+   * every calculator, calculators whose name starts with the query first.
+   */
+  candidates(searchTerm: string): string[] {
+    if (searchTerm.length === 0) return [];
+    const docs = searchTerm.length < 3 ? this.allDocs() : this.trigramMatches(searchTerm);
+
+    // Calculators whose name starts with the query come first, in prefix-table order
+    const ranked = this.data.prefixes[searchTerm.slice(0, this.data.maxPrefixLength)] || EMPTY;
+    const matched = new Set(docs);
+    const ids: string[] = [];
+    for (const doc of ranked) {
+      if (matched.delete(doc)) ids.push(this.data.ids[doc]);
+    }
+    for (const doc of docs) {
+      if (matched.has(doc)) ids.push(this.data.ids[doc]);
+    }
+    return ids;
+  }
+
+  private allDocs(): number[] {
+    return this.data.ids.map((_, doc) => doc);
+  }
+
+  /**
+   * Documents containing every trigram of a query of 3+ characters
+   */
+  private trigramMatches(searchTerm: string): number[] {
+    // Intersect from the rarest trigram so intermediate lists stay small
+    const lists: number[][] = [];
+    for (let i = 0; i + 3 <= searchTerm.length; i++) {
+      const postings = this.data.trigrams[searchTerm.slice(i, i + 3)];
+      if (!postings) return EMPTY;
+      lists.push(postings);
+    }
+    lists.sort((a, b) => a.length - b.length);
+    let docs = lists[0];
+    for (let i = 1; i < lists.length && docs.length > 0; i++) {
+      docs = intersect(docs, lists[i]);
+    }
+    return docs;
+  }
+}
@@ -0,0 +1,11 @@
+// Generated by extract_lookup_tables.py from public/tables/manifest.json - do not edit
+export interface LookupTableAsset {
+  url: string;
+  type: 'int32' | 'float64';
+  length: number;
+  module: string; // calculator directory under src/calculators that uses the table
+  firstKey?: number; // record keys are firstKey, firstKey + 1, ...; otherwise stored after the values
+}
+
+export const lookupTableAssets: Record<string, LookupTableAsset> = {
+};
@@ -0,0 +1,99 @@
+/**
+ * Lazily fetched numeric lookup tables (life expectancy, RMD divisors, brackets, ...)
+ *
+ * extract_lookup_tables.py moves large constant tables out of calculator modules
+ * into typed-array assets under public/tables and replaces each literal with
+ * lookupRecord()/lookupArray(). Those return the table object straight away and
+ * fill it in place once the asset arrives, so formulas keep reading it
+ * synchronously; await lookupTablesReady(modulePath) before calculating.
+ */
+
+import { lookupTableAssets, LookupTableAsset } from '@/data/lookupTables.generated';
+
+const tables = new Map<string, number[] | Record<number, number>>();
+const pending = new Map<string, Promise<void>>();
+const loaded = new Set<string>();
+
+async function fetchTable(name: string, asset: LookupTableAsset, table: number[] | Record<number, number>): Promise<void> {
+  const response = await fetch(asset.url);
+  if (!response.ok) {
+    throw new Error(`Failed to load lookup table ${name}: ${response.status}`);
+  }
+
+  const buffer = await response.arrayBuffer();
+  const values = asset.type === 'int32'
+    ? new Int32Array(buffer, 0, asset.length)
+    : new Float64Array(buffer, 0, asset.length);
+
+  if (Array.isArray(table)) {
+    table.push(...values);
+    return;
+  }
+
+  // Keys follow the values as Int32, unless they are a contiguous range
+  const keys = asset.firstKey === undefined
+    ? new Int32Array(buffer, values.byteLength, asset.length)
+    : null;
+  values.forEach((value, i) => {
+    table[keys ? keys[i] : asset.firstKey! + i] = value;
+  });
+}
+
+function startFetch(name: string): Promise<void> {
+  const request = fetchTable(name, lookupTableAssets[name], tables.get(name)!).then(
+    () => {
+      loaded.add(name);
+      pending.delete(name);
+    },
+    (error) => {
+      // Forget the attempt so the next lookupTablesReady() fetches it again
+      pending.delete(name);
+      throw error;
+    }
+  );
+  // Callers of lookupTablesReady() still see the rejection; nobody awaiting is not an unhandled one
+  request.catch(() => undefined);
+  pending.set(name, request);
+  return request;
+}
+
+function load<T extends number[] | Record<number, number>>(name: string, empty: T): T {
+  const existing = tables.get(name);
+  if (existing) {
+    return existing as T;
+  }
+
+  if (!lookupTableAssets[name]) {
+    throw new Error(`Unknown lookup table: ${name}`);
+  }
+
+  // The module keeps this object, so a retry after a failed fetch fills the same one
+  tables.set(name, empty);
+  startFetch(name);
+  return empty;
+}
+
+export function lookupRecord(name: string): Record<number, number> {
+  return load<Record<number, number>>(name, {});
+}
+
+export function lookupArray(name: string): number[] {
+  return load<number[]>(name, []);
+}
+
+/**
+ * Resolves once the tables used by the calculator module at modulePath (relative to
+ * src/calculators) are filled; tables whose earlier fetch failed are requested again.
+ */
+export function lookupTablesReady(modulePath: string): Promise<void> {
+  const prefix = modulePath.replace(/\/+$/, '');
+  const requests: Promise<void>[] = [];
+  tables.forEach((_, name) => {
+    const module = lookupTableAssets[name].module;
+    if (loaded.has(name) || (module !== prefix && !module.startsWith(`${prefix}/`))) {
+      return;
+    }
+    requests.push(pending.get(name) ?? startFetch(name));
+  });
+  return Promise.all(requests).then(() => undefined);
+}
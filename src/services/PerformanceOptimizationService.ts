@@ -1,3 +1,6 @@
+import { calculatorCostClasses, CalculatorCostClass } from '../data/calculatorCostClasses.generated';
+import { lookupTablesReady } from '../lib/lookupTables';
+
 export interface PerformanceMetrics {
   calculationTime: number;
   renderTime: number;
@@ -155,7 +158,7 @@ export class PerformanceOptimizationService {
     }) as T;
   }
 
-  static createCalculatorCache(calculatorId: string): {
+  static createCalculatorCache(calculatorId: string, keyGenerator?: (inputs: any) => string): {
     get: (inputs: any) => any;
     set: (inputs: any, result: any) => void;
     clear: () => void;
@@ -166,7 +169,7 @@ export class PerformanceOptimizationService {
 
     return {
       get: (inputs: any) => {
-        const key = JSON.stringify(inputs);
+        const key = keyGenerator ? keyGenerator(inputs) : JSON.stringify(inputs);
         const cached = cache.get(key);
         
         if (cached && Date.now() - cached.timestamp < cacheTimeout) {
@@ -181,7 +184,7 @@ export class PerformanceOptimizationService {
       },
       
       set: (inputs: any, result: any) => {
-        const key = JSON.stringify(inputs);
+        const key = keyGenerator ? keyGenerator(inputs) : JSON.stringify(inputs);
         cache.set(key, { result, timestamp: Date.now() });
         
         // Clean up old entries
@@ -197,11 +200,26 @@ export class PerformanceOptimizationService {
     };
   }
 
+  // Cost classes from classify_calculator_cost.py (static formulas.ts analysis)
+  static getCalculatorCostClass(calculatorId: string): CalculatorCostClass {
+    return calculatorCostClasses[calculatorId] ?? 'cheap';
+  }
+
+  static shouldMemoizeCalculator(calculatorId: string): boolean {
+    return this.getCalculatorCostClass(calculatorId) === 'memoize';
+  }
+
+  static shouldRunInWorker(calculatorId: string): boolean {
+    return this.getCalculatorCostClass(calculatorId) === 'worker';
+  }
+
   // Bundle Optimization
   static async loadCalculatorModule(calculatorId: string): Promise<any> {
     try {
       // Dynamic import with error handling
       const module = await import(`../calculators/${calculatorId}`);
+      // Lookup tables this module uses (extract_lookup_tables.py) arrive after the module itself
+      await lookupTablesReady(calculatorId);
       return module.default || module;
     } catch (error) {
       console.error(`Failed to load calculator module: ${calculatorId}`, error);
@@ -0,0 +1,24 @@
+import { readFileSync } from 'fs';
+
+interface ShardManifest {
+  shards: Array<{ index: number; calculators: string[]; files: string[] }>;
+}
+
+/**
+ * Restrict generated calculator cases to the shard named by CALCULATOR_TEST_SHARD,
+ * using the manifest written by plan_test_shards.py. Without the variable every
+ * case runs, so plain `vitest` and `vitest --shard` behave as before.
+ */
+export function selectShardCases<T extends [string, ...unknown[]]>(cases: T[]): T[] {
+  const shard = process.env.CALCULATOR_TEST_SHARD;
+  if (!shard) {
+    return cases;
+  }
+
+  const manifestPath = process.env.CALCULATOR_SHARD_MANIFEST || 'test-shards.json';
+  const manifest: ShardManifest = JSON.parse(readFileSync(manifestPath, 'utf8'));
+  const entry = manifest.shards.find(s => String(s.index) === shard);
+  const ids = new Set(entry ? entry.calculators : []);
+
+  return cases.filter(([id]) => ids.has(id));
+}
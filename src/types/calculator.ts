@@ -103,4 +103,15 @@ export interface Calculator {
   validationRules: ValidationRule[];
   examples: CalculatorExample[];
   calculate?: (inputs: Record<string, any>) => CalculationResult;
-}
\ No newline at end of file
+}
+
+// Listing metadata, available before a calculator's module is loaded
+export type CalculatorSummary = Pick<Calculator, 'id' | 'title' | 'category' | 'subcategory' | 'description'> & {
+  usageInstructions?: string[];
+};
+
+// Lazy registry entry (see src/calculators/manifest.ts)
+export interface CalculatorManifestEntry extends CalculatorSummary {
+  modulePath: string; // calculator directory under src/calculators, for lookupTablesReady
+  load: () => Promise<Calculator>;
+}
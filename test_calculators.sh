@@ -1,6 +1,39 @@
 #!/bin/bash
 
 # Test script to verify calculators have real formulas
+#
+# Usage: ./test_calculators.sh                 # formula sanity checks
+#        ./test_calculators.sh --shard <k>     # run vitest shard k from test-shards.json
+#                                              # (see plan_test_shards.py)
+
+if [[ "$1" == "--shard" ]]; then
+    SHARD="$2"
+    MANIFEST="${CALCULATOR_SHARD_MANIFEST:-test-shards.json}"
+
+    if [[ -z "$SHARD" ]] || [[ ! -f "$MANIFEST" ]]; then
+        echo "Usage: $0 --shard <k>  (requires $MANIFEST from plan_test_shards.py)"
+        exit 1
+    fi
+
+    mapfile -t shard_files < <(python3 -c "
+import json, sys
+manifest = json.load(open(sys.argv[1]))
+for shard in manifest['shards']:
+    if str(shard['index']) == sys.argv[2]:
+        for test_file in shard['files']:
+            print(test_file)
+" "$MANIFEST" "$SHARD")
+
+    if [[ ${#shard_files[@]} -eq 0 ]]; then
+        echo "❌ Shard $SHARD not found in $MANIFEST"
+        exit 1
+    fi
+
+    echo "🧪 Running shard $SHARD (${#shard_files[@]} test files)..."
+    CALCULATOR_TEST_SHARD="$SHARD" CALCULATOR_SHARD_MANIFEST="$MANIFEST" npx vitest run "${shard_files[@]}"
+    exit $?
+fi
+
 echo "🧪 TESTING CALCULATOR FORMULAS..."
 echo ""
 
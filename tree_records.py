@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Compact records for calculator tree and import metadata
+
+The tooling is heading for 10x more calculators, and per-entry dicts with
+repeated path strings do not scale to that:
+1. PathTable interns every path once and hands out integer ids
+   (import_graph keeps its nodes and edges as these ids)
+2. ImportRecord is a __slots__ record for one import, used by ImportFixer's
+   report instead of a dict per import
+
+Scope: directory, file and registration records, and a full-tree index built
+from them, were left out on purpose. No script keeps such per-entry metadata
+in memory today: calculator_catalog stores it in SQLite and the fixers stream
+their reports (event_log). Add a record here when a script first needs one.
+
+Usage from a script:
+    paths = PathTable()
+    file_id = paths.intern(path)
+    record = ImportRecord(path, line_no, specifier, target, 'fixed', line)
+"""
+
+import sys
+from typing import Dict, List, Optional
+
+NO_ID = -1
+
+class PathTable:
+    """Interned strings (paths, specifiers) addressed by integer id"""
+    __slots__ = ('_ids', '_values')
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._values: List[str] = []
+
+    def intern(self, value: str) -> int:
+        found = self._ids.get(value)
+        if found is not None:
+            return found
+        value = sys.intern(value)
+        index = len(self._values)
+        self._ids[value] = index
+        self._values.append(value)
+        return index
+
+    def lookup(self, value: str) -> int:
+        """Id of a value, or NO_ID if it was never interned"""
+        return self._ids.get(value, NO_ID)
+
+    def __getitem__(self, index: int) -> str:
+        return self._values[index]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+class ImportRecord:
+    """One import in a file: where it points, what it resolved to, and its line"""
+    __slots__ = ('file', 'line_no', 'specifier', 'target', 'status', 'line')
+
+    def __init__(self, file: str, line_no: int, specifier: str, target: Optional[str] = None,
+                 status: str = '', line: Optional[str] = None):
+        self.file = file
+        self.line_no = line_no
+        self.specifier = specifier
+        self.target = target
+        self.status = status
+        # The import statement's text (statement_text builds it per record); .strip() when reporting
+        self.line = line
@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+"""
+Single-pass TypeScript import/export scanner shared by the fixers
+
+Each fixer used to carry its own line-oriented regex ("import \\{ (.+) as (.+) \\} from",
+"^(\\s*)import\\s+(.+?)\\s+from", "from '\\./([^']+)Calculator'", ...). Together they
+missed multi-line imports and `import type`, matched inside comments and strings,
+and could backtrack badly on long lines. This module replaces them:
+1. scan() walks a file's bytes once. Runs of ordinary code are skipped by one
+   regex, strings, comments, template literals and regex literals are stepped
+   over, and only import/export/require statements are parsed
+2. Each statement becomes a ModuleRecord: kind, bindings (name/alias pairs),
+   source, byte offsets of the statement and of the source string, and line
+3. rewrite() applies byte-span edits, so fixers change exactly the specifier
+   (or statement) they mean to and leave the rest of the file untouched
+
+Usage:
+    python ts_scanner.py show src/calculators/index.ts
+    python ts_scanner.py validate [--root src]    # regression cases, then scan every file and compare with the old regexes
+    python ts_scanner.py bench [--root src]       # time the scanner against the old regexes
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+WORD_CHARS = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$')
+SPACE = frozenset(b' \t\r\n\f\v')
+# After these words a '/' starts a regex literal, not a division
+EXPRESSION_KEYWORDS = frozenset([b'return', b'typeof', b'instanceof', b'in', b'of', b'new', b'delete',
+                                 b'void', b'throw', b'case', b'do', b'else', b'yield', b'await'])
+
+def _plain_code(braces: bool) -> 're.Pattern':
+    """Runs of code the scanner can skip in one regex match.
+
+    A run swallows complete string literals and divisions (a '/' right after an
+    operand that is not a keyword) and stops at anything that needs the main
+    loop: comments, regex literals, template literals, unterminated quotes and
+    import/export/require keywords. Braces only matter inside template
+    expressions, so outside them they are part of the run too.
+    """
+    not_after_keyword = b''.join(rb'(?<!\b%s)(?<!\b%s )' % (word, word) for word in sorted(EXPRESSION_KEYWORDS))
+    division = rb'(?:(?<=[\w$)\]])|(?<=[\w$)\]] ))' + not_after_keyword + rb'/(?![/*])'
+    alternatives = [
+        rb"[^'\"`/{}ier]+",
+        rb"'(?:[^'\\\n]|\\.)*'",
+        rb'"(?:[^"\\\n]|\\.)*"',
+        rb'\B[ier]',
+        rb'[ier](?!mport\b|xport\b|equire\b)',
+        division,
+    ]
+    if braces:
+        alternatives.append(rb'[{}]')
+    return re.compile(rb'(?:' + rb'|'.join(alternatives) + rb')+')
+
+PLAIN_CODE = _plain_code(braces=True)
+PLAIN_TEMPLATE_CODE = _plain_code(braces=False)
+KEYWORD = re.compile(rb'import\b|export\b|require\b')
+STRINGS = {
+    ord("'"): re.compile(rb"'(?:[^'\\\n]|\\.)*'", re.S),
+    ord('"'): re.compile(rb'"(?:[^"\\\n]|\\.)*"', re.S),
+}
+TEMPLATE_BODY = re.compile(rb'(?:[^`\\$]|\\.|\$(?!\{))*', re.S)
+LINE_COMMENT = re.compile(rb'//[^\n]*')
+BLOCK_COMMENT = re.compile(rb'/\*.*?(?:\*/|\Z)', re.S)
+REGEX_LITERAL = re.compile(rb'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+# Identifiers may carry hyphens or lead with digits here: older generators emitted
+# names like `AdAgencyCommission-calculator` and `401k_calculatorInputs`, and those
+# are exactly the imports the fixers repair
+TOKEN = re.compile(rb"(?:\s+|//[^\n]*|/\*.*?\*/)*(?:([\w$]+(?:-[\w$]+)*)|('(?:[^'\\\n]|\\.)*'|\"(?:[^\"\\\n]|\\.)*\")|(.))", re.S)
+
+DECLARATION_MODIFIERS = frozenset([b'declare', b'abstract', b'async', b'const'])
+DECLARATIONS = frozenset([b'const', b'let', b'var', b'function', b'class', b'interface', b'type',
+                          b'enum', b'namespace', b'module'])
+
+IDENT, STRING, PUNCT = 1, 2, 3
+TEMPLATE, BRACE = 0, 1
+
+class Binding:
+    """One name in a statement: `name as alias` (alias == name when there is no `as`).
+
+    Imports: name is the exported name ('default' for default imports, '*' for
+    namespaces) and alias the local binding. Exports: name is the local (or
+    re-exported) name and alias the exported one.
+    """
+    __slots__ = ('name', 'alias', 'type_only')
+
+    def __init__(self, name: str, alias: str, type_only: bool = False):
+        self.name = name
+        self.alias = alias
+        self.type_only = type_only
+
+    def __repr__(self):
+        return f"{'type ' if self.type_only else ''}{self.name}" + (f" as {self.alias}" if self.alias != self.name else '')
+
+class ModuleRecord:
+    """An import, export, dynamic import() or require() found in a file.
+
+    kind is 'import', 'export', 'dynamic' or 'require'. start/end span the
+    statement (for exported declarations, up to the declared name);
+    source_start/source_end span the specifier text inside its quotes.
+    """
+    __slots__ = ('kind', 'type_only', 'names', 'source', 'start', 'end', 'source_start', 'source_end', 'line')
+
+    def __init__(self, kind: str, start: int, line: int):
+        self.kind = kind
+        self.type_only = False
+        self.names: List[Binding] = []
+        self.source: Optional[str] = None
+        self.start = start
+        self.end = start
+        self.source_start = -1
+        self.source_end = -1
+        self.line = line
+
+    def __repr__(self):
+        names = ', '.join(map(repr, self.names))
+        return (f"<{self.kind}{' type' if self.type_only else ''} {{{names}}}"
+                + (f" from {self.source!r}" if self.source is not None else '') + f" @{self.line}>")
+
+class _ParseError(Exception):
+    pass
+
+class Scanner:
+    def __init__(self, source: bytes):
+        self.src = source
+        self.records: List[ModuleRecord] = []
+        # Index of the last significant byte, for regex-vs-division decisions
+        self.last = -1
+        # Open template expressions and the braces inside them
+        self.stack: List[int] = []
+        self.pos = 0
+        self.peeked = None
+        self.line = 1
+        self.line_pos = 0
+
+    def _line_at(self, offset: int) -> int:
+        self.line += self.src.count(b'\n', self.line_pos, offset)
+        self.line_pos = offset
+        return self.line
+
+    def run(self) -> List[ModuleRecord]:
+        src = self.src
+        n = len(src)
+        pos = 0
+        while pos < n:
+            m = (PLAIN_TEMPLATE_CODE if self.stack else PLAIN_CODE).match(src, pos)
+            if m:
+                end = m.end()
+                i = end - 1
+                while i >= pos and src[i] in SPACE:
+                    i -= 1
+                if i >= pos:
+                    self.last = i
+                pos = end
+                continue
+
+            c = src[pos]
+            if c in STRINGS:
+                m = STRINGS[c].match(src, pos)
+                pos = m.end() if m else pos + 1
+            elif c == 0x60:  # `
+                if src.startswith(b'```', pos) and (pos == 0 or src[pos - 1] == 0x0A):
+                    # Markdown fence left in a generated file: not code, skip the line
+                    end = src.find(b'\n', pos)
+                    pos = n if end == -1 else end
+                    continue
+                pos = self._template(pos + 1)
+            elif c == 0x7B:  # {
+                self.stack.append(BRACE)
+                pos += 1
+            elif c == 0x7D:  # }
+                if self.stack and self.stack.pop() == TEMPLATE:
+                    pos = self._template(pos + 1)
+                else:
+                    pos += 1
+            elif c == 0x2F:  # /
+                nxt = src[pos + 1:pos + 2]
+                if nxt == b'/':
+                    pos = LINE_COMMENT.match(src, pos).end()
+                    continue
+                if nxt == b'*':
+                    pos = BLOCK_COMMENT.match(src, pos).end()
+                    continue
+                m = REGEX_LITERAL.match(src, pos) if self._regex_allowed() else None
+                pos = m.end() if m else pos + 1
+            else:
+                pos = self._keyword(pos)
+                continue
+            self.last = pos - 1
+        return self.records
+
+    def _template(self, pos: int) -> int:
+        src = self.src
+        pos = TEMPLATE_BODY.match(src, pos).end()
+        if pos >= len(src):
+            return pos
+        if src[pos] == 0x60:
+            return pos + 1
+        # '${': the expression runs until the matching '}'
+        self.stack.append(TEMPLATE)
+        return pos + 2
+
+    def _regex_allowed(self) -> bool:
+        if self.last < 0:
+            return True
+        src = self.src
+        c = src[self.last]
+        if c in WORD_CHARS:
+            i = self.last
+            while i >= 0 and src[i] in WORD_CHARS:
+                i -= 1
+            return src[i + 1:self.last + 1] in EXPRESSION_KEYWORDS
+        return c not in b')]}\'"`'
+
+    def _keyword(self, pos: int) -> int:
+        """Parse the statement at an import/export/require keyword (or step over the word)"""
+        src = self.src
+        m = KEYWORD.match(src, pos)
+        word_end = pos + 1
+        while word_end < len(src) and src[word_end] in WORD_CHARS:
+            word_end += 1
+        # Property access (obj.import) or part of a longer identifier
+        if not m or m.end() != word_end or (self.last >= 0 and src[self.last] == 0x2E) or \
+                (pos > 0 and src[pos - 1] in WORD_CHARS):
+            self.last = word_end - 1
+            return word_end
+
+        keyword = m.group()
+        record = ModuleRecord('', pos, self._line_at(pos))
+        self.pos = word_end
+        try:
+            if keyword == b'import':
+                self._parse_import(record)
+            elif keyword == b'export':
+                self._parse_export(record)
+            else:
+                self._parse_call(record, 'require')
+        except _ParseError:
+            self.last = word_end - 1
+            return word_end
+        self.records.append(record)
+        self.last = record.end - 1
+        return record.end
+
+    # Statement parser: tokens are read on demand from self.pos
+
+    def _peek(self) -> Tuple[int, bytes, int, int]:
+        """(kind, value, start, end) of the next token, skipping whitespace and comments"""
+        if self.peeked is not None and self.peeked[0] == self.pos:
+            return self.peeked[1]
+        m = TOKEN.match(self.src, self.pos)
+        if m is None:
+            # Exact end of input: a statement may end there without ';' or a newline
+            token = (0, b'', self.pos, self.pos)
+        elif m.lastindex is None:
+            token = (0, b'', m.end(), m.end())
+        else:
+            token = (m.lastindex, m.group(m.lastindex), m.start(m.lastindex), m.end())
+        self.peeked = (self.pos, token)
+        return token
+
+    def _next(self) -> Tuple[int, bytes, int, int]:
+        token = self._peek()
+        if token[0] == 0:
+            raise _ParseError()
+        self.pos = token[3]
+        return token
+
+    def _expect(self, kind: int, value: Optional[bytes] = None) -> Tuple[int, bytes, int, int]:
+        token = self._next()
+        if token[0] != kind or (value is not None and token[1] != value):
+            raise _ParseError()
+        return token
+
+    def _source(self, record: ModuleRecord) -> None:
+        _, value, start, end = self._expect(STRING)
+        record.source = value[1:-1].decode('utf-8', 'replace')
+        record.source_start = start + 1
+        record.source_end = end - 1
+        record.end = end
+
+    def _finish(self, record: ModuleRecord) -> None:
+        """Optional import attributes and semicolon"""
+        kind, value, _, end = self._peek()
+        if kind == IDENT and value in (b'with', b'assert') and self.src.find(b'{', end, end + 64) != -1:
+            self._next()
+            self._expect(PUNCT, b'{')
+            while self._next()[1] != b'}':
+                pass
+            record.end = self.pos
+            kind, value, _, end = self._peek()
+        if kind == PUNCT and value == b';':
+            record.end = end
+            self.pos = end
+
+    def _name(self, token) -> str:
+        kind, value = token[0], token[1]
+        if kind == STRING:
+            return value[1:-1].decode('utf-8', 'replace')
+        if kind != IDENT:
+            raise _ParseError()
+        return value.decode('utf-8')
+
+    def _named_list(self, record: ModuleRecord) -> None:
+        """`{ a, b as c, type d, 'e' as f }` after the opening brace"""
+        while True:
+            token = self._next()
+            if token[1] == b'}':
+                return
+            type_only = False
+            if token[0] == IDENT and token[1] == b'type':
+                following = self._peek()
+                if following[0] in (IDENT, STRING) and following[1] != b'as':
+                    type_only = True
+                    token = self._next()
+            name = self._name(token)
+            alias = name
+            if self._peek()[1] == b'as':
+                self._next()
+                alias = self._name(self._next())
+            record.names.append(Binding(name, alias, type_only))
+            separator = self._next()[1]
+            if separator == b'}':
+                return
+            if separator != b',':
+                raise _ParseError()
+
+    def _parse_call(self, record: ModuleRecord, kind: str) -> None:
+        """import('x') / require('x') with a literal specifier"""
+        record.kind = kind
+        self._expect(PUNCT, b'(')
+        self._source(record)
+        record.end = self._expect(PUNCT, b')')[3]
+
+    def _parse_import(self, record: ModuleRecord) -> None:
+        kind, value, _, _ = self._peek()
+        if kind == PUNCT and value == b'(':
+            self._parse_call(record, 'dynamic')
+            return
+        record.kind = 'import'
+        if kind == IDENT and value == b'type':
+            self._next()
+            following = self._peek()
+            if following[1] in (b'{', b'*') or (following[0] == IDENT and following[1] != b'from'):
+                record.type_only = True
+            else:
+                # `import type from '...'` / `import type, {...}`: a default import named type
+                record.names.append(Binding('default', 'type'))
+                if self._peek()[1] == b',':
+                    self._next()
+                self._import_clause(record, allow_default=False)
+                return
+        if self._peek()[0] == STRING:
+            # Side-effect import
+            self._source(record)
+            self._finish(record)
+            return
+        self._import_clause(record, allow_default=True)
+
+    def _import_clause(self, record: ModuleRecord, allow_default: bool) -> None:
+        token = self._next()
+        if allow_default and token[0] == IDENT and token[1] != b'from':
+            record.names.append(Binding('default', self._name(token)))
+            token = self._next()
+            if token[1] == b',':
+                token = self._next()
+        if token[1] == b'*':
+            self._expect(IDENT, b'as')
+            record.names.append(Binding('*', self._name(self._expect(IDENT))))
+            token = self._next()
+        elif token[1] == b'{':
+            self._named_list(record)
+            token = self._next()
+        if token[0] != IDENT or token[1] != b'from':
+            raise _ParseError()
+        self._source(record)
+        self._finish(record)
+
+    def _parse_export(self, record: ModuleRecord) -> None:
+        record.kind = 'export'
+        kind, value, _, _ = self._peek()
+        if kind == IDENT and value == b'type':
+            following = self._peek_after()
+            if following in (b'{', b'*'):
+                self._next()
+                record.type_only = True
+                kind, value, _, _ = self._peek()
+
+        if value == b'*':
+            self._next()
+            alias = '*'
+            if self._peek()[1] == b'as':
+                self._next()
+                alias = self._name(self._next())
+            record.names.append(Binding('*', alias))
+            self._expect(IDENT, b'from')
+            self._source(record)
+            self._finish(record)
+        elif value == b'{':
+            self._next()
+            self._named_list(record)
+            record.end = self.pos
+            if self._peek()[1] == b'from':
+                self._next()
+                self._source(record)
+            self._finish(record)
+        elif kind == IDENT and value == b'default':
+            record.end = self._next()[3]
+            kind, value, _, end = self._peek()
+            if kind == IDENT and value in (b'function', b'class', b'async', b'abstract'):
+                name = self._declared_name(record)
+                record.names.append(Binding(name or 'default', 'default'))
+            elif kind == IDENT and self._peek_after() in (b';', b''):
+                self._next()
+                record.names.append(Binding(value.decode('utf-8'), 'default'))
+                record.end = end
+                self._finish(record)
+            else:
+                record.names.append(Binding('default', 'default'))
+        elif kind == IDENT and (value in DECLARATIONS or value in DECLARATION_MODIFIERS):
+            name = self._declared_name(record)
+            if name is not None:
+                record.names.append(Binding(name, name))
+        else:
+            raise _ParseError()
+
+    def _peek_after(self) -> bytes:
+        """Value of the token after the next one"""
+        saved = self.pos
+        try:
+            self._next()
+            return self._peek()[1]
+        except _ParseError:
+            return b''
+        finally:
+            self.pos = saved
+
+    def _declared_name(self, record: ModuleRecord) -> Optional[str]:
+        """Consume declaration keywords up to (and including) the declared name.
+
+        Stops before any brace or parenthesis so the main loop still sees them.
+        """
+        while True:
+            kind, value, _, end = self._peek()
+            if kind == IDENT and (value in DECLARATION_MODIFIERS or value in DECLARATIONS):
+                self._next()
+                record.end = end
+                if value in DECLARATIONS and value != b'const':
+                    break
+                continue
+            if kind == PUNCT and value == b'*':
+                self._next()
+                record.end = end
+                continue
+            break
+        kind, value, _, end = self._peek()
+        if kind == PUNCT and value == b'*':
+            self._next()
+            record.end = end
+            kind, value, _, end = self._peek()
+        if kind != IDENT:
+            return None
+        self._next()
+        record.end = end
+        return value.decode('utf-8')
+
+def scan(source: bytes) -> List[ModuleRecord]:
+    """Every import/export/dynamic import()/require() in a TypeScript source, in order"""
+    return Scanner(source).run()
+
+def scan_file(path: str) -> Tuple[bytes, List[ModuleRecord]]:
+    with open(path, 'rb') as f:
+        source = f.read()
+    return source, scan(source)
+
+def specifiers(records: Iterable[ModuleRecord]) -> List[str]:
+    """Distinct module specifiers, in order of appearance"""
+    seen = {}
+    for record in records:
+        if record.source is not None:
+            seen.setdefault(record.source, None)
+    return list(seen)
+
+def imported_bindings(records: Iterable[ModuleRecord], include_types: bool = False) -> Dict[str, str]:
+    """Local name -> specifier for every binding the file imports"""
+    bindings = {}
+    for record in records:
+        if record.kind != 'import' or (record.type_only and not include_types):
+            continue
+        for binding in record.names:
+            if include_types or not binding.type_only:
+                bindings[binding.alias] = record.source
+    return bindings
+
+def statement_text(source: bytes, record: ModuleRecord) -> str:
+    return source[record.start:record.end].decode('utf-8', 'replace')
+
+Edit = Tuple[int, int, bytes]
+
+def replace_source(record: ModuleRecord, specifier: str) -> Edit:
+    """Edit that points a statement at a different module"""
+    return record.source_start, record.source_end, specifier.encode('utf-8')
+
+def remove_statement(source: bytes, record: ModuleRecord) -> Edit:
+    """Edit that deletes a statement, with its line when nothing else is on it"""
+    start, end = record.start, record.end
+    line_start = source.rfind(b'\n', 0, start) + 1
+    line_end = source.find(b'\n', end)
+    line_end = len(source) if line_end == -1 else line_end
+    if not source[line_start:start].strip() and not source[end:line_end].strip():
+        return line_start, min(line_end + 1, len(source)), b''
+    return start, end, b''
+
+def rewrite(source: bytes, edits: Iterable[Edit]) -> bytes:
+    """Apply non-overlapping (start, end, replacement) byte edits"""
+    pieces = []
+    last = 0
+    for start, end, replacement in sorted(edits, key=lambda edit: (edit[0], edit[1])):
+        if start < last:
+            raise ValueError(f'overlapping edits at byte {start}')
+        pieces.append(source[last:start])
+        pieces.append(replacement)
+        last = end
+    pieces.append(source[last:])
+    return b''.join(pieces)
+
+# The regexes the fixers used before this scanner, kept for validate/bench
+LEGACY_PATTERNS = [
+    re.compile(rb'\b(?:import|export)\s[^\'";]*?\bfrom\s*[\'"]([^\'"\n]+)[\'"]', re.S),
+    re.compile(rb'^\s*import\s*[\'"]([^\'"\n]+)[\'"]', re.M),
+    re.compile(rb'\bimport\s*\(\s*[\'"]([^\'"\n]+)[\'"]\s*\)'),
+    re.compile(rb'\brequire\s*\(\s*[\'"]([^\'"\n]+)[\'"]\s*\)'),
+]
+LEGACY_LINE_PATTERNS = [
+    re.compile(rb'^(\s*)import\s+(.+?)\s+from\s+([\'"])(.+?)\3\s*;?\s*$'),
+    re.compile(rb"import \{ (.+) as (.+) \} from '(.+)';"),
+    re.compile(rb"from '\./([^']+)Calculator'"),
+]
+
+def legacy_specifiers(source: bytes) -> List[str]:
+    found = set()
+    for pattern in LEGACY_PATTERNS:
+        found.update(m.group(1).decode('utf-8', 'replace') for m in pattern.finditer(source))
+    return sorted(found)
+
+def source_files(root: str) -> List[str]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != 'node_modules']
+        files.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(('.ts', '.tsx')))
+    files.sort()
+    return files
+
+# Inputs that once broke the scanner, with the specifiers each must yield
+REGRESSION_CASES = (
+    (b"import './side'", ['./side']),
+    (b"export { a }", []),
+    (b"import z from './z'", ['./z']),
+)
+
+def check_regressions() -> List[str]:
+    failures = []
+    for source, expected in REGRESSION_CASES:
+        try:
+            found = specifiers(scan(source))
+        except Exception as e:
+            failures.append(f'{source!r}: {type(e).__name__}: {e}')
+            continue
+        if found != expected:
+            failures.append(f'{source!r}: expected {expected}, got {found}')
+    return failures
+
+def validate(root: str, verbose: bool) -> int:
+    regressions = check_regressions()
+    print(f"{'✅' if not regressions else '❌'} Regression cases: {len(regressions)} of {len(REGRESSION_CASES)} failing")
+    for failure in regressions:
+        print(f"  {failure}")
+    files = source_files(root)
+    records = 0
+    span_errors = []
+    scanner_only: Dict[str, List[str]] = {}
+    legacy_only: Dict[str, List[str]] = {}
+    for path in files:
+        with open(path, 'rb') as f:
+            source = f.read()
+        found = scan(source)
+        records += len(found)
+        for record in found:
+            if record.source is not None and \
+                    source[record.source_start:record.source_end].decode('utf-8', 'replace') != record.source:
+                span_errors.append(f'{path}:{record.line}')
+        ours = set(specifiers(found))
+        theirs = set(legacy_specifiers(source))
+        if ours - theirs:
+            scanner_only[path] = sorted(ours - theirs)
+        if theirs - ours:
+            legacy_only[path] = sorted(theirs - ours)
+
+    print(f"🔎 Scanned {len(files)} files: {records} import/export records")
+    print(f"{'✅' if not span_errors else '❌'} Source spans: {len(span_errors)} mismatches")
+    print(f"➕ Found only by the scanner (multi-line, import type, ...): {len(scanner_only)} files")
+    print(f"➖ Found only by the old regexes (comments, strings, ...): {len(legacy_only)} files")
+    if verbose:
+        for label, diffs in (('scanner only', scanner_only), ('regex only', legacy_only)):
+            for path, names in diffs.items():
+                print(f"  {label}: {path}: {', '.join(names)}")
+    for location in span_errors[:20]:
+        print(f"  span mismatch: {location}")
+    return 1 if span_errors or regressions else 0
+
+def bench(root: str, repeat: int) -> int:
+    files = source_files(root)
+    sources = []
+    for path in files:
+        with open(path, 'rb') as f:
+            sources.append(f.read())
+    total = sum(map(len, sources))
+
+    def best(fn) -> float:
+        times = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - started)
+        return min(times)
+
+    def line_regexes():
+        for source in sources:
+            for line in source.split(b'\n'):
+                for pattern in LEGACY_LINE_PATTERNS:
+                    pattern.search(line)
+
+    results = [
+        ('scanner', best(lambda: [scan(source) for source in sources])),
+        ('import-graph regexes', best(lambda: [legacy_specifiers(source) for source in sources])),
+        ('fixer line regexes', best(line_regexes)),
+    ]
+    print(f"⏱️  {len(files)} files, {total / 1024 / 1024:.1f} MB, best of {repeat}")
+    for name, seconds in results:
+        print(f"  {name:22} {seconds:7.2f} s  {total / 1024 / 1024 / seconds:6.1f} MB/s  "
+              f"{seconds / len(files) * 1e6:6.0f} µs/file")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Scan TypeScript imports and exports')
+    sub = parser.add_subparsers(dest='command', required=True)
+    show = sub.add_parser('show', help='print the records of files')
+    show.add_argument('files', nargs='+')
+    check = sub.add_parser('validate', help='scan every file and compare with the old regexes')
+    check.add_argument('--root', default='src')
+    check.add_argument('--verbose', action='store_true', help='list every differing specifier')
+    timing = sub.add_parser('bench', help='time the scanner against the old regexes')
+    timing.add_argument('--root', default='src')
+    timing.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == 'show':
+        for path in args.files:
+            _, records = scan_file(path)
+            for record in records:
+                print(f"{path}:{record.line} {record!r}")
+        return 0
+    if args.command == 'validate':
+        return validate(args.root, args.verbose)
+    return bench(args.root, args.repeat)
+
+if __name__ == '__main__':
+    sys.exit(main())
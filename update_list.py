@@ -1,73 +1,27 @@
 import re
 
-# Read all dirs
-with open('all_dirs.txt') as f:
-    dirs = [line.strip() for line in f if line.strip()]
+from calculator_catalog import CalculatorCatalog
+from calculator_categories import HUB_CATEGORIES, categorize_all, to_human
 
-dirs = [d.split('/')[-1] for d in dirs]
+# Read all dirs and listed names from the catalog
+catalog = CalculatorCatalog()
+catalog.refresh()
+dirs = catalog.top_level_directories()
 
 # Generate human names
-def to_human(name):
-    if name.endswith('Calculator'):
-        name = name[:-10]
-    name = name.replace('_', ' ').title()
-    return name + ' Calculator'
-
 human_names = [to_human(d) for d in dirs]
 
 # Read existing
-with open('existing_names.txt') as f:
-    existing = set(line.split('] ')[1].strip() for line in f if line.strip())
+existing = catalog.listed_names()
+catalog.close()
 
 # Find missing
 missing = [h for h in human_names if h not in existing]
 
 # Categorize
-categories = {
-    'Mortgage & Real Estate Hub': [],
-    'Retirement & Savings Hub': [],
-    'Investment & Portfolio Hub': [],
-    'Loans & Debt Hub': [],
-    'Cryptocurrency Hub': [],
-    'Legal Settlement Hub': [],
-    'Insurance Hub': [],
-    'Business Operations & Finance Hub': [],
-    'Marketing & Creator Hub': [],
-    'Health & Fitness Hub': [],
-    'Construction Hub': [],
-    'Math Hub': [],
-    'Lifestyle & Automotive Hub': [],
-}
-
-def categorize(name):
-    n = name.lower()
-    if 'mortgage' in n or 'real estate' in n or 'property' in n or 'home' in n or 'rental' in n:
-        return 'Mortgage & Real Estate Hub'
-    elif 'retirement' in n or '401k' in n or 'ira' in n or 'annuity' in n or 'social security' in n or 'life insurance' in n or 'savings' in n or 'pension' in n or 'college' in n or 'student loan' in n:
-        return 'Retirement & Savings Hub'
-    elif 'investment' in n or 'portfolio' in n or 'stock' in n or 'bond' in n or 'dividend' in n or 'equity' in n or 'forex' in n or 'futures' in n or 'options' in n or 'reit' in n:
-        return 'Investment & Portfolio Hub'
-    elif 'loan' in n or 'debt' in n or 'credit' in n:
-        return 'Loans & Debt Hub'
-    elif 'crypto' in n or 'bitcoin' in n or 'blockchain' in n or 'nft' in n or 'ethereum' in n:
-        return 'Cryptocurrency Hub'
-    elif 'legal' in n or 'settlement' in n or 'lawsuit' in n or 'malpractice' in n or 'injury' in n or 'accident' in n or 'divorce' in n or 'patent' in n:
-        return 'Legal Settlement Hub'
-    elif 'insurance' in n:
-        return 'Insurance Hub'
-    elif 'business' in n or 'marketing' in n or 'roi' in n or 'valuation' in n or 'payback' in n or 'break even' in n or 'churn' in n or 'saas' in n or 'customer' in n:
-        return 'Business Operations & Finance Hub'
-    elif 'health' in n or 'fitness' in n or 'calorie' in n or 'diet' in n or 'bmi' in n or 'body' in n or 'blood' in n or 'cholesterol' in n:
-        return 'Health & Fitness Hub'
-    elif 'construction' in n or 'concrete' in n or 'drywall' in n or 'flooring' in n or 'roofing' in n:
-        return 'Construction Hub'
-    elif 'math' in n or 'algebra' in n or 'calculus' in n or 'geometry' in n or 'trigonometry' in n or 'probability' in n:
-        return 'Math Hub'
-    else:
-        return 'Lifestyle & Automotive Hub'
+categories = {hub: [] for hub in HUB_CATEGORIES}
 
-for name in missing:
-    cat = categorize(name)
+for name, cat in zip(missing, categorize_all(missing)):
     categories[cat].append(name)
 
 # Read content
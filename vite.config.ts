@@ -1,7 +1,18 @@
 import { defineConfig } from "vite";
 import react from "@vitejs/plugin-react-swc";
+import fs from "fs";
 import path from "path";
 
+// Calculator module -> chunk, generated by generate_calculator_manifest.py
+const calculatorChunksFile = path.resolve(__dirname, "./src/calculators/chunks.json");
+const calculatorChunks = new Map<string, string>();
+if (fs.existsSync(calculatorChunksFile)) {
+  const chunks: Record<string, string[]> = JSON.parse(fs.readFileSync(calculatorChunksFile, "utf-8"));
+  for (const [chunk, files] of Object.entries(chunks)) {
+    files.forEach((file) => calculatorChunks.set(path.resolve(__dirname, file), chunk));
+  }
+}
+
 // https://vitejs.dev/config/
 export default defineConfig({
   server: {
@@ -14,4 +25,13 @@ export default defineConfig({
       "@": path.resolve(__dirname, "./src"),
     },
   },
-});
\ No newline at end of file
+  build: {
+    rollupOptions: {
+      output: {
+        manualChunks(id) {
+          return calculatorChunks.get(id.split("?")[0]);
+        },
+      },
+    },
+  },
+});
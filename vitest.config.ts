@@ -1,4 +1,4 @@
-import { defineConfig } from 'vitest/config';
+import { configDefaults, defineConfig } from 'vitest/config';
 import { resolve } from 'path';
 
 export default defineConfig({
@@ -6,6 +6,8 @@ export default defineConfig({
     environment: 'jsdom',
     globals: true,
     setupFiles: ['./src/test/setup.ts'],
+    // Calculators moved out by find_unreachable_calculators.py --quarantine
+    exclude: [...configDefaults.exclude, 'quarantine/**'],
   },
   resolve: {
     alias: {
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Watch src/calculators and apply import and registry fixes as files change
+
+After generating calculators, fix_relative_imports.py, fix_import_paths_comprehensive.py
+and fix_registry.py are run by hand, and each cold start rescans the whole tree.
+This daemon keeps the tree warm instead:
+1. Watches with inotify (Linux, via libc) and falls back to mtime polling
+   when inotify is unavailable or runs out of watches
+2. Debounces bursts of events (a generator writing a whole directory) into one batch
+3. Keeps an in-memory index of file mtimes and a warm ImportFixer, so a batch
+   only touches the changed files
+4. Fixes broken relative imports in changed files, and re-runs the index.ts
+   import and registry fixes only when registration-relevant files changed
+5. Reports the latency from save (file mtime) to fix for every batch
+
+Usage:
+    python watch_calculators.py                 # inotify, polling fallback
+    python watch_calculators.py --poll --interval 0.5
+    python watch_calculators.py --debounce 300
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import argparse
+import statistics
+from typing import Dict, List, Optional, Set
+
+from fix_import_paths_comprehensive import ImportFixer
+from fix_registry import fix_registry
+from fix_relative_imports import fix_imports_in_file
+from git_scope import registration_changed
+
+CALCULATORS_DIR = 'src/calculators'
+INDEX_FILE = 'src/calculators/index.ts'
+DEFAULT_DEBOUNCE_MS = 150
+DEFAULT_POLL_INTERVAL = 1.0
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+def is_source(path: str) -> bool:
+    return path.endswith('.ts') and not path.endswith('.d.ts')
+
+class TreeSnapshot:
+    """Warm mtime index of the calculator sources"""
+
+    def __init__(self, root: str = CALCULATORS_DIR):
+        self.root = root
+        self.mtimes: Dict[str, int] = {}
+
+    def scan(self) -> Dict[str, int]:
+        mtimes = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            for name in filenames:
+                path = os.path.join(dirpath, name).replace(os.sep, '/')
+                if is_source(path):
+                    try:
+                        mtimes[path] = os.stat(path).st_mtime_ns
+                    except FileNotFoundError:
+                        pass
+        return mtimes
+
+    def load(self) -> 'TreeSnapshot':
+        self.mtimes = self.scan()
+        return self
+
+    def diff(self) -> Set[str]:
+        """Rescan and return every path added, removed or modified since the last scan"""
+        current = self.scan()
+        changed = {p for p, m in current.items() if self.mtimes.get(p) != m}
+        changed.update(p for p in self.mtimes if p not in current)
+        self.mtimes = current
+        return changed
+
+    def update(self, paths: Set[str]) -> None:
+        """Refresh the index for paths reported by inotify"""
+        for path in paths:
+            try:
+                self.mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                self.mtimes.pop(path, None)
+
+class PollingWatcher:
+    name = 'polling'
+
+    def __init__(self, snapshot: TreeSnapshot, interval: float = DEFAULT_POLL_INTERVAL):
+        self.snapshot = snapshot
+        self.interval = interval
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        return self.snapshot.diff()
+
+    def close(self) -> None:
+        pass
+
+class InotifyWatcher:
+    """Recursive inotify watch on a directory tree, through libc"""
+    name = 'inotify'
+
+    def __init__(self, snapshot: TreeSnapshot):
+        self.snapshot = snapshot
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(self.libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'inotify is not available')
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs: Dict[int, str] = {}
+        try:
+            for dirpath, _, _ in os.walk(snapshot.root):
+                self._add_watch(dirpath.replace(os.sep, '/'))
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: str) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f'inotify_add_watch({directory}): {os.strerror(err)}')
+        self.dirs[wd] = directory
+
+    def _watch_new_tree(self, directory: str, changed: Set[str]) -> None:
+        # Files created before the watch was added produce no events, so list them here
+        for dirpath, _, filenames in os.walk(directory):
+            dirpath = dirpath.replace(os.sep, '/')
+            self._add_watch(dirpath)
+            changed.update(f'{dirpath}/{name}' for name in filenames if is_source(name))
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[str] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: fall back to a full rescan for this batch
+                changed.update(self.snapshot.diff())
+                continue
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = f'{directory}/{name}'
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_new_tree(path, changed)
+                else:
+                    prefix = path + '/'
+                    changed.update(p for p in self.snapshot.mtimes if p.startswith(prefix))
+            elif is_source(name):
+                changed.add(path)
+
+        self.snapshot.update(changed)
+        return changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+class FixDaemon:
+    """Applies the fixers to batches of changed files"""
+
+    def __init__(self, fix_index: bool = True):
+        self.fix_index = fix_index
+        self.fixer = ImportFixer(CALCULATORS_DIR)
+        # mtimes of files this daemon wrote, so its own writes do not retrigger fixes
+        self.own_writes: Dict[str, int] = {}
+        self.latencies: List[float] = []
+
+    def _record_write(self, path: str) -> None:
+        self.own_writes[path] = os.stat(path).st_mtime_ns
+
+    def _is_own_write(self, path: str) -> bool:
+        expected = self.own_writes.pop(path, None)
+        if expected is None:
+            return False
+        try:
+            return os.stat(path).st_mtime_ns == expected
+        except FileNotFoundError:
+            return False
+
+    def _fix_index(self) -> List[str]:
+        actions = []
+        self.fixer.refresh()
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            current = f.read()
+        fixed_content = self.fixer.fix_imports(INDEX_FILE)
+        if fixed_content != current:
+            with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+                f.write(fixed_content)
+            actions.append(f"{self.fixer.counts['fixed']} import paths fixed, "
+                           f"{self.fixer.counts['removed']} removed")
+        removed = fix_registry(INDEX_FILE, verbose=False)
+        if removed:
+            actions.append(f"{len(removed)} stale registrations dropped")
+        if actions:
+            self._record_write(INDEX_FILE)
+        return actions
+
+    def handle(self, changed: Set[str]) -> None:
+        changed = {p for p in changed if not self._is_own_write(p)}
+        if not changed:
+            return
+        started = time.time()
+        saved = [os.stat(p).st_mtime_ns / 1e9 for p in changed if os.path.exists(p)]
+
+        fixed_files = []
+        for path in sorted(changed):
+            if path != INDEX_FILE and os.path.isfile(path) and fix_imports_in_file(path):
+                self._record_write(path)
+                fixed_files.append(path)
+
+        index_actions = []
+        if self.fix_index and os.path.exists(INDEX_FILE) and registration_changed(changed):
+            index_actions = self._fix_index()
+
+        finished = time.time()
+        latency = (finished - min(saved)) * 1000 if saved else 0.0
+        self.latencies.append(latency)
+
+        print(f"🔄 {len(changed)} changed files: {len(fixed_files)} relative-import fixes"
+              + (f"; index.ts: {', '.join(index_actions)}" if index_actions else '')
+              + f" (fix {(finished - started) * 1000:.0f} ms, save→fix {latency:.0f} ms)")
+        for path in fixed_files:
+            print(f"  ✅ {path}")
+
+    def summary(self) -> str:
+        if not self.latencies:
+            return "No batches processed"
+        ordered = sorted(self.latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return (f"{len(ordered)} batches, save→fix median {statistics.median(ordered):.0f} ms, "
+                f"p95 {p95:.0f} ms, max {ordered[-1]:.0f} ms")
+
+def open_watcher(snapshot: TreeSnapshot, force_poll: bool, interval: float):
+    if not force_poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(snapshot)
+        except OSError as e:
+            print(f"⚠️  inotify unavailable ({e}); falling back to polling")
+    return PollingWatcher(snapshot, interval)
+
+def main():
+    parser = argparse.ArgumentParser(description='Watch src/calculators and apply import and registry fixes on change')
+    parser.add_argument('--poll', action='store_true', help='use mtime polling instead of inotify')
+    parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL, help='polling interval in seconds')
+    parser.add_argument('--debounce', type=int, default=DEFAULT_DEBOUNCE_MS,
+                        help='wait this many ms without new events before fixing a batch')
+    parser.add_argument('--no-index', action='store_true', help='only fix changed files, never rewrite index.ts')
+    args = parser.parse_args()
+
+    if not os.path.isdir(CALCULATORS_DIR):
+        print(f"Error: {CALCULATORS_DIR} not found")
+        return 1
+
+    started = time.time()
+    snapshot = TreeSnapshot().load()
+    watcher = open_watcher(snapshot, args.poll, args.interval)
+    daemon = FixDaemon(fix_index=not args.no_index)
+    print(f"👀 Watching {len(snapshot.mtimes)} files with {watcher.name} "
+          f"(warm index in {(time.time() - started) * 1000:.0f} ms); Ctrl-C to stop")
+
+    debounce = args.debounce / 1000
+    try:
+        while True:
+            pending = watcher.wait(None if watcher.name == 'inotify' else args.interval)
+            if not pending:
+                continue
+            # Keep collecting until the tree has been quiet for the debounce window
+            while True:
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                pending |= more
+            daemon.handle(pending)
+    except KeyboardInterrupt:
+        print(f"\n⏹️  Stopped. {daemon.summary()}")
+    finally:
+        watcher.close()
+    return 0
+
+if __name__ == '__main__':
+    exit(main())